@@ -0,0 +1,12 @@
+from semantic_router.cache.base import BaseCache
+from semantic_router.cache.memory import LRUCache, TTLCache
+from semantic_router.cache.semantic import SemanticCache
+from semantic_router.cache.sqlite import SQLiteCache
+
+__all__ = [
+    "BaseCache",
+    "LRUCache",
+    "SemanticCache",
+    "SQLiteCache",
+    "TTLCache",
+]
@@ -0,0 +1,148 @@
+import hashlib
+import sys
+import unicodedata
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text before it is used as part of a cache key. Applies unicode NFKC
+    normalization, strips leading/trailing whitespace and collapses any internal
+    runs of whitespace into a single space.
+
+    :param text: The text to normalize.
+    :type text: str
+    :return: The normalized text.
+    :rtype: str
+    """
+    return " ".join(unicodedata.normalize("NFKC", text).split())
+
+
+def encoder_identity(encoder: Any) -> str:
+    """Build a string identifying an encoder configuration. Two encoders with the
+    same identity are expected to produce the same embedding for the same text.
+
+    :param encoder: The encoder to identify.
+    :type encoder: Any
+    :return: The encoder identity, formatted as "type/name/dimensions".
+    :rtype: str
+    """
+    dimensions = getattr(encoder, "dimensions", None)
+    return f"{encoder.type}/{encoder.name}/{dimensions}"
+
+
+def embedding_cache_key(encoder: Any, text: str, input_type: str) -> str:
+    """Build the cache key for an embedding. The key is made from the encoder
+    type, name and dimensions, the input type and a hash of the normalized text.
+
+    :param encoder: The encoder that produces the embedding.
+    :type encoder: Any
+    :param text: The text being encoded.
+    :type text: str
+    :param input_type: Either "queries" or "documents".
+    :type input_type: str
+    :return: The cache key.
+    :rtype: str
+    """
+    text_hash = hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+    return f"{encoder_identity(encoder)}/{input_type}/{text_hash}"
+
+
+def sizeof(value: Any) -> int:
+    """Estimate the memory used by a cached value in bytes. Numpy arrays report
+    their buffer size, everything else falls back to `sys.getsizeof`.
+
+    :param value: The value to measure.
+    :type value: Any
+    :return: The estimated size in bytes.
+    :rtype: int
+    """
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    return sys.getsizeof(value)
+
+
+class BaseCache(BaseModel):
+    """Base class for all key-value caches. Caches are bounded by a maximum number of
+    entries and optionally by a maximum number of bytes, and record hit and miss
+    counts for every lookup.
+    """
+
+    type: str = Field(default="base")
+    max_entries: int = 10_000
+    max_bytes: Optional[int] = None
+    hits: int = 0
+    misses: int = 0
+
+    model_config: ClassVar[ConfigDict] = ConfigDict(arbitrary_types_allowed=True)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a value from the cache.
+
+        :param key: The key to look up.
+        :type key: str
+        :return: The cached value, or None if the key is not cached.
+        :rtype: Optional[Any]
+        """
+        raise NotImplementedError("Subclasses must implement this method")
+
+    def set(self, key: str, value: Any):
+        """Add a value to the cache, evicting old entries where required.
+
+        :param key: The key to store the value under.
+        :type key: str
+        :param value: The value to store.
+        :type value: Any
+        """
+        raise NotImplementedError("Subclasses must implement this method")
+
+    def delete(self, key: str):
+        """Remove a key from the cache if present.
+
+        :param key: The key to remove.
+        :type key: str
+        """
+        raise NotImplementedError("Subclasses must implement this method")
+
+    def clear(self):
+        """Remove all entries from the cache. Hit and miss counters are kept."""
+        raise NotImplementedError("Subclasses must implement this method")
+
+    def __len__(self) -> int:
+        raise NotImplementedError("Subclasses must implement this method")
+
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get multiple values from the cache.
+
+        :param keys: The keys to look up.
+        :type keys: List[str]
+        :return: The cached values in the same order as the keys, with None for any
+            key that is not cached.
+        :rtype: List[Optional[Any]]
+        """
+        return [self.get(key) for key in keys]
+
+    def set_many(self, items: List[Tuple[str, Any]]):
+        """Add multiple values to the cache.
+
+        :param items: A list of (key, value) pairs to store.
+        :type items: List[Tuple[str, Any]]
+        """
+        for key, value in items:
+            self.set(key, value)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the cache statistics.
+
+        :return: A dictionary of hits, misses, hit rate and current size.
+        :rtype: Dict[str, Any]
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self),
+        }
@@ -0,0 +1,130 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from pydantic import Field, PrivateAttr
+
+from semantic_router.cache.base import BaseCache, sizeof
+
+
+class LRUCache(BaseCache):
+    """An in-process cache that evicts the least recently used entries once either
+    `max_entries` or `max_bytes` is exceeded. Safe to share between threads.
+    """
+
+    type: str = Field(default="lru")
+
+    _store: "OrderedDict[str, Tuple[Any, int, Optional[float]]]" = PrivateAttr(
+        default_factory=OrderedDict
+    )
+    _bytes: int = PrivateAttr(default=0)
+    _lock: Any = PrivateAttr(default_factory=threading.RLock)
+
+    def _expires_at(self) -> Optional[float]:
+        """Get the expiry time for an entry added now. LRU entries never expire.
+
+        :return: The monotonic expiry time, or None if entries do not expire.
+        :rtype: Optional[float]
+        """
+        return None
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a value from the cache, marking it as most recently used.
+
+        :param key: The key to look up.
+        :type key: str
+        :return: The cached value, or None if the key is not cached or has expired.
+        :rtype: Optional[Any]
+        """
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is not None and entry[2] is not None:
+                if entry[2] <= time.monotonic():
+                    self._remove(key)
+                    entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._store.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key: str, value: Any):
+        """Add a value to the cache, evicting least recently used entries until the
+        cache is within its bounds again.
+
+        :param key: The key to store the value under.
+        :type key: str
+        :param value: The value to store.
+        :type value: Any
+        """
+        size = sizeof(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            # the value could never fit, caching it would only flush the cache
+            return
+        with self._lock:
+            self._remove(key)
+            self._store[key] = (value, size, self._expires_at())
+            self._bytes += size
+            while len(self._store) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                oldest_key = next(iter(self._store))
+                self._remove(oldest_key)
+
+    def delete(self, key: str):
+        """Remove a key from the cache if present.
+
+        :param key: The key to remove.
+        :type key: str
+        """
+        with self._lock:
+            self._remove(key)
+
+    def clear(self):
+        """Remove all entries from the cache. Hit and miss counters are kept."""
+        with self._lock:
+            self._store.clear()
+            self._bytes = 0
+
+    def _remove(self, key: str):
+        entry = self._store.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    @property
+    def nbytes(self) -> int:
+        """The estimated number of bytes held by the cache."""
+        return self._bytes
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the cache statistics.
+
+        :return: A dictionary of hits, misses, hit rate, current size and bytes used.
+        :rtype: Dict[str, Any]
+        """
+        stats = super().stats()
+        stats["bytes"] = self._bytes
+        return stats
+
+
+class TTLCache(LRUCache):
+    """An in-process cache where entries expire `ttl` seconds after being written.
+    Entries are also evicted in least recently used order when the cache exceeds
+    `max_entries` or `max_bytes`.
+    """
+
+    type: str = Field(default="ttl")
+    ttl: float = 3600.0
+
+    def _expires_at(self) -> Optional[float]:
+        """Get the expiry time for an entry added now.
+
+        :return: The monotonic expiry time.
+        :rtype: Optional[float]
+        """
+        return time.monotonic() + self.ttl
@@ -0,0 +1,138 @@
+import threading
+from typing import Any, ClassVar, Dict, List, Optional
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+
+class SemanticCache(BaseModel):
+    """An in-process cache of values keyed by embedding rather than by text. A lookup
+    returns the value stored for the most similar recent embedding, provided that
+    the cosine similarity is at least `similarity_threshold`. Used by routers to
+    reuse the route decision of a near-duplicate query without querying the index.
+
+    Entries are grouped by a context string, e.g. the router version and query
+    options, and a lookup only matches entries of the same context. The cache holds
+    the `max_entries` most recently added embeddings. Safe to share between threads.
+
+    Routers only cache choices of static routes unless `include_dynamic` is set, as
+    the function call arguments of a dynamic route may differ between two similar
+    queries, e.g. "weather in Paris" and "weather in Rome".
+    """
+
+    type: str = Field(default="semantic")
+    max_entries: int = 1000
+    similarity_threshold: float = 0.98
+    include_dynamic: bool = False
+    hits: int = 0
+    misses: int = 0
+
+    model_config: ClassVar[ConfigDict] = ConfigDict(arbitrary_types_allowed=True)
+
+    _vectors: Optional[np.ndarray] = PrivateAttr(default=None)
+    _contexts: np.ndarray = PrivateAttr(default_factory=lambda: np.array([]))
+    _context_ids: Dict[str, int] = PrivateAttr(default_factory=dict)
+    _next_context_id: int = PrivateAttr(default=0)
+    _values: List[Any] = PrivateAttr(default_factory=list)
+    _next: int = PrivateAttr(default=0)
+    _size: int = PrivateAttr(default=0)
+    _lock: Any = PrivateAttr(default_factory=threading.RLock)
+
+    def get(self, vector: List[float] | np.ndarray, context: str = "") -> Optional[Any]:
+        """Get the value stored for the most similar embedding of the same context.
+
+        :param vector: The embedding of the query.
+        :type vector: List[float] | np.ndarray
+        :param context: The context the value must have been stored under.
+        :type context: str
+        :return: The cached value, or None if no embedding is similar enough.
+        :rtype: Optional[Any]
+        """
+        query = _normalize(vector)
+        with self._lock:
+            context_id = self._context_ids.get(context)
+            if (
+                context_id is None
+                or self._vectors is None
+                or self._vectors.shape[1] != query.shape[0]
+            ):
+                self.misses += 1
+                return None
+            size = self._size
+            similarities = self._vectors[:size] @ query
+            similarities[self._contexts[:size] != context_id] = -np.inf
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.similarity_threshold:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return self._values[best]
+
+    def set(self, vector: List[float] | np.ndarray, value: Any, context: str = ""):
+        """Store a value for an embedding, replacing the oldest entry once the cache
+        is full.
+
+        :param vector: The embedding of the query.
+        :type vector: List[float] | np.ndarray
+        :param value: The value to store.
+        :type value: Any
+        :param context: The context to store the value under.
+        :type context: str
+        """
+        query = _normalize(vector)
+        with self._lock:
+            if self._vectors is None or self._vectors.shape[1] != query.shape[0]:
+                # first entry, or the encoder changed dimensions
+                self.clear()
+                self._vectors = np.zeros((self.max_entries, query.shape[0]))
+                self._contexts = np.full(self.max_entries, -1)
+                self._values = [None] * self.max_entries
+            if context not in self._context_ids:
+                if len(self._context_ids) >= self.max_entries:
+                    # forget contexts that no longer have any entries
+                    live = set(self._contexts[: self._size].tolist())
+                    self._context_ids = {
+                        name: i for name, i in self._context_ids.items() if i in live
+                    }
+                self._context_ids[context] = self._next_context_id
+                self._next_context_id += 1
+            context_id = self._context_ids[context]
+            self._vectors[self._next] = query
+            self._contexts[self._next] = context_id
+            self._values[self._next] = value
+            self._next = (self._next + 1) % self.max_entries
+            self._size = min(self._size + 1, self.max_entries)
+
+    def clear(self):
+        """Remove all entries from the cache. Hit and miss counters are kept."""
+        with self._lock:
+            self._vectors = None
+            self._contexts = np.array([])
+            self._context_ids = {}
+            self._next_context_id = 0
+            self._values = []
+            self._next = 0
+            self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the cache statistics.
+
+        :return: A dictionary of hits, misses, hit rate and current size.
+        :rtype: Dict[str, Any]
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self),
+        }
+
+
+def _normalize(vector: List[float] | np.ndarray) -> np.ndarray:
+    array = np.asarray(vector, dtype=float).reshape(-1)
+    norm = np.linalg.norm(array)
+    return array / norm if norm else array
@@ -0,0 +1,287 @@
+import argparse
+import os
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Any, List, Optional, Set, Tuple
+
+import numpy as np
+from pydantic import Field, PrivateAttr
+
+from semantic_router.cache.base import BaseCache, embedding_cache_key
+from semantic_router.utils.logger import logger
+
+if TYPE_CHECKING:
+    # imported lazily so that routes can use caches without a circular import
+    from semantic_router.encoders.base import DenseEncoder
+
+# sqlite limits the number of host parameters in a single statement
+_SQLITE_MAX_VARIABLES = 500
+
+
+class SQLiteCache(BaseCache):
+    """A persistent embedding store backed by a local sqlite database. Entries
+    survive process restarts, so encoding paths like `add`, `sync`, `fit` and
+    `evaluate` only pay for texts that have never been encoded before. Once
+    `max_entries` is exceeded the oldest written entries are removed first.
+    """
+
+    type: str = Field(default="sqlite")
+    path: str = "semantic_router_embeddings.db"
+    max_entries: int = 1_000_000
+
+    _conn: Any = PrivateAttr(default=None)
+    _lock: Any = PrivateAttr(default_factory=threading.RLock)
+    # the number of stored rows, counted once at open so writes never scan the table
+    _count: int = PrivateAttr(default=0)
+
+    def __init__(self, **data):
+        super().__init__(**data)
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "key TEXT PRIMARY KEY, dtype TEXT NOT NULL, value BLOB NOT NULL, "
+            "created_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS embeddings_created_at "
+            "ON embeddings (created_at)"
+        )
+        self._conn.commit()
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        self._count = count
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get an embedding from the store.
+
+        :param key: The key to look up.
+        :type key: str
+        :return: The embedding, or None if the key is not stored.
+        :rtype: Optional[Any]
+        """
+        return self.get_many([key])[0]
+
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get multiple embeddings from the store using as few queries as possible.
+
+        :param keys: The keys to look up.
+        :type keys: List[str]
+        :return: The embeddings in the same order as the keys, with None for any key
+            that is not stored.
+        :rtype: List[Optional[Any]]
+        """
+        found = {}
+        unique_keys = list(dict.fromkeys(keys))
+        with self._lock:
+            for i in range(0, len(unique_keys), _SQLITE_MAX_VARIABLES):
+                batch = unique_keys[i : i + _SQLITE_MAX_VARIABLES]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    "SELECT key, dtype, value FROM embeddings "
+                    f"WHERE key IN ({placeholders})",
+                    batch,
+                ).fetchall()
+                for key, dtype, value in rows:
+                    found[key] = np.frombuffer(value, dtype=dtype)
+            values = [found.get(key) for key in keys]
+            hits = sum(value is not None for value in values)
+            self.hits += hits
+            self.misses += len(values) - hits
+        return values
+
+    def set(self, key: str, value: Any):
+        """Write an embedding to the store.
+
+        :param key: The key to store the embedding under.
+        :type key: str
+        :param value: The embedding to store.
+        :type value: Any
+        """
+        self.set_many([(key, value)])
+
+    def set_many(self, items: List[Tuple[str, Any]]):
+        """Write multiple embeddings to the store in a single transaction.
+
+        :param items: A list of (key, embedding) pairs to store.
+        :type items: List[Tuple[str, Any]]
+        """
+        if not items:
+            return
+        now = time.time()
+        rows = []
+        for key, value in items:
+            array = np.asarray(value)
+            rows.append((key, array.dtype.str, array.tobytes(), now))
+        unique_keys = list(dict.fromkeys(key for key, _ in items))
+        with self._lock:
+            new_keys = len(unique_keys) - len(self._stored_keys(unique_keys))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, dtype, value, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._count += new_keys
+            overflow = self._count - self.max_entries
+            if overflow > 0:
+                cursor = self._conn.execute(
+                    "DELETE FROM embeddings WHERE key IN (SELECT key FROM "
+                    "embeddings ORDER BY created_at ASC LIMIT ?)",
+                    (overflow,),
+                )
+                self._count -= cursor.rowcount
+            self._conn.commit()
+
+    def _stored_keys(self, keys: List[str]) -> Set[str]:
+        """Get which of the given keys are stored, using the primary key index.
+
+        :param keys: The keys to look up, without duplicates.
+        :type keys: List[str]
+        :return: The stored keys.
+        :rtype: Set[str]
+        """
+        stored: Set[str] = set()
+        for i in range(0, len(keys), _SQLITE_MAX_VARIABLES):
+            batch = keys[i : i + _SQLITE_MAX_VARIABLES]
+            placeholders = ",".join("?" * len(batch))
+            rows = self._conn.execute(
+                f"SELECT key FROM embeddings WHERE key IN ({placeholders})", batch
+            ).fetchall()
+            stored.update(key for (key,) in rows)
+        return stored
+
+    def delete(self, key: str):
+        """Remove an embedding from the store if present.
+
+        :param key: The key to remove.
+        :type key: str
+        """
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM embeddings WHERE key = ?", (key,))
+            self._count -= cursor.rowcount
+            self._conn.commit()
+
+    def clear(self):
+        """Remove all embeddings from the store. Hit and miss counters are kept."""
+        with self._lock:
+            self._conn.execute("DELETE FROM embeddings")
+            self._conn.commit()
+            self._count = 0
+
+    def close(self):
+        """Close the underlying sqlite connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def prewarm(
+        self,
+        path: str,
+        encoder: "DenseEncoder",
+        input_type: str = "documents",
+        batch_size: int = 100,
+    ) -> int:
+        """Encode every text in a file that is not already in the store. JSON and
+        YAML files are read as router configs and all route utterances are used,
+        any other file is read as plain text with one text per line.
+
+        :param path: The path to the file to read texts from.
+        :type path: str
+        :param encoder: The encoder used to create missing embeddings.
+        :type encoder: DenseEncoder
+        :param input_type: Either "queries" or "documents". Use "documents" for route
+            utterances so that the keys match those written by router `add` and `sync`.
+        :type input_type: str
+        :param batch_size: The number of texts sent to the encoder per call.
+        :type batch_size: int
+        :return: The number of newly encoded texts.
+        :rtype: int
+        """
+        from semantic_router.encoders.base import AsymmetricDenseMixin
+
+        texts = _read_texts(path)
+        keys = [embedding_cache_key(encoder, text, input_type) for text in texts]
+        missing = {
+            key: text
+            for key, text, value in zip(keys, texts, self.get_many(keys))
+            if value is None
+        }
+        if isinstance(encoder, AsymmetricDenseMixin):
+            encode_fn = (
+                encoder.encode_queries
+                if input_type == "queries"
+                else encoder.encode_documents
+            )
+        else:
+            encode_fn = encoder
+        missing_keys = list(missing.keys())
+        for i in range(0, len(missing_keys), batch_size):
+            batch_keys = missing_keys[i : i + batch_size]
+            embeddings = encode_fn([missing[key] for key in batch_keys])
+            self.set_many(list(zip(batch_keys, embeddings)))
+        logger.info(
+            f"Prewarmed {len(missing_keys)} new embeddings, "
+            f"{len(keys) - len(missing_keys)} already stored."
+        )
+        return len(missing_keys)
+
+
+def _read_texts(path: str) -> List[str]:
+    """Read the texts to prewarm from a router config or a plain text file.
+
+    :param path: The path to the file.
+    :type path: str
+    :return: The texts found in the file.
+    :rtype: List[str]
+    """
+    _, ext = os.path.splitext(path)
+    if ext in [".json", ".yaml", ".yml"]:
+        from semantic_router.routers.base import RouterConfig
+
+        config = RouterConfig.from_file(path)
+        return [utt.utterance for utt in config.to_utterances()]
+    with open(path, "r") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def main(argv: Optional[List[str]] = None):
+    """Prewarm an embedding store from the command line, for example:
+
+    python -m semantic_router.cache.sqlite routes.yaml --encoder-type openai
+    """
+    from semantic_router.encoders import AutoEncoder, DenseEncoder
+
+    parser = argparse.ArgumentParser(
+        description="Encode the texts in a file into a persistent embedding store."
+    )
+    parser.add_argument("file", help="Router config (JSON/YAML) or text file.")
+    parser.add_argument("--db", default="semantic_router_embeddings.db")
+    parser.add_argument("--encoder-type", required=True)
+    parser.add_argument("--encoder-name", default=None)
+    parser.add_argument("--input-type", default="documents")
+    parser.add_argument("--batch-size", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    encoder = AutoEncoder(type=args.encoder_type, name=args.encoder_name).model
+    if not isinstance(encoder, DenseEncoder):
+        raise ValueError("Only dense encoders can be used to prewarm the store.")
+    store = SQLiteCache(path=args.db)
+    try:
+        store.prewarm(
+            path=args.file,
+            encoder=encoder,
+            input_type=args.input_type,
+            batch_size=args.batch_size,
+        )
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,7 @@ from semantic_router.encoders.clip import CLIPEncoder
 from semantic_router.encoders.cohere import CohereEncoder
 from semantic_router.encoders.fastembed import FastEmbedEncoder
 from semantic_router.encoders.google import GoogleEncoder
+from semantic_router.encoders.hedged import HedgedEncoder
 from semantic_router.encoders.huggingface import HFEndpointEncoder, HuggingFaceEncoder
 from semantic_router.encoders.jina import JinaEncoder
 from semantic_router.encoders.litellm import LiteLLMEncoder
@@ -39,6 +40,7 @@ __all__ = [
     "LiteLLMEncoder",
     "VoyageEncoder",
     "JinaEncoder",
+    "HedgedEncoder",
 ]
 
 
@@ -5,20 +5,24 @@ from typing import Any, Callable, Dict, List, Optional, Union
 
 import httpx
 import openai
+import tiktoken
 from openai import OpenAIError
 from openai._types import NotGiven
 from openai.types import CreateEmbeddingResponse
+from pydantic import PrivateAttr
 
-from semantic_router.encoders import DenseEncoder
+from semantic_router.encoders.remote import RemoteDenseEncoder
 from semantic_router.utils.defaults import EncoderDefault
 from semantic_router.utils.logger import logger
 
 
-class AzureOpenAIEncoder(DenseEncoder):
+class AzureOpenAIEncoder(RemoteDenseEncoder):
     """Encoder for Azure OpenAI API.
 
     This class provides functionality to encode text documents using the Azure OpenAI API.
     It supports customization of the score threshold for filtering or processing the embeddings.
+    Large inputs are split into batches bounded by item count and tiktoken token totals
+    and sent concurrently under optional requests and tokens per minute budgets.
     """
 
     client: Optional[openai.AzureOpenAI] = None
@@ -27,6 +31,9 @@ class AzureOpenAIEncoder(DenseEncoder):
     type: str = "azure"
     deployment_name: str | None = None
     max_retries: int = 3
+    max_batch_size: int = 2048
+    max_batch_tokens: Optional[int] = 300_000
+    _token_encoder: Any = PrivateAttr()
 
     def __init__(
         self,
@@ -41,6 +48,9 @@ class AzureOpenAIEncoder(DenseEncoder):
         score_threshold: float = 0.82,
         dimensions: Union[int, NotGiven] = NotGiven(),
         max_retries: int = 3,
+        max_concurrency: int = 4,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
     ):
         """Initialize the AzureOpenAIEncoder.
 
@@ -86,12 +96,27 @@ class AzureOpenAIEncoder(DenseEncoder):
         :param max_retries: The maximum number of retries for API calls in case of failures.
             Default is `3`.
         :type max_retries: int, optional
+
+        :param max_concurrency: The maximum number of batches sent at the same time.
+        :type max_concurrency: int, optional
+
+        :param requests_per_minute: An optional requests per minute budget.
+        :type requests_per_minute: int, optional
+
+        :param tokens_per_minute: An optional tokens per minute budget.
+        :type tokens_per_minute: int, optional
         """
         if name is None:
             name = deployment_name
             if name is None:
                 name = EncoderDefault.AZURE.value["embedding_model"]
-        super().__init__(name=name, score_threshold=score_threshold)
+        super().__init__(
+            name=name,
+            score_threshold=score_threshold,
+            max_concurrency=max_concurrency,
+            requests_per_minute=requests_per_minute,
+            tokens_per_minute=tokens_per_minute,
+        )
 
         azure_endpoint = azure_endpoint or os.getenv("AZURE_OPENAI_ENDPOINT")
         if not azure_endpoint:
@@ -159,15 +184,48 @@ class AzureOpenAIEncoder(DenseEncoder):
             raise ValueError(
                 f"OpenAI API client failed to initialize. Error: {e}"
             ) from e
+        # deployment names are not always model names, so fall back to the
+        # tokenizer used by all current OpenAI embedding models
+        try:
+            self._token_encoder = tiktoken.encoding_for_model(name)
+        except KeyError:
+            self._token_encoder = tiktoken.get_encoding("cl100k_base")
 
     def __call__(self, docs: List[str]) -> List[List[float]]:
         """Encode a list of documents into embeddings using the Azure OpenAI API.
+        Documents are sent in concurrent batches bounded by `max_batch_size` items and
+        `max_batch_tokens` tokens.
 
         :param docs: The documents to encode.
         :type docs: List[str]
         :return: The embeddings for the documents.
         :rtype: List[List[float]]
         """
+        if self.client is None:
+            raise ValueError("Azure OpenAI client is not initialized.")
+        return self._encode_batches(docs, self._count_tokens(docs))
+
+    def _count_tokens(self, docs: List[Any]) -> Optional[List[int]]:
+        """Count the tokens in each document with tiktoken.
+
+        :param docs: The documents to count tokens for.
+        :type docs: List[Any]
+        :return: The number of tokens in each document.
+        :rtype: Optional[List[int]]
+        """
+        return [
+            len(tokens) for tokens in self._token_encoder.encode_ordinary_batch(docs)
+        ]
+
+    def _embed_batch(self, docs: List[str]) -> List[List[float]]:
+        """Embed a single batch of documents, retrying with jittered exponential
+        backoff on OpenAI errors.
+
+        :param docs: The batch of documents to embed.
+        :type docs: List[str]
+        :return: The embeddings for the batch.
+        :rtype: List[List[float]]
+        """
         if self.client is None:
             raise ValueError("Azure OpenAI client is not initialized.")
         embeds = None
@@ -175,19 +233,21 @@ class AzureOpenAIEncoder(DenseEncoder):
         # Exponential backoff
         for j in range(self.max_retries + 1):
             try:
-                embeds = self.client.embeddings.create(
-                    input=docs,
-                    model=str(self.deployment_name),
-                    dimensions=self.dimensions,
-                )
+                with self._request_slot():
+                    embeds = self.client.embeddings.create(
+                        input=docs,
+                        model=str(self.deployment_name),
+                        dimensions=self.dimensions,
+                    )
                 if embeds.data:
                     break
             except OpenAIError as e:
                 logger.error("Exception occurred", exc_info=True)
                 if self.max_retries != 0 and j < self.max_retries:
-                    sleep(2**j)
+                    delay = self._retry_delay(j, e)
+                    sleep(delay)
                     logger.warning(
-                        "Retrying in %d seconds due to OpenAIError: %s", 2**j, e
+                        "Retrying in %.2f seconds due to OpenAIError: %s", delay, e
                     )
                 else:
                     raise
@@ -206,32 +266,49 @@ class AzureOpenAIEncoder(DenseEncoder):
         return embeddings
 
     async def acall(self, docs: List[str]) -> List[List[float]]:
-        """Encode a list of documents into embeddings using the Azure OpenAI API asynchronously.
+        """Encode a list of documents into embeddings using the Azure OpenAI API
+        asynchronously. Documents are sent in concurrent batches bounded by
+        `max_batch_size` items and `max_batch_tokens` tokens.
 
         :param docs: The documents to encode.
         :type docs: List[str]
         :return: The embeddings for the documents.
         :rtype: List[List[float]]
         """
+        if self.async_client is None:
+            raise ValueError("Azure OpenAI async client is not initialized.")
+        return await self._aencode_batches(docs, self._count_tokens(docs))
+
+    async def _aembed_batch(self, docs: List[str]) -> List[List[float]]:
+        """Embed a single batch of documents asynchronously, retrying with jittered
+        exponential backoff on OpenAI errors.
+
+        :param docs: The batch of documents to embed.
+        :type docs: List[str]
+        :return: The embeddings for the batch.
+        :rtype: List[List[float]]
+        """
         if self.async_client is None:
             raise ValueError("Azure OpenAI async client is not initialized.")
         embeds = None
         # Exponential backoff
         for j in range(self.max_retries + 1):
             try:
-                embeds = await self.async_client.embeddings.create(
-                    input=docs,
-                    model=str(self.deployment_name),
-                    dimensions=self.dimensions,
-                )
+                async with self._arequest_slot():
+                    embeds = await self.async_client.embeddings.create(
+                        input=docs,
+                        model=str(self.deployment_name),
+                        dimensions=self.dimensions,
+                    )
                 if embeds.data:
                     break
             except OpenAIError as e:
                 logger.error("Exception occurred", exc_info=True)
                 if self.max_retries != 0 and j < self.max_retries:
-                    await asleep(2**j)
+                    delay = self._retry_delay(j, e)
+                    await asleep(delay)
                     logger.warning(
-                        "Retrying in %d seconds due to OpenAIError: %s", 2**j, e
+                        "Retrying in %.2f seconds due to OpenAIError: %s", delay, e
                     )
                 else:
                     raise
@@ -18,17 +18,16 @@ Classes:
 
 import json
 import os
-from time import sleep
 from typing import Any, Dict, List, Optional, Union
 
 import tiktoken
 
-from semantic_router.encoders import DenseEncoder
+from semantic_router.encoders.remote import RemoteDenseEncoder
 from semantic_router.utils.defaults import EncoderDefault
 from semantic_router.utils.logger import logger
 
 
-class BedrockEncoder(DenseEncoder):
+class BedrockEncoder(RemoteDenseEncoder):
     """Dense encoder using Amazon Bedrock embedding API. Requires an AWS Access Key ID
     and AWS Secret Access Key.
 
@@ -37,6 +36,10 @@ class BedrockEncoder(DenseEncoder):
     given documents. It supports customization of the pre-trained model, score
     threshold, and region.
 
+    The Bedrock runtime embeds one document per request, so documents are sent
+    concurrently, at most `max_concurrency` at a time. Throttled requests are
+    retried with jittered exponential backoff.
+
     Example usage:
 
     ```python
@@ -59,6 +62,7 @@ class BedrockEncoder(DenseEncoder):
     secret_access_key: Optional[str] = None
     session_token: Optional[str] = None
     region: Optional[str] = None
+    max_batch_size: int = 1
 
     def __init__(
         self,
@@ -192,91 +196,104 @@ class BedrockEncoder(DenseEncoder):
             )
         if self.client is None:
             raise ValueError("Bedrock client is not initialised.")
-        max_attempts = 3
-        for attempt in range(max_attempts):
-            try:
-                embeddings = []
-                if self.name and "amazon" in self.name:
-                    for doc in docs:
-                        embedding_body = {}
-
-                        if isinstance(doc, dict):
-                            embedding_body["inputText"] = doc.get("text")
-                            embedding_body["inputImage"] = doc.get(
-                                "image"
-                            )  # expects a base64-encoded image
-                        else:
-                            embedding_body["inputText"] = doc
-
-                        # Add model-specific inference parameters
-                        if model_kwargs:
-                            embedding_body = embedding_body | model_kwargs
-
-                        # Clean up null values
-                        embedding_body = {k: v for k, v in embedding_body.items() if v}
-
-                        # Format payload
-                        embedding_body_payload: str = json.dumps(embedding_body)
-
-                        response = self.client.invoke_model(
-                            body=embedding_body_payload,
-                            modelId=self.name,
-                            accept="application/json",
-                            contentType="application/json",
-                        )
-                        response_body = json.loads(response.get("body").read())
-                        embeddings.append(response_body.get("embedding"))
-                elif self.name and "cohere" in self.name:
-                    chunked_docs = self.chunk_strings(docs)
-                    for chunk in chunked_docs:
-                        chunk = {"texts": chunk, "input_type": self.input_type}
-
-                        # Add model-specific inference parameters
-                        # Note: if specified, input_type will be overwritten by model_kwargs
-                        if model_kwargs:
-                            chunk = chunk | model_kwargs
-
-                        # Format payload
-                        chunk = json.dumps(chunk)
-
-                        response = self.client.invoke_model(
-                            body=chunk,
-                            modelId=self.name,
-                            accept="*/*",
-                            contentType="application/json",
-                        )
-                        response_body = json.loads(response.get("body").read())
-                        chunk_embeddings = response_body.get("embeddings")
-                        embeddings.extend(chunk_embeddings)
+
+        def embed(batch: List[Union[str, Dict]]) -> List[List[float]]:
+            return self._with_retries(
+                lambda docs: self._invoke(docs, model_kwargs), batch
+            )
+
+        try:
+            return self._encode_batches(docs, embed_fn=embed)
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "ExpiredTokenException":
+                logger.warning("Session token has expired. Retrying initialisation.")
+                try:
+                    self.session_token = os.getenv("AWS_SESSION_TOKEN")
+                    self.client = self._initialize_client(
+                        self.access_key_id,
+                        self.secret_access_key,
+                        self.session_token,
+                        self.region,
+                    )
+                except Exception as e:
+                    raise ValueError(
+                        f"Bedrock client failed to reinitialise. Error: {e}"
+                    ) from e
+            raise ValueError(
+                f"Retries exhausted, Bedrock call failed. Error: {error}"
+            ) from error
+        except Exception as e:
+            raise ValueError(f"Bedrock call failed. Error: {e}") from e
+
+    def _invoke(
+        self, docs: List[Union[str, Dict]], model_kwargs: Optional[Dict] = None
+    ) -> List[List[float]]:
+        """Invokes the embedding model for a batch of documents.
+
+        :param docs: The documents to embed.
+        :type docs: list[str | dict]
+        :param model_kwargs: A dictionary of model-specific inference parameters.
+        :type model_kwargs: dict
+        :returns: The embeddings returned by the model.
+        :rtype: list[list[float]]
+        :raises ValueError: If the model is not supported.
+        """
+        embeddings = []
+        if self.name and "amazon" in self.name:
+            for doc in docs:
+                embedding_body = {}
+
+                if isinstance(doc, dict):
+                    embedding_body["inputText"] = doc.get("text")
+                    embedding_body["inputImage"] = doc.get(
+                        "image"
+                    )  # expects a base64-encoded image
                 else:
-                    raise ValueError("Unknown model name")
-                return embeddings
-            except ClientError as error:
-                if attempt < max_attempts - 1:
-                    if error.response["Error"]["Code"] == "ExpiredTokenException":
-                        logger.warning(
-                            "Session token has expired. Retrying initialisation."
-                        )
-                        try:
-                            self.session_token = os.getenv("AWS_SESSION_TOKEN")
-                            self.client = self._initialize_client(
-                                self.access_key_id,
-                                self.secret_access_key,
-                                self.session_token,
-                                self.region,
-                            )
-                        except Exception as e:
-                            raise ValueError(
-                                f"Bedrock client failed to reinitialise. Error: {e}"
-                            ) from e
-                    sleep(2**attempt)
-                    logger.warning(f"Retrying in {2**attempt} seconds...")
-                raise ValueError(
-                    f"Retries exhausted, Bedrock call failed. Error: {error}"
-                ) from error
-            except Exception as e:
-                raise ValueError(f"Bedrock call failed. Error: {e}") from e
-        raise ValueError("Bedrock call failed to return embeddings.")
+                    embedding_body["inputText"] = doc
+
+                # Add model-specific inference parameters
+                if model_kwargs:
+                    embedding_body = embedding_body | model_kwargs
+
+                # Clean up null values
+                embedding_body = {k: v for k, v in embedding_body.items() if v}
+
+                # Format payload
+                embedding_body_payload: str = json.dumps(embedding_body)
+
+                response = self.client.invoke_model(
+                    body=embedding_body_payload,
+                    modelId=self.name,
+                    accept="application/json",
+                    contentType="application/json",
+                )
+                response_body = json.loads(response.get("body").read())
+                embeddings.append(response_body.get("embedding"))
+        elif self.name and "cohere" in self.name:
+            chunked_docs = self.chunk_strings(docs)
+            for chunk in chunked_docs:
+                chunk = {"texts": chunk, "input_type": self.input_type}
+
+                # Add model-specific inference parameters
+                # Note: if specified, input_type will be overwritten by model_kwargs
+                if model_kwargs:
+                    chunk = chunk | model_kwargs
+
+                # Format payload
+                chunk = json.dumps(chunk)
+
+                response = self.client.invoke_model(
+                    body=chunk,
+                    modelId=self.name,
+                    accept="*/*",
+                    contentType="application/json",
+                )
+                response_body = json.loads(response.get("body").read())
+                chunk_embeddings = response_body.get("embeddings")
+                embeddings.extend(chunk_embeddings)
+        else:
+            raise ValueError("Unknown model name")
+        return embeddings
 
     def chunk_strings(self, strings, MAX_WORDS=20):
         """Breaks up a list of strings into smaller chunks.
@@ -1,11 +1,10 @@
 import os
-from typing import Any
+from typing import Any, ClassVar
 
-import litellm
 from pydantic import PrivateAttr
 from typing_extensions import deprecated
 
-from semantic_router.encoders.litellm import LiteLLMEncoder, litellm_to_list
+from semantic_router.encoders.litellm import LiteLLMEncoder
 from semantic_router.utils.defaults import EncoderDefault
 
 
@@ -18,6 +17,8 @@ class CohereEncoder(LiteLLMEncoder):
     _async_client: Any = PrivateAttr()  # TODO: deprecated, to remove in v0.2.0
     _embed_type: Any = PrivateAttr()  # TODO: deprecated, to remove in v0.2.0
     type: str = "cohere"
+    query_input_type: ClassVar[str | None] = "search_query"
+    document_input_type: ClassVar[str | None] = "search_document"
 
     def __init__(
         self,
@@ -64,51 +65,3 @@ class CohereEncoder(LiteLLMEncoder):
         if cohere_api_key is None:
             raise ValueError("Cohere API key cannot be 'None'.")
         return None, None
-
-    def encode_queries(self, docs: list[str], **kwargs) -> list[list[float]]:
-        try:
-            embeds = litellm.embedding(
-                input=docs,
-                input_type="search_query",
-                model=f"{self.type}/{self.name}",
-                **kwargs,
-            )
-            return litellm_to_list(embeds)
-        except Exception as e:
-            raise ValueError(f"Cohere API call failed. Error: {e}") from e
-
-    def encode_documents(self, docs: list[str], **kwargs) -> list[list[float]]:
-        try:
-            embeds = litellm.embedding(
-                input=docs,
-                input_type="search_document",
-                model=f"{self.type}/{self.name}",
-                **kwargs,
-            )
-            return litellm_to_list(embeds)
-        except Exception as e:
-            raise ValueError(f"Cohere API call failed. Error: {e}") from e
-
-    async def aencode_queries(self, docs: list[str], **kwargs) -> list[list[float]]:
-        try:
-            embeds = await litellm.aembedding(
-                input=docs,
-                input_type="search_query",
-                model=f"{self.type}/{self.name}",
-                **kwargs,
-            )
-            return litellm_to_list(embeds)
-        except Exception as e:
-            raise ValueError(f"Cohere API call failed. Error: {e}") from e
-
-    async def aencode_documents(self, docs: list[str], **kwargs) -> list[list[float]]:
-        try:
-            embeds = await litellm.aembedding(
-                input=docs,
-                input_type="search_document",
-                model=f"{self.type}/{self.name}",
-                **kwargs,
-            )
-            return litellm_to_list(embeds)
-        except Exception as e:
-            raise ValueError(f"Cohere API call failed. Error: {e}") from e
@@ -1,11 +1,11 @@
 import os
 from typing import Any, List, Optional
 
-from semantic_router.encoders import DenseEncoder
+from semantic_router.encoders.remote import RemoteDenseEncoder
 from semantic_router.utils.defaults import EncoderDefault
 
 
-class GoogleEncoder(DenseEncoder):
+class GoogleEncoder(RemoteDenseEncoder):
     """GoogleEncoder class for generating embeddings using Google's AI Platform.
 
     The GoogleEncoder class is a subclass of DenseEncoder and utilizes the TextEmbeddingModel from the
@@ -28,6 +28,8 @@ class GoogleEncoder(DenseEncoder):
 
     client: Optional[Any] = None
     type: str = "google"
+    # Vertex AI accepts at most 250 texts per embedding request
+    max_batch_size: int = 250
 
     def __init__(
         self,
@@ -126,7 +128,38 @@ class GoogleEncoder(DenseEncoder):
         if self.client is None:
             raise ValueError("Google AI Platform client is not initialized.")
         try:
-            embeddings = self.client.get_embeddings(docs)
-            return [embedding.values for embedding in embeddings]
+            return self._encode_batches(docs)
+        except Exception as e:
+            raise ValueError(f"Google AI Platform API call failed. Error: {e}") from e
+
+    async def acall(self, docs: List[str]) -> List[List[float]]:
+        """Generates embeddings for the given documents asynchronously.
+
+        :param docs: A list of strings representing the documents to embed.
+        :type docs: List[str]
+        :return: A list of lists, where each inner list contains the embedding values for a
+            document.
+        :rtype: List[List[float]]
+        :raise ValueError: If the Google AI Platform client is not initialized or if the
+            API call fails.
+        """
+        if self.client is None:
+            raise ValueError("Google AI Platform client is not initialized.")
+        try:
+            return await self._aencode_batches(docs)
         except Exception as e:
             raise ValueError(f"Google AI Platform API call failed. Error: {e}") from e
+
+    def _embed_batch(self, docs: List[str]) -> List[List[float]]:
+        def embed(batch: List[str]) -> List[List[float]]:
+            embeddings = self.client.get_embeddings(batch)  # type: ignore
+            return [embedding.values for embedding in embeddings]
+
+        return self._with_retries(embed, docs)
+
+    async def _aembed_batch(self, docs: List[str]) -> List[List[float]]:
+        async def embed(batch: List[str]) -> List[List[float]]:
+            embeddings = await self.client.get_embeddings_async(batch)  # type: ignore
+            return [embedding.values for embedding in embeddings]
+
+        return await self._awith_retries(embed, docs)
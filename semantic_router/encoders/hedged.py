@@ -0,0 +1,204 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+import numpy as np
+from pydantic import Field, PrivateAttr
+
+from semantic_router.encoders.base import DenseEncoder
+from semantic_router.utils.logger import logger
+
+
+class HedgedEncoder(DenseEncoder):
+    """Dense encoder that hedges slow asynchronous requests to cut tail latency.
+
+    `acall` sends the request to the primary encoder. If it has not returned after
+    the `hedge_percentile` latency of recent requests, a duplicate request is sent
+    to the secondary encoder, or to the primary encoder again when there is no
+    secondary. The first response wins and the other request is cancelled. At most
+    `max_hedge_ratio` of recent requests are hedged, so a slow provider does not
+    see its load doubled.
+
+    Synchronous calls are passed straight to the primary encoder.
+
+    Example usage:
+
+    ```python
+    from semantic_router.encoders import (
+        AzureOpenAIEncoder,
+        HedgedEncoder,
+        OpenAIEncoder,
+    )
+
+    encoder = HedgedEncoder(
+        primary=OpenAIEncoder(name="text-embedding-3-small"),
+        secondary=AzureOpenAIEncoder(deployment_name="text-embedding-3-small"),
+    )
+    embeddings = await encoder.acall(["document1", "document2"])
+    ```
+    """
+
+    type: str = Field(default="hedged")
+    primary: DenseEncoder
+    secondary: Optional[DenseEncoder] = None
+    hedge_percentile: float = 95.0
+    initial_delay: float = 1.0
+    min_samples: int = 20
+    max_hedge_ratio: float = 0.1
+    window_size: int = 1000
+
+    _latencies: Deque[float] = PrivateAttr()
+    _hedged: Deque[bool] = PrivateAttr()
+
+    def __init__(
+        self,
+        primary: DenseEncoder,
+        secondary: Optional[DenseEncoder] = None,
+        hedge_percentile: float = 95.0,
+        initial_delay: float = 1.0,
+        min_samples: int = 20,
+        max_hedge_ratio: float = 0.1,
+        window_size: int = 1000,
+        score_threshold: Optional[float] = None,
+    ):
+        """Initialize the HedgedEncoder.
+
+        :param primary: The encoder every request is sent to first.
+        :type primary: DenseEncoder
+        :param secondary: The encoder hedged requests are sent to, must produce
+            embeddings with the same dimensions as the primary encoder. Defaults to
+            the primary encoder.
+        :type secondary: Optional[DenseEncoder]
+        :param hedge_percentile: The percentile of recent latencies to wait for
+            before hedging a request.
+        :type hedge_percentile: float
+        :param initial_delay: The delay in seconds before hedging, used until
+            `min_samples` latencies have been observed.
+        :type initial_delay: float
+        :param min_samples: The number of latencies to observe before using the
+            percentile based delay.
+        :type min_samples: int
+        :param max_hedge_ratio: The maximum fraction of recent requests that may be
+            hedged.
+        :type max_hedge_ratio: float
+        :param window_size: The number of recent requests used for the latency
+            percentile and the hedge budget.
+        :type window_size: int
+        :param score_threshold: The score threshold, defaults to the primary
+            encoder's threshold.
+        :type score_threshold: Optional[float]
+        :raise ValueError: If the encoders produce embeddings of different
+            dimensions.
+        """
+        primary_dims = getattr(primary, "dimensions", None)
+        secondary_dims = getattr(secondary, "dimensions", None)
+        if primary_dims and secondary_dims and primary_dims != secondary_dims:
+            raise ValueError(
+                f"Secondary encoder dimensions ({secondary_dims}) must match the "
+                f"primary encoder dimensions ({primary_dims})."
+            )
+        data: Dict[str, Any] = {
+            "primary": primary,
+            "secondary": secondary,
+            "hedge_percentile": hedge_percentile,
+            "initial_delay": initial_delay,
+            "min_samples": min_samples,
+            "max_hedge_ratio": max_hedge_ratio,
+            "window_size": window_size,
+        }
+        super().__init__(
+            name=primary.name,
+            score_threshold=(
+                score_threshold
+                if score_threshold is not None
+                else primary.score_threshold
+            ),
+            **data,
+        )
+        self._latencies = deque(maxlen=window_size)
+        self._hedged = deque(maxlen=window_size)
+
+    @property
+    def dimensions(self) -> Optional[int]:
+        """The dimensions of the embeddings, if known."""
+        return getattr(self.primary, "dimensions", None)
+
+    def __call__(self, docs: List[Any]) -> List[List[float]]:
+        """Encode a list of documents with the primary encoder.
+
+        :param docs: The documents to encode.
+        :type docs: List[Any]
+        :return: The encoded documents.
+        :rtype: List[List[float]]
+        """
+        return self.primary(docs)
+
+    async def acall(self, docs: List[Any]) -> List[List[float]]:
+        """Encode a list of documents asynchronously, hedging the request if the
+        primary encoder is slow.
+
+        :param docs: The documents to encode.
+        :type docs: List[Any]
+        :return: The encoded documents.
+        :rtype: List[List[float]]
+        """
+        start = time.monotonic()
+        tasks = [asyncio.ensure_future(self.primary.acall(docs))]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.hedge_delay())
+            if done or not self._within_budget():
+                result = await tasks[0]
+                self._record(time.monotonic() - start, hedged=False)
+                return result
+            logger.debug(
+                f"Hedging encoder request after {time.monotonic() - start:.3f}s"
+            )
+            tasks.append(
+                asyncio.ensure_future((self.secondary or self.primary).acall(docs))
+            )
+            pending = set(tasks)
+            while True:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in sorted(done, key=lambda t: t.exception() is not None):
+                    if task.exception() is None or not pending:
+                        # the first success wins, an error only when both failed
+                        result = task.result()
+                        # the winner's latency is cut short by the hedge, so it
+                        # would skew the percentile of the primary's latencies
+                        self._record(None, hedged=True)
+                        return result
+                    logger.warning(f"Hedged encoder request failed: {task.exception()}")
+        finally:
+            # cancel the losing request, or every request if the caller gave up
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def hedge_delay(self) -> float:
+        """Get the time to wait for the primary encoder before hedging.
+
+        :return: The delay in seconds.
+        :rtype: float
+        """
+        if len(self._latencies) < self.min_samples:
+            return self.initial_delay
+        return float(np.percentile(self._latencies, self.hedge_percentile))
+
+    def hedge_rate(self) -> float:
+        """Get the fraction of recent requests that were hedged.
+
+        :return: The hedge rate.
+        :rtype: float
+        """
+        return sum(self._hedged) / len(self._hedged) if self._hedged else 0.0
+
+    def _within_budget(self) -> bool:
+        return sum(self._hedged) + 1 <= self.max_hedge_ratio * (len(self._hedged) + 1)
+
+    def _record(self, latency: Optional[float], hedged: bool):
+        if latency is not None:
+            self._latencies.append(latency)
+        self._hedged.append(hedged)
@@ -22,12 +22,15 @@ Classes:
 
 import os
 import time
+from asyncio import sleep as asleep
 from typing import Any, Dict, List, Optional
 
+import aiohttp
 import requests
 from pydantic import PrivateAttr
 
 from semantic_router.encoders import DenseEncoder
+from semantic_router.encoders.remote import RemoteDenseEncoder
 from semantic_router.utils.logger import logger
 
 # TODO: this should support local models, and we should have another class for remote
@@ -179,7 +182,7 @@ class HuggingFaceEncoder(DenseEncoder):
         return self._torch.max(token_embeddings, 1)[0]
 
 
-class HFEndpointEncoder(DenseEncoder):
+class HFEndpointEncoder(RemoteDenseEncoder):
     """HFEndpointEncoder class to embeddings models using Huggingface's inference endpoints.
 
     The HFEndpointEncoder class is a subclass of DenseEncoder and utilizes a specified
@@ -187,6 +190,10 @@ class HFEndpointEncoder(DenseEncoder):
     of the Huggingface API endpoint and an API key for authentication. The class supports
     customization of the score threshold for filtering or processing the embeddings.
 
+    Requests share a pooled HTTP session and are sent concurrently, at most
+    `max_concurrency` at a time. Each request embeds a single document by default,
+    endpoints accepting a list of inputs can set `max_batch_size` to send more.
+
     Example usage:
 
     ```python
@@ -203,6 +210,7 @@ class HFEndpointEncoder(DenseEncoder):
     name: str = "hugging_face_custom_endpoint"
     huggingface_url: Optional[str] = None
     huggingface_api_key: Optional[str] = None
+    max_batch_size: int = 1
 
     def __init__(
         self,
@@ -254,42 +262,82 @@ class HFEndpointEncoder(DenseEncoder):
         :rtype: List[List[float]]
         :raise ValueError: If no embeddings are returned for a document.
         """
-        embeddings = []
-        for d in docs:
-            try:
-                output = self.query({"inputs": d, "parameters": {}})
-                if not output or len(output) == 0:
-                    raise ValueError("No embeddings returned from the query.")
-                embeddings.append(output)
+        try:
+            return self._encode_batches(docs)
+        except Exception as e:
+            raise ValueError(f"No embeddings returned for document. Error: {e}") from e
 
-            except Exception as e:
-                raise ValueError(
-                    f"No embeddings returned for document. Error: {e}"
-                ) from e
-        return embeddings
+    async def acall(self, docs: List[str]) -> List[List[float]]:
+        """Encodes a list of documents into embeddings using the Hugging Face API
+        asynchronously.
+
+        :param docs: A list of documents to encode.
+        :type docs: List[str]
+        :return: A list of embeddings for the given documents.
+        :rtype: List[List[float]]
+        :raise ValueError: If no embeddings are returned for a document.
+        """
+        try:
+            return await self._aencode_batches(docs)
+        except Exception as e:
+            raise ValueError(f"No embeddings returned for document. Error: {e}") from e
+
+    def _embed_batch(self, docs: List[str]) -> List[List[float]]:
+        return self._parse_output(docs, self.query(self._payload(docs)))
+
+    async def _aembed_batch(self, docs: List[str]) -> List[List[float]]:
+        return self._parse_output(docs, await self.aquery(self._payload(docs)))
+
+    def _payload(self, docs: List[str]) -> Dict[str, Any]:
+        # single documents are sent as a plain string, which every endpoint accepts
+        return {"inputs": docs[0] if len(docs) == 1 else docs, "parameters": {}}
+
+    def _parse_output(self, docs: List[str], output: Any) -> List[List[float]]:
+        if not output or len(output) == 0:
+            raise ValueError("No embeddings returned from the query.")
+        return [output] if len(docs) == 1 else output
+
+    def _headers(self) -> Dict[str, str]:
+        return {
+            "Accept": "application/json",
+            "Authorization": f"Bearer {self.huggingface_api_key}",
+            "Content-Type": "application/json",
+        }
 
     def query(self, payload, max_retries=3, retry_interval=5):
-        """Sends a query to the Hugging Face API and returns the response.
+        """Sends a query to the Hugging Face API and returns the response. Rate
+        limited (429) and server errors are retried with jittered exponential
+        backoff, while the endpoint is loading the model the estimated loading time
+        is waited for instead.
 
         :param payload: The payload to send in the request.
         :type payload: dict
+        :param max_retries: The maximum number of retries.
+        :type max_retries: int
+        :param retry_interval: The minimum delay in seconds between retries.
+        :type retry_interval: float
         :return: The response from the Hugging Face API.
         :rtype: dict
         :raise ValueError: If the query fails or the response status is not 200.
         """
-        headers = {
-            "Accept": "application/json",
-            "Authorization": f"Bearer {self.huggingface_api_key}",
-            "Content-Type": "application/json",
-        }
-        for attempt in range(1, max_retries + 1):
+        for attempt in range(max_retries + 1):
             try:
-                response = requests.post(
-                    self.huggingface_url,
-                    headers=headers,
+                response = self._get_session().post(
+                    self.huggingface_url,  # type: ignore
+                    headers=self._headers(),
                     json=payload,
-                    # timeout=timeout_seconds,
                 )
+            except requests.exceptions.RequestException as e:
+                if attempt < max_retries:
+                    logger.info(
+                        f"Retrying attempt: {attempt + 1} for payload: {payload}"
+                    )
+                    time.sleep(max(retry_interval, self._retry_delay(attempt, e)))
+                    continue
+                raise ValueError(f"Query failed. Error: {e}") from e
+            if response.ok:
+                return response.json()
+            if attempt < max_retries:
                 if response.status_code == 503:
                     estimated_time = response.json().get("estimated_time", "")
                     if estimated_time:
@@ -298,17 +346,71 @@ class HFEndpointEncoder(DenseEncoder):
                         )
                         time.sleep(estimated_time)
                         continue
-                else:
-                    response.raise_for_status()
-
-            except requests.exceptions.RequestException:
-                if attempt < max_retries - 1:
-                    logger.info(f"Retrying attempt: {attempt} for payload: {payload} ")
-                    time.sleep(retry_interval)
-                    retry_interval += attempt
-                else:
-                    raise ValueError(
-                        f"Query failed with status {response.status_code}: {response.text}"
+                error = requests.HTTPError(response=response)
+                if self._is_retryable(error):
+                    logger.info(
+                        f"Retrying attempt: {attempt + 1} for payload: {payload}"
                     )
+                    time.sleep(max(retry_interval, self._retry_delay(attempt, error)))
+                    continue
+            raise ValueError(
+                f"Query failed with status {response.status_code}: {response.text}"
+            )
 
-        return response.json()
+    async def aquery(self, payload, max_retries=3, retry_interval=5):
+        """Sends a query to the Hugging Face API asynchronously and returns the
+        response, retrying like `query`.
+
+        :param payload: The payload to send in the request.
+        :type payload: dict
+        :param max_retries: The maximum number of retries.
+        :type max_retries: int
+        :param retry_interval: The minimum delay in seconds between retries.
+        :type retry_interval: float
+        :return: The response from the Hugging Face API.
+        :rtype: dict
+        :raise ValueError: If the query fails or the response status is not 200.
+        """
+        for attempt in range(max_retries + 1):
+            try:
+                async with self._get_async_session().post(
+                    self.huggingface_url,  # type: ignore
+                    headers=self._headers(),
+                    json=payload,
+                ) as response:
+                    if response.ok:
+                        return await response.json()
+                    text = await response.text()
+                    if attempt < max_retries:
+                        if response.status == 503:
+                            estimated_time = (await response.json()).get(
+                                "estimated_time", ""
+                            )
+                            if estimated_time:
+                                logger.info(
+                                    f"Model Initializing wait for - {estimated_time:.2f}s "
+                                )
+                                await asleep(estimated_time)
+                                continue
+                        error = aiohttp.ClientResponseError(
+                            response.request_info,
+                            response.history,
+                            status=response.status,
+                            headers=response.headers,
+                        )
+                        if self._is_retryable(error):
+                            await asleep(
+                                max(retry_interval, self._retry_delay(attempt, error))
+                            )
+                            continue
+                    raise ValueError(
+                        f"Query failed with status {response.status}: {text}"
+                    )
+            except aiohttp.ClientError as e:
+                if attempt < max_retries:
+                    logger.info(
+                        f"Retrying attempt: {attempt + 1} for payload: {payload}"
+                    )
+                    await asleep(max(retry_interval, self._retry_delay(attempt, e)))
+                    continue
+                raise ValueError(f"Query failed. Error: {e}") from e
@@ -1,10 +1,10 @@
 import os
-from typing import Any
+from typing import Any, ClassVar
 
 import litellm
 
-from semantic_router.encoders import DenseEncoder
 from semantic_router.encoders.base import AsymmetricDenseMixin
+from semantic_router.encoders.remote import RemoteDenseEncoder
 from semantic_router.utils.defaults import EncoderDefault
 
 
@@ -23,21 +23,41 @@ def litellm_to_list(embeds: litellm.EmbeddingResponse) -> list[list[float]]:
     return [x["embedding"] for x in embeds.data]
 
 
-class LiteLLMEncoder(DenseEncoder, AsymmetricDenseMixin):
+# maximum number of inputs accepted in a single embedding request by each provider
+PROVIDER_MAX_BATCH_SIZES: dict[str, int] = {
+    "openai": 2048,
+    "azure": 2048,
+    "cohere": 96,
+    "voyage": 128,
+    "mistral": 128,
+    "jina_ai": 2048,
+}
+
+
+class LiteLLMEncoder(RemoteDenseEncoder, AsymmetricDenseMixin):
     """LiteLLM encoder class for generating embeddings using LiteLLM.
 
     The LiteLLMEncoder class is a subclass of DenseEncoder and utilizes the LiteLLM SDK
     to generate embeddings for given documents. It supports all encoders supported by LiteLLM
     and supports customization of the score threshold for filtering or processing the embeddings.
+
+    Documents are sent in batches of at most the provider's maximum batch size, with
+    up to `max_concurrency` batches in flight at once. Rate limited and failed
+    requests are retried with jittered exponential backoff.
     """
 
     type: str = "litellm"
+    # provider specific input types used for asymmetric models
+    query_input_type: ClassVar[str | None] = None
+    document_input_type: ClassVar[str | None] = None
 
     def __init__(
         self,
         name: str | None = None,
         score_threshold: float | None = None,
         api_key: str | None = None,
+        max_batch_size: int | None = None,
+        max_concurrency: int = 4,
     ):
         """Initialize the LiteLLMEncoder.
 
@@ -46,6 +66,11 @@ class LiteLLMEncoder(DenseEncoder, AsymmetricDenseMixin):
         :type name: str
         :param score_threshold: The score threshold for the embeddings.
         :type score_threshold: float
+        :param max_batch_size: The maximum number of documents sent in one request,
+            defaults to the provider's limit.
+        :type max_batch_size: int | None
+        :param max_concurrency: The maximum number of requests in flight at once.
+        :type max_concurrency: int
         """
         if name is None:
             # defaults to default openai model if none provided
@@ -53,8 +78,12 @@ class LiteLLMEncoder(DenseEncoder, AsymmetricDenseMixin):
         super().__init__(
             name=name,
             score_threshold=score_threshold if score_threshold is not None else 0.3,
+            max_concurrency=max_concurrency,
         )
         self.type, self.name = self.name.split("/")
+        self.max_batch_size = max_batch_size or PROVIDER_MAX_BATCH_SIZES.get(
+            self.type, 100
+        )
         if api_key is None:
             api_key = os.getenv(self.type.upper() + "_API_KEY")
         if api_key is None:
@@ -79,44 +108,70 @@ class LiteLLMEncoder(DenseEncoder, AsymmetricDenseMixin):
         return await self.aencode_queries(docs, **kwargs)
 
     def encode_queries(self, docs: list[str], **kwargs) -> list[list[float]]:
-        try:
-            embeds = litellm.embedding(
-                input=docs, model=f"{self.type}/{self.name}", **kwargs
-            )
-            return litellm_to_list(embeds)
-        except Exception as e:
-            raise ValueError(
-                f"{self.type.capitalize()} API call failed. Error: {e}"
-            ) from e
+        return self._encode(docs, self.query_input_type, **kwargs)
 
     def encode_documents(self, docs: list[str], **kwargs) -> list[list[float]]:
-        try:
-            embeds = litellm.embedding(
-                input=docs, model=f"{self.type}/{self.name}", **kwargs
-            )
-            return litellm_to_list(embeds)
-        except Exception as e:
-            raise ValueError(
-                f"{self.type.capitalize()} API call failed. Error: {e}"
-            ) from e
+        return self._encode(docs, self.document_input_type, **kwargs)
 
     async def aencode_queries(self, docs: list[str], **kwargs) -> list[list[float]]:
+        return await self._aencode(docs, self.query_input_type, **kwargs)
+
+    async def aencode_documents(self, docs: list[str], **kwargs) -> list[list[float]]:
+        return await self._aencode(docs, self.document_input_type, **kwargs)
+
+    def _embedding_kwargs(self, input_type: str | None, **kwargs) -> dict[str, Any]:
+        if input_type is not None:
+            kwargs["input_type"] = input_type
+        return {"model": f"{self.type}/{self.name}", **kwargs}
+
+    def _encode(
+        self, docs: list[str], input_type: str | None, **kwargs
+    ) -> list[list[float]]:
+        """Embed documents in concurrent, retried batches.
+
+        :param docs: The documents to embed.
+        :type docs: list[str]
+        :param input_type: The provider specific input type, if any.
+        :type input_type: str | None
+        :return: The embeddings, in the same order as the documents.
+        :rtype: list[list[float]]
+        """
+        embedding_kwargs = self._embedding_kwargs(input_type, **kwargs)
+
+        def embed(batch: list[str]) -> list[list[float]]:
+            return litellm_to_list(litellm.embedding(input=batch, **embedding_kwargs))
+
         try:
-            embeds = await litellm.aembedding(
-                input=docs, model=f"{self.type}/{self.name}", **kwargs
+            return self._encode_batches(
+                docs, embed_fn=lambda batch: self._with_retries(embed, batch)
             )
-            return litellm_to_list(embeds)
         except Exception as e:
             raise ValueError(
                 f"{self.type.capitalize()} API call failed. Error: {e}"
             ) from e
 
-    async def aencode_documents(self, docs: list[str], **kwargs) -> list[list[float]]:
+    async def _aencode(
+        self, docs: list[str], input_type: str | None, **kwargs
+    ) -> list[list[float]]:
+        """Embed documents in concurrent, retried batches asynchronously.
+
+        :param docs: The documents to embed.
+        :type docs: list[str]
+        :param input_type: The provider specific input type, if any.
+        :type input_type: str | None
+        :return: The embeddings, in the same order as the documents.
+        :rtype: list[list[float]]
+        """
+        embedding_kwargs = self._embedding_kwargs(input_type, **kwargs)
+
+        async def embed(batch: list[str]) -> list[list[float]]:
+            embeds = await litellm.aembedding(input=batch, **embedding_kwargs)
+            return litellm_to_list(embeds)
+
         try:
-            embeds = await litellm.aembedding(
-                input=docs, model=f"{self.type}/{self.name}", **kwargs
+            return await self._aencode_batches(
+                docs, embed_fn=lambda batch: self._awith_retries(embed, batch)
             )
-            return litellm_to_list(embeds)
         except Exception as e:
             raise ValueError(
                 f"{self.type.capitalize()} API call failed. Error: {e}"
@@ -1,7 +1,7 @@
 import os
 from asyncio import sleep as asleep
 from time import sleep
-from typing import Any, List, Optional, Union
+from typing import Any, List, Optional, Tuple, Union
 
 import openai
 import tiktoken
@@ -10,7 +10,7 @@ from openai._types import NotGiven
 from openai.types import CreateEmbeddingResponse
 from pydantic import PrivateAttr
 
-from semantic_router.encoders import DenseEncoder
+from semantic_router.encoders.remote import RemoteDenseEncoder
 from semantic_router.schema import EncoderInfo
 from semantic_router.utils.defaults import EncoderDefault
 from semantic_router.utils.logger import logger
@@ -34,12 +34,14 @@ model_configs = {
 }
 
 
-class OpenAIEncoder(DenseEncoder):
+class OpenAIEncoder(RemoteDenseEncoder):
     """OpenAI encoder class for generating embeddings using OpenAI API.
 
-    The OpenAIEncoder class is a subclass of DenseEncoder and utilizes the OpenAI API
-    to generate embeddings for given documents. It requires an OpenAI API key and
+    The OpenAIEncoder class is a subclass of RemoteDenseEncoder and utilizes the OpenAI
+    API to generate embeddings for given documents. It requires an OpenAI API key and
     supports customization of the score threshold for filtering or processing the embeddings.
+    Large inputs are split into batches bounded by item count and tiktoken token totals
+    and sent concurrently under optional requests and tokens per minute budgets.
     """
 
     _client: Optional[openai.Client] = PrivateAttr(default=None)
@@ -49,6 +51,8 @@ class OpenAIEncoder(DenseEncoder):
     _token_encoder: Any = PrivateAttr()
     type: str = "openai"
     max_retries: int = 3
+    max_batch_size: int = 2048
+    max_batch_tokens: Optional[int] = 300_000
 
     def __init__(
         self,
@@ -59,6 +63,9 @@ class OpenAIEncoder(DenseEncoder):
         score_threshold: Optional[float] = None,
         dimensions: Union[int, NotGiven] = NotGiven(),
         max_retries: int = 3,
+        max_concurrency: int = 4,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
     ):
         """Initialize the OpenAIEncoder.
 
@@ -76,6 +83,12 @@ class OpenAIEncoder(DenseEncoder):
         :type dimensions: int
         :param max_retries: The maximum number of retries for the OpenAI API call.
         :type max_retries: int
+        :param max_concurrency: The maximum number of batches sent at the same time.
+        :type max_concurrency: int
+        :param requests_per_minute: An optional requests per minute budget.
+        :type requests_per_minute: Optional[int]
+        :param tokens_per_minute: An optional tokens per minute budget.
+        :type tokens_per_minute: Optional[int]
         """
         if name is None:
             name = EncoderDefault.OPENAI.value["embedding_model"]
@@ -91,6 +104,9 @@ class OpenAIEncoder(DenseEncoder):
         super().__init__(
             name=name,
             score_threshold=set_score_threshold,
+            max_concurrency=max_concurrency,
+            requests_per_minute=requests_per_minute,
+            tokens_per_minute=tokens_per_minute,
         )
         api_key = openai_api_key or os.getenv("OPENAI_API_KEY")
         base_url = openai_base_url or os.getenv("OPENAI_BASE_URL")
@@ -119,7 +135,9 @@ class OpenAIEncoder(DenseEncoder):
         self._token_encoder = tiktoken.encoding_for_model(name)
 
     def __call__(self, docs: List[str], truncate: bool = True) -> List[List[float]]:
-        """Encode a list of text documents into embeddings using OpenAI API.
+        """Encode a list of text documents into embeddings using OpenAI API. Documents
+        are sent in concurrent batches bounded by `max_batch_size` items and
+        `max_batch_tokens` tokens.
 
         :param docs: List of text documents to encode.
         :param truncate: Whether to truncate the documents to token limit. If
@@ -128,28 +146,40 @@ class OpenAIEncoder(DenseEncoder):
         :return: List of embeddings for each document."""
         if self._client is None:
             raise ValueError("OpenAI client is not initialized.")
-        embeds = None
+        docs, token_counts = self._prepare_docs(docs, truncate=truncate)
+        return self._encode_batches(docs, token_counts)
+
+    def _embed_batch(self, docs: List[str]) -> List[List[float]]:
+        """Embed a single batch of documents, retrying with jittered exponential
+        backoff on OpenAI errors.
 
-        if truncate:
-            # check if any document exceeds token limit and truncate if so
-            docs = [self._truncate(doc) for doc in docs]
+        :param docs: The batch of documents to embed.
+        :type docs: List[str]
+        :return: The embeddings for the batch.
+        :rtype: List[List[float]]
+        """
+        if self._client is None:
+            raise ValueError("OpenAI client is not initialized.")
+        embeds = None
 
         # Exponential backoff
         for j in range(self.max_retries + 1):
             try:
-                embeds = self._client.embeddings.create(
-                    input=docs,
-                    model=self.name,
-                    dimensions=self.dimensions,
-                )
+                with self._request_slot():
+                    embeds = self._client.embeddings.create(
+                        input=docs,
+                        model=self.name,
+                        dimensions=self.dimensions,
+                    )
                 if embeds.data:
                     break
             except OpenAIError as e:
                 logger.error("Exception occurred", exc_info=True)
                 if self.max_retries != 0 and j < self.max_retries:
-                    sleep(2**j)
+                    delay = self._retry_delay(j, e)
+                    sleep(delay)
                     logger.warning(
-                        f"Retrying in {2**j} seconds due to OpenAIError: {e}"
+                        f"Retrying in {delay:.2f} seconds due to OpenAIError: {e}"
                     )
                 else:
                     raise
@@ -169,28 +199,40 @@ class OpenAIEncoder(DenseEncoder):
         embeddings = [embeds_obj.embedding for embeds_obj in embeds.data]
         return embeddings
 
-    def _truncate(self, text: str) -> str:
-        """Truncate a document to the token limit.
+    def _prepare_docs(
+        self, docs: List[str], truncate: bool = True
+    ) -> Tuple[List[str], List[int]]:
+        """Tokenize all documents in one pass, truncating any document over the token
+        limit when `truncate` is set. The token counts are used to build batches
+        and to charge the tokens per minute budget.
 
-        :param text: The document to truncate.
-        :type text: str
-        :return: The truncated document.
-        :rtype: str
+        :param docs: The documents to prepare.
+        :type docs: List[str]
+        :param truncate: Whether to truncate documents to the token limit.
+        :type truncate: bool
+        :return: The prepared documents and the number of tokens in each.
+        :rtype: Tuple[List[str], List[int]]
         """
         # we use encode_ordinary as faster equivalent to encode(text, disallowed_special=())
-        tokens = self._token_encoder.encode_ordinary(text)
-        if len(tokens) > self.token_limit:
-            logger.warning(
-                f"Document exceeds token limit: {len(tokens)} > {self.token_limit}"
-                "\nTruncating document..."
-            )
-            text = self._token_encoder.decode(tokens[: self.token_limit - 1])
-            logger.info(f"Trunc length: {len(self._token_encoder.encode(text))}")
-            return text
-        return text
+        all_tokens = self._token_encoder.encode_ordinary_batch(docs)
+        prepared: List[str] = []
+        token_counts: List[int] = []
+        for doc, tokens in zip(docs, all_tokens):
+            if truncate and len(tokens) > self.token_limit:
+                logger.warning(
+                    f"Document exceeds token limit: {len(tokens)} > {self.token_limit}"
+                    "\nTruncating document..."
+                )
+                tokens = tokens[: self.token_limit - 1]
+                doc = self._token_encoder.decode(tokens)
+            prepared.append(doc)
+            token_counts.append(len(tokens))
+        return prepared, token_counts
 
     async def acall(self, docs: List[str], truncate: bool = True) -> List[List[float]]:
         """Encode a list of text documents into embeddings using OpenAI API asynchronously.
+        Documents are sent in concurrent batches bounded by `max_batch_size` items and
+        `max_batch_tokens` tokens.
 
         :param docs: List of text documents to encode.
         :param truncate: Whether to truncate the documents to token limit. If
@@ -199,28 +241,40 @@ class OpenAIEncoder(DenseEncoder):
         :return: List of embeddings for each document."""
         if self._async_client is None:
             raise ValueError("OpenAI async client is not initialized.")
-        embeds = None
+        docs, token_counts = self._prepare_docs(docs, truncate=truncate)
+        return await self._aencode_batches(docs, token_counts)
 
-        if truncate:
-            # check if any document exceeds token limit and truncate if so
-            docs = [self._truncate(doc) for doc in docs]
+    async def _aembed_batch(self, docs: List[str]) -> List[List[float]]:
+        """Embed a single batch of documents asynchronously, retrying with jittered
+        exponential backoff on OpenAI errors.
+
+        :param docs: The batch of documents to embed.
+        :type docs: List[str]
+        :return: The embeddings for the batch.
+        :rtype: List[List[float]]
+        """
+        if self._async_client is None:
+            raise ValueError("OpenAI async client is not initialized.")
+        embeds = None
 
         # Exponential backoff
         for j in range(self.max_retries + 1):
             try:
-                embeds = await self._async_client.embeddings.create(
-                    input=docs,
-                    model=self.name,
-                    dimensions=self.dimensions,
-                )
+                async with self._arequest_slot():
+                    embeds = await self._async_client.embeddings.create(
+                        input=docs,
+                        model=self.name,
+                        dimensions=self.dimensions,
+                    )
                 if embeds.data:
                     break
             except OpenAIError as e:
                 logger.error("Exception occurred", exc_info=True)
                 if self.max_retries != 0 and j < self.max_retries:
-                    await asleep(2**j)
+                    delay = self._retry_delay(j, e)
+                    await asleep(delay)
                     logger.warning(
-                        f"Retrying in {2**j} seconds due to OpenAIError: {e}"
+                        f"Retrying in {delay:.2f} seconds due to OpenAIError: {e}"
                     )
                 else:
                     raise
@@ -0,0 +1,428 @@
+import asyncio
+import time
+from asyncio import sleep as asleep
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from time import sleep
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, List, Optional
+
+import aiohttp
+import requests
+from pydantic import PrivateAttr
+
+from semantic_router.encoders.base import DenseEncoder
+from semantic_router.utils.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    get_concurrency_limiter,
+)
+from semantic_router.utils.logger import logger
+from semantic_router.utils.rate_limit import (
+    RateLimiter,
+    get_retry_after,
+    get_status_code,
+    jittered_backoff,
+)
+
+
+class RemoteDenseEncoder(DenseEncoder):
+    """Base class for dense encoders that call a remote embedding API.
+
+    Documents are split into batches bounded by `max_batch_size` items and, where
+    the subclass can count tokens, `max_batch_tokens` tokens. Batches are sent
+    concurrently, at most `max_concurrency` at a time, under optional requests per
+    minute and tokens per minute budgets. Embeddings are returned in input order.
+
+    Subclasses implement `_embed_batch` and `_aembed_batch` to embed a single batch,
+    and may implement `_count_tokens` to enable token-aware batching. Requests can be
+    wrapped in `_with_retries` to retry rate limited (429), server (5xx) and
+    connection errors. A 429 pauses every batch of the encoder, honouring any
+    Retry-After header, so that concurrent batches do not keep hitting the limit.
+    Encoders calling HTTP endpoints directly should use the pooled sessions from
+    `_get_session` and `_get_async_session`.
+
+    With `adaptive_concurrency` enabled, every request also holds a slot of an
+    adaptive concurrency limiter shared by all encoders of the same provider, which
+    shrinks the number of requests in flight when the provider starts throttling
+    and grows it again while requests succeed. The limit is shared by the whole
+    process: it starts at 8 requests in flight per provider and grows up to 64.
+    """
+
+    max_batch_size: int = 100
+    max_batch_tokens: Optional[int] = None
+    max_concurrency: int = 4
+    max_retries: int = 3
+    adaptive_concurrency: bool = True
+    requests_per_minute: Optional[int] = None
+    tokens_per_minute: Optional[int] = None
+
+    _rate_limiter: Optional[RateLimiter] = PrivateAttr(default=None)
+    _throttled_until: float = PrivateAttr(default=0.0)
+    _session: Optional[requests.Session] = PrivateAttr(default=None)
+    _async_session: Optional[aiohttp.ClientSession] = PrivateAttr(default=None)
+
+    def _count_tokens(self, docs: List[Any]) -> Optional[List[int]]:
+        """Count the tokens in each document. Returns None when the encoder cannot
+        count tokens, in which case batches are bounded by item count only.
+
+        :param docs: The documents to count tokens for.
+        :type docs: List[Any]
+        :return: The number of tokens in each document, or None.
+        :rtype: Optional[List[int]]
+        """
+        return None
+
+    def _embed_batch(self, docs: List[Any]) -> List[List[float]]:
+        """Embed a single batch of documents.
+
+        :param docs: The batch of documents to embed.
+        :type docs: List[Any]
+        :return: The embeddings for the batch, in the same order as the documents.
+        :rtype: List[List[float]]
+        """
+        raise NotImplementedError("Subclasses must implement this method")
+
+    async def _aembed_batch(self, docs: List[Any]) -> List[List[float]]:
+        """Embed a single batch of documents asynchronously.
+
+        :param docs: The batch of documents to embed.
+        :type docs: List[Any]
+        :return: The embeddings for the batch, in the same order as the documents.
+        :rtype: List[List[float]]
+        """
+        raise NotImplementedError("Subclasses must implement this method")
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Get the jittered delay before retrying after the given failed attempt.
+
+        :param attempt: The zero-based number of the attempt that failed.
+        :type attempt: int
+        :return: The delay in seconds.
+        :rtype: float
+        """
+        return jittered_backoff(attempt)
+
+    def _is_rate_limited(self, error: BaseException) -> bool:
+        """Check whether an error means the provider is throttling requests.
+
+        :param error: The error raised by the request.
+        :type error: BaseException
+        :return: True if the request was rate limited.
+        :rtype: bool
+        """
+        return (
+            get_status_code(error) == 429 or "ratelimit" in type(error).__name__.lower()
+        )
+
+    def _is_retryable(self, error: BaseException) -> bool:
+        """Check whether a failed request should be retried. Rate limits, server
+        errors, timeouts and connection errors are retried, client errors are not.
+
+        :param error: The error raised by the request.
+        :type error: BaseException
+        :return: True if the request should be retried.
+        :rtype: bool
+        """
+        if self._is_rate_limited(error):
+            return True
+        status = get_status_code(error)
+        if status is not None:
+            return status >= 500
+        return isinstance(
+            error,
+            (
+                ConnectionError,
+                TimeoutError,
+                asyncio.TimeoutError,
+                aiohttp.ClientConnectionError,
+                requests.ConnectionError,
+                requests.Timeout,
+            ),
+        )
+
+    def _retry_delay(self, attempt: int, error: BaseException) -> float:
+        """Get the delay before retrying a failed request. Rate limited requests
+        wait at least as long as the provider's Retry-After header asks for, and
+        pause all other batches of this encoder for the same time.
+
+        :param attempt: The zero-based number of the attempt that failed.
+        :type attempt: int
+        :param error: The error raised by the request.
+        :type error: BaseException
+        :return: The delay in seconds.
+        :rtype: float
+        """
+        delay = self._backoff_delay(attempt)
+        if self._is_rate_limited(error):
+            retry_after = get_retry_after(error)
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+            self._throttled_until = max(self._throttled_until, time.monotonic() + delay)
+        return delay
+
+    def _throttle_delay(self) -> float:
+        """Get the time left before this encoder may send requests again after
+        being rate limited.
+
+        :return: The delay in seconds, zero if the encoder is not throttled.
+        :rtype: float
+        """
+        return max(0.0, self._throttled_until - time.monotonic())
+
+    def _get_concurrency_limiter(self) -> AdaptiveConcurrencyLimiter:
+        """Get the adaptive concurrency limiter shared by all encoders of this
+        provider.
+
+        :return: The shared limiter.
+        :rtype: AdaptiveConcurrencyLimiter
+        """
+        return get_concurrency_limiter(f"encoder/{self.type}")
+
+    @contextmanager
+    def _request_slot(self) -> Iterator[None]:
+        """Hold a slot of the provider's adaptive concurrency limiter for the
+        duration of a single request, if adaptive concurrency is enabled.
+        """
+        if not self.adaptive_concurrency:
+            yield
+            return
+        with self._get_concurrency_limiter().slot():
+            yield
+
+    @asynccontextmanager
+    async def _arequest_slot(self) -> AsyncIterator[None]:
+        """Hold a slot of the provider's adaptive concurrency limiter for the
+        duration of a single async request, if adaptive concurrency is enabled.
+        """
+        if not self.adaptive_concurrency:
+            yield
+            return
+        async with self._get_concurrency_limiter().aslot():
+            yield
+
+    def _with_retries(self, fn: Callable[[List[Any]], Any], docs: List[Any]) -> Any:
+        """Call `fn` with a batch of documents, retrying retryable errors with
+        jittered exponential backoff up to `max_retries` times. Each attempt holds a
+        slot of the provider's adaptive concurrency limiter.
+
+        :param fn: The function sending the request.
+        :type fn: Callable[[List[Any]], Any]
+        :param docs: The batch of documents.
+        :type docs: List[Any]
+        :return: The value returned by `fn`.
+        :rtype: Any
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                with self._request_slot():
+                    return fn(docs)
+            except Exception as e:
+                if attempt >= self.max_retries or not self._is_retryable(e):
+                    raise
+                delay = self._retry_delay(attempt, e)
+                logger.warning(
+                    f"{self.type} request failed, retrying in {delay:.2f} seconds. "
+                    f"Error: {e}"
+                )
+                sleep(delay)
+
+    async def _awith_retries(
+        self, fn: Callable[[List[Any]], Awaitable[Any]], docs: List[Any]
+    ) -> Any:
+        """Await `fn` with a batch of documents, retrying retryable errors with
+        jittered exponential backoff up to `max_retries` times. Each attempt holds a
+        slot of the provider's adaptive concurrency limiter.
+
+        :param fn: The coroutine function sending the request.
+        :type fn: Callable[[List[Any]], Awaitable[Any]]
+        :param docs: The batch of documents.
+        :type docs: List[Any]
+        :return: The value returned by `fn`.
+        :rtype: Any
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with self._arequest_slot():
+                    return await fn(docs)
+            except Exception as e:
+                if attempt >= self.max_retries or not self._is_retryable(e):
+                    raise
+                delay = self._retry_delay(attempt, e)
+                logger.warning(
+                    f"{self.type} request failed, retrying in {delay:.2f} seconds. "
+                    f"Error: {e}"
+                )
+                await asleep(delay)
+
+    def _get_session(self) -> requests.Session:
+        """Get the pooled HTTP session used for synchronous requests, creating it on
+        first use.
+
+        :return: The HTTP session.
+        :rtype: requests.Session
+        """
+        if self._session is None:
+            self._session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=1, pool_maxsize=max(self.max_concurrency, 1)
+            )
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
+        return self._session
+
+    def _get_async_session(self) -> aiohttp.ClientSession:
+        """Get the pooled HTTP session used for asynchronous requests, creating it on
+        first use or when the previous session was closed or belonged to another
+        event loop.
+
+        :return: The HTTP session.
+        :rtype: aiohttp.ClientSession
+        """
+        session = self._async_session
+        if (
+            session is None
+            or session.closed
+            or session._loop is not asyncio.get_running_loop()
+        ):
+            self._async_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=max(self.max_concurrency, 1))
+            )
+        return self._async_session  # type: ignore
+
+    def close(self):
+        """Close the pooled synchronous HTTP session, if one was opened."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    async def aclose(self):
+        """Close the pooled HTTP sessions, if any were opened."""
+        self.close()
+        if self._async_session is not None and not self._async_session.closed:
+            await self._async_session.close()
+        self._async_session = None
+
+    def _get_rate_limiter(self) -> Optional[RateLimiter]:
+        """Get the rate limiter for this encoder, creating it on first use if a
+        requests or tokens per minute budget is set.
+
+        :return: The rate limiter, or None if no budget is set.
+        :rtype: Optional[RateLimiter]
+        """
+        if self._rate_limiter is None and (
+            self.requests_per_minute or self.tokens_per_minute
+        ):
+            self._rate_limiter = RateLimiter(
+                requests_per_minute=self.requests_per_minute,
+                tokens_per_minute=self.tokens_per_minute,
+            )
+        return self._rate_limiter
+
+    def _split_batches(
+        self, docs: List[Any], token_counts: Optional[List[int]] = None
+    ) -> List[List[int]]:
+        """Split documents into batches of indices, each holding at most
+        `max_batch_size` documents and, when token counts are given, at most
+        `max_batch_tokens` tokens. A single document over the token bound is sent
+        in a batch of its own.
+
+        :param docs: The documents to split.
+        :type docs: List[Any]
+        :param token_counts: The number of tokens in each document.
+        :type token_counts: Optional[List[int]]
+        :return: The batches, as lists of document indices.
+        :rtype: List[List[int]]
+        """
+        batches: List[List[int]] = []
+        current: List[int] = []
+        current_tokens = 0
+        for i in range(len(docs)):
+            tokens = token_counts[i] if token_counts is not None else 0
+            over_tokens = (
+                self.max_batch_tokens is not None
+                and token_counts is not None
+                and current_tokens + tokens > self.max_batch_tokens
+            )
+            if current and (len(current) >= self.max_batch_size or over_tokens):
+                batches.append(current)
+                current = []
+                current_tokens = 0
+            current.append(i)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    def _encode_batches(
+        self,
+        docs: List[Any],
+        token_counts: Optional[List[int]] = None,
+        embed_fn: Optional[Callable[[List[Any]], List[List[float]]]] = None,
+    ) -> List[List[float]]:
+        """Embed documents in concurrent batches using a thread pool.
+
+        :param docs: The documents to embed.
+        :type docs: List[Any]
+        :param token_counts: The number of tokens in each document.
+        :type token_counts: Optional[List[int]]
+        :param embed_fn: The function embedding a single batch, defaults to
+            `_embed_batch`.
+        :type embed_fn: Optional[Callable[[List[Any]], List[List[float]]]]
+        :return: The embeddings, in the same order as the documents.
+        :rtype: List[List[float]]
+        """
+        batches = self._split_batches(docs, token_counts)
+        rate_limiter = self._get_rate_limiter()
+        embed_batch = embed_fn or self._embed_batch
+
+        def embed(batch: List[int]) -> List[List[float]]:
+            if (wait := self._throttle_delay()) > 0:
+                sleep(wait)
+            if rate_limiter is not None:
+                tokens = sum(token_counts[i] for i in batch) if token_counts else 0
+                rate_limiter.acquire(tokens)
+            return embed_batch([docs[i] for i in batch])
+
+        if len(batches) <= 1 or self.max_concurrency <= 1:
+            results = [embed(batch) for batch in batches]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_concurrency, len(batches))
+            ) as executor:
+                results = list(executor.map(embed, batches))
+        return [embedding for result in results for embedding in result]
+
+    async def _aencode_batches(
+        self,
+        docs: List[Any],
+        token_counts: Optional[List[int]] = None,
+        embed_fn: Optional[Callable[[List[Any]], Awaitable[List[List[float]]]]] = None,
+    ) -> List[List[float]]:
+        """Embed documents in concurrent batches asynchronously.
+
+        :param docs: The documents to embed.
+        :type docs: List[Any]
+        :param token_counts: The number of tokens in each document.
+        :type token_counts: Optional[List[int]]
+        :param embed_fn: The coroutine function embedding a single batch, defaults to
+            `_aembed_batch`.
+        :type embed_fn: Optional[Callable[[List[Any]], Awaitable[List[List[float]]]]]
+        :return: The embeddings, in the same order as the documents.
+        :rtype: List[List[float]]
+        """
+        batches = self._split_batches(docs, token_counts)
+        rate_limiter = self._get_rate_limiter()
+        semaphore = asyncio.Semaphore(max(self.max_concurrency, 1))
+        embed_batch = embed_fn or self._aembed_batch
+
+        async def embed(batch: List[int]) -> List[List[float]]:
+            async with semaphore:
+                if (wait := self._throttle_delay()) > 0:
+                    await asleep(wait)
+                if rate_limiter is not None:
+                    tokens = sum(token_counts[i] for i in batch) if token_counts else 0
+                    await rate_limiter.aacquire(tokens)
+                return await embed_batch([docs[i] for i in batch])
+
+        # gather preserves the order of the batches
+        results = await asyncio.gather(*[embed(batch) for batch in batches])
+        return [embedding for result in results for embedding in result]
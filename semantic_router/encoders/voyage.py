@@ -1,8 +1,8 @@
 """This file contains the VoyageEncoder class which is used to encode text using Voyage"""
 
-import litellm
+from typing import ClassVar
 
-from semantic_router.encoders.litellm import LiteLLMEncoder, litellm_to_list
+from semantic_router.encoders.litellm import LiteLLMEncoder
 from semantic_router.utils.defaults import EncoderDefault
 
 
@@ -11,6 +11,8 @@ class VoyageEncoder(LiteLLMEncoder):
     https://voyageai.com/api-keys/"""
 
     type: str = "voyage"
+    query_input_type: ClassVar[str | None] = "query"
+    document_input_type: ClassVar[str | None] = "document"
 
     def __init__(
         self,
@@ -35,51 +37,3 @@ class VoyageEncoder(LiteLLMEncoder):
             score_threshold=score_threshold,
             api_key=api_key,
         )
-
-    def encode_queries(self, docs: list[str], **kwargs) -> list[list[float]]:
-        try:
-            embeds = litellm.embedding(
-                input=docs,
-                input_type="query",
-                model=f"{self.type}/{self.name}",
-                **kwargs,
-            )
-            return litellm_to_list(embeds)
-        except Exception as e:
-            raise ValueError(f"Voyage API call failed. Error: {e}") from e
-
-    def encode_documents(self, docs: list[str], **kwargs) -> list[list[float]]:
-        try:
-            embeds = litellm.embedding(
-                input=docs,
-                input_type="document",
-                model=f"{self.type}/{self.name}",
-                **kwargs,
-            )
-            return litellm_to_list(embeds)
-        except Exception as e:
-            raise ValueError(f"Voyage API call failed. Error: {e}") from e
-
-    async def aencode_queries(self, docs: list[str], **kwargs) -> list[list[float]]:
-        try:
-            embeds = await litellm.aembedding(
-                input=docs,
-                input_type="query",
-                model=f"{self.type}/{self.name}",
-                **kwargs,
-            )
-            return litellm_to_list(embeds)
-        except Exception as e:
-            raise ValueError(f"Voyage API call failed. Error: {e}") from e
-
-    async def aencode_documents(self, docs: list[str], **kwargs) -> list[list[float]]:
-        try:
-            embeds = await litellm.aembedding(
-                input=docs,
-                input_type="document",
-                model=f"{self.type}/{self.name}",
-                **kwargs,
-            )
-            return litellm_to_list(embeds)
-        except Exception as e:
-            raise ValueError(f"Voyage API call failed. Error: {e}") from e
@@ -35,6 +35,8 @@ class BaseIndex(BaseModel):
     type: str = "base"
     init_async_index: bool = False
     index: Optional[Any] = None
+    # the number of batches that can be added concurrently during bulk ingestion
+    write_concurrency: ClassVar[int] = 1
 
     def add(
         self,
@@ -94,40 +96,55 @@ class BaseIndex(BaseModel):
             **kwargs,
         )
 
-    def get_utterances(self, include_metadata: bool = False) -> List[Utterance]:
+    def get_utterances(
+        self, include_metadata: bool = False, routes: Optional[List[str]] = None
+    ) -> List[Utterance]:
         """Gets a list of route and utterance objects currently stored in the
         index, including additional metadata.
 
         :param include_metadata: Whether to include function schemas and metadata in
         the returned Utterance objects.
         :type include_metadata: bool
+        :param routes: The routes to get the utterances of, all routes if None.
+        :type routes: Optional[List[str]]
         :return: A list of Utterance objects.
         :rtype: List[Utterance]
         """
         if self.index is None:
             logger.warning("Index is None, could not retrieve utterances.")
             return []
-        _, metadata = self._get_all(include_metadata=True)  # include_metadata required
+        if routes is None:
+            # include_metadata required
+            _, metadata = self._get_all(include_metadata=True)
+        else:
+            metadata = self._get_routes_metadata(routes)
         route_tuples = parse_route_info(metadata=metadata)
         if not include_metadata:
             # we remove the metadata from the tuples (ie only keep 0, 1 items)
             route_tuples = [x[:2] for x in route_tuples]
         return [Utterance.from_tuple(x) for x in route_tuples]
 
-    async def aget_utterances(self, include_metadata: bool = False) -> List[Utterance]:
+    async def aget_utterances(
+        self, include_metadata: bool = False, routes: Optional[List[str]] = None
+    ) -> List[Utterance]:
         """Gets a list of route and utterance objects currently stored in the
         index, including additional metadata.
 
         :param include_metadata: Whether to include function schemas and metadata in
         the returned Utterance objects.
         :type include_metadata: bool
+        :param routes: The routes to get the utterances of, all routes if None.
+        :type routes: Optional[List[str]]
         :return: A list of Utterance objects.
         :rtype: List[Utterance]
         """
         if self.index is None:
             logger.warning("Index is None, could not retrieve utterances.")
             return []
-        _, metadata = await self._async_get_all(include_metadata=True)
+        if routes is None:
+            _, metadata = await self._async_get_all(include_metadata=True)
+        else:
+            metadata = await self._async_get_routes_metadata(routes)
         route_tuples = parse_route_info(metadata=metadata)
         if not include_metadata:
             # we remove the metadata from the tuples (ie only keep 0, 1 items)
@@ -182,6 +199,31 @@ class BaseIndex(BaseModel):
         logger.warning("Async method not implemented.")
         return self._remove_and_sync(routes_to_delete=routes_to_delete)
 
+    def update_metadata(self, utterances: List[Utterance]) -> List[Utterance]:
+        """Update the function schemas and metadata of utterances already stored in
+        the index, keeping their embeddings. Indexes that cannot update records in
+        place return the utterances, which must then be removed and added again.
+
+        :param utterances: The utterances with their new function schemas and
+            metadata.
+        :type utterances: List[Utterance]
+        :return: The utterances that were not updated.
+        :rtype: List[Utterance]
+        """
+        return utterances
+
+    async def aupdate_metadata(self, utterances: List[Utterance]) -> List[Utterance]:
+        """Update the function schemas and metadata of utterances already stored in
+        the index asynchronously, keeping their embeddings.
+
+        :param utterances: The utterances with their new function schemas and
+            metadata.
+        :type utterances: List[Utterance]
+        :return: The utterances that were not updated.
+        :rtype: List[Utterance]
+        """
+        return self.update_metadata(utterances)
+
     def delete(self, route_name: str):
         """Deletes route by route name.
         This method should be implemented by subclasses.
@@ -213,6 +255,17 @@ class BaseIndex(BaseModel):
         """
         raise NotImplementedError("This method should be implemented by subclasses.")
 
+    def _copy_for_write(self) -> "BaseIndex":
+        """Copy the index for a router write, so that changing the copy leaves the
+        index queries are served from untouched. Remote indexes keep their records
+        on the server, so the copy shares the clients of the index. Local indexes
+        share their arrays, as writes replace them rather than change them in place.
+
+        :return: The index copy.
+        :rtype: BaseIndex
+        """
+        return self.model_copy()
+
     def is_ready(self) -> bool:
         """Checks if the index is ready to be used.
         This method should be implemented by subclasses.
@@ -268,6 +321,34 @@ class BaseIndex(BaseModel):
         """
         raise NotImplementedError("This method should be implemented by subclasses.")
 
+    async def aquery_batch(
+        self,
+        vectors: np.ndarray,
+        top_k: int = 5,
+        route_filter: Optional[List[str]] = None,
+    ) -> List[Tuple[np.ndarray, List[str]]]:
+        """Search the index for several query vectors at once. The default sends the
+        queries concurrently, subclasses with a batch search should override it.
+
+        :param vectors: The vectors to search for, one per row.
+        :type vectors: np.ndarray
+        :param top_k: The number of results to return per vector.
+        :type top_k: int
+        :param route_filter: The routes to filter the search by.
+        :type route_filter: Optional[List[str]]
+        :return: The scores and route names of each vector, in the order of the
+            vectors.
+        :rtype: List[Tuple[np.ndarray, List[str]]]
+        """
+        return list(
+            await asyncio.gather(
+                *[
+                    self.aquery(vector=vector, top_k=top_k, route_filter=route_filter)
+                    for vector in vectors
+                ]
+            )
+        )
+
     def aget_routes(self):
         """
         Asynchronously get a list of route and utterance objects currently stored in the index.
@@ -375,6 +456,28 @@ class BaseIndex(BaseModel):
         """
         return await self._async_read_config(field="sr_hash")
 
+    def _read_route_hashes(self, shard: int = 0) -> ConfigParameter:
+        """Read the per-route hashes of the previously written index.
+
+        :param shard: The record of the route hashes to read, defaults to the first
+            record which holds the number of records.
+        :type shard: int
+        :return: The config parameter that was read.
+        :rtype: ConfigParameter
+        """
+        return self._read_config(field=route_hashes_field(shard))
+
+    async def _async_read_route_hashes(self, shard: int = 0) -> ConfigParameter:
+        """Read the per-route hashes of the previously written index asynchronously.
+
+        :param shard: The record of the route hashes to read, defaults to the first
+            record which holds the number of records.
+        :type shard: int
+        :return: The config parameter that was read.
+        :rtype: ConfigParameter
+        """
+        return await self._async_read_config(field=route_hashes_field(shard))
+
     def _is_locked(self, scope: str | None = None) -> bool:
         """Check if the index is locked for a given scope (if applicable).
 
@@ -500,6 +603,34 @@ class BaseIndex(BaseModel):
         """
         raise NotImplementedError("This method should be implemented by subclasses.")
 
+    def _get_routes_metadata(self, routes: List[str]) -> List[Dict[str, Any]]:
+        """Retrieves the metadata of the records of the given routes. Filters the
+        metadata of all records by default, indexes able to retrieve the records of
+        a single route should override this.
+
+        :param routes: The routes to retrieve the metadata of.
+        :type routes: List[str]
+        :return: A list of metadata dictionaries.
+        :rtype: List[Dict[str, Any]]
+        """
+        _, metadata = self._get_all(include_metadata=True)
+        route_set = set(routes)
+        return [x for x in metadata if x.get("sr_route") in route_set]
+
+    async def _async_get_routes_metadata(
+        self, routes: List[str]
+    ) -> List[Dict[str, Any]]:
+        """Retrieves the metadata of the records of the given routes asynchronously.
+
+        :param routes: The routes to retrieve the metadata of.
+        :type routes: List[str]
+        :return: A list of metadata dictionaries.
+        :rtype: List[Dict[str, Any]]
+        """
+        _, metadata = await self._async_get_all(include_metadata=True)
+        route_set = set(routes)
+        return [x for x in metadata if x.get("sr_route") in route_set]
+
     async def _async_get_routes(self) -> List[Tuple]:
         """Asynchronously gets a list of route and utterance objects currently
         stored in the index, including additional metadata.
@@ -547,3 +678,14 @@ def parse_route_info(metadata: List[Dict[str, Any]]) -> List[Tuple]:
             (sr_route, sr_utterance, sr_function_schema, additional_metadata)
         )
     return route_info
+
+
+def route_hashes_field(shard: int) -> str:
+    """Get the config field of a record of the route hashes.
+
+    :param shard: The record of the route hashes.
+    :type shard: int
+    :return: The config field of the record.
+    :rtype: str
+    """
+    return "sr_route_hashes" if shard == 0 else f"sr_route_hashes_{shard}"
@@ -67,22 +67,35 @@ class HybridLocalIndex(LocalIndex):
         else:
             # TODO: we should probably switch to an `upsert` method and standardize elsewhere
             self.index = np.concatenate([self.index, embeds])
-            self.sparse_index.extend([x.to_dict() for x in sparse_embeddings])
+            # a new list rather than extending, as copies of the index share it
+            self.sparse_index = self.sparse_index + [
+                x.to_dict() for x in sparse_embeddings
+            ]
             self.routes = np.concatenate([self.routes, routes_arr])
             self.utterances = np.concatenate([self.utterances, utterances_arr])
 
-    def get_utterances(self, include_metadata: bool = False) -> List[Utterance]:
+    def get_utterances(
+        self, include_metadata: bool = False, routes: Optional[List[str]] = None
+    ) -> List[Utterance]:
         """Gets a list of route and utterance objects currently stored in the index.
 
         :param include_metadata: Whether to include function schemas and metadata in
         the returned Utterance objects - HybridLocalIndex doesn't include metadata so
         this parameter is ignored.
         :type include_metadata: bool
+        :param routes: The routes to get the utterances of, all routes if None.
+        :type routes: Optional[List[str]]
         :return: A list of Utterance objects.
         :rtype: List[Utterance]
         """
         if self.routes is None or self.utterances is None:
             return []
+        if routes is not None:
+            mask = np.isin(self.routes, routes)
+            return [
+                Utterance.from_tuple(x)
+                for x in zip(self.routes[mask], self.utterances[mask])
+            ]
         return [Utterance.from_tuple(x) for x in zip(self.routes, self.utterances)]
 
     def _sparse_dot_product(
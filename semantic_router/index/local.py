@@ -83,19 +83,42 @@ class LocalIndex(BaseIndex):
         # return what was removed
         return route_utterances[~mask]
 
-    def get_utterances(self, include_metadata: bool = False) -> List[Utterance]:
+    def get_utterances(
+        self, include_metadata: bool = False, routes: Optional[List[str]] = None
+    ) -> List[Utterance]:
         """Gets a list of route and utterance objects currently stored in the index.
 
         :param include_metadata: Whether to include function schemas and metadata in
         the returned Utterance objects - LocalIndex doesn't include metadata so this
         parameter is ignored.
+        :param routes: The routes to get the utterances of, all routes if None.
+        :type routes: Optional[List[str]]
         :return: A list of Utterance objects.
         :rtype: List[Utterance]
         """
         if self.routes is None or self.utterances is None:
             return []
+        if routes is not None:
+            mask = np.isin(self.routes, routes)
+            return [
+                Utterance.from_tuple(x)
+                for x in zip(self.routes[mask], self.utterances[mask])
+            ]
         return [Utterance.from_tuple(x) for x in zip(self.routes, self.utterances)]
 
+    def update_metadata(self, utterances: List[Utterance]) -> List[Utterance]:
+        """Update the function schemas and metadata of utterances already stored in
+        the index - LocalIndex doesn't store function schemas or metadata so there is
+        nothing to update.
+
+        :param utterances: The utterances with their new function schemas and
+            metadata.
+        :type utterances: List[Utterance]
+        :return: The utterances that were not updated, always empty.
+        :rtype: List[Utterance]
+        """
+        return []
+
     def describe(self) -> IndexConfig:
         """Describe the index.
 
@@ -136,24 +159,10 @@ class LocalIndex(BaseIndex):
         :return: A tuple containing the query vector and a list of route names.
         :rtype: Tuple[np.ndarray, List[str]]
         """
-        if self.index is None or self.routes is None:
-            raise ValueError("Index or routes are not populated.")
-        if route_filter is not None:
-            filtered_index = []
-            filtered_routes = []
-            for route, vec in zip(self.routes, self.index):
-                if route in route_filter:
-                    filtered_index.append(vec)
-                    filtered_routes.append(route)
-            if not filtered_routes:
-                raise ValueError("No routes found matching the filter criteria.")
-            sim = similarity_matrix(vector, np.array(filtered_index))
-            scores, idx = top_scores(sim, top_k)
-            route_names = [filtered_routes[i] for i in idx]
-        else:
-            sim = similarity_matrix(vector, self.index)
-            scores, idx = top_scores(sim, top_k)
-            route_names = [self.routes[i] for i in idx]
+        index, routes = self._get_filtered_index(route_filter)
+        sim = similarity_matrix(vector, index)
+        scores, idx = top_scores(sim, top_k)
+        route_names = [routes[i] for i in idx]
         return scores, route_names
 
     async def aquery(
@@ -176,25 +185,62 @@ class LocalIndex(BaseIndex):
         :return: A tuple containing the query vector and a list of route names.
         :rtype: Tuple[np.ndarray, List[str]]
         """
+        index, routes = self._get_filtered_index(route_filter)
+        sim = similarity_matrix(vector, index)
+        scores, idx = top_scores(sim, top_k)
+        route_names = [routes[i] for i in idx]
+        return scores, route_names
+
+    async def aquery_batch(
+        self,
+        vectors: np.ndarray,
+        top_k: int = 5,
+        route_filter: Optional[List[str]] = None,
+    ) -> List[Tuple[np.ndarray, List[str]]]:
+        """Search the index for several query vectors with a single matrix product.
+
+        :param vectors: The vectors to search for, one per row.
+        :type vectors: np.ndarray
+        :param top_k: The number of results to return per vector.
+        :type top_k: int
+        :param route_filter: The routes to filter the search by.
+        :type route_filter: Optional[List[str]]
+        :return: The scores and route names of each vector, in the order of the
+            vectors.
+        :rtype: List[Tuple[np.ndarray, List[str]]]
+        """
+        index, routes = self._get_filtered_index(route_filter)
+        vectors = np.atleast_2d(vectors)
+        # one column of similarities per query vector
+        sims = (index @ vectors.T) / (
+            np.linalg.norm(index, axis=1)[:, None]
+            * np.linalg.norm(vectors, axis=1)[None, :]
+        )
+        results = []
+        for sim in sims.T:
+            scores, idx = top_scores(sim, top_k)
+            results.append((scores, [routes[i] for i in idx]))
+        return results
+
+    def _get_filtered_index(
+        self, route_filter: Optional[List[str]]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the vectors and route names to search, restricted to the routes of
+        the filter if one is given.
+
+        :param route_filter: The routes to filter the search by.
+        :type route_filter: Optional[List[str]]
+        :return: The vectors and their route names.
+        :rtype: Tuple[np.ndarray, np.ndarray]
+        """
         if self.index is None or self.routes is None:
             raise ValueError("Index or routes are not populated.")
-        if route_filter is not None:
-            filtered_index = []
-            filtered_routes = []
-            for route, vec in zip(self.routes, self.index):
-                if route in route_filter:
-                    filtered_index.append(vec)
-                    filtered_routes.append(route)
-            if not filtered_routes:
-                raise ValueError("No routes found matching the filter criteria.")
-            sim = similarity_matrix(vector, np.array(filtered_index))
-            scores, idx = top_scores(sim, top_k)
-            route_names = [filtered_routes[i] for i in idx]
-        else:
-            sim = similarity_matrix(vector, self.index)
-            scores, idx = top_scores(sim, top_k)
-            route_names = [self.routes[i] for i in idx]
-        return scores, route_names
+        if route_filter is None:
+            return self.index, self.routes
+        mask = np.isin(self.routes, route_filter)
+        if not mask.any():
+            raise ValueError("No routes found matching the filter criteria.")
+        return self.index[mask], self.routes[mask]
 
     def aget_routes(self):
         """Get all routes from the index.
@@ -3,17 +3,43 @@ import hashlib
 import json
 import os
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from json.decoder import JSONDecodeError
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import aiohttp
 import numpy as np
 import requests
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from semantic_router.index.base import BaseIndex, IndexConfig
-from semantic_router.schema import ConfigParameter, SparseEmbedding
+from semantic_router.schema import ConfigParameter, SparseEmbedding, Utterance
 from semantic_router.utils.logger import logger
+from semantic_router.utils.rate_limit import (
+    get_retry_after,
+    get_status_code,
+    jittered_backoff,
+)
+
+# IDs are fetched in batches of one list page, as fetch requests send them in the
+# URL query string
+FETCH_BATCH_SIZE = 100
+# the maximum number of fetch requests running at once when retrieving metadata
+MAX_CONCURRENT_FETCHES = 8
+# the maximum number of IDs Pinecone accepts in a single delete request
+DELETE_BATCH_SIZE = 1000
+# the delay in seconds before the first retry of a failed write
+RETRY_BASE_DELAY = 0.5
 
 
 def clean_route_name(route_name: str) -> str:
@@ -137,7 +163,146 @@ class PineconeRecord(BaseModel):
         return d
 
 
+def _metadata_record(utterance: Utterance) -> PineconeRecord:
+    """Build the record of an utterance with its function schemas and metadata,
+    without values.
+    """
+    return PineconeRecord(
+        values=[],
+        route=utterance.route,
+        utterance=utterance.utterance,
+        function_schema=json.dumps(utterance.function_schemas),
+        metadata=dict(utterance.metadata),
+    )
+
+
+def _vector_dict(vector: Any) -> dict:
+    """Convert a vector returned by the Pinecone client to a dictionary."""
+    return vector.to_dict() if hasattr(vector, "to_dict") else dict(vector)
+
+
+def _batched(items: List[Any], batch_size: int = FETCH_BATCH_SIZE) -> List[List[Any]]:
+    """Split IDs or records into batches of at most `batch_size` items."""
+    return [items[i : i + batch_size] for i in range(0, len(items), batch_size)]
+
+
+def _stored_metadata(ids: List[str], vectors: Dict[str, Any]) -> List[dict]:
+    """Get the metadata of each ID from the fetched vectors, in the order of the
+    IDs, with empty metadata for IDs that are no longer stored.
+    """
+    metadata = []
+    for id in ids:
+        vector = vectors.get(id)
+        metadata.append(
+            (_vector_dict(vector).get("metadata") or {}) if vector is not None else {}
+        )
+    return metadata
+
+
+def _utterance_ids(
+    routes_to_delete: Dict[str, List[str]],
+    route_names: List[str],
+    remote_routes: List[List[dict]],
+) -> List[str]:
+    """Get the IDs of the records of the utterances to delete.
+
+    :param routes_to_delete: The utterances to delete of each route.
+    :type routes_to_delete: Dict[str, List[str]]
+    :param route_names: The routes whose records were listed.
+    :type route_names: List[str]
+    :param remote_routes: The records listed for each route, with their IDs.
+    :type remote_routes: List[List[dict]]
+    :return: The IDs of the records to delete.
+    :rtype: List[str]
+    """
+    ids: List[str] = []
+    for route, records in zip(route_names, remote_routes):
+        utterances = set(routes_to_delete[route])
+        ids.extend(
+            r["id"]
+            for r in records
+            if r["route"] == route and r["utterance"] in utterances
+        )
+    return ids
+
+
+def _is_retryable(error: BaseException) -> bool:
+    """Check whether a failed request should be retried. Rate limits, server errors,
+    timeouts and connection errors are retried, client errors are not.
+
+    :param error: The error raised by the request.
+    :type error: BaseException
+    :return: True if the request should be retried.
+    :rtype: bool
+    """
+    status = get_status_code(error)
+    if status is not None:
+        return status == 429 or status >= 500
+    return isinstance(
+        error,
+        (
+            ConnectionError,
+            TimeoutError,
+            asyncio.TimeoutError,
+            aiohttp.ClientConnectionError,
+            requests.ConnectionError,
+            requests.Timeout,
+        ),
+    )
+
+
+def _retry_delay(attempt: int, error: BaseException) -> float:
+    """Get the delay before retrying a failed request, waiting at least as long as
+    a rate limited response's Retry-After header asks for.
+
+    :param attempt: The zero-based number of the attempt that failed.
+    :type attempt: int
+    :param error: The error raised by the request.
+    :type error: BaseException
+    :return: The delay in seconds.
+    :rtype: float
+    """
+    delay = jittered_backoff(attempt, base=RETRY_BASE_DELAY)
+    retry_after = get_retry_after(error)
+    return max(delay, retry_after) if retry_after is not None else delay
+
+
+def _with_stored_values(
+    utterances: List[Utterance],
+    records: List[PineconeRecord],
+    vectors: Dict[str, dict],
+) -> Tuple[List[Dict], List[Utterance]]:
+    """Fill records with the values of the stored vectors of the same IDs.
+
+    :param utterances: The utterances the records were built from.
+    :type utterances: List[Utterance]
+    :param records: The records without values.
+    :type records: List[PineconeRecord]
+    :param vectors: The stored vectors, keyed by ID.
+    :type vectors: Dict[str, dict]
+    :return: The records to upsert, and the utterances without stored vectors.
+    :rtype: Tuple[List[Dict], List[Utterance]]
+    """
+    to_upsert = []
+    missing = []
+    for utterance, record in zip(utterances, records):
+        vector = vectors.get(record.id)
+        if vector is None:
+            missing.append(utterance)
+            continue
+        record.values = vector["values"]
+        record.sparse_values = vector.get("sparse_values") or None
+        to_upsert.append(record.to_dict())
+    return to_upsert, missing
+
+
 class PineconeIndex(BaseIndex):
+    """Pinecone index.
+
+    Async methods reuse a pooled HTTP session, call `aclose` or use the index as an
+    async context manager to release it.
+    """
+
     index_prefix: str = "semantic-router--"
     api_key: Optional[str] = None
     index_name: str = "index"
@@ -153,6 +318,13 @@ class PineconeIndex(BaseIndex):
     base_url: Optional[str] = None
     headers: dict[str, str] = {}
     index_host: Optional[str] = "http://localhost:5080"
+    write_concurrency: ClassVar[int] = 4
+    batch_concurrency: int = 4
+    max_retries: int = 3
+    max_connections: ClassVar[int] = 32
+    keepalive_timeout: ClassVar[float] = 30.0
+
+    _async_session: Optional[aiohttp.ClientSession] = PrivateAttr(default=None)
 
     def __init__(
         self,
@@ -166,6 +338,8 @@ class PineconeIndex(BaseIndex):
         namespace: Optional[str] = "",
         base_url: Optional[str] = "https://api.pinecone.io",
         init_async_index: bool = False,
+        batch_concurrency: int = 4,
+        max_retries: int = 3,
     ):
         """Initialize PineconeIndex.
 
@@ -189,8 +363,16 @@ class PineconeIndex(BaseIndex):
         :type base_url: Optional[str]
         :param init_async_index: Whether to initialize the index asynchronously.
         :type init_async_index: bool
+        :param batch_concurrency: The number of upsert or delete batches sent
+            concurrently.
+        :type batch_concurrency: int
+        :param max_retries: The number of times a failed upsert or delete batch is
+            retried.
+        :type max_retries: int
         """
         super().__init__()
+        self.batch_concurrency = batch_concurrency
+        self.max_retries = max_retries
         self.api_key = api_key or os.getenv("PINECONE_API_KEY")
         if not self.api_key:
             raise ValueError("Pinecone API key is required.")
@@ -436,6 +618,110 @@ class PineconeIndex(BaseIndex):
         else:
             raise ValueError("Index is None, could not upsert.")
 
+    def _run_batches(self, fn: Callable[[Any], Any], batches: List[Any]) -> List[Any]:
+        """Call `fn` with each batch, running up to `batch_concurrency` batches at
+        once in threads and retrying failed batches up to `max_retries` times. The
+        remaining batches are cancelled once a batch fails.
+
+        :param fn: The function sending the request for a batch.
+        :type fn: Callable[[Any], Any]
+        :param batches: The batches.
+        :type batches: List[Any]
+        :return: The value returned for each batch, in order.
+        :rtype: List[Any]
+        """
+        if len(batches) <= 1 or self.batch_concurrency <= 1:
+            return [self._with_retries(fn, batch) for batch in batches]
+        workers = min(self.batch_concurrency, len(batches))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._with_retries, fn, batch) for batch in batches
+            ]
+            try:
+                return [future.result() for future in futures]
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    async def _arun_batches(
+        self, fn: Callable[[Any], Awaitable[Any]], batches: List[Any]
+    ) -> List[Any]:
+        """Await `fn` with each batch, running up to `batch_concurrency` batches at
+        once as tasks and retrying failed batches up to `max_retries` times. The
+        remaining batches are cancelled once a batch fails.
+
+        :param fn: The coroutine function sending the request for a batch.
+        :type fn: Callable[[Any], Awaitable[Any]]
+        :param batches: The batches.
+        :type batches: List[Any]
+        :return: The value returned for each batch, in order.
+        :rtype: List[Any]
+        """
+        semaphore = asyncio.Semaphore(max(self.batch_concurrency, 1))
+
+        async def run(batch: Any) -> Any:
+            async with semaphore:
+                return await self._awith_retries(fn, batch)
+
+        tasks = [asyncio.create_task(run(batch)) for batch in batches]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    def _with_retries(self, fn: Callable[[Any], Any], batch: Any) -> Any:
+        """Call `fn` with a batch, retrying retryable errors with jittered
+        exponential backoff up to `max_retries` times.
+
+        :param fn: The function sending the request for the batch.
+        :type fn: Callable[[Any], Any]
+        :param batch: The batch.
+        :type batch: Any
+        :return: The value returned by `fn`.
+        :rtype: Any
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                return fn(batch)
+            except Exception as e:
+                if attempt >= self.max_retries or not _is_retryable(e):
+                    raise
+                delay = _retry_delay(attempt, e)
+                logger.warning(
+                    f"Pinecone request failed, retrying in {delay:.2f} seconds. "
+                    f"Error: {e}"
+                )
+                time.sleep(delay)
+
+    async def _awith_retries(
+        self, fn: Callable[[Any], Awaitable[Any]], batch: Any
+    ) -> Any:
+        """Await `fn` with a batch, retrying retryable errors with jittered
+        exponential backoff up to `max_retries` times.
+
+        :param fn: The coroutine function sending the request for the batch.
+        :type fn: Callable[[Any], Awaitable[Any]]
+        :param batch: The batch.
+        :type batch: Any
+        :return: The value returned by `fn`.
+        :rtype: Any
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                return await fn(batch)
+            except Exception as e:
+                if attempt >= self.max_retries or not _is_retryable(e):
+                    raise
+                delay = _retry_delay(attempt, e)
+                logger.warning(
+                    f"Pinecone request failed, retrying in {delay:.2f} seconds. "
+                    f"Error: {e}"
+                )
+                await asyncio.sleep(delay)
+
     def add(
         self,
         embeddings: List[List[float]],
@@ -475,9 +761,7 @@ class PineconeIndex(BaseIndex):
             metadata_list=metadata_list,
             sparse_embeddings=sparse_embeddings,
         )
-        for i in range(0, len(vectors_to_upsert), batch_size):
-            batch = vectors_to_upsert[i : i + batch_size]
-            self._batch_upsert(batch)
+        self._run_batches(self._batch_upsert, _batched(vectors_to_upsert, batch_size))
 
     async def aadd(
         self,
@@ -519,12 +803,73 @@ class PineconeIndex(BaseIndex):
             sparse_embeddings=sparse_embeddings,
         )
 
-        for i in range(0, len(vectors_to_upsert), batch_size):
-            batch = vectors_to_upsert[i : i + batch_size]
-            await self._async_upsert(
-                vectors=batch,
-                namespace=self.namespace or "",
+        async def upsert(batch: List[Dict]):
+            await self._async_upsert(vectors=batch, namespace=self.namespace or "")
+
+        await self._arun_batches(upsert, _batched(vectors_to_upsert, batch_size))
+
+    def update_metadata(
+        self, utterances: List[Utterance], batch_size: int = 100
+    ) -> List[Utterance]:
+        """Update the function schemas and metadata of utterances already stored in
+        the index. The stored vectors are fetched and upserted again with the new
+        metadata, so no embeddings need to be created.
+
+        :param utterances: The utterances with their new function schemas and
+            metadata.
+        :type utterances: List[Utterance]
+        :param batch_size: Number of records to fetch and upsert in a single batch.
+        :type batch_size: int, optional
+        :return: The utterances that were not found in the index.
+        :rtype: List[Utterance]
+        """
+        if self.index is None:
+            return utterances
+        missing = []
+        for i in range(0, len(utterances), batch_size):
+            batch = utterances[i : i + batch_size]
+            records = [_metadata_record(utt) for utt in batch]
+            res = self.index.fetch(
+                ids=[record.id for record in records], namespace=self.namespace
             )
+            vectors = {
+                id: _vector_dict(vector) for id, vector in res["vectors"].items()
+            }
+            to_upsert, batch_missing = _with_stored_values(batch, records, vectors)
+            missing.extend(batch_missing)
+            if to_upsert:
+                self._batch_upsert(to_upsert)
+        return missing
+
+    async def aupdate_metadata(
+        self, utterances: List[Utterance], batch_size: int = 100
+    ) -> List[Utterance]:
+        """Update the function schemas and metadata of utterances already stored in
+        the index asynchronously. The stored vectors are fetched and upserted again
+        with the new metadata, so no embeddings need to be created.
+
+        :param utterances: The utterances with their new function schemas and
+            metadata.
+        :type utterances: List[Utterance]
+        :param batch_size: Number of records to fetch and upsert in a single batch.
+        :type batch_size: int, optional
+        :return: The utterances that were not found in the index.
+        :rtype: List[Utterance]
+        """
+        if self.index is None:
+            return utterances
+        missing = []
+        for i in range(0, len(utterances), batch_size):
+            batch = utterances[i : i + batch_size]
+            records = [_metadata_record(utt) for utt in batch]
+            vectors = await self._async_fetch_vectors([record.id for record in records])
+            to_upsert, batch_missing = _with_stored_values(batch, records, vectors)
+            missing.extend(batch_missing)
+            if to_upsert:
+                await self._async_upsert(
+                    vectors=to_upsert, namespace=self.namespace or ""
+                )
+        return missing
 
     def _remove_and_sync(self, routes_to_delete: dict):
         """Remove specified routes from index if they exist.
@@ -532,16 +877,13 @@ class PineconeIndex(BaseIndex):
         :param routes_to_delete: Routes to delete.
         :type routes_to_delete: dict
         """
-        for route, utterances in routes_to_delete.items():
-            remote_routes = self._get_routes_with_ids(route_name=route)
-            ids_to_delete = [
-                r["id"]
-                for r in remote_routes
-                if (r["route"], r["utterance"])
-                in zip([route] * len(utterances), utterances)
-            ]
-            if ids_to_delete and self.index:
-                self.index.delete(ids=ids_to_delete, namespace=self.namespace)
+        route_names = list(routes_to_delete)
+        remote_routes = self._run_batches(
+            lambda route: self._get_routes_with_ids(route_name=route), route_names
+        )
+        ids_to_delete = _utterance_ids(routes_to_delete, route_names, remote_routes)
+        if ids_to_delete and self.index:
+            self._delete_ids(ids_to_delete)
 
     async def _async_remove_and_sync(self, routes_to_delete: dict):
         """Remove specified routes from index if they exist.
@@ -551,18 +893,14 @@ class PineconeIndex(BaseIndex):
         :param routes_to_delete: Routes to delete.
         :type routes_to_delete: dict
         """
-        for route, utterances in routes_to_delete.items():
-            remote_routes = await self._async_get_routes_with_ids(route_name=route)
-            ids_to_delete = [
-                r["id"]
-                for r in remote_routes
-                if (r["route"], r["utterance"])
-                in zip([route] * len(utterances), utterances)
-            ]
-            if ids_to_delete and self.index:
-                await self._async_delete(
-                    ids=ids_to_delete, namespace=self.namespace or ""
-                )
+        route_names = list(routes_to_delete)
+        remote_routes = await self._arun_batches(
+            lambda route: self._async_get_routes_with_ids(route_name=route),
+            route_names,
+        )
+        ids_to_delete = _utterance_ids(routes_to_delete, route_names, remote_routes)
+        if ids_to_delete and self.index:
+            await self._async_delete_ids(ids_to_delete)
 
     def _get_route_ids(self, route_name: str):
         """Get the IDs of the routes in the index.
@@ -628,6 +966,48 @@ class PineconeIndex(BaseIndex):
             )
         return route_tuples
 
+    def _get_routes_metadata(self, routes: List[str]) -> List[Dict[str, Any]]:
+        """Retrieves the metadata of the records of the given routes, listing only
+        the IDs prefixed with each route name.
+
+        :param routes: The routes to retrieve the metadata of.
+        :type routes: List[str]
+        :return: A list of metadata dictionaries.
+        :rtype: List[Dict[str, Any]]
+        """
+        metadata: List[Dict[str, Any]] = []
+        for route in routes:
+            _, route_metadata = self._get_all(
+                prefix=f"{clean_route_name(route)}#", include_metadata=True
+            )
+            # different route names may share the same cleaned prefix
+            metadata.extend(x for x in route_metadata if x.get("sr_route") == route)
+        return metadata
+
+    async def _async_get_routes_metadata(
+        self, routes: List[str]
+    ) -> List[Dict[str, Any]]:
+        """Retrieves the metadata of the records of the given routes asynchronously,
+        listing only the IDs prefixed with each route name.
+
+        :param routes: The routes to retrieve the metadata of.
+        :type routes: List[str]
+        :return: A list of metadata dictionaries.
+        :rtype: List[Dict[str, Any]]
+        """
+        results = await asyncio.gather(
+            *[
+                self._async_get_all(
+                    prefix=f"{clean_route_name(route)}#", include_metadata=True
+                )
+                for route in routes
+            ]
+        )
+        metadata: List[Dict[str, Any]] = []
+        for route, (_, route_metadata) in zip(routes, results):
+            metadata.extend(x for x in route_metadata if x.get("sr_route") == route)
+        return metadata
+
     def _get_all(self, prefix: Optional[str] = None, include_metadata: bool = False):
         """Retrieves all vector IDs from the Pinecone index using pagination.
 
@@ -641,23 +1021,35 @@ class PineconeIndex(BaseIndex):
         if self.index is None:
             raise ValueError("Index is None, could not retrieve vector IDs.")
         all_vector_ids = []
-        metadata = []
+        if not include_metadata:
+            for ids in self.index.list(prefix=prefix, namespace=self.namespace):
+                all_vector_ids.extend(ids)
+            return all_vector_ids, []
+
+        # the metadata of each page is fetched while the next pages are listed
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FETCHES) as executor:
+            fetches: List[Future] = []
+            for ids in self.index.list(prefix=prefix, namespace=self.namespace):
+                all_vector_ids.extend(ids)
+                fetches.extend(
+                    executor.submit(self._fetch_metadata, batch)
+                    for batch in _batched(ids)
+                )
+            metadata = [x for fetch in fetches for x in fetch.result()]
+        return all_vector_ids, metadata
 
-        for ids in self.index.list(prefix=prefix, namespace=self.namespace):
-            all_vector_ids.extend(ids)
+    def _fetch_metadata(self, vector_ids: List[str]) -> List[dict]:
+        """Fetch the metadata of a batch of vector IDs.
 
-            if include_metadata:
-                for id in ids:
-                    res_meta = (
-                        self.index.fetch(ids=[id], namespace=self.namespace)
-                        if self.index
-                        else {}
-                    )
-                    metadata.extend(
-                        [x["metadata"] for x in res_meta["vectors"].values()]
-                    )
-
-        return all_vector_ids, metadata
+        :param vector_ids: The IDs of the vectors to fetch.
+        :type vector_ids: List[str]
+        :return: The metadata of each vector, in the order of the IDs.
+        :rtype: List[dict]
+        """
+        if self.index is None:
+            raise ValueError("Index is None, could not fetch metadata.")
+        res = self.index.fetch(ids=vector_ids, namespace=self.namespace)
+        return _stored_metadata(vector_ids, res["vectors"])
 
     def delete(self, route_name: str) -> list[str]:
         """Delete specified route from index if it exists. Returns the IDs of the vectors
@@ -672,7 +1064,7 @@ class PineconeIndex(BaseIndex):
         if self.index is not None:
             logger.info("index is not None, deleting...")
             if self.base_url and "api.pinecone.io" in self.base_url:
-                self.index.delete(ids=route_vec_ids, namespace=self.namespace)
+                self._delete_ids(route_vec_ids)
             else:
                 response = requests.post(
                     f"{self.index_host}/vectors/delete",
@@ -707,11 +1099,75 @@ class PineconeIndex(BaseIndex):
         """
         route_vec_ids = await self._async_get_route_ids(route_name=route_name)
         if self.index is not None:
-            await self._async_delete(ids=route_vec_ids, namespace=self.namespace or "")
+            await self._async_delete_ids(route_vec_ids)
             return route_vec_ids
         else:
             raise ValueError("Index is None, could not delete.")
 
+    def delete_routes(self, route_names: List[str]) -> List[str]:
+        """Delete several routes from the index. The IDs of the routes are listed in
+        parallel and deleted in batches of up to DELETE_BATCH_SIZE IDs. Returns the
+        IDs of the vectors deleted.
+
+        :param route_names: Names of the routes to delete.
+        :type route_names: List[str]
+        :return: List of IDs of the vectors deleted.
+        :rtype: List[str]
+        """
+        if self.index is None:
+            raise ValueError("Index is None, could not delete.")
+        route_ids = self._run_batches(
+            lambda route: self._get_route_ids(route_name=route), route_names
+        )
+        ids = [id for ids in route_ids for id in ids]
+        self._delete_ids(ids)
+        return ids
+
+    async def adelete_routes(self, route_names: List[str]) -> List[str]:
+        """Asynchronously delete several routes from the index. The IDs of the
+        routes are listed concurrently and deleted in batches of up to
+        DELETE_BATCH_SIZE IDs. Returns the IDs of the vectors deleted.
+
+        :param route_names: Names of the routes to delete.
+        :type route_names: List[str]
+        :return: List of IDs of the vectors deleted.
+        :rtype: List[str]
+        """
+        if self.index is None:
+            raise ValueError("Index is None, could not delete.")
+        route_ids = await self._arun_batches(
+            lambda route: self._async_get_route_ids(route_name=route), route_names
+        )
+        ids = [id for ids in route_ids for id in ids]
+        await self._async_delete_ids(ids)
+        return ids
+
+    def _delete_ids(self, ids: List[str]):
+        """Delete vectors by ID in concurrent batches of up to DELETE_BATCH_SIZE IDs.
+
+        :param ids: The IDs of the vectors to delete.
+        :type ids: List[str]
+        """
+        index = self.index
+        if index is None:
+            raise ValueError("Index is None, could not delete.")
+        self._run_batches(
+            lambda batch: index.delete(ids=batch, namespace=self.namespace),
+            _batched(ids, DELETE_BATCH_SIZE),
+        )
+
+    async def _async_delete_ids(self, ids: List[str]):
+        """Asynchronously delete vectors by ID in concurrent batches of up to
+        DELETE_BATCH_SIZE IDs.
+
+        :param ids: The IDs of the vectors to delete.
+        :type ids: List[str]
+        """
+        await self._arun_batches(
+            lambda batch: self._async_delete(ids=batch, namespace=self.namespace or ""),
+            _batched(ids, DELETE_BATCH_SIZE),
+        )
+
     def delete_all(self):
         """Delete all routes from index if it exists.
 
@@ -1000,6 +1456,58 @@ class PineconeIndex(BaseIndex):
         self.index = None
 
     # __ASYNC CLIENT METHODS__
+    def _get_async_host(self) -> str:
+        """Get the host of the index for async requests, adding the scheme to hosts
+        returned without one and resolving local hosts against the base URL.
+
+        :return: The host of the index.
+        :rtype: str
+        """
+        if self.host == "":
+            raise ValueError("self.host is not initialized.")
+        elif self.base_url and "api.pinecone.io" in self.base_url:
+            if not self.host.startswith("http"):
+                self.host = f"https://{self.host}"
+        elif self.host.startswith("localhost") and self.base_url:
+            self.host = f"http://{self.base_url.split(':')[-2].strip('/')}:{self.host.split(':')[-1]}"
+        return self.host
+
+    def _get_async_session(self) -> aiohttp.ClientSession:
+        """Get the pooled HTTP session used for asynchronous requests, creating it on
+        first use or when the previous session was closed or belonged to another
+        event loop. Connections are kept alive between requests.
+
+        :return: The HTTP session.
+        :rtype: aiohttp.ClientSession
+        """
+        session = self._async_session
+        if (
+            session is None
+            or session.closed
+            or session._loop is not asyncio.get_running_loop()
+        ):
+            self._async_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.max_connections,
+                    keepalive_timeout=self.keepalive_timeout,
+                )
+            )
+        return self._async_session  # type: ignore
+
+    async def aclose(self):
+        """Close the pooled HTTP session used for asynchronous requests, if one was
+        opened.
+        """
+        if self._async_session is not None and not self._async_session.closed:
+            await self._async_session.close()
+        self._async_session = None
+
+    async def __aenter__(self) -> "PineconeIndex":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
     async def _async_query(
         self,
         vector: list[float],
@@ -1034,32 +1542,24 @@ class PineconeIndex(BaseIndex):
             "topK": top_k,
             "includeMetadata": include_metadata,
         }
-        if self.host == "":
-            raise ValueError("self.host is not initialized.")
-        elif self.base_url and "api.pinecone.io" in self.base_url:
-            if not self.host.startswith("http"):
-                logger.error(f"host exists:{self.host}")
-
-                self.host = f"https://{self.host}"
-        elif self.host.startswith("localhost") and self.base_url:
-            self.host = f"http://{self.base_url.split(':')[-2].strip('/')}:{self.host.split(':')[-1]}"
+        host = self._get_async_host()
+
+        session = self._get_async_session()
+        async with session.post(
+            f"{host}/query",
+            json=params,
+            headers=self.headers,
+        ) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                logger.error(f"Error in query response: {error_text}")
+                return {}  # or handle the error as needed
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.host}/query",
-                json=params,
-                headers=self.headers,
-            ) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    logger.error(f"Error in query response: {error_text}")
-                    return {}  # or handle the error as needed
-
-                try:
-                    return await response.json(content_type=None)
-                except JSONDecodeError as e:
-                    logger.error(f"JSON decode error: {e}")
-                    return {}
+            try:
+                return await response.json(content_type=None)
+            except JSONDecodeError as e:
+                logger.error(f"JSON decode error: {e}")
+                return {}
 
     async def _is_async_ready(self, client_only: bool = False) -> bool:
         """Checks if class attributes exist to be used for async operations.
@@ -1086,12 +1586,12 @@ class PineconeIndex(BaseIndex):
         :return: List of indexes.
         :rtype: list[dict]
         """
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"{self.base_url}/indexes",
-                headers=self.headers,
-            ) as response:
-                return await response.json(content_type=None)
+        session = self._get_async_session()
+        async with session.get(
+            f"{self.base_url}/indexes",
+            headers=self.headers,
+        ) as response:
+            return await response.json(content_type=None)
 
     async def _async_upsert(
         self,
@@ -1110,21 +1610,17 @@ class PineconeIndex(BaseIndex):
             "namespace": namespace,
         }
 
-        if self.base_url and "api.pinecone.io" in self.base_url:
-            if not self.host.startswith("http"):
-                logger.error(f"host exists:{self.host}")
-                self.host = f"https://{self.host}"
+        host = self._get_async_host()
 
-        elif self.host.startswith("localhost") and self.base_url:
-            self.host = f"http://{self.base_url.split(':')[-2].strip('/')}:{self.host.split(':')[-1]}"
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.host}/vectors/upsert",
-                json=params,
-                headers=self.headers,
-            ) as response:
-                res = await response.json(content_type=None)
-                return res
+        session = self._get_async_session()
+        async with session.post(
+            f"{host}/vectors/upsert",
+            json=params,
+            headers=self.headers,
+        ) as response:
+            response.raise_for_status()
+            res = await response.json(content_type=None)
+            return res
 
     async def _async_create_index(
         self,
@@ -1153,13 +1649,13 @@ class PineconeIndex(BaseIndex):
             "metric": metric,
             "spec": {"serverless": {"cloud": cloud, "region": region}},
         }
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.base_url}/indexes",
-                json=params,
-                headers=self.headers,
-            ) as response:
-                return await response.json(content_type=None)
+        session = self._get_async_session()
+        async with session.post(
+            f"{self.base_url}/indexes",
+            json=params,
+            headers=self.headers,
+        ) as response:
+            return await response.json(content_type=None)
 
     async def _async_delete(self, ids: list[str], namespace: str = ""):
         """Asynchronously deletes vectors from the index.
@@ -1173,20 +1669,16 @@ class PineconeIndex(BaseIndex):
             "ids": ids,
             "namespace": namespace,
         }
-        if self.base_url and "api.pinecone.io" in self.base_url:
-            if not self.host.startswith("http"):
-                logger.error(f"host exists:{self.host}")
-                self.host = f"https://{self.host}"
-        elif self.host.startswith("localhost") and self.base_url:
-            self.host = f"http://{self.base_url.split(':')[-2].strip('/')}:{self.host.split(':')[-1]}"
+        host = self._get_async_host()
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.host}/vectors/delete",
-                json=params,
-                headers=self.headers,
-            ) as response:
-                return await response.json(content_type=None)
+        session = self._get_async_session()
+        async with session.post(
+            f"{host}/vectors/delete",
+            json=params,
+            headers=self.headers,
+        ) as response:
+            response.raise_for_status()
+            return await response.json(content_type=None)
 
     async def _async_describe_index(self, name: str):
         """Asynchronously describes the index.
@@ -1194,12 +1686,12 @@ class PineconeIndex(BaseIndex):
         :param name: The name of the index to describe.
         :type name: str
         """
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"{self.base_url}/indexes/{name}",
-                headers=self.headers,
-            ) as response:
-                return await response.json(content_type=None)
+        session = self._get_async_session()
+        async with session.get(
+            f"{self.base_url}/indexes/{name}",
+            headers=self.headers,
+        ) as response:
+            return await response.json(content_type=None)
 
     async def _async_get_all(
         self, prefix: Optional[str] = None, include_metadata: bool = False
@@ -1216,8 +1708,6 @@ class PineconeIndex(BaseIndex):
         """
         if self.index is None:
             raise ValueError("Index is None, could not retrieve vector IDs.")
-        if self.host == "":
-            raise ValueError("self.host is not initialized.")
 
         all_vector_ids = []
         next_page_token = None
@@ -1227,53 +1717,56 @@ class PineconeIndex(BaseIndex):
         else:
             prefix_str = ""
 
-        if self.base_url and "api.pinecone.io" in self.base_url:
-            if not self.host.startswith("http"):
-                logger.error(f"host exists:{self.host}")
-                self.host = f"https://{self.host}"
-
-        elif self.host.startswith("localhost") and self.base_url:
-            self.host = f"http://{self.base_url.split(':')[-2].strip('/')}:{self.host.split(':')[-1]}"
+        host = self._get_async_host()
 
-        list_url = f"{self.host}/vectors/list{prefix_str}"
+        list_url = f"{host}/vectors/list{prefix_str}"
         params: dict = {}
         if self.namespace:
             params["namespace"] = self.namespace
-        metadata = []
-
-        async with aiohttp.ClientSession() as session:
-            while True:
-                if next_page_token:
-                    params["paginationToken"] = next_page_token
-
-                async with session.get(
-                    list_url,
-                    params=params,
-                    headers=self.headers,
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"Error fetching vectors: {error_text}")
-                        break
-
-                    response_data = await response.json(content_type=None)
-
-                vector_ids = [vec["id"] for vec in response_data.get("vectors", [])]
-                if not vector_ids:
-                    break
-                all_vector_ids.extend(vector_ids)
+        fetches: List[asyncio.Task] = []
+
+        session = self._get_async_session()
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
 
-                if include_metadata:
-                    metadata_tasks = [
-                        self._async_fetch_metadata(id) for id in vector_ids
-                    ]
-                    metadata_results = await asyncio.gather(*metadata_tasks)
-                    metadata.extend(metadata_results)
+        async def fetch_metadata(vector_ids: List[str]) -> List[dict]:
+            async with semaphore:
+                vectors = await self._async_fetch_vectors(vector_ids)
+            return _stored_metadata(vector_ids, vectors)
 
-                next_page_token = response_data.get("pagination", {}).get("next")
-                if not next_page_token:
+        while True:
+            if next_page_token:
+                params["paginationToken"] = next_page_token
+
+            async with session.get(
+                list_url,
+                params=params,
+                headers=self.headers,
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"Error fetching vectors: {error_text}")
                     break
 
+                response_data = await response.json(content_type=None)
+
+            vector_ids = [vec["id"] for vec in response_data.get("vectors", [])]
+            if not vector_ids:
+                break
+            all_vector_ids.extend(vector_ids)
+
+            if include_metadata:
+                # fetch the metadata of the page while the next pages are listed
+                fetches.extend(
+                    asyncio.create_task(fetch_metadata(batch))
+                    for batch in _batched(vector_ids)
+                )
+
+            next_page_token = response_data.get("pagination", {}).get("next")
+            if not next_page_token:
+                break
+
+        results = await asyncio.gather(*fetches)
+        metadata = [x for result in results for x in result]
         return all_vector_ids, metadata
 
     async def _async_fetch_metadata(
@@ -1291,16 +1784,9 @@ class PineconeIndex(BaseIndex):
         :return: A dictionary containing the metadata for the vector.
         :rtype: dict
         """
-        if self.host == "":
-            raise ValueError("self.host is not initialized.")
-        if self.base_url and "api.pinecone.io" in self.base_url:
-            if not self.host.startswith("http"):
-                logger.error(f"host exists:{self.host}")
-                self.host = f"https://{self.host}"
-        elif self.host.startswith("localhost") and self.base_url:
-            self.host = f"http://{self.base_url.split(':')[-2].strip('/')}:{self.host.split(':')[-1]}"
+        host = self._get_async_host()
 
-        url = f"{self.host}/vectors/fetch"
+        url = f"{host}/vectors/fetch"
 
         params = {
             "ids": [vector_id],
@@ -1311,26 +1797,48 @@ class PineconeIndex(BaseIndex):
         elif self.namespace:
             params["namespace"] = [self.namespace]
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                url, params=params, headers=self.headers
-            ) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    logger.error(f"Error fetching metadata: {error_text}")
-                    return {}
-
-                try:
-                    response_data = await response.json(content_type=None)
-                except Exception as e:
-                    logger.warning(f"No metadata found for vector {vector_id}: {e}")
-                    return {}
-
-                return (
-                    response_data.get("vectors", {})
-                    .get(vector_id, {})
-                    .get("metadata", {})
-                )
+        session = self._get_async_session()
+        async with session.get(url, params=params, headers=self.headers) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                logger.error(f"Error fetching metadata: {error_text}")
+                return {}
+
+            try:
+                response_data = await response.json(content_type=None)
+            except Exception as e:
+                logger.warning(f"No metadata found for vector {vector_id}: {e}")
+                return {}
+
+            return (
+                response_data.get("vectors", {}).get(vector_id, {}).get("metadata", {})
+            )
+
+    async def _async_fetch_vectors(self, vector_ids: List[str]) -> Dict[str, dict]:
+        """Fetch the records of several vector IDs asynchronously, including their
+        values and metadata.
+
+        :param vector_ids: The IDs of the vectors to fetch.
+        :type vector_ids: List[str]
+        :return: A dictionary mapping the IDs found to their records.
+        :rtype: Dict[str, dict]
+        """
+        host = self._get_async_host()
+
+        params: Dict[str, Any] = {"ids": vector_ids}
+        if self.namespace:
+            params["namespace"] = [self.namespace]
+
+        session = self._get_async_session()
+        async with session.get(
+            f"{host}/vectors/fetch", params=params, headers=self.headers
+        ) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                logger.error(f"Error fetching vectors: {error_text}")
+                return {}
+            response_data = await response.json(content_type=None)
+            return response_data.get("vectors", {})
 
     def __len__(self):
         namespace_stats = self.index.describe_index_stats()["namespaces"].get(
@@ -7,7 +7,7 @@ import numpy as np
 from pydantic import BaseModel, ConfigDict, Field
 
 from semantic_router.index.base import BaseIndex, IndexConfig
-from semantic_router.schema import ConfigParameter, Metric, SparseEmbedding
+from semantic_router.schema import ConfigParameter, Metric, SparseEmbedding, Utterance
 from semantic_router.utils.logger import logger
 
 if TYPE_CHECKING:
@@ -298,6 +298,19 @@ class PostgresIndex(BaseIndex):
             )
             self.conn.commit()
 
+    def update_metadata(self, utterances: List[Utterance]) -> List[Utterance]:
+        """Update the function schemas and metadata of utterances already stored in
+        the index - PostgresIndex doesn't store function schemas or metadata so there is
+        nothing to update.
+
+        :param utterances: The utterances with their new function schemas and
+            metadata.
+        :type utterances: List[Utterance]
+        :return: The utterances that were not updated, always empty.
+        :rtype: List[Utterance]
+        """
+        return []
+
     def delete(self, route_name: str) -> None:
         """Deletes records with the specified route name.
 
@@ -218,7 +218,9 @@ class QdrantIndex(BaseIndex):
             batch_size=batch_size,
         )
 
-    def get_utterances(self, include_metadata: bool = False) -> List[Utterance]:
+    def get_utterances(
+        self, include_metadata: bool = False, routes: Optional[List[str]] = None
+    ) -> List[Utterance]:
         """Gets a list of route and utterance objects currently stored in the index.
 
         :param include_metadata: Whether to include function schemas and metadata in
@@ -226,6 +228,8 @@ class QdrantIndex(BaseIndex):
         parameter so it is ignored. If required for your use-case please reach out to
         semantic-router maintainers on GitHub via an issue or PR.
         :type include_metadata: bool
+        :param routes: The routes to get the utterances of, all routes if None.
+        :type routes: Optional[List[str]]
         :return: A list of Utterance objects.
         :rtype: List[Utterance]
         """
@@ -233,8 +237,18 @@ class QdrantIndex(BaseIndex):
         if not self.client.collection_exists(self.index_name):
             return []
 
-        from qdrant_client import grpc
+        from qdrant_client import grpc, models
 
+        scroll_filter = None
+        if routes is not None:
+            scroll_filter = models.Filter(
+                must=[
+                    models.FieldCondition(
+                        key=SR_ROUTE_PAYLOAD_KEY,
+                        match=models.MatchAny(any=routes),
+                    )
+                ]
+            )
         results = []
         next_offset = None
         stop_scrolling = False
@@ -242,6 +256,7 @@ class QdrantIndex(BaseIndex):
             while not stop_scrolling:
                 records, next_offset = self.client.scroll(
                     self.index_name,
+                    scroll_filter=scroll_filter,
                     limit=SCROLL_SIZE,
                     offset=next_offset,
                     with_payload=True,
@@ -268,6 +283,19 @@ class QdrantIndex(BaseIndex):
             return []
         return utterances
 
+    def update_metadata(self, utterances: List[Utterance]) -> List[Utterance]:
+        """Update the function schemas and metadata of utterances already stored in
+        the index - QdrantIndex doesn't store function schemas or metadata so there is
+        nothing to update.
+
+        :param utterances: The utterances with their new function schemas and
+            metadata.
+        :type utterances: List[Utterance]
+        :return: The utterances that were not updated, always empty.
+        :rtype: List[Utterance]
+        """
+        return []
+
     def delete(self, route_name: str):
         """Delete records from the index.
 
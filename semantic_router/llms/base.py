@@ -1,9 +1,25 @@
+import asyncio
 import json
-from typing import Any, ClassVar, Dict, List, Optional
+from contextlib import asynccontextmanager, contextmanager
+from functools import lru_cache
+from typing import (
+    Any,
+    AsyncIterator,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 from pydantic import BaseModel, ConfigDict
 
 from semantic_router.schema import Message
+from semantic_router.utils.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    get_concurrency_limiter,
+)
 from semantic_router.utils.logger import logger
 
 
@@ -12,11 +28,22 @@ class BaseLLM(BaseModel):
 
     This class provides a base implementation for LLMs. It defines the common
     configuration and methods for all LLM classes.
+
+    Calls to remote providers hold a slot of an adaptive concurrency limiter shared
+    by all LLMs of the same class, so a throttling provider sees fewer requests in
+    flight instead of a storm of retries. The limit starts at 8 requests in flight
+    per class across the process and grows up to 64 while requests succeed. Set
+    `adaptive_concurrency` to False to disable this.
+
+    Function inputs for dynamic routes are extracted with a compact prompt built from
+    compiled function schemas, see `compile_function_schema`. `OpenAILLM` can use
+    native tool calling instead, see its `native_function_calling` option.
     """
 
     name: str
     temperature: Optional[float] = 0.0
     max_tokens: Optional[int] = None
+    adaptive_concurrency: bool = True
 
     model_config: ClassVar[ConfigDict] = ConfigDict(arbitrary_types_allowed=True)
 
@@ -42,6 +69,49 @@ class BaseLLM(BaseModel):
         """
         raise NotImplementedError("Subclasses must implement this method")
 
+    async def acall(self, messages: List[Message]) -> Optional[str]:
+        """Call the LLM asynchronously.
+
+        LLMs without a native async client inherit this default, which runs the
+        synchronous call in a worker thread so that the event loop is not blocked.
+
+        :param messages: The messages to pass to the LLM.
+        :type messages: List[Message]
+        :return: The response from the LLM.
+        :rtype: Optional[str]
+        """
+        return await asyncio.to_thread(self.__call__, messages)
+
+    def _get_concurrency_limiter(self) -> AdaptiveConcurrencyLimiter:
+        """Get the adaptive concurrency limiter shared by all LLMs of this class.
+
+        :return: The shared limiter.
+        :rtype: AdaptiveConcurrencyLimiter
+        """
+        return get_concurrency_limiter(f"llm/{type(self).__name__}")
+
+    @contextmanager
+    def _request_slot(self) -> Iterator[None]:
+        """Hold a slot of the provider's adaptive concurrency limiter for the
+        duration of a single request, if adaptive concurrency is enabled.
+        """
+        if not self.adaptive_concurrency:
+            yield
+            return
+        with self._get_concurrency_limiter().slot():
+            yield
+
+    @asynccontextmanager
+    async def _arequest_slot(self) -> AsyncIterator[None]:
+        """Hold a slot of the provider's adaptive concurrency limiter for the
+        duration of a single async request, if adaptive concurrency is enabled.
+        """
+        if not self.adaptive_concurrency:
+            yield
+            return
+        async with self._get_concurrency_limiter().aslot():
+            yield
+
     def _check_for_mandatory_inputs(
         self, inputs: dict[str, Any], mandatory_params: List[str]
     ) -> bool:
@@ -127,31 +197,18 @@ class BaseLLM(BaseModel):
         :rtype: bool
         """
         try:
-            # Extract parameter names and determine if they are optional
-            signature = function_schema["signature"]
-            param_info = [param.strip() for param in signature[1:-1].split(",")]
-            mandatory_params = []
-            all_params = []
-
-            for info in param_info:
-                parts = info.split("=")
-                name_type_pair = parts[0].strip()
-                if ":" in name_type_pair:
-                    name, _ = name_type_pair.split(":")
-                else:
-                    name = name_type_pair
-                all_params.append(name)
-
-                # If there is no default value, it's a mandatory parameter
-                if len(parts) == 1:
-                    mandatory_params.append(name)
+            compiled = compile_function_schema(function_schema)
 
             # Check for mandatory parameters
-            if not self._check_for_mandatory_inputs(inputs, mandatory_params):
+            if not self._check_for_mandatory_inputs(
+                inputs, list(compiled.mandatory_parameters)
+            ):
                 return False
 
             # Check for extra parameters not defined in the signature
-            if not self._check_for_extra_inputs(inputs, all_params):
+            if not compiled.accepts_extra_inputs and not self._check_for_extra_inputs(
+                inputs, list(compiled.parameters)
+            ):
                 return False
 
             return True
@@ -187,67 +244,222 @@ class BaseLLM(BaseModel):
         :rtype: List[Dict[str, Any]]
         """
         logger.info("Extracting function input...")
+        prompt = build_function_inputs_prompt(query, function_schemas)
+        output = self([Message(role="user", content=prompt)])
+        return self._function_inputs_from_output(output, function_schemas)
+
+    async def async_extract_function_inputs(
+        self, query: str, function_schemas: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Extract the function inputs from the query asynchronously.
+
+        :param query: The query to extract the function inputs from.
+        :type query: str
+        :param function_schemas: The function schemas to extract the function inputs from.
+        :type function_schemas: List[Dict[str, Any]]
+        :return: The function inputs.
+        :rtype: List[Dict[str, Any]]
+        """
+        logger.info("Extracting function input...")
+        prompt = build_function_inputs_prompt(query, function_schemas)
+        output = await self.acall([Message(role="user", content=prompt)])
+        return self._function_inputs_from_output(output, function_schemas)
+
+    def _function_inputs_from_output(
+        self, output: Optional[str], function_schemas: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Parse and validate the function inputs returned by the LLM.
 
-        prompt = f"""
-You are an accurate and reliable computer program that only outputs valid JSON. 
-Your task is to output JSON representing the input arguments of a Python function.
-
-This is the Python function's schema:
-
-### FUNCTION_SCHEMAS Start ###
-	{function_schemas}
-### FUNCTION_SCHEMAS End ###
-
-This is the input query.
-
-### QUERY Start ###
-	{query}
-### QUERY End ###
-
-The arguments that you need to provide values for, together with their datatypes, are stated in "signature" in the FUNCTION_SCHEMAS.
-The values these arguments must take are made clear by the QUERY.
-Use the FUNCTION_SCHEMAS "description" too, as this might provide helpful clues about the arguments and their values.
-Return only JSON, stating the argument names and their corresponding values.
-
-### FORMATTING_INSTRUCTIONS Start ###
-	Return a respones in valid JSON format. Do not return any other explanation or text, just the JSON.
-	The JSON-Keys are the names of the arguments, and JSON-values are the values those arguments should take.
-### FORMATTING_INSTRUCTIONS End ###
-
-### EXAMPLE Start ###
-	=== EXAMPLE_INPUT_QUERY Start ===
-		"How is the weather in Hawaii right now in International units?"
-	=== EXAMPLE_INPUT_QUERY End ===
-	=== EXAMPLE_INPUT_SCHEMA Start ===
-		{{
-			"name": "get_weather",
-			"description": "Useful to get the weather in a specific location",
-			"signature": "(location: str, degree: str) -> str",
-			"output": "<class 'str'>",
-		}}
-	=== EXAMPLE_INPUT_QUERY End ===
-	=== EXAMPLE_OUTPUT Start ===
-		{{
-			"location": "Hawaii",
-			"degree": "Celsius",
-		}}
-	=== EXAMPLE_OUTPUT End ===
-### EXAMPLE End ###
-
-Note: I will tip $500 for an accurate JSON output. You will be penalized for an inaccurate JSON output.
-
-Provide JSON output now:
-"""
-        llm_input = [Message(role="user", content=prompt)]
-        output = self(llm_input)
+        :param output: The LLM output.
+        :type output: Optional[str]
+        :param function_schemas: The function schemas to validate the inputs against.
+        :type function_schemas: List[Dict[str, Any]]
+        :return: The function inputs.
+        :rtype: List[Dict[str, Any]]
+        """
         if not output:
             raise Exception("No output generated for extract function input")
-        output = output.replace("'", '"').strip().rstrip(",")
         logger.info(f"LLM output: {output}")
-        function_inputs = json.loads(output)
-        if not isinstance(function_inputs, list):
-            function_inputs = [function_inputs]
+        function_inputs = parse_function_inputs(output)
         logger.info(f"Function inputs: {function_inputs}")
         if not self._is_valid_inputs(function_inputs, function_schemas):
             raise ValueError("Invalid inputs")
         return function_inputs
+
+
+FUNCTION_INPUTS_PROMPT = (
+    "Extract the arguments of a call to the Python function below from the query. "
+    "Return only a JSON object mapping argument names to their values, with no "
+    "other text. Leave out optional arguments the query does not give.\n\n"
+    "{functions}\n\n"
+    "Query: {query}\n"
+    "JSON:"
+)
+
+
+class CompiledFunctionSchema(BaseModel):
+    """A function schema compiled into the compact prompt fragment describing the
+    function to the LLM and the parameter lists used to validate the extracted
+    inputs, so neither is rebuilt from the schema on every call.
+
+    :param name: The name of the function.
+    :type name: str
+    :param prompt: The prompt fragment describing the function.
+    :type prompt: str
+    :param parameters: The names of all parameters of the function.
+    :type parameters: Tuple[str, ...]
+    :param mandatory_parameters: The names of the parameters without a default.
+    :type mandatory_parameters: Tuple[str, ...]
+    :param parameter_types: The annotated type of each parameter, if any.
+    :type parameter_types: Dict[str, str]
+    :param accepts_extra_inputs: Whether the function takes `**kwargs`.
+    :type accepts_extra_inputs: bool
+    """
+
+    name: str
+    description: str = ""
+    prompt: str
+    parameters: Tuple[str, ...]
+    mandatory_parameters: Tuple[str, ...]
+    parameter_types: Dict[str, str] = {}
+    accepts_extra_inputs: bool = False
+
+    model_config: ClassVar[ConfigDict] = ConfigDict(frozen=True)
+
+
+def compile_function_schema(function_schema: Dict[str, Any]) -> CompiledFunctionSchema:
+    """Compile a function schema, as returned by `get_schema`, for input extraction.
+    Compiled schemas are cached, so repeated calls with an equal schema are cheap.
+
+    :param function_schema: The function schema to compile.
+    :type function_schema: Dict[str, Any]
+    :return: The compiled function schema.
+    :rtype: CompiledFunctionSchema
+    """
+    return _compile_function_schema(
+        json.dumps(function_schema, sort_keys=True, default=str)
+    )
+
+
+@lru_cache(maxsize=256)
+def _compile_function_schema(schema_json: str) -> CompiledFunctionSchema:
+    function_schema = json.loads(schema_json)
+    name = function_schema.get("name", "")
+    signature = function_schema["signature"]
+    parameters: List[str] = []
+    mandatory: List[str] = []
+    types: Dict[str, str] = {}
+    accepts_extra = False
+    for param in _split_parameters(signature):
+        name_type, has_default, _ = param.partition("=")
+        param_name, _, param_type = name_type.partition(":")
+        param_name = param_name.strip()
+        if param_name in ("", "*", "/"):
+            continue
+        if param_name.startswith("**"):
+            accepts_extra = True
+            continue
+        if param_name.startswith("*"):
+            continue
+        parameters.append(param_name)
+        types[param_name] = param_type.strip()
+        # if there is no default value, it's a mandatory parameter
+        if not has_default:
+            mandatory.append(param_name)
+    description = str(function_schema.get("description") or "").strip()
+    if description == "None":
+        description = ""
+    prompt = f"{name}{signature}"
+    if description:
+        prompt += f"\n{description}"
+    return CompiledFunctionSchema(
+        name=name,
+        description=description,
+        prompt=prompt,
+        parameters=tuple(parameters),
+        mandatory_parameters=tuple(mandatory),
+        parameter_types=types,
+        accepts_extra_inputs=accepts_extra,
+    )
+
+
+def _split_parameters(signature: str) -> List[str]:
+    """Split the parameter list of a signature such as `(a: int, b: str = 'x') -> str`
+    on the commas between parameters, ignoring commas in brackets or strings.
+    """
+    params: List[str] = []
+    current: List[str] = []
+    depth = 0
+    quote = None
+    for char in signature.strip():
+        if quote:
+            current.append(char)
+            if char == quote:
+                quote = None
+            continue
+        if char in "'\"":
+            quote = char
+        elif char in "([{":
+            depth += 1
+            if depth == 1:
+                continue
+        elif char in ")]}":
+            depth -= 1
+            if depth == 0:
+                # end of the parameter list, the return annotation follows
+                break
+        elif char == "," and depth == 1:
+            params.append("".join(current).strip())
+            current = []
+            continue
+        current.append(char)
+    params.append("".join(current).strip())
+    return [param for param in params if param]
+
+
+def build_function_inputs_prompt(
+    query: str, function_schemas: List[Dict[str, Any]]
+) -> str:
+    """Build the prompt asking an LLM for the function inputs found in a query.
+
+    :param query: The query to extract the function inputs from.
+    :type query: str
+    :param function_schemas: The function schemas to extract the function inputs for.
+    :type function_schemas: List[Dict[str, Any]]
+    :return: The prompt.
+    :rtype: str
+    """
+    functions = "\n\n".join(_function_prompt(schema) for schema in function_schemas)
+    return FUNCTION_INPUTS_PROMPT.format(functions=functions, query=query)
+
+
+def _function_prompt(function_schema: Any) -> str:
+    try:
+        return compile_function_schema(function_schema).prompt
+    except (AttributeError, KeyError, TypeError):
+        # not a `get_schema` schema, describe it as is and let validation decide
+        return str(function_schema)
+
+
+def parse_function_inputs(output: str) -> List[Dict[str, Any]]:
+    """Parse the function inputs from the JSON output of an LLM. Markdown code
+    fences and Python-style single quotes are tolerated.
+
+    :param output: The LLM output.
+    :type output: str
+    :return: The function inputs.
+    :rtype: List[Dict[str, Any]]
+    """
+    output = output.strip()
+    if output.startswith("```"):
+        output = output.strip("`").strip()
+        if output.startswith("json"):
+            output = output[len("json") :]
+    output = output.strip().rstrip(",")
+    try:
+        function_inputs = json.loads(output)
+    except json.JSONDecodeError:
+        function_inputs = json.loads(output.replace("'", '"'))
+    if not isinstance(function_inputs, list):
+        function_inputs = [function_inputs]
+    return function_inputs
@@ -15,6 +15,7 @@ class CohereLLM(BaseLLM):
     """
 
     _client: Any = PrivateAttr()
+    _async_client: Any = PrivateAttr(default=None)
 
     def __init__(
         self,
@@ -55,6 +56,7 @@ class CohereLLM(BaseLLM):
             raise ValueError("Cohere API key cannot be 'None'.")
         try:
             client = cohere.Client(cohere_api_key)
+            self._async_client = cohere.AsyncClient(cohere_api_key)
         except Exception as e:
             raise ValueError(
                 f"Cohere API client failed to initialize. Error: {e}"
@@ -72,11 +74,39 @@ class CohereLLM(BaseLLM):
         if self._client is None:
             raise ValueError("Cohere client is not initialized.")
         try:
-            completion = self._client.chat(
-                model=self.name,
-                chat_history=[m.to_cohere() for m in messages[:-1]],
-                message=messages[-1].content,
-            )
+            with self._request_slot():
+                completion = self._client.chat(
+                    model=self.name,
+                    chat_history=[m.to_cohere() for m in messages[:-1]],
+                    message=messages[-1].content,
+                )
+
+            output = completion.text
+
+            if not output:
+                raise Exception("No output generated")
+            return output
+
+        except Exception as e:
+            raise ValueError(f"Cohere API call failed. Error: {e}") from e
+
+    async def acall(self, messages: List[Message]) -> str:
+        """Call the Cohere client asynchronously.
+
+        :param messages: The messages to pass to the Cohere client.
+        :type messages: List[Message]
+        :return: The response from the Cohere client.
+        :rtype: str
+        """
+        if self._async_client is None:
+            raise ValueError("Cohere async client is not initialized.")
+        try:
+            async with self._arequest_slot():
+                completion = await self._async_client.chat(
+                    model=self.name,
+                    chat_history=[m.to_cohere() for m in messages[:-1]],
+                    message=messages[-1].content,
+                )
 
             output = completion.text
 
@@ -1,3 +1,5 @@
+import asyncio
+import threading
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -12,11 +14,15 @@ from semantic_router.utils.logger import logger
 class LlamaCppLLM(BaseLLM):
     """LLM for LlamaCPP. Enables fully local LLM use, helpful for local implementation of
     dynamic routes.
+
+    The model runs in-process, so async calls run in a worker thread. Calls are
+    serialized as a llama.cpp model cannot run several completions at once.
     """
 
     llm: Any
     grammar: Optional[Any] = None
     _llama_cpp: Any = PrivateAttr()
+    _lock: Any = PrivateAttr(default_factory=threading.RLock)
 
     def __init__(
         self,
@@ -73,13 +79,14 @@ class LlamaCppLLM(BaseLLM):
         :rtype: str
         """
         try:
-            completion = self.llm.create_chat_completion(
-                messages=[m.to_llamacpp() for m in messages],
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                grammar=self.grammar,
-                stream=False,
-            )
+            with self._lock:
+                completion = self.llm.create_chat_completion(
+                    messages=[m.to_llamacpp() for m in messages],
+                    temperature=self.temperature,
+                    max_tokens=self.max_tokens,
+                    grammar=self.grammar,
+                    stream=False,
+                )
             assert isinstance(completion, dict)  # keep mypy happy
             output = completion["choices"][0]["message"]["content"]
 
@@ -117,7 +124,25 @@ class LlamaCppLLM(BaseLLM):
         :return: The function inputs.
         :rtype: List[Dict[str, Any]]
         """
-        with self._grammar():
+        # hold the lock so no other call runs while the grammar is set
+        with self._lock, self._grammar():
             return super().extract_function_inputs(
                 query=query, function_schemas=function_schemas
             )
+
+    async def async_extract_function_inputs(
+        self, query: str, function_schemas: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Extract the function inputs from the query asynchronously, in a worker
+        thread.
+
+        :param query: The query to extract the function inputs from.
+        :type query: str
+        :param function_schemas: The function schemas to extract the function inputs from.
+        :type function_schemas: List[Dict[str, Any]]
+        :return: The function inputs.
+        :rtype: List[Dict[str, Any]]
+        """
+        return await asyncio.to_thread(
+            self.extract_function_inputs, query, function_schemas
+        )
@@ -13,6 +13,7 @@ class MistralAILLM(BaseLLM):
     """LLM for MistralAI. Requires a MistralAI API key from https://console.mistral.ai/api-keys/"""
 
     _client: Any = PrivateAttr()
+    _async_client: Any = PrivateAttr(default=None)
     _mistralai: Any = PrivateAttr()
 
     def __init__(
@@ -50,6 +51,7 @@ class MistralAILLM(BaseLLM):
         """
         try:
             import mistralai
+            from mistralai.async_client import MistralAsyncClient
             from mistralai.client import MistralClient
         except ImportError:
             raise ImportError(
@@ -62,6 +64,7 @@ class MistralAILLM(BaseLLM):
             raise ValueError("MistralAI API key cannot be 'None'.")
         try:
             client = MistralClient(api_key=api_key)
+            self._async_client = MistralAsyncClient(api_key=api_key)
         except Exception as e:
             raise ValueError(
                 f"MistralAI API client failed to initialize. Error: {e}"
@@ -85,12 +88,47 @@ class MistralAILLM(BaseLLM):
             for m in messages
         ]
         try:
-            completion = self._client.chat(
-                model=self.name,
-                messages=chat_messages,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
+            with self._request_slot():
+                completion = self._client.chat(
+                    model=self.name,
+                    messages=chat_messages,
+                    temperature=self.temperature,
+                    max_tokens=self.max_tokens,
+                )
+
+            output = completion.choices[0].message.content
+
+            if not output:
+                raise Exception("No output generated")
+            return output
+        except Exception as e:
+            logger.error(f"LLM error: {e}")
+            raise Exception(f"LLM error: {e}") from e
+
+    async def acall(self, messages: List[Message]) -> str:
+        """Call the MistralAILLM asynchronously.
+
+        :param messages: The messages to pass to the MistralAILLM.
+        :type messages: List[Message]
+        :return: The response from the MistralAILLM.
+        :rtype: str
+        """
+        if self._async_client is None:
+            raise ValueError("MistralAI async client is not initialized.")
+        chat_messages = [
+            self._mistralai.models.chat_completion.ChatMessage(
+                role=m.role, content=m.content
             )
+            for m in messages
+        ]
+        try:
+            async with self._arequest_slot():
+                completion = await self._async_client.chat(
+                    model=self.name,
+                    messages=chat_messages,
+                    temperature=self.temperature,
+                    max_tokens=self.max_tokens,
+                )
 
             output = completion.choices[0].message.content
 
@@ -1,19 +1,29 @@
-from typing import List, Optional
+import asyncio
+from typing import Any, Dict, List, Optional
 
+import aiohttp
 import requests
+from pydantic import PrivateAttr
 
 from semantic_router.llms import BaseLLM
 from semantic_router.schema import Message
 from semantic_router.utils.logger import logger
 
+OLLAMA_CHAT_URL = "http://localhost:11434/api/chat"
+
 
 class OllamaLLM(BaseLLM):
     """LLM for Ollama. Enables fully local LLM use, helpful for local implementation of
     dynamic routes.
+
+    Requests reuse pooled HTTP sessions, call `close` or `aclose` to release them.
     """
 
     stream: bool = False
 
+    _session: Optional[requests.Session] = PrivateAttr(default=None)
+    _async_session: Optional[aiohttp.ClientSession] = PrivateAttr(default=None)
+
     def __init__(
         self,
         name: str = "openhermes",
@@ -57,25 +67,114 @@ class OllamaLLM(BaseLLM):
         :type max_tokens: Optional[int]
         :param stream: Whether to stream the response.
         :type stream: Optional[bool]
+        :return: The response from the OllamaLLM.
+        :rtype: str
         """
-        # Use instance defaults if not overridden
-        temperature = temperature if temperature is not None else self.temperature
-        name = name if name is not None else self.name
-        max_tokens = max_tokens if max_tokens is not None else self.max_tokens
-        stream = stream if stream is not None else self.stream
-
         try:
-            payload = {
-                "model": name,
-                "messages": [m.to_openai() for m in messages],
-                "options": {"temperature": temperature, "num_predict": max_tokens},
-                "format": "json",
-                "stream": stream,
-            }
-            response = requests.post("http://localhost:11434/api/chat", json=payload)
+            payload = self._payload(messages, temperature, name, max_tokens, stream)
+            response = self._get_session().post(OLLAMA_CHAT_URL, json=payload)
             output = response.json()["message"]["content"]
 
             return output
         except Exception as e:
             logger.error(f"LLM error: {e}")
             raise Exception(f"LLM error: {e}") from e
+
+    async def acall(
+        self,
+        messages: List[Message],
+        temperature: Optional[float] = None,
+        name: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        stream: Optional[bool] = None,
+    ) -> str:
+        """Call the OllamaLLM asynchronously.
+
+        :param messages: The messages to pass to the OllamaLLM.
+        :type messages: List[Message]
+        :param temperature: The temperature of the LLM.
+        :type temperature: Optional[float]
+        :param name: The name of the Ollama model to use.
+        :type name: Optional[str]
+        :param max_tokens: The maximum number of tokens to generate.
+        :type max_tokens: Optional[int]
+        :param stream: Whether to stream the response.
+        :type stream: Optional[bool]
+        :return: The response from the OllamaLLM.
+        :rtype: str
+        """
+        try:
+            payload = self._payload(messages, temperature, name, max_tokens, stream)
+            async with self._get_async_session().post(
+                OLLAMA_CHAT_URL, json=payload
+            ) as response:
+                output = (await response.json())["message"]["content"]
+
+            return output
+        except Exception as e:
+            logger.error(f"LLM error: {e}")
+            raise Exception(f"LLM error: {e}") from e
+
+    def _payload(
+        self,
+        messages: List[Message],
+        temperature: Optional[float],
+        name: Optional[str],
+        max_tokens: Optional[int],
+        stream: Optional[bool],
+    ) -> Dict[str, Any]:
+        """Build the chat request payload, using the instance defaults for any
+        argument not overridden.
+        """
+        temperature = temperature if temperature is not None else self.temperature
+        name = name if name is not None else self.name
+        max_tokens = max_tokens if max_tokens is not None else self.max_tokens
+        stream = stream if stream is not None else self.stream
+        return {
+            "model": name,
+            "messages": [m.to_openai() for m in messages],
+            "options": {"temperature": temperature, "num_predict": max_tokens},
+            "format": "json",
+            "stream": stream,
+        }
+
+    def _get_session(self) -> requests.Session:
+        """Get the pooled HTTP session used for synchronous requests, creating it on
+        first use.
+
+        :return: The HTTP session.
+        :rtype: requests.Session
+        """
+        if self._session is None:
+            self._session = requests.Session()
+        return self._session
+
+    def _get_async_session(self) -> aiohttp.ClientSession:
+        """Get the pooled HTTP session used for asynchronous requests, creating it on
+        first use or when the previous session was closed or belonged to another
+        event loop.
+
+        :return: The HTTP session.
+        :rtype: aiohttp.ClientSession
+        """
+        session = self._async_session
+        if (
+            session is None
+            or session.closed
+            or session._loop is not asyncio.get_running_loop()
+        ):
+            self._async_session = aiohttp.ClientSession()
+        return self._async_session  # type: ignore
+
+    def close(self):
+        """Close the pooled synchronous HTTP session, if one was opened."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    async def aclose(self):
+        """Close the pooled HTTP sessions, if any were opened."""
+        self.close()
+        if self._async_session is not None and not self._async_session.closed:
+            await self._async_session.close()
+        self._async_session = None
@@ -12,6 +12,9 @@ from openai.types.chat.chat_completion_message_tool_call import (
 from pydantic import PrivateAttr
 
 from semantic_router.llms import BaseLLM
+from semantic_router.llms.base import (
+    compile_function_schema,
+)
 from semantic_router.schema import Message
 from semantic_router.utils.defaults import EncoderDefault
 from semantic_router.utils.function_call import (
@@ -24,6 +27,8 @@ from semantic_router.utils.logger import logger
 class OpenAILLM(BaseLLM):
     """LLM for OpenAI. Requires an OpenAI API key from https://platform.openai.com/api-keys."""
 
+    native_function_calling: bool = False
+
     _client: Optional[openai.OpenAI] = PrivateAttr(default=None)
     _async_client: Optional[openai.AsyncOpenAI] = PrivateAttr(default=None)
 
@@ -33,6 +38,7 @@ class OpenAILLM(BaseLLM):
         openai_api_key: Optional[str] = None,
         temperature: float = 0.01,
         max_tokens: int = 200,
+        native_function_calling: bool = False,
     ):
         """Initialize the OpenAILLM.
 
@@ -44,6 +50,11 @@ class OpenAILLM(BaseLLM):
         :type temperature: float
         :param max_tokens: The maximum number of tokens to generate.
         :type max_tokens: int
+        :param native_function_calling: Whether to extract the inputs of function
+            schemas returned by `get_schema` with OpenAI tool calling rather than by
+            prompting for JSON. Schemas returned by `get_schemas_openai` always use
+            tool calling.
+        :type native_function_calling: bool
         """
         if name is None:
             name = EncoderDefault.OPENAI.value["language_model"]
@@ -60,6 +71,7 @@ class OpenAILLM(BaseLLM):
             ) from e
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self.native_function_calling = native_function_calling
 
     def _extract_tool_calls_info(
         self, tool_calls: List[ChatCompletionMessageToolCall]
@@ -130,13 +142,14 @@ class OpenAILLM(BaseLLM):
                 function_schemas if function_schemas else NOT_GIVEN
             )
 
-            completion = self._client.chat.completions.create(
-                model=self.name,
-                messages=[m.to_openai() for m in messages],
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                tools=tools,  # type: ignore # We pass a list of dicts which get interpreted as Iterable[ChatCompletionToolParam].
-            )
+            with self._request_slot():
+                completion = self._client.chat.completions.create(
+                    model=self.name,
+                    messages=[m.to_openai() for m in messages],
+                    temperature=self.temperature,
+                    max_tokens=self.max_tokens,
+                    tools=tools,  # type: ignore # We pass a list of dicts which get interpreted as Iterable[ChatCompletionToolParam].
+                )
 
             if function_schemas:
                 tool_calls = completion.choices[0].message.tool_calls
@@ -183,13 +196,14 @@ class OpenAILLM(BaseLLM):
                 function_schemas if function_schemas is not None else NOT_GIVEN
             )
 
-            completion = await self._async_client.chat.completions.create(
-                model=self.name,
-                messages=[m.to_openai() for m in messages],
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                tools=tools,  # type: ignore # We pass a list of dicts which get interpreted as Iterable[ChatCompletionToolParam].
-            )
+            async with self._arequest_slot():
+                completion = await self._async_client.chat.completions.create(
+                    model=self.name,
+                    messages=[m.to_openai() for m in messages],
+                    temperature=self.temperature,
+                    max_tokens=self.max_tokens,
+                    tools=tools,  # type: ignore # We pass a list of dicts which get interpreted as Iterable[ChatCompletionToolParam].
+                )
 
             if function_schemas:
                 tool_calls = completion.choices[0].message.tool_calls
@@ -227,6 +241,10 @@ class OpenAILLM(BaseLLM):
         :return: The function inputs.
         :rtype: List[Dict[str, Any]]
         """
+        if _is_signature_schemas(function_schemas):
+            if self.native_function_calling:
+                return self._extract_native_function_inputs(query, function_schemas)
+            return super().extract_function_inputs(query, function_schemas)
         system_prompt = "You are an intelligent AI. Given a command or request from the user, call the function to complete the request."
         messages = [
             Message(role="system", content=system_prompt),
@@ -253,6 +271,12 @@ class OpenAILLM(BaseLLM):
         :return: The function inputs.
         :rtype: List[Dict[str, Any]]
         """
+        if _is_signature_schemas(function_schemas):
+            if self.native_function_calling:
+                return await self._async_extract_native_function_inputs(
+                    query, function_schemas
+                )
+            return await super().async_extract_function_inputs(query, function_schemas)
         system_prompt = "You are an intelligent AI. Given a command or request from the user, call the function to complete the request."
         messages = [
             Message(role="system", content=system_prompt),
@@ -267,6 +291,92 @@ class OpenAILLM(BaseLLM):
             raise ValueError("Invalid inputs")
         return function_inputs
 
+    def _extract_native_function_inputs(
+        self, query: str, function_schemas: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Extract the inputs of `get_schema` function schemas with tool calling.
+
+        :param query: The query to extract the function inputs from.
+        :type query: str
+        :param function_schemas: The function schemas to extract the function inputs from.
+        :type function_schemas: List[Dict[str, Any]]
+        :return: The function inputs.
+        :rtype: List[Dict[str, Any]]
+        """
+        if self._client is None:
+            raise ValueError("OpenAI client is not initialized.")
+        tools = _get_tools(function_schemas)
+        with self._request_slot():
+            completion = self._client.chat.completions.create(
+                model=self.name,
+                messages=[m.to_openai() for m in _tool_messages(query)],
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
+                tools=tools,  # type: ignore # We pass a list of dicts which get interpreted as Iterable[ChatCompletionToolParam].
+                tool_choice=_tool_choice(tools),  # type: ignore
+            )
+        tool_calls = completion.choices[0].message.tool_calls
+        if not tool_calls:
+            raise Exception("No output generated for extract function input")
+        return self._check_native_function_inputs(
+            self._extract_tool_calls_info(tool_calls), function_schemas
+        )
+
+    async def _async_extract_native_function_inputs(
+        self, query: str, function_schemas: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Extract the inputs of `get_schema` function schemas with tool calling
+        asynchronously.
+
+        :param query: The query to extract the function inputs from.
+        :type query: str
+        :param function_schemas: The function schemas to extract the function inputs from.
+        :type function_schemas: List[Dict[str, Any]]
+        :return: The function inputs.
+        :rtype: List[Dict[str, Any]]
+        """
+        if self._async_client is None:
+            raise ValueError("OpenAI async_client is not initialized.")
+        tools = _get_tools(function_schemas)
+        async with self._arequest_slot():
+            completion = await self._async_client.chat.completions.create(
+                model=self.name,
+                messages=[m.to_openai() for m in _tool_messages(query)],
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
+                tools=tools,  # type: ignore # We pass a list of dicts which get interpreted as Iterable[ChatCompletionToolParam].
+                tool_choice=_tool_choice(tools),  # type: ignore
+            )
+        tool_calls = completion.choices[0].message.tool_calls
+        if not tool_calls:
+            raise Exception("No output generated for extract function input")
+        return self._check_native_function_inputs(
+            await self.async_extract_tool_calls_info(tool_calls), function_schemas
+        )
+
+    def _check_native_function_inputs(
+        self,
+        tool_calls_info: List[Dict[str, Any]],
+        function_schemas: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """Convert tool calls to the function inputs format of `get_schema` function
+        schemas and validate them.
+
+        :param tool_calls_info: The tool calls information.
+        :type tool_calls_info: List[Dict[str, Any]]
+        :param function_schemas: The function schemas the tools were built from.
+        :type function_schemas: List[Dict[str, Any]]
+        :return: The function inputs.
+        :rtype: List[Dict[str, Any]]
+        """
+        names = {compile_function_schema(schema).name for schema in function_schemas}
+        if any(call["function_name"] not in names for call in tool_calls_info):
+            raise ValueError("Invalid inputs")
+        function_inputs = [call["arguments"] for call in tool_calls_info]
+        if not self._is_valid_inputs(function_inputs, function_schemas):
+            raise ValueError("Invalid inputs")
+        return function_inputs
+
     def _is_valid_inputs(
         self, inputs: List[Dict[str, Any]], function_schemas: List[Dict[str, Any]]
     ) -> bool:
@@ -280,6 +390,8 @@ class OpenAILLM(BaseLLM):
         :return: True if the inputs are valid, False otherwise.
         :rtype: bool
         """
+        if _is_signature_schemas(function_schemas):
+            return super()._is_valid_inputs(inputs, function_schemas)
         try:
             for input_dict in inputs:
                 # Check if 'function_name' and 'arguments' keys exist in each input dictionary
@@ -330,6 +442,8 @@ class OpenAILLM(BaseLLM):
         :type function_schema: Dict[str, Any]
         :return: True if the inputs are valid, False otherwise.
         """
+        if isinstance(function_schema, dict) and "signature" in function_schema:
+            return super()._validate_single_function_inputs(inputs, function_schema)
         try:
             # Access the parameters and their properties from the function schema directly
             parameters = function_schema["parameters"]["properties"]
@@ -360,6 +474,67 @@ class OpenAILLM(BaseLLM):
             return False
 
 
+def _is_signature_schemas(function_schemas: List[Dict[str, Any]]) -> bool:
+    """Check whether function schemas are in the format returned by `get_schema`
+    rather than OpenAI tools, as returned by `get_schemas_openai`.
+    """
+    return bool(function_schemas) and all(
+        isinstance(schema, dict) and "signature" in schema
+        for schema in function_schemas
+    )
+
+
+def _tool_messages(query: str) -> List[Message]:
+    system_prompt = "You are an intelligent AI. Given a command or request from the user, call the function to complete the request."
+    return [
+        Message(role="system", content=system_prompt),
+        Message(role="user", content=query),
+    ]
+
+
+def _tool_choice(tools: List[Dict[str, Any]]) -> Union[str, Dict[str, Any]]:
+    if len(tools) == 1:
+        return {"type": "function", "function": {"name": tools[0]["function"]["name"]}}
+    return "required"
+
+
+def _get_tools(function_schemas: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Convert function schemas returned by `get_schema` to OpenAI tools.
+
+    :param function_schemas: The function schemas to convert.
+    :type function_schemas: List[Dict[str, Any]]
+    :return: The OpenAI tools.
+    :rtype: List[Dict[str, Any]]
+    """
+    tools = []
+    for schema in function_schemas:
+        compiled = compile_function_schema(schema)
+        properties: Dict[str, Dict[str, Any]] = {}
+        for name in compiled.parameters:
+            param_type = compiled.parameter_types.get(name, "")
+            # only simple annotations map to a JSON type, leave the rest untyped
+            properties[name] = (
+                {"type": convert_python_type_to_json_type(param_type)}
+                if param_type in ("int", "float", "str", "bool", "list", "dict")
+                else {}
+            )
+        tools.append(
+            {
+                "type": "function",
+                "function": {
+                    "name": compiled.name,
+                    "description": compiled.description,
+                    "parameters": {
+                        "type": "object",
+                        "properties": properties,
+                        "required": list(compiled.mandatory_parameters),
+                    },
+                },
+            }
+        )
+    return tools
+
+
 def get_schemas_openai(items: List[Callable]) -> List[Dict[str, Any]]:
     """Get function schemas for the OpenAI LLM from a list of functions.
 
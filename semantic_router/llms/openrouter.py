@@ -14,6 +14,7 @@ class OpenRouterLLM(BaseLLM):
     https://openrouter.ai/docs/api-reference/authentication#using-an-api-key"""
 
     _client: Optional[openai.OpenAI] = PrivateAttr(default=None)
+    _async_client: Optional[openai.AsyncOpenAI] = PrivateAttr(default=None)
     _base_url: str = PrivateAttr(default="https://openrouter.ai/api/v1")
 
     def __init__(
@@ -48,6 +49,9 @@ class OpenRouterLLM(BaseLLM):
             raise ValueError("OpenRouter API key cannot be 'None'.")
         try:
             self._client = openai.OpenAI(api_key=api_key, base_url=self._base_url)
+            self._async_client = openai.AsyncOpenAI(
+                api_key=api_key, base_url=self._base_url
+            )
         except Exception as e:
             raise ValueError(
                 f"OpenRouter API client failed to initialize. Error: {e}"
@@ -66,12 +70,41 @@ class OpenRouterLLM(BaseLLM):
         if self._client is None:
             raise ValueError("OpenRouter client is not initialized.")
         try:
-            completion = self._client.chat.completions.create(
-                model=self.name,
-                messages=[m.to_openai() for m in messages],
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-            )
+            with self._request_slot():
+                completion = self._client.chat.completions.create(
+                    model=self.name,
+                    messages=[m.to_openai() for m in messages],
+                    temperature=self.temperature,
+                    max_tokens=self.max_tokens,
+                )
+
+            output = completion.choices[0].message.content
+
+            if not output:
+                raise Exception("No output generated")
+            return output
+        except Exception as e:
+            logger.error(f"LLM error: {e}")
+            raise Exception(f"LLM error: {e}") from e
+
+    async def acall(self, messages: List[Message]) -> str:
+        """Call the OpenRouterLLM asynchronously.
+
+        :param messages: The messages to pass to the OpenRouterLLM.
+        :type messages: List[Message]
+        :return: The response from the OpenRouterLLM.
+        :rtype: str
+        """
+        if self._async_client is None:
+            raise ValueError("OpenRouter async client is not initialized.")
+        try:
+            async with self._arequest_slot():
+                completion = await self._async_client.chat.completions.create(
+                    model=self.name,
+                    messages=[m.to_openai() for m in messages],
+                    temperature=self.temperature,
+                    max_tokens=self.max_tokens,
+                )
 
             output = completion.choices[0].message.content
 
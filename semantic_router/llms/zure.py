@@ -68,12 +68,13 @@ class AzureOpenAILLM(BaseLLM):
         if self._client is None:
             raise ValueError("AzureOpenAI client is not initialized.")
         try:
-            completion = self._client.chat.completions.create(
-                model=self.name,
-                messages=[m.to_openai() for m in messages],
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-            )
+            with self._request_slot():
+                completion = self._client.chat.completions.create(
+                    model=self.name,
+                    messages=[m.to_openai() for m in messages],
+                    temperature=self.temperature,
+                    max_tokens=self.max_tokens,
+                )
 
             output = completion.choices[0].message.content
 
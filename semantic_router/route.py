@@ -1,9 +1,12 @@
+import copy
+import hashlib
 import json
 import re
 from typing import Any, Callable, ClassVar, Dict, List, Optional, Union
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
+from semantic_router.cache.base import BaseCache, normalize_text
 from semantic_router.llms import BaseLLM
 from semantic_router.schema import Message, RouteChoice
 from semantic_router.utils import function_call
@@ -62,6 +65,10 @@ class Route(BaseModel):
     :type score_threshold: Optional[float]
     :param metadata: The metadata of the route.
     :type metadata: Optional[Dict[str, Any]]
+    :param function_cache: An optional cache, such as an `LRUCache` or `TTLCache`, of
+        the function inputs extracted by the LLM for previous queries. It is not
+        serialized with the route.
+    :type function_cache: Optional[BaseCache]
     """
 
     name: str
@@ -71,15 +78,20 @@ class Route(BaseModel):
     llm: Optional[BaseLLM] = None
     score_threshold: Optional[float] = None
     metadata: Optional[Dict[str, Any]] = {}
+    function_cache: Optional[BaseCache] = Field(default=None, exclude=True)
 
     model_config: ClassVar[ConfigDict] = ConfigDict(arbitrary_types_allowed=True)
 
-    def __call__(self, query: Optional[str] = None) -> RouteChoice:
+    def __call__(
+        self, query: Optional[str] = None, use_cache: bool = True
+    ) -> RouteChoice:
         """Call the route. If dynamic routes have been provided the query must have been
         provided and the llm attribute must be set.
 
         :param query: The query to pass to the route.
         :type query: Optional[str]
+        :param use_cache: Whether to use the function cache, if one is set.
+        :type use_cache: bool
         :return: The route choice.
         :rtype: RouteChoice
         """
@@ -94,22 +106,30 @@ class Route(BaseModel):
                     "Query is required for dynamic routes. Please ensure the `query` "
                     "argument is passed."
                 )
+            key = self._function_cache_key(query) if use_cache else None
+            if (cached := self._read_function_inputs(key)) is not None:
+                return RouteChoice(name=self.name, function_call=cached)
             # if a function schema is provided we generate the inputs
             extracted_inputs = self.llm.extract_function_inputs(
                 query=query, function_schemas=self.function_schemas
             )
+            self._write_function_inputs(key, extracted_inputs)
             func_call = extracted_inputs
         else:
             # otherwise we just pass None for the call
             func_call = None
         return RouteChoice(name=self.name, function_call=func_call)
 
-    async def acall(self, query: Optional[str] = None) -> RouteChoice:
+    async def acall(
+        self, query: Optional[str] = None, use_cache: bool = True
+    ) -> RouteChoice:
         """Asynchronous call the route. If dynamic routes have been provided the query
         must have been provided and the llm attribute must be set.
 
         :param query: The query to pass to the route.
         :type query: Optional[str]
+        :param use_cache: Whether to use the function cache, if one is set.
+        :type use_cache: bool
         :return: The route choice.
         :rtype: RouteChoice
         """
@@ -124,16 +144,67 @@ class Route(BaseModel):
                     "Query is required for dynamic routes. Please ensure the `query` "
                     "argument is passed."
                 )
+            key = self._function_cache_key(query) if use_cache else None
+            if (cached := self._read_function_inputs(key)) is not None:
+                return RouteChoice(name=self.name, function_call=cached)
             # if a function schema is provided we generate the inputs
-            extracted_inputs = await self.llm.async_extract_function_inputs(  # type: ignore # openai-llm
+            extracted_inputs = await self.llm.async_extract_function_inputs(
                 query=query, function_schemas=self.function_schemas
             )
+            self._write_function_inputs(key, extracted_inputs)
             func_call = extracted_inputs
         else:
             # otherwise we just pass None for the call
             func_call = None
         return RouteChoice(name=self.name, function_call=func_call)
 
+    def _function_cache_key(self, query: str) -> Optional[str]:
+        """Build the function cache key for a query, made from the route name, a hash
+        of the function schemas, the LLM and the normalized query.
+
+        :param query: The query passed to the route.
+        :type query: str
+        :return: The cache key, or None if the route has no function cache.
+        :rtype: Optional[str]
+        """
+        if self.function_cache is None or self.llm is None:
+            return None
+        schemas = json.dumps(self.function_schemas, sort_keys=True, default=str)
+        key = json.dumps(
+            [
+                self.name,
+                hashlib.sha256(schemas.encode("utf-8")).hexdigest(),
+                f"{self.llm.__class__.__name__}/{self.llm.name}",
+                normalize_text(query),
+            ]
+        )
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _read_function_inputs(self, key: Optional[str]) -> Optional[Any]:
+        """Get the cached function inputs for a cache key.
+
+        :param key: The cache key, or None to skip the cache.
+        :type key: Optional[str]
+        :return: A copy of the cached function inputs, or None on a cache miss.
+        :rtype: Optional[Any]
+        """
+        if key is None or self.function_cache is None:
+            return None
+        cached = self.function_cache.get(key)
+        return copy.deepcopy(cached) if cached is not None else None
+
+    def _write_function_inputs(self, key: Optional[str], function_inputs: Any):
+        """Cache the function inputs extracted for a cache key.
+
+        :param key: The cache key, or None to skip the cache.
+        :type key: Optional[str]
+        :param function_inputs: The extracted function inputs.
+        :type function_inputs: Any
+        """
+        if key is None or self.function_cache is None:
+            return
+        self.function_cache.set(key, copy.deepcopy(function_inputs))
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert the route to a dictionary.
 
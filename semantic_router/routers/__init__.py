@@ -1,4 +1,10 @@
 from semantic_router.routers.base import BaseRouter, RouterConfig
+from semantic_router.routers.cascade import (
+    CascadeRouter,
+    CascadeStage,
+    RouterStage,
+    SparseStage,
+)
 from semantic_router.routers.hybrid import HybridRouter
 from semantic_router.routers.semantic import SemanticRouter
 
@@ -7,4 +13,8 @@ __all__ = [
     "RouterConfig",
     "SemanticRouter",
     "HybridRouter",
+    "CascadeRouter",
+    "CascadeStage",
+    "RouterStage",
+    "SparseStage",
 ]
@@ -1,16 +1,37 @@
+import asyncio
 import hashlib
 import importlib
 import json
 import os
 import random
-from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple, Union
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import numpy as np
 import yaml  # type: ignore
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 from tqdm.auto import tqdm
 from typing_extensions import deprecated
 
+from semantic_router.cache import BaseCache, SemanticCache
+from semantic_router.cache.base import embedding_cache_key, normalize_text
 from semantic_router.encoders import (
     AutoEncoder,
     DenseEncoder,
@@ -18,7 +39,7 @@ from semantic_router.encoders import (
     SparseEncoder,
 )
 from semantic_router.encoders.encode_input_type import EncodeInputType
-from semantic_router.index.base import BaseIndex
+from semantic_router.index.base import BaseIndex, route_hashes_field
 from semantic_router.index.local import LocalIndex
 from semantic_router.index.pinecone import PineconeIndex
 from semantic_router.index.qdrant import QdrantIndex
@@ -31,9 +52,31 @@ from semantic_router.schema import (
     Utterance,
     UtteranceDiff,
 )
+from semantic_router.utils.batching import MicroBatcher
 from semantic_router.utils.defaults import EncoderDefault
+from semantic_router.utils.ingestion import (
+    DEFAULT_INGEST_BATCH_SIZE,
+    IngestionCheckpoint,
+    ProgressCallback,
+    aingest,
+    fingerprint,
+    ingest,
+)
 from semantic_router.utils.logger import logger
 
+# Pinecone limits the metadata of a record to 40KB
+MAX_ROUTE_HASHES_SIZE = 32_000
+# room left in the first route hashes record for the root hash, router hash and
+# number of records
+ROUTE_HASHES_HEAD_SIZE = 256
+# seconds between attempts of an async writer to take the write lock
+WRITE_LOCK_POLL_INTERVAL = 0.01
+# the ids of the write locks held by the current thread or task, so that a write
+# nested in another write of the same router does not wait on itself
+_held_write_locks: ContextVar[FrozenSet[int]] = ContextVar(
+    "held_write_locks", default=frozenset()
+)
+
 
 def is_valid(layer_config: str) -> bool:
     """Make sure the given string is json format and contains the 3 keys:
@@ -324,6 +367,40 @@ class RouterConfig:
             value=hashlib.sha256(json.dumps(layer).encode()).hexdigest(),
         )
 
+    def get_route_hashes(self) -> List[ConfigParameter]:
+        """Get the hash of each route of the RouterConfig, with a root hash over all
+        of them. Used to sync only the routes that changed. The hashes are split
+        across as many config records as needed to keep each record under
+        `MAX_ROUTE_HASHES_SIZE`, the first record also holds the root hash and the
+        number of records.
+
+        :return: The records of the route hashes of the RouterConfig.
+        :rtype: List[ConfigParameter]
+        """
+        route_hashes = _route_hashes(self.to_utterances())
+        shards = _shard_route_hashes(route_hashes)
+        values = [
+            json.dumps(
+                {
+                    "root": _root_hash(route_hashes),
+                    "sr_hash": self.get_hash().value,
+                    "shards": len(shards),
+                    "routes": shards[0],
+                },
+                sort_keys=True,
+            )
+        ] + [json.dumps({"routes": shard}, sort_keys=True) for shard in shards[1:]]
+        if any(len(value) > MAX_ROUTE_HASHES_SIZE for value in values):
+            logger.warning(
+                "Route hashes are too large to be stored, syncs will compare all "
+                "routes."
+            )
+            values = [""]
+        return [
+            ConfigParameter(field=route_hashes_field(shard), value=value)
+            for shard, value in enumerate(values)
+        ]
+
 
 def xq_reshape(xq: List[float] | np.ndarray) -> np.ndarray:
     """Reshape the query vector to be a 2D numpy array.
@@ -346,6 +423,224 @@ def xq_reshape(xq: List[float] | np.ndarray) -> np.ndarray:
     return xq
 
 
+def _copy_choice(
+    route_choice: RouteChoice | List[RouteChoice],
+) -> RouteChoice | List[RouteChoice]:
+    """Copy a route choice so that cached choices are not shared with callers."""
+    if isinstance(route_choice, list):
+        return [choice.model_copy() for choice in route_choice]
+    return route_choice.model_copy()
+
+
+def _utterance_key(utterance: Any) -> Any:
+    """Get a hashable key for an utterance, which may be any object."""
+    try:
+        hash(utterance)
+        return utterance
+    except TypeError:
+        return repr(utterance)
+
+
+def _utterances_by_route(utterances: List[Utterance]) -> Dict[str, List[Any]]:
+    """Group the utterance texts by route, as expected by `_remove_and_sync`."""
+    by_route: Dict[str, List[Any]] = {}
+    for utt in utterances:
+        by_route.setdefault(utt.route, []).append(utt.utterance)
+    return by_route
+
+
+def _utterance_records(utterances: List[Utterance]) -> List[Tuple]:
+    """Get the records to add to the index for utterances."""
+    return [
+        (utt.route, utt.utterance, utt.function_schemas, utt.metadata)
+        for utt in utterances
+    ]
+
+
+def _get_checkpoint(
+    records: List[Tuple], batch_size: int, checkpoint_path: Optional[str]
+) -> Optional[IngestionCheckpoint]:
+    """Get the ingestion checkpoint of records, if a checkpoint path is given."""
+    if checkpoint_path is None:
+        return None
+    return IngestionCheckpoint(
+        path=checkpoint_path,
+        fingerprint=fingerprint(
+            [json.dumps(record, sort_keys=True, default=str) for record in records]
+        ),
+        batch_size=batch_size,
+    )
+
+
+def _route_hashes(utterances: List[Utterance]) -> Dict[str, str]:
+    """Hash the utterances of each route, including their function schemas and
+    metadata. Utterance order and duplicates do not change the hash.
+
+    :param utterances: The utterances to hash.
+    :type utterances: List[Utterance]
+    :return: A mapping of route names to their hashes.
+    :rtype: Dict[str, str]
+    """
+    route_strs: Dict[str, Set[str]] = {}
+    for utt in utterances:
+        route_strs.setdefault(utt.route, set()).add(utt.to_str(include_metadata=True))
+    return {
+        route: hashlib.sha256(json.dumps(sorted(strs)).encode()).hexdigest()[:16]
+        for route, strs in route_strs.items()
+    }
+
+
+def _shard_route_hashes(route_hashes: Dict[str, str]) -> List[Dict[str, str]]:
+    """Split the route hashes into shards that each fit in a config record, leaving
+    room in the first shard for the root hash, router hash and number of shards.
+
+    :param route_hashes: A mapping of route names to their hashes.
+    :type route_hashes: Dict[str, str]
+    :return: The shards of the route hashes, at least one.
+    :rtype: List[Dict[str, str]]
+    """
+    shards: List[Dict[str, str]] = [{}]
+    size = ROUTE_HASHES_HEAD_SIZE
+    for route, route_hash in sorted(route_hashes.items()):
+        entry_size = len(json.dumps({route: route_hash}))
+        if shards[-1] and size + entry_size > MAX_ROUTE_HASHES_SIZE:
+            shards.append({})
+            size = len(json.dumps({"routes": {}}))
+        shards[-1][route] = route_hash
+        size += entry_size
+    return shards
+
+
+def _route_hash_shards(route_hashes: str) -> int:
+    """Get the number of records of the route hashes from the first record, which
+    is 1 for route hashes written before they were sharded or that are invalid."""
+    try:
+        shards = json.loads(route_hashes).get("shards", 1)
+    except (json.JSONDecodeError, AttributeError):
+        return 1
+    return shards if isinstance(shards, int) and shards > 0 else 1
+
+
+def _root_hash(route_hashes: Dict[str, str]) -> str:
+    """Hash the per-route hashes into a single root hash."""
+    return hashlib.sha256(json.dumps(route_hashes, sort_keys=True).encode()).hexdigest()
+
+
+def _changed_routes(
+    local_utterances: List[Utterance], route_hashes: List[str], remote_hash: str
+) -> Optional[Set[str]]:
+    """Compare the local route hashes with the route hashes stored in the index.
+
+    :param local_utterances: The local utterances.
+    :type local_utterances: List[Utterance]
+    :param route_hashes: The records of the route hashes read from the index.
+    :type route_hashes: List[str]
+    :param remote_hash: The router hash read from the index.
+    :type remote_hash: str
+    :return: The names of the routes that differ between local and remote, or None
+        if the stored route hashes cannot be trusted and all routes must be compared.
+    :rtype: Optional[Set[str]]
+    """
+    if not route_hashes or not route_hashes[0] or not remote_hash:
+        return None
+    try:
+        stored = json.loads(route_hashes[0])
+        remote_routes: Dict[str, str] = {}
+        for value in route_hashes:
+            shard = json.loads(value)["routes"]
+            if not isinstance(shard, dict):
+                raise TypeError("route hashes must be a mapping")
+            remote_routes.update(shard)
+        valid = (
+            stored.get("root") == _root_hash(remote_routes)
+            # the route hashes must have been written with the current router hash
+            and stored.get("sr_hash") == remote_hash
+        )
+    except (json.JSONDecodeError, KeyError, TypeError) as e:
+        logger.warning(f"Invalid route hashes in index: {e}")
+        return None
+    if not valid:
+        return None
+    local_routes = _route_hashes(local_utterances)
+    return {
+        route
+        for route in local_routes.keys() | remote_routes.keys()
+        if local_routes.get(route) != remote_routes.get(route)
+    }
+
+
+def _unchanged_utterances(
+    local_utterances: List[Utterance],
+    changed_routes: Set[str],
+    include_metadata: bool,
+) -> List[Utterance]:
+    """Get the local utterances of the routes that match the index, standing in
+    for their remote utterances.
+
+    :param local_utterances: The local utterances.
+    :type local_utterances: List[Utterance]
+    :param changed_routes: The routes that differ between local and remote.
+    :type changed_routes: Set[str]
+    :param include_metadata: Whether to keep function schemas and metadata.
+    :type include_metadata: bool
+    :return: The utterances of the unchanged routes.
+    :rtype: List[Utterance]
+    """
+    return [
+        utt.model_copy()
+        if include_metadata
+        else Utterance(route=utt.route, utterance=utt.utterance)
+        for utt in local_utterances
+        if utt.route not in changed_routes
+    ]
+
+
+class RouterState(NamedTuple):
+    """The routes, index and score threshold a router serves queries from, with the
+    version cached route decisions are keyed on and the exact match table of the
+    routes. A state is never modified once published, so a query reads one
+    consistent state throughout.
+    """
+
+    routes: List[Route]
+    route_index: BaseIndex
+    score_threshold: Optional[float]
+    # identifies the routes, thresholds and scoring settings of the state
+    version: str
+    # normalized utterance to route names, None when exact matching is disabled
+    exact_matches: Optional[Dict[str, List[str]]] = None
+
+
+def _exact_match_table(routes: List[Route]) -> Dict[str, List[str]]:
+    """Map the normalized text of each utterance to the names of the routes that
+    hold it.
+    """
+    exact_matches: Dict[str, List[str]] = {}
+    for route in routes:
+        for utterance in route.utterances:
+            if not isinstance(utterance, str):
+                continue
+            names = exact_matches.setdefault(normalize_text(utterance), [])
+            if route.name not in names:
+                names.append(route.name)
+    return exact_matches
+
+
+def _format_route_choices(
+    passed_routes: List[RouteChoice],
+) -> RouteChoice | List[RouteChoice]:
+    """Return a single RouteChoice when one route passed, for backward
+    compatibility, a list when several passed and an empty RouteChoice otherwise.
+    """
+    if len(passed_routes) == 1:
+        return passed_routes[0]
+    elif len(passed_routes) > 1:
+        return passed_routes
+    else:
+        # if no route passes threshold, return empty route choice
+        return RouteChoice()
+
+
 class BaseRouter(BaseModel):
     """Base class for all routers."""
 
@@ -359,9 +654,25 @@ class BaseRouter(BaseModel):
     aggregation: str = "mean"
     aggregation_method: Optional[Callable] = None
     auto_sync: Optional[str] = None
+    sync_interval: Optional[float] = None
+    embedding_cache: Optional[BaseCache] = None
+    embedding_store: Optional[BaseCache] = None
+    decision_cache: Optional[BaseCache] = None
+    semantic_cache: Optional[SemanticCache] = None
+    exact_match: bool = False
+    max_concurrent_routes: int = 8
 
     model_config: ClassVar[ConfigDict] = ConfigDict(arbitrary_types_allowed=True)
 
+    _encode_batcher: Optional[MicroBatcher] = PrivateAttr(default=None)
+    _query_batcher: Optional[MicroBatcher] = PrivateAttr(default=None)
+    _state: Optional[RouterState] = PrivateAttr(default=None)
+    _state_lock: Any = PrivateAttr(default_factory=threading.RLock)
+    _write_lock: Any = PrivateAttr(default_factory=threading.Lock)
+    _sync_thread: Optional[threading.Thread] = PrivateAttr(default=None)
+    _sync_stop: Any = PrivateAttr(default_factory=threading.Event)
+    _sync_cycle_done: Any = PrivateAttr(default_factory=threading.Event)
+
     def __init__(
         self,
         encoder: Optional[DenseEncoder] = None,
@@ -372,6 +683,11 @@ class BaseRouter(BaseModel):
         top_k: int = 5,
         aggregation: str = "mean",
         auto_sync: Optional[str] = None,
+        embedding_cache: Optional[BaseCache] = None,
+        embedding_store: Optional[BaseCache] = None,
+        decision_cache: Optional[BaseCache] = None,
+        semantic_cache: Optional[SemanticCache] = None,
+        sync_interval: Optional[float] = None,
     ):
         """Initialize a BaseRouter object. Expected to be used as a base class only,
         not directly instantiated.
@@ -392,6 +708,22 @@ class BaseRouter(BaseModel):
         :type aggregation: str
         :param auto_sync: The auto sync mode to use.
         :type auto_sync: Optional[str]
+        :param embedding_cache: An optional cache used to avoid re-encoding text that
+            has been encoded before.
+        :type embedding_cache: Optional[BaseCache]
+        :param embedding_store: An optional persistent store, such as a `SQLiteCache`,
+            consulted after the embedding cache so that embeddings survive restarts.
+        :type embedding_store: Optional[BaseCache]
+        :param decision_cache: An optional in-memory cache, such as an `LRUCache`, of
+            the route choices made for text queries that resolve to static routes.
+        :type decision_cache: Optional[BaseCache]
+        :param semantic_cache: An optional cache of recent query embeddings, reusing
+            the route choice of a near-duplicate query without querying the index.
+        :type semantic_cache: Optional[SemanticCache]
+        :param sync_interval: When set with `auto_sync`, the router is synced by a
+            background thread every `sync_interval` seconds instead of during
+            initialization.
+        :type sync_interval: Optional[float]
         """
         routes = routes.copy() if routes else []
         super().__init__(
@@ -403,6 +735,11 @@ class BaseRouter(BaseModel):
             top_k=top_k,
             aggregation=aggregation,
             auto_sync=auto_sync,
+            embedding_cache=embedding_cache,
+            embedding_store=embedding_store,
+            decision_cache=decision_cache,
+            semantic_cache=semantic_cache,
+            sync_interval=sync_interval,
         )
         self.encoder = self._get_encoder(encoder=encoder)
         self.sparse_encoder = self._get_sparse_encoder(sparse_encoder=sparse_encoder)
@@ -422,6 +759,7 @@ class BaseRouter(BaseModel):
             )
         self.aggregation_method = self._set_aggregation_method(self.aggregation)
         self.auto_sync = auto_sync
+        self.sync_interval = sync_interval
 
         # set route score thresholds if not already set
         for route in self.routes:
@@ -490,9 +828,14 @@ class BaseRouter(BaseModel):
             self.index.index = self.index._init_index(force_create=True)
 
         # run auto sync if active
-        if self.auto_sync:
+        if self.auto_sync and self.sync_interval is not None:
+            # sync in the background so initialization never waits on the index
+            self.start_background_sync(
+                sync_mode=self.auto_sync, interval=self.sync_interval
+            )
+        elif self.auto_sync:
             local_utterances = self.to_config().to_utterances()
-            remote_utterances = self.index.get_utterances(include_metadata=True)
+            remote_utterances = self._get_remote_utterances(local_utterances)
             diff = UtteranceDiff.from_utterances(
                 local_utterances=local_utterances,
                 remote_utterances=remote_utterances,
@@ -500,6 +843,153 @@ class BaseRouter(BaseModel):
             sync_strategy = diff.get_sync_strategy(self.auto_sync)
             self._execute_sync_strategy(sync_strategy)
 
+    def _get_state(self) -> RouterState:
+        """Get the state to serve a query from. Readers take the state once and use
+        it for the whole query, so a write completing meanwhile is never half seen.
+
+        :return: The current router state.
+        :rtype: RouterState
+        """
+        state = self._state
+        if (
+            state is not None
+            and state.routes is self.routes
+            and state.route_index is self.index
+            and state.score_threshold == self.score_threshold
+        ):
+            return state
+        # the routes, index or threshold were reassigned since the last publish
+        with self._state_lock:
+            state = self._new_state(self)
+            self._state = state
+            return state
+
+    def _new_state(self, router: "BaseRouter") -> RouterState:
+        """Build a state to serve queries from the routes, index and score threshold
+        of a router, with its version and the exact match table of its routes if
+        exact matching is enabled.
+
+        :param router: The router to take the state from, either this router or a
+            changed copy of it.
+        :type router: BaseRouter
+        :return: The router state.
+        :rtype: RouterState
+        """
+        version = {
+            "hash": router._get_hash().value,
+            "thresholds": router.get_thresholds(),
+            "score_threshold": router.score_threshold,
+            "top_k": router.top_k,
+            "aggregation": router.aggregation,
+        }
+        return RouterState(
+            routes=router.routes,
+            route_index=router.index,
+            score_threshold=router.score_threshold,
+            version=hashlib.sha256(
+                json.dumps(version, sort_keys=True, default=str).encode("utf-8")
+            ).hexdigest(),
+            exact_matches=(
+                _exact_match_table(router.routes) if self.exact_match else None
+            ),
+        )
+
+    @contextmanager
+    def _write_state(self) -> Iterator["BaseRouter"]:
+        """Make a change to the router on a copy of its state, publishing the copy
+        once the change completes. Queries keep being served from the current state
+        meanwhile, and nothing is published if the change raises. Writers run one
+        at a time.
+
+        :return: The router copy to change.
+        :rtype: Iterator[BaseRouter]
+        """
+        with self._hold_write_lock():
+            staged = self._stage_copy()
+            yield staged
+            self._publish_staged(staged)
+
+    @asynccontextmanager
+    async def _async_write_state(self) -> AsyncIterator["BaseRouter"]:
+        """Make a change to the router on a copy of its state, publishing the copy
+        once the change completes. The write lock is polled so the event loop keeps
+        running while another writer holds it.
+
+        :return: The router copy to change.
+        :rtype: AsyncIterator[BaseRouter]
+        """
+        async with self._async_hold_write_lock():
+            staged = self._stage_copy()
+            yield staged
+            self._publish_staged(staged)
+
+    @contextmanager
+    def _hold_write_lock(self) -> Iterator[None]:
+        """Hold the write lock, or do nothing if the current thread or task already
+        holds it, so that a write nested in another write does not deadlock.
+        """
+        held = _held_write_locks.get()
+        if id(self._write_lock) in held:
+            yield
+            return
+        with self._write_lock:
+            token = _held_write_locks.set(held | {id(self._write_lock)})
+            try:
+                yield
+            finally:
+                _held_write_locks.reset(token)
+
+    @asynccontextmanager
+    async def _async_hold_write_lock(self) -> AsyncIterator[None]:
+        """Hold the write lock like `_hold_write_lock`, polling it so the event loop
+        keeps running while another writer holds it.
+        """
+        held = _held_write_locks.get()
+        if id(self._write_lock) in held:
+            yield
+            return
+        while not self._write_lock.acquire(blocking=False):
+            await asyncio.sleep(WRITE_LOCK_POLL_INTERVAL)
+        token = _held_write_locks.set(held | {id(self._write_lock)})
+        try:
+            yield
+        finally:
+            _held_write_locks.reset(token)
+            self._write_lock.release()
+
+    def _stage_copy(self) -> "BaseRouter":
+        """Copy the router for a write, with its own routes and index so that
+        changing the copy leaves the served state untouched.
+
+        :return: The router copy.
+        :rtype: BaseRouter
+        """
+        return self.model_copy(
+            update={
+                "routes": [
+                    route.model_copy(update={"utterances": list(route.utterances)})
+                    for route in self.routes
+                ],
+                "index": self.index._copy_for_write(),
+            }
+        )
+
+    def _publish_staged(self, staged: "BaseRouter"):
+        """Atomically replace the state the router serves from with the routes,
+        index and score threshold of a changed router copy.
+
+        :param staged: The changed router copy.
+        :type staged: BaseRouter
+        """
+        # the version and exact match table are rebuilt once per add, delete,
+        # update or sync, so queries only look them up
+        state = self._new_state(staged)
+        with self._state_lock:
+            self._state = state
+            self.routes = staged.routes
+            self.index = staged.index
+            self.score_threshold = staged.score_threshold
+
     def _set_score_threshold(self):
         """Set the score threshold for the layer based on the encoder
         score threshold.
@@ -515,16 +1005,22 @@ class BaseRouter(BaseModel):
                     "'None' value can lead to unexpected results."
                 )
 
-    def check_for_matching_routes(self, top_class: str) -> Optional[Route]:
+    def check_for_matching_routes(
+        self, top_class: str, routes: Optional[List[Route]] = None
+    ) -> Optional[Route]:
         """Check for a matching route in the routes list.
 
         :param top_class: The top class to check for.
         :type top_class: str
+        :param routes: The routes to check, defaults to the routes of the router.
+        :type routes: Optional[List[Route]]
         :return: The matching route if found, otherwise None.
         :rtype: Optional[Route]
         """
+        if routes is None:
+            routes = self.routes
         matching_route = next(
-            (route for route in self.routes if route.name == top_class), None
+            (route for route in routes if route.name == top_class), None
         )
         if matching_route is None:
             logger.error(
@@ -541,6 +1037,8 @@ class BaseRouter(BaseModel):
         simulate_static: bool = False,
         route_filter: Optional[List[str]] = None,
         limit: int | None = 1,
+        *,
+        use_function_cache: bool = True,
     ) -> RouteChoice | List[RouteChoice]:
         """Call the router to get a route choice.
 
@@ -555,11 +1053,77 @@ class BaseRouter(BaseModel):
         :param limit: The number of routes to return, defaults to 1. If set to None, no
             limit is applied and all routes are returned.
         :type limit: int | None
+        :param use_function_cache: Whether dynamic routes may reuse the function call
+            inputs cached by their function cache, defaults to True. When False the
+            router's decision caches are not read either, so dynamic routes always
+            call their LLM.
+        :type use_function_cache: bool
         :return: The route choice.
         :rtype: RouteChoice | List[RouteChoice]
         """
-        if not self.index.is_ready():
+        state = self._get_state()
+        if not state.route_index.is_ready():
             raise ValueError("Index is not ready.")
+        cache_text = text if vector is None else None
+        if cache_text is not None and use_function_cache:
+            if (
+                cached := self._read_decision(cache_text, route_filter, limit, state)
+            ) is not None:
+                return cached
+            if self._use_semantic_cache(cache_text, route_filter):
+                vector = self._encode(text=[cache_text], input_type="queries")
+                if (
+                    cached := self._read_similar(vector, route_filter, limit, state)
+                ) is not None:
+                    return cached
+        scored_routes = self._retrieve(
+            text=text, vector=vector, route_filter=route_filter, state=state
+        )
+        route_choice = self._pass_routes(
+            scored_routes=scored_routes,
+            simulate_static=simulate_static,
+            text=text,
+            limit=limit,
+            state=state,
+            use_function_cache=use_function_cache,
+        )
+        if cache_text is not None:
+            self._write_decision(cache_text, route_filter, limit, route_choice, state)
+            if vector is not None:
+                self._write_similar(
+                    vector, route_filter, limit, route_choice, simulate_static, state
+                )
+        return route_choice
+
+    def _retrieve(
+        self,
+        text: Optional[str] = None,
+        vector: Optional[List[float] | np.ndarray] = None,
+        route_filter: Optional[List[str]] = None,
+        state: Optional[RouterState] = None,
+    ) -> List[Tuple[str, float, List[float]]]:
+        """Query the index and score the routes for a text or vector, without
+        applying any thresholds.
+
+        :param text: The text to route.
+        :type text: Optional[str]
+        :param vector: The vector to route.
+        :type vector: Optional[List[float] | np.ndarray]
+        :param route_filter: The route filter to use.
+        :type route_filter: Optional[List[str]]
+        :param state: The state to query, defaults to the current state.
+        :type state: Optional[RouterState]
+        :return: The routes, their total scores and their individual scores, ordered
+            from highest to lowest total score.
+        :rtype: List[Tuple[str, float, List[float]]]
+        """
+        if state is None:
+            state = self._get_state()
+        if vector is None and text is not None:
+            if exact_routes := self._match_exact(
+                text, route_filter=route_filter, state=state
+            ):
+                return exact_routes
         # if no vector provided, encode text to get vector
         if vector is None:
             if text is None:
@@ -568,20 +1132,413 @@ class BaseRouter(BaseModel):
         # convert to numpy array if not already
         vector = xq_reshape(vector)
         # get scores and routes
-        scores, routes = self.index.query(
+        scores, routes = state.route_index.query(
             vector=vector[0], top_k=self.top_k, route_filter=route_filter
         )
         query_results = [
             {"route": d, "score": s.item()} for d, s in zip(routes, scores)
         ]
         # decide most relevant routes
-        scored_routes = self._score_routes(query_results=query_results)
-        return self._pass_routes(
-            scored_routes=scored_routes,
-            simulate_static=simulate_static,
-            text=text,
-            limit=limit,
+        return self._score_routes(query_results=query_results)
+
+    async def _async_retrieve(
+        self,
+        text: Optional[str] = None,
+        vector: Optional[List[float] | np.ndarray] = None,
+        route_filter: Optional[List[str]] = None,
+        state: Optional[RouterState] = None,
+    ) -> List[Tuple[str, float, List[float]]]:
+        """Asynchronously query the index and score the routes for a text or vector,
+        without applying any thresholds.
+
+        :param text: The text to route.
+        :type text: Optional[str]
+        :param vector: The vector to route.
+        :type vector: Optional[List[float] | np.ndarray]
+        :param route_filter: The route filter to use.
+        :type route_filter: Optional[List[str]]
+        :param state: The state to query, defaults to the current state.
+        :type state: Optional[RouterState]
+        :return: The routes, their total scores and their individual scores, ordered
+            from highest to lowest total score.
+        :rtype: List[Tuple[str, float, List[float]]]
+        """
+        if state is None:
+            state = self._get_state()
+        if vector is None and text is not None:
+            if exact_routes := self._match_exact(
+                text, route_filter=route_filter, state=state
+            ):
+                return exact_routes
+        # if no vector provided, encode text to get vector
+        if vector is None:
+            if text is None:
+                raise ValueError("Either text or vector must be provided")
+            vector = await self._async_encode(text=[text], input_type="queries")
+        # convert to numpy array if not already
+        vector = xq_reshape(vector)
+        # get scores and routes
+        scores, routes = await state.route_index.aquery(
+            vector=vector[0], top_k=self.top_k, route_filter=route_filter
         )
+        query_results = [
+            {"route": d, "score": s.item()} for d, s in zip(routes, scores)
+        ]
+        return self._score_routes(query_results=query_results)
+
+    def _router_version_key(self) -> str:
+        """Get a version string identifying the routes, thresholds and scoring
+        settings of the current state. Route decisions cached under one version are
+        not reused once the router changes.
+
+        :return: The router version.
+        :rtype: str
+        """
+        return self._get_state().version
+
+    def _invalidate_decisions(self):
+        """Mark the router as changed so that cached route decisions are no longer
+        used. The next query rebuilds the state with a new version.
+        """
+        with self._state_lock:
+            self._state = None
+
+    def _decision_key(
+        self,
+        text: str,
+        route_filter: Optional[List[str]],
+        limit: int | None,
+        state: Optional[RouterState] = None,
+    ) -> str:
+        """Build the decision cache key for a query.
+
+        :param text: The text being routed.
+        :type text: str
+        :param route_filter: The route filter used.
+        :type route_filter: Optional[List[str]]
+        :param limit: The number of routes requested.
+        :type limit: int | None
+        :param state: The state the query is routed with, defaults to the current
+            state.
+        :type state: Optional[RouterState]
+        :return: The cache key.
+        :rtype: str
+        """
+        if state is None:
+            state = self._get_state()
+        query = json.dumps(
+            [
+                normalize_text(text),
+                sorted(route_filter) if route_filter is not None else None,
+                limit,
+            ]
+        )
+        query_hash = hashlib.sha256(query.encode("utf-8")).hexdigest()
+        return f"{state.version}/{query_hash}"
+
+    def _read_decision(
+        self,
+        text: str,
+        route_filter: Optional[List[str]],
+        limit: int | None,
+        state: Optional[RouterState] = None,
+    ) -> Optional[RouteChoice | List[RouteChoice]]:
+        """Get the cached route choice for a query, if any.
+
+        :param text: The text being routed.
+        :type text: str
+        :param route_filter: The route filter used.
+        :type route_filter: Optional[List[str]]
+        :param limit: The number of routes requested.
+        :type limit: int | None
+        :param state: The state the query is routed with, defaults to the current
+            state.
+        :type state: Optional[RouterState]
+        :return: A copy of the cached route choice, or None on a cache miss.
+        :rtype: Optional[RouteChoice | List[RouteChoice]]
+        """
+        if self.decision_cache is None:
+            return None
+        cached = self.decision_cache.get(
+            self._decision_key(text, route_filter, limit, state)
+        )
+        return _copy_choice(cached) if cached is not None else None
+
+    def _write_decision(
+        self,
+        text: str,
+        route_filter: Optional[List[str]],
+        limit: int | None,
+        route_choice: RouteChoice | List[RouteChoice],
+        state: Optional[RouterState] = None,
+    ):
+        """Cache the route choice for a query. Choices involving dynamic routes are
+        not cached as their function call depends on the LLM output.
+
+        :param text: The text being routed.
+        :type text: str
+        :param route_filter: The route filter used.
+        :type route_filter: Optional[List[str]]
+        :param limit: The number of routes requested.
+        :type limit: int | None
+        :param route_choice: The route choice to cache.
+        :type route_choice: RouteChoice | List[RouteChoice]
+        :param state: The state the query was routed with, defaults to the current
+            state.
+        :type state: Optional[RouterState]
+        """
+        if self.decision_cache is None or not self._is_static_choice(route_choice):
+            return
+        self.decision_cache.set(
+            self._decision_key(text, route_filter, limit, state),
+            _copy_choice(route_choice),
+        )
+
+    def _is_static_choice(self, route_choice: RouteChoice | List[RouteChoice]) -> bool:
+        """Check whether a route choice only involves static routes, i.e. routes
+        whose choice does not depend on an LLM generated function call.
+
+        :param route_choice: The route choice to check.
+        :type route_choice: RouteChoice | List[RouteChoice]
+        :return: True if every chosen route is static.
+        :rtype: bool
+        """
+        choices = route_choice if isinstance(route_choice, list) else [route_choice]
+        for choice in choices:
+            if choice.name is None:
+                continue
+            route = self.get(choice.name)
+            if route is None or route.function_schemas:
+                return False
+        return True
+
+    def _use_semantic_cache(self, text: str, route_filter: Optional[List[str]]) -> bool:
+        """Check whether a text query should be looked up in the semantic cache.
+        Exact utterance matches are routed without encoding, so they skip it.
+
+        :param text: The text being routed.
+        :type text: str
+        :param route_filter: The route filter used.
+        :type route_filter: Optional[List[str]]
+        :return: True if the query should be encoded and looked up.
+        :rtype: bool
+        """
+        return self.semantic_cache is not None and not self._match_exact(
+            text, route_filter=route_filter
+        )
+
+    def _semantic_cache_context(
+        self,
+        route_filter: Optional[List[str]],
+        limit: int | None,
+        state: Optional[RouterState] = None,
+    ) -> str:
+        """Get the semantic cache context for a query, so that choices are only
+        reused for the same router version and query options.
+
+        :param route_filter: The route filter used.
+        :type route_filter: Optional[List[str]]
+        :param limit: The number of routes requested.
+        :type limit: int | None
+        :param state: The state the query is routed with, defaults to the current
+            state.
+        :type state: Optional[RouterState]
+        :return: The cache context.
+        :rtype: str
+        """
+        if state is None:
+            state = self._get_state()
+        options = json.dumps(
+            [sorted(route_filter) if route_filter is not None else None, limit]
+        )
+        return f"{state.version}/{options}"
+
+    def _read_similar(
+        self,
+        vector: List[float] | np.ndarray,
+        route_filter: Optional[List[str]],
+        limit: int | None,
+        state: Optional[RouterState] = None,
+    ) -> Optional[RouteChoice | List[RouteChoice]]:
+        """Get the route choice made for a recent query with a near-identical
+        embedding, if any.
+
+        :param vector: The embedding of the query.
+        :type vector: List[float] | np.ndarray
+        :param route_filter: The route filter used.
+        :type route_filter: Optional[List[str]]
+        :param limit: The number of routes requested.
+        :type limit: int | None
+        :param state: The state the query is routed with, defaults to the current
+            state.
+        :type state: Optional[RouterState]
+        :return: A copy of the cached route choice, or None on a cache miss.
+        :rtype: Optional[RouteChoice | List[RouteChoice]]
+        """
+        if self.semantic_cache is None:
+            return None
+        cached = self.semantic_cache.get(
+            vector, context=self._semantic_cache_context(route_filter, limit, state)
+        )
+        return _copy_choice(cached) if cached is not None else None
+
+    def _write_similar(
+        self,
+        vector: List[float] | np.ndarray,
+        route_filter: Optional[List[str]],
+        limit: int | None,
+        route_choice: RouteChoice | List[RouteChoice],
+        simulate_static: bool,
+        state: Optional[RouterState] = None,
+    ):
+        """Add a routed query to the semantic cache. Choices involving dynamic routes
+        are only cached if the cache allows it, and never when dynamic routes were
+        simulated as static.
+
+        :param vector: The embedding of the query.
+        :type vector: List[float] | np.ndarray
+        :param route_filter: The route filter used.
+        :type route_filter: Optional[List[str]]
+        :param limit: The number of routes requested.
+        :type limit: int | None
+        :param route_choice: The route choice to cache.
+        :type route_choice: RouteChoice | List[RouteChoice]
+        :param simulate_static: Whether dynamic routes were simulated as static.
+        :type simulate_static: bool
+        :param state: The state the query was routed with, defaults to the current
+            state.
+        :type state: Optional[RouterState]
+        """
+        if self.semantic_cache is None:
+            return
+        if not self._is_static_choice(route_choice) and (
+            simulate_static or not self.semantic_cache.include_dynamic
+        ):
+            return
+        self.semantic_cache.set(
+            vector,
+            _copy_choice(route_choice),
+            context=self._semantic_cache_context(route_filter, limit, state),
+        )
+
+    def _match_exact(
+        self,
+        text: str,
+        route_filter: Optional[List[str]] = None,
+        state: Optional[RouterState] = None,
+    ) -> List[Tuple[str, float, List[float]]]:
+        """Look up routes with an utterance identical to the text after
+        normalization, so that such queries can be routed without encoding them.
+        Matching routes are given a perfect score of 1.0.
+
+        :param text: The text to route.
+        :type text: str
+        :param route_filter: The route filter to use.
+        :type route_filter: Optional[List[str]]
+        :param state: The state to match against, defaults to the current state.
+        :type state: Optional[RouterState]
+        :return: The matching routes in the same format as `_score_routes`, or an
+            empty list if no utterance matches.
+        :rtype: List[Tuple[str, float, List[float]]]
+        """
+        if not self.exact_match:
+            return []
+        if state is None:
+            state = self._get_state()
+        exact_matches = state.exact_matches
+        if exact_matches is None:
+            # exact matching was enabled after the state was published
+            exact_matches = _exact_match_table(state.routes)
+            with self._state_lock:
+                if self._state is state:
+                    self._state = state._replace(exact_matches=exact_matches)
+        names = exact_matches.get(normalize_text(text), [])
+        return [
+            (name, 1.0, [1.0])
+            for name in names
+            if route_filter is None or name in route_filter
+        ]
+
+    def _prepare_route(self, route: Route, text: Optional[str]):
+        """Make sure a dynamic route can be called, attaching the router LLM (or a
+        default OpenAI LLM) to routes with function schemas but no LLM.
+
+        :param route: The route that is about to be called.
+        :type route: Route
+        :param text: The text being routed.
+        :type text: Optional[str]
+        """
+        if route.function_schemas and text is None:
+            raise ValueError("Route has a function schema, but no text was provided.")
+        if route.function_schemas and not isinstance(route.llm, BaseLLM):
+            if not self.llm:
+                logger.warning(
+                    "No LLM provided for dynamic route, will use OpenAI LLM "
+                    "default. Ensure API key is set in OPENAI_API_KEY environment "
+                    "variable."
+                )
+
+                self.llm = OpenAILLM()
+                route.llm = self.llm
+            else:
+                route.llm = self.llm
+
+    def _choose_route(
+        self,
+        route: Route,
+        text: Optional[str],
+        simulate_static: bool,
+        use_function_cache: bool = True,
+    ) -> RouteChoice:
+        """Get the RouteChoice for a route that passed its threshold, calling the
+        route's LLM to generate the function call for dynamic routes.
+
+        :param route: The route that was chosen.
+        :type route: Route
+        :param text: The text being routed.
+        :type text: Optional[str]
+        :param simulate_static: Whether to simulate a static route.
+        :type simulate_static: bool
+        :param use_function_cache: Whether dynamic routes may use their function cache.
+        :type use_function_cache: bool
+        :return: The route choice.
+        :rtype: RouteChoice
+        """
+        if simulate_static:
+            return RouteChoice(
+                name=route.name, function_call=None, similarity_score=None
+            )
+        self._prepare_route(route=route, text=text)
+        # call dynamic route to generate the function_call content
+        return route(query=text, use_cache=use_function_cache)
+
+    async def _async_choose_route(
+        self,
+        route: Route,
+        text: Optional[str],
+        simulate_static: bool,
+        use_function_cache: bool = True,
+    ) -> RouteChoice:
+        """Asynchronously get the RouteChoice for a route that passed its threshold,
+        calling the route's LLM to generate the function call for dynamic routes.
+
+        :param route: The route that was chosen.
+        :type route: Route
+        :param text: The text being routed.
+        :type text: Optional[str]
+        :param simulate_static: Whether to simulate a static route.
+        :type simulate_static: bool
+        :param use_function_cache: Whether dynamic routes may use their function cache.
+        :type use_function_cache: bool
+        :return: The route choice.
+        :rtype: RouteChoice
+        """
+        if simulate_static:
+            return RouteChoice(
+                name=route.name, function_call=None, similarity_score=None
+            )
+        self._prepare_route(route=route, text=text)
+        return await route.acall(query=text, use_cache=use_function_cache)
 
     def _pass_routes(
         self,
@@ -589,6 +1546,8 @@ class BaseRouter(BaseModel):
         simulate_static: bool,
         text: Optional[str],
         limit: int | None,
+        state: Optional[RouterState] = None,
+        use_function_cache: bool = True,
     ) -> RouteChoice | list[RouteChoice]:
         """Returns a list of RouteChoice objects that passed the thresholds set.
 
@@ -601,70 +1560,70 @@ class BaseRouter(BaseModel):
         :param limit: The number of routes to return, defaults to 1. If set to None, no
             limit is applied and all routes are returned.
         :type limit: int | None
+        :param state: The state the routes were scored against, defaults to the
+            current state.
+        :type state: Optional[RouterState]
+        :param use_function_cache: Whether dynamic routes may use their function cache.
+        :type use_function_cache: bool
         :return: The route choice.
         :rtype: RouteChoice | list[RouteChoice]
         """
-        passed_routes: list[RouteChoice] = []
+        passed_routes = [
+            self._choose_route(
+                route=route,
+                text=text,
+                simulate_static=simulate_static,
+                use_function_cache=use_function_cache,
+            )
+            for route in self._select_routes(
+                scored_routes=scored_routes, limit=limit, state=state
+            )
+        ]
+        return _format_route_choices(passed_routes)
+
+    def _select_routes(
+        self,
+        scored_routes: List[Tuple[str, float, List[float]]],
+        limit: int | None,
+        state: Optional[RouterState] = None,
+    ) -> List[Route]:
+        """Select the routes that pass their thresholds, in order of score.
+
+        :param scored_routes: The scored routes to select from.
+        :type scored_routes: List[Tuple[str, float, List[float]]]
+        :param limit: The maximum number of routes to select, or None for no limit.
+        :type limit: int | None
+        :param state: The state the routes were scored against, defaults to the
+            current state.
+        :type state: Optional[RouterState]
+        :return: The routes that passed their thresholds.
+        :rtype: List[Route]
+        """
+        if state is None:
+            state = self._get_state()
+        selected: List[Route] = []
         for route_name, total_score, scores in scored_routes:
-            route = self.check_for_matching_routes(top_class=route_name)
+            route = self.check_for_matching_routes(
+                top_class=route_name, routes=state.routes
+            )
             if route is None:
                 # if no route is found we cannot use it
                 continue
             if current_threshold := (
                 route.score_threshold
                 if route.score_threshold is not None
-                else self.score_threshold
+                else state.score_threshold
             ):
                 # check if our route score exceeds the set threshold
                 passed = total_score >= current_threshold
             else:
                 # if no threshold is set, we always pass
                 passed = True
-            if passed and route is not None and not simulate_static:
-                if route.function_schemas and text is None:
-                    raise ValueError(
-                        "Route has a function schema, but no text was provided."
-                    )
-                if route.function_schemas and not isinstance(route.llm, BaseLLM):
-                    if not self.llm:
-                        logger.warning(
-                            "No LLM provided for dynamic route, will use OpenAI LLM "
-                            "default. Ensure API key is set in OPENAI_API_KEY environment "
-                            "variable."
-                        )
-
-                        self.llm = OpenAILLM()
-                        route.llm = self.llm
-                    else:
-                        route.llm = self.llm
-                # call dynamic route to generate the function_call content
-                route_choice = route(query=text)
-                passed_routes.append(route_choice)
-            elif passed and route is not None and simulate_static:
-                passed_routes.append(
-                    RouteChoice(
-                        name=route.name,
-                        function_call=None,
-                        similarity_score=None,
-                    )
-                )
-            if limit is None:
-                # without limit we continue through all routes
-                continue
-            if len(passed_routes) >= limit:
-                if limit == 1:
-                    # maintain backward compatibility and return single route choice
-                    return passed_routes[0]
-                else:
-                    # otherwise return all passed routes
-                    return passed_routes
-        if len(passed_routes) == 1:
-            return passed_routes[0]
-        elif len(passed_routes) > 1:
-            return passed_routes
-        else:
-            # if no route passes threshold, return empty route choice
-            return RouteChoice()
+            if passed:
+                selected.append(route)
+            if limit is not None and len(selected) >= limit:
+                break
+        return selected
 
     async def _async_pass_routes(
         self,
@@ -672,10 +1631,13 @@ class BaseRouter(BaseModel):
         simulate_static: bool,
         text: Optional[str],
         limit: int | None,
+        state: Optional[RouterState] = None,
+        use_function_cache: bool = True,
     ) -> RouteChoice | list[RouteChoice]:
         """Returns a list of RouteChoice objects that passed the thresholds set. Runs any
-        dynamic route calls asynchronously. If there are no dynamic routes this method is
-        equivalent to _pass_routes.
+        dynamic route calls concurrently, at most `max_concurrent_routes` at a time, and
+        returns the choices in score order. If there are no dynamic routes this method
+        is equivalent to _pass_routes.
 
         :param scored_routes: The scored routes to pass.
         :type scored_routes: List[Tuple[str, float, List[float]]]
@@ -686,70 +1648,114 @@ class BaseRouter(BaseModel):
         :param limit: The number of routes to return, defaults to 1. If set to None, no
             limit is applied and all routes are returned.
         :type limit: int | None
+        :param state: The state the routes were scored against, defaults to the
+            current state.
+        :type state: Optional[RouterState]
+        :param use_function_cache: Whether dynamic routes may use their function cache.
+        :type use_function_cache: bool
         :return: The route choice.
         :rtype: RouteChoice | list[RouteChoice]
         """
-        passed_routes: list[RouteChoice] = []
-        for route_name, total_score, scores in scored_routes:
-            route = self.check_for_matching_routes(top_class=route_name)
-            if route is None:
-                # if no route is found we cannot use it
-                continue
-            if current_threshold := (
-                route.score_threshold
-                if route.score_threshold is not None
-                else self.score_threshold
-            ):
-                # check if our route score exceeds the set threshold
-                passed = total_score >= current_threshold
-            else:
-                # if no threshold is set, we always pass
-                passed = True
-            if passed and route is not None and not simulate_static:
-                if route.function_schemas and text is None:
-                    raise ValueError(
-                        "Route has a function schema, but no text was provided."
-                    )
-                if route.function_schemas and not isinstance(route.llm, BaseLLM):
-                    if not self.llm:
-                        logger.warning(
-                            "No LLM provided for dynamic route, will use OpenAI LLM "
-                            "default. Ensure API key is set in OPENAI_API_KEY environment "
-                            "variable."
-                        )
+        routes = self._select_routes(
+            scored_routes=scored_routes, limit=limit, state=state
+        )
+        # dynamic routes call their LLM concurrently, gather keeps the score order
+        passed_routes = await asyncio.gather(
+            *self._async_choose_routes(
+                routes=routes,
+                text=text,
+                simulate_static=simulate_static,
+                use_function_cache=use_function_cache,
+            )
+        )
+        return _format_route_choices(list(passed_routes))
 
-                        self.llm = OpenAILLM()
-                        route.llm = self.llm
-                    else:
-                        route.llm = self.llm
-                # TODO need to move to asyncio tasks and gather
-                route_choice = await route.acall(query=text)
-                passed_routes.append(route_choice)
-            elif passed and route is not None and simulate_static:
-                passed_routes.append(
-                    RouteChoice(
-                        name=route.name,
-                        function_call=None,
-                        similarity_score=None,
-                    )
+    def _async_choose_routes(
+        self,
+        routes: List[Route],
+        text: Optional[str],
+        simulate_static: bool,
+        use_function_cache: bool = True,
+    ) -> List[Awaitable[RouteChoice]]:
+        """Get the RouteChoice awaitables of the passing routes, with at most
+        `max_concurrent_routes` dynamic route LLM calls running at once.
+
+        :param routes: The routes that passed their thresholds.
+        :type routes: List[Route]
+        :param text: The text being routed.
+        :type text: Optional[str]
+        :param simulate_static: Whether to simulate a static route.
+        :type simulate_static: bool
+        :param use_function_cache: Whether dynamic routes may use their function cache.
+        :type use_function_cache: bool
+        :return: One awaitable per route, in the order of the routes.
+        :rtype: List[Awaitable[RouteChoice]]
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_routes)
+
+        async def choose(route: Route) -> RouteChoice:
+            async with semaphore:
+                return await self._async_choose_route(
+                    route=route,
+                    text=text,
+                    simulate_static=simulate_static,
+                    use_function_cache=use_function_cache,
                 )
-            if limit is None:
-                # without limit we continue through all routes
-                continue
-            if len(passed_routes) >= limit:
-                if limit == 1:
-                    # maintain backward compatibility and return single route choice
-                    return passed_routes[0]
-                else:
-                    # otherwise return all passed routes
-                    return passed_routes
-        if len(passed_routes) == 1:
-            return passed_routes[0]
-        elif len(passed_routes) > 1:
-            return passed_routes
-        else:
-            # if no route passes threshold, return empty route choice
-            return RouteChoice()
+
+        return [choose(route) for route in routes]
+
+    async def astream(
+        self,
+        text: str,
+        simulate_static: bool = False,
+        route_filter: Optional[List[str]] = None,
+        limit: int | None = None,
+        use_function_cache: bool = True,
+    ) -> AsyncIterator[RouteChoice]:
+        """Route a query and yield each passing route as soon as its RouteChoice is
+        ready. Static routes are yielded immediately while the LLM calls of dynamic
+        routes are still running, so results are in completion rather than score
+        order.
+
+        :param text: The text to route.
+        :type text: str
+        :param simulate_static: Whether to simulate a static route.
+        :type simulate_static: bool
+        :param route_filter: The route filter to use.
+        :type route_filter: Optional[List[str]]
+        :param limit: The number of routes to return, defaults to None for all
+            passing routes.
+        :type limit: int | None
+        :param use_function_cache: Whether dynamic routes may reuse the function call
+            inputs cached by their function cache, defaults to True.
+        :type use_function_cache: bool
+        :return: An async iterator of route choices.
+        :rtype: AsyncIterator[RouteChoice]
+        """
+        state = self._get_state()
+        if not state.route_index.is_ready():
+            raise ValueError("Index is not ready.")
+        scored_routes = await self._async_retrieve(
+            text=text, route_filter=route_filter, state=state
+        )
+        routes = self._select_routes(
+            scored_routes=scored_routes, limit=limit, state=state
+        )
+        tasks = [
+            asyncio.ensure_future(choice)
+            for choice in self._async_choose_routes(
+                routes=routes,
+                text=text,
+                simulate_static=simulate_static,
+                use_function_cache=use_function_cache,
+            )
+        ]
+        try:
+            for next_choice in asyncio.as_completed(tasks):
+                yield await next_choice
+        finally:
+            for task in tasks:
+                task.cancel()
 
     async def acall(
         self,
@@ -757,6 +1763,9 @@ class BaseRouter(BaseModel):
         vector: Optional[List[float] | np.ndarray] = None,
         simulate_static: bool = False,
         route_filter: Optional[List[str]] = None,
+        limit: int | None = 1,
+        *,
+        use_function_cache: bool = True,
     ) -> RouteChoice | list[RouteChoice]:
         """Asynchronously call the router to get a route choice.
 
@@ -769,33 +1778,158 @@ class BaseRouter(BaseModel):
         :type simulate_static: bool
         :param route_filter: The route filter to use.
         :type route_filter: Optional[List[str]]
+        :param limit: The number of routes to return, defaults to 1. If set to None, no
+            limit is applied and all routes are returned.
+        :type limit: int | None
+        :param use_function_cache: Whether dynamic routes may reuse the function call
+            inputs cached by their function cache, defaults to True. When False the
+            router's decision caches are not read either, so dynamic routes always
+            call their LLM.
+        :type use_function_cache: bool
         :return: The route choice.
-        :rtype: RouteChoice
+        :rtype: RouteChoice | List[RouteChoice]
         """
-        if not self.index.is_ready():
+        state = self._get_state()
+        if not state.route_index.is_ready():
             # TODO: need async version for qdrant
             raise ValueError("Index is not ready.")
-        # if no vector provided, encode text to get vector
-        if vector is None:
-            if text is None:
-                raise ValueError("Either text or vector must be provided")
-            vector = await self._async_encode(text=[text], input_type="queries")
-        # convert to numpy array if not already
-        vector = xq_reshape(vector)
-        # get scores and routes
-        scores, routes = await self.index.aquery(
-            vector=vector[0], top_k=self.top_k, route_filter=route_filter
-        )
-        query_results = [
-            {"route": d, "score": s.item()} for d, s in zip(routes, scores)
-        ]
-        scored_routes = self._score_routes(query_results=query_results)
-        return await self._async_pass_routes(
+        cache_text = text if vector is None else None
+        if cache_text is not None and use_function_cache:
+            if (
+                cached := self._read_decision(cache_text, route_filter, limit, state)
+            ) is not None:
+                return cached
+            if self._use_semantic_cache(cache_text, route_filter) or (
+                self._encode_batcher is not None
+                and not self._match_exact(
+                    cache_text, route_filter=route_filter, state=state
+                )
+            ):
+                vector = await self._async_encode_query(cache_text)
+                if (
+                    cached := self._read_similar(vector, route_filter, limit, state)
+                ) is not None:
+                    return cached
+        if self._query_batcher is not None and vector is not None:
+            scored_routes = await self._query_batcher.submit(
+                (xq_reshape(vector)[0], route_filter)
+            )
+            if isinstance(scored_routes, BaseException):
+                raise scored_routes
+        else:
+            scored_routes = await self._async_retrieve(
+                text=text, vector=vector, route_filter=route_filter, state=state
+            )
+        route_choice = await self._async_pass_routes(
             scored_routes=scored_routes,
             simulate_static=simulate_static,
             text=text,
-            limit=1,
+            limit=limit,
+            state=state,
+            use_function_cache=use_function_cache,
+        )
+        if cache_text is not None:
+            self._write_decision(cache_text, route_filter, limit, route_choice, state)
+            if vector is not None:
+                self._write_similar(
+                    vector, route_filter, limit, route_choice, simulate_static, state
+                )
+        return route_choice
+
+    def enable_micro_batching(self, max_wait: float = 0.003, max_batch_size: int = 64):
+        """Coalesce concurrent `acall` requests into batches. Queries arriving within
+        `max_wait` seconds of each other, up to `max_batch_size` queries, are encoded
+        with a single encoder call and searched with a single batched index query.
+        This adds up to `max_wait` seconds of latency per request in exchange for
+        fewer encoder API calls and higher throughput under concurrent load.
+
+        :param max_wait: The maximum time in seconds a query waits for others.
+        :type max_wait: float
+        :param max_batch_size: The maximum number of queries per batch.
+        :type max_batch_size: int
+        """
+        self._encode_batcher = MicroBatcher(
+            batch_fn=self._aencode_query_batch,
+            max_wait=max_wait,
+            max_batch_size=max_batch_size,
+        )
+        self._query_batcher = MicroBatcher(
+            batch_fn=self._aquery_batch,
+            max_wait=max_wait,
+            max_batch_size=max_batch_size,
+        )
+
+    def disable_micro_batching(self):
+        """Stop coalescing concurrent `acall` requests."""
+        self._encode_batcher = None
+        self._query_batcher = None
+
+    async def _async_encode_query(self, text: str) -> np.ndarray:
+        """Encode a single query, through the micro-batcher if enabled.
+
+        :param text: The query to encode.
+        :type text: str
+        :return: The query embedding.
+        :rtype: np.ndarray
+        """
+        if self._encode_batcher is not None:
+            return await self._encode_batcher.submit(text)
+        xq = await self._async_encode(text=[text], input_type="queries")
+        return xq_reshape(xq)[0]
+
+    async def _aencode_query_batch(self, texts: List[str]) -> List[np.ndarray]:
+        """Encode a batch of coalesced queries with one encoder call.
+
+        :param texts: The queries to encode.
+        :type texts: List[str]
+        :return: The embedding of each query.
+        :rtype: List[np.ndarray]
+        """
+        return list(
+            np.asarray(await self._async_encode(text=texts, input_type="queries"))
+        )
+
+    async def _aquery_batch(
+        self, items: List[Tuple[np.ndarray, Optional[List[str]]]]
+    ) -> List[List[Tuple[str, float, List[float]]] | BaseException]:
+        """Search the index for a batch of coalesced queries, with one batched index
+        query per distinct route filter.
+
+        :param items: The query vector and route filter of each query.
+        :type items: List[Tuple[np.ndarray, Optional[List[str]]]]
+        :return: The scored routes of each query, or the error raised when searching
+            for it.
+        :rtype: List[List[Tuple[str, float, List[float]]] | BaseException]
+        """
+        index = self._get_state().route_index
+        groups: Dict[Optional[Tuple[str, ...]], List[int]] = {}
+        for i, (_, route_filter) in enumerate(items):
+            key = tuple(sorted(route_filter)) if route_filter is not None else None
+            groups.setdefault(key, []).append(i)
+        group_results = await asyncio.gather(
+            *[
+                index.aquery_batch(
+                    vectors=np.array([items[i][0] for i in ids]),
+                    top_k=self.top_k,
+                    route_filter=list(key) if key is not None else None,
+                )
+                for key, ids in groups.items()
+            ],
+            return_exceptions=True,
         )
+        results: List[Any] = [None] * len(items)
+        for ids, group_result in zip(groups.values(), group_results):
+            for j, i in enumerate(ids):
+                if isinstance(group_result, BaseException):
+                    results[i] = group_result
+                    continue
+                scores, routes = group_result[j]
+                results[i] = self._score_routes(
+                    query_results=[
+                        {"route": d, "score": s.item()} for d, s in zip(routes, scores)
+                    ]
+                )
+        return results
 
     def _index_ready(self) -> bool:
         """Method to check if the index is ready to be used.
@@ -817,7 +1951,7 @@ class BaseRouter(BaseModel):
         :param sync_mode: The mode to sync the routes with the remote index.
         :type sync_mode: str
         :param force: Whether to force the sync even if the local and remote
-            hashes already match. Defaults to False.
+            hashes already match, comparing all routes. Defaults to False.
         :type force: bool, optional
         :param wait: The number of seconds to wait for the index to be unlocked
         before proceeding with the sync. If set to 0, will raise an error if
@@ -842,17 +1976,8 @@ class BaseRouter(BaseModel):
             diff_utt_str: list[str] = []
             _ = self.index.lock(value=True, wait=wait)
             try:
-                # first creating a diff
-                local_utterances = self.to_config().to_utterances()
-                remote_utterances = self.index.get_utterances(include_metadata=True)
-                diff = UtteranceDiff.from_utterances(
-                    local_utterances=local_utterances,
-                    remote_utterances=remote_utterances,
-                )
-                # generate sync strategy
-                sync_strategy = diff.get_sync_strategy(sync_mode=sync_mode)
-                # and execute
-                self._execute_sync_strategy(sync_strategy)
+                # diff and execute the sync strategy on a copy of the router state
+                diff = self._sync_state(sync_mode=sync_mode, force=force)
                 diff_utt_str = diff.to_utterance_str()
             except Exception as e:
                 logger.error(f"Failed to create diff: {e}")
@@ -873,7 +1998,7 @@ class BaseRouter(BaseModel):
         :param sync_mode: The mode to sync the routes with the remote index.
         :type sync_mode: str
         :param force: Whether to force the sync even if the local and remote
-            hashes already match. Defaults to False.
+            hashes already match, comparing all routes. Defaults to False.
         :type force: bool, optional
         :param wait: The number of seconds to wait for the index to be unlocked
         before proceeding with the sync. If set to 0, will raise an error if
@@ -898,19 +2023,18 @@ class BaseRouter(BaseModel):
             diff_utt_str: list[str] = []
             _ = await self.index.alock(value=True, wait=wait)
             try:
-                # first creating a diff
-                local_utterances = self.to_config().to_utterances()
-                remote_utterances = await self.index.aget_utterances(
-                    include_metadata=True
-                )
-                diff = UtteranceDiff.from_utterances(
-                    local_utterances=local_utterances,
-                    remote_utterances=remote_utterances,
-                )
-                # generate sync strategy
-                sync_strategy = diff.get_sync_strategy(sync_mode=sync_mode)
-                # and execute
-                await self._async_execute_sync_strategy(sync_strategy)
+                # diff and execute the sync strategy on a copy of the router state
+                async with self._async_write_state() as router:
+                    local_utterances = router.to_config().to_utterances()
+                    remote_utterances = await router._async_get_remote_utterances(
+                        local_utterances, force=force
+                    )
+                    diff = UtteranceDiff.from_utterances(
+                        local_utterances=local_utterances,
+                        remote_utterances=remote_utterances,
+                    )
+                    sync_strategy = diff.get_sync_strategy(sync_mode=sync_mode)
+                    await router._async_execute_sync_strategy(sync_strategy)
                 diff_utt_str = diff.to_utterance_str()
             except Exception as e:
                 logger.error(f"Failed to create diff: {e}")
@@ -923,6 +2047,132 @@ class BaseRouter(BaseModel):
             raise e
         return diff_utt_str
 
+    def start_background_sync(
+        self, sync_mode: Optional[str] = None, interval: float = 60.0
+    ):
+        """Start a background thread that syncs the router with the remote index
+        every `interval` seconds. Each sync is applied to a copy of the routes and
+        index, which replaces the state queries are served from once complete, so
+        queries never wait on a sync.
+
+        :param sync_mode: The mode to sync the routes with the remote index, defaults
+            to the `auto_sync` mode of the router.
+        :type sync_mode: Optional[str]
+        :param interval: The number of seconds between syncs.
+        :type interval: float
+        """
+        sync_mode = sync_mode or self.auto_sync
+        if sync_mode is None:
+            raise ValueError("A sync_mode is required for background sync.")
+        if interval <= 0:
+            raise ValueError(f"interval needs to be > 0, but was: {interval}.")
+        if self._sync_thread is not None and self._sync_thread.is_alive():
+            logger.warning("Background sync is already running.")
+            return
+        self._sync_stop = threading.Event()
+        self._sync_cycle_done = threading.Event()
+        self._sync_thread = threading.Thread(
+            target=self._run_background_sync,
+            args=(sync_mode, interval, self._sync_stop, self._sync_cycle_done),
+            name="semantic-router-sync",
+            daemon=True,
+        )
+        self._sync_thread.start()
+
+    def stop_background_sync(self, timeout: Optional[float] = None):
+        """Stop the background sync thread, waiting for a running sync to finish.
+
+        :param timeout: The maximum number of seconds to wait for the thread.
+        :type timeout: Optional[float]
+        """
+        self._sync_stop.set()
+        if self._sync_thread is not None:
+            self._sync_thread.join(timeout=timeout)
+            self._sync_thread = None
+
+    def wait_for_background_sync(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the first background sync to run, for example before serving
+        queries from a router whose local routes are empty until synced.
+
+        :param timeout: The maximum number of seconds to wait.
+        :type timeout: Optional[float]
+        :return: True if a background sync ran, False if the timeout expired.
+        :rtype: bool
+        """
+        return self._sync_cycle_done.wait(timeout=timeout)
+
+    def _run_background_sync(
+        self,
+        sync_mode: str,
+        interval: float,
+        stop: threading.Event,
+        cycle_done: threading.Event,
+    ):
+        """Run background syncs until stopped.
+
+        :param sync_mode: The mode to sync the routes with the remote index.
+        :type sync_mode: str
+        :param interval: The number of seconds between syncs.
+        :type interval: float
+        :param stop: Set to stop the background syncs.
+        :type stop: threading.Event
+        :param cycle_done: Set once the first sync has run.
+        :type cycle_done: threading.Event
+        """
+        while not stop.is_set():
+            try:
+                self._background_sync(sync_mode=sync_mode)
+            except Exception as e:
+                logger.error(f"Background sync failed: {e}")
+            cycle_done.set()
+            stop.wait(interval)
+
+    def _background_sync(self, sync_mode: str) -> bool:
+        """Sync a copy of the routes and index with the remote index and publish it
+        as the state queries are served from.
+
+        :param sync_mode: The mode to sync the routes with the remote index.
+        :type sync_mode: str
+        :return: True if a synced state was published, False otherwise.
+        :rtype: bool
+        """
+        if self.is_synced():
+            return False
+        try:
+            _ = self.index.lock(value=True)
+        except ValueError as e:
+            logger.warning(f"Skipping background sync: {e}")
+            return False
+        try:
+            self._sync_state(sync_mode=sync_mode)
+        finally:
+            _ = self.index.lock(value=False)
+        return True
+
+    def _sync_state(self, sync_mode: str, force: bool = False) -> UtteranceDiff:
+        """Diff the local routes with the remote index and execute the sync
+        strategy on a copy of the router state, which is published once the sync
+        completes. The index is expected to be locked by the caller.
+
+        :param sync_mode: The mode to sync the routes with the remote index.
+        :type sync_mode: str
+        :param force: Whether to compare all routes even if the hashes match.
+        :type force: bool
+        :return: The diff between the local and remote utterances.
+        :rtype: UtteranceDiff
+        """
+        with self._write_state() as router:
+            local_utterances = router.to_config().to_utterances()
+            remote_utterances = router._get_remote_utterances(
+                local_utterances, force=force
+            )
+            diff = UtteranceDiff.from_utterances(
+                local_utterances=local_utterances,
+                remote_utterances=remote_utterances,
+            )
+            router._execute_sync_strategy(diff.get_sync_strategy(sync_mode=sync_mode))
+        return diff
+
     def _execute_sync_strategy(self, strategy: Dict[str, Dict[str, List[Utterance]]]):
         """Executes the provided sync strategy, either deleting or upserting
         routes from the local and remote instances as defined in the strategy.
@@ -930,24 +2180,17 @@ class BaseRouter(BaseModel):
         :param strategy: The sync strategy to execute.
         :type strategy: Dict[str, Dict[str, List[Utterance]]]
         """
+        self._invalidate_decisions()
         if strategy["remote"]["delete"]:
-            data_to_delete = {}  # type: ignore
-            for utt_obj in strategy["remote"]["delete"]:
-                data_to_delete.setdefault(utt_obj.route, []).append(utt_obj.utterance)
             # TODO: switch to remove without sync??
-            self.index._remove_and_sync(data_to_delete)
-        if strategy["remote"]["upsert"]:
-            utterances_text = [utt.utterance for utt in strategy["remote"]["upsert"]]
-            self.index.add(
-                embeddings=self.encoder(utterances_text),
-                routes=[utt.route for utt in strategy["remote"]["upsert"]],
-                utterances=utterances_text,
-                function_schemas=[
-                    utt.function_schemas  # type: ignore
-                    for utt in strategy["remote"]["upsert"]
-                ],
-                metadata_list=[utt.metadata for utt in strategy["remote"]["upsert"]],
+            self.index._remove_and_sync(
+                _utterances_by_route(strategy["remote"]["delete"])
             )
+        remote_upsert = strategy["remote"]["upsert"] + self._update_remote_metadata(
+            strategy["remote"].get("update", [])
+        )
+        if remote_upsert:
+            self._add_records(_utterance_records(remote_upsert))
         if strategy["local"]["delete"]:
             self._local_delete(utterances=strategy["local"]["delete"])
         if strategy["local"]["upsert"]:
@@ -964,24 +2207,18 @@ class BaseRouter(BaseModel):
         :param strategy: The sync strategy to execute.
         :type strategy: Dict[str, Dict[str, List[Utterance]]]
         """
+        self._invalidate_decisions()
         if strategy["remote"]["delete"]:
-            data_to_delete = {}  # type: ignore
-            for utt_obj in strategy["remote"]["delete"]:
-                data_to_delete.setdefault(utt_obj.route, []).append(utt_obj.utterance)
             # TODO: switch to remove without sync??
-            await self.index._async_remove_and_sync(data_to_delete)
-        if strategy["remote"]["upsert"]:
-            utterances_text = [utt.utterance for utt in strategy["remote"]["upsert"]]
-            await self.index.aadd(
-                embeddings=await self.encoder.acall(docs=utterances_text),
-                routes=[utt.route for utt in strategy["remote"]["upsert"]],
-                utterances=utterances_text,
-                function_schemas=[
-                    utt.function_schemas  # type: ignore
-                    for utt in strategy["remote"]["upsert"]
-                ],
-                metadata_list=[utt.metadata for utt in strategy["remote"]["upsert"]],
+            await self.index._async_remove_and_sync(
+                _utterances_by_route(strategy["remote"]["delete"])
             )
+        not_updated = await self._async_update_remote_metadata(
+            strategy["remote"].get("update", [])
+        )
+        remote_upsert = strategy["remote"]["upsert"] + not_updated
+        if remote_upsert:
+            await self._async_add_records(_utterance_records(remote_upsert))
         if strategy["local"]["delete"]:
             # assumption is that with simple local delete we don't benefit from async
             self._local_delete(utterances=strategy["local"]["delete"])
@@ -991,6 +2228,152 @@ class BaseRouter(BaseModel):
         # update hash
         await self._async_write_hash()
 
+    def _add_records(
+        self,
+        records: List[Tuple],
+        batch_size: int = DEFAULT_INGEST_BATCH_SIZE,
+        progress_callback: Optional[ProgressCallback] = None,
+        checkpoint_path: Optional[str] = None,
+    ):
+        """Encode records and add them to the index in batches, encoding the next
+        batches while the previous ones are added. Each record is a tuple of route
+        name, utterance, function schema and metadata.
+
+        :param records: The records to add.
+        :type records: List[Tuple]
+        :param batch_size: The number of records encoded and added at once.
+        :type batch_size: int
+        :param progress_callback: Called with the number of records added and the
+            total number of records after each batch.
+        :type progress_callback: Optional[Callable[[int, int], None]]
+        :param checkpoint_path: A file recording the batches added, so an
+            interrupted add of the same records resumes where it stopped.
+        :type checkpoint_path: Optional[str]
+        """
+        ingest(
+            items=records,
+            encode_fn=lambda batch: self._encode(
+                [record[1] for record in batch], input_type="documents"
+            ),
+            add_fn=self._index_add,
+            batch_size=batch_size,
+            workers=self.index.write_concurrency,
+            progress_callback=progress_callback,
+            checkpoint=_get_checkpoint(records, batch_size, checkpoint_path),
+        )
+
+    async def _async_add_records(
+        self,
+        records: List[Tuple],
+        batch_size: int = DEFAULT_INGEST_BATCH_SIZE,
+        progress_callback: Optional[ProgressCallback] = None,
+        checkpoint_path: Optional[str] = None,
+    ):
+        """Encode records and add them to the index in batches asynchronously,
+        encoding the next batches while the previous ones are added. Each record is
+        a tuple of route name, utterance, function schema and metadata.
+
+        :param records: The records to add.
+        :type records: List[Tuple]
+        :param batch_size: The number of records encoded and added at once.
+        :type batch_size: int
+        :param progress_callback: Called with the number of records added and the
+            total number of records after each batch.
+        :type progress_callback: Optional[Callable[[int, int], None]]
+        :param checkpoint_path: A file recording the batches added, so an
+            interrupted add of the same records resumes where it stopped.
+        :type checkpoint_path: Optional[str]
+        """
+
+        async def encode(batch: List[Tuple]) -> Any:
+            return await self._async_encode(
+                [record[1] for record in batch], input_type="documents"
+            )
+
+        await aingest(
+            items=records,
+            encode_fn=encode,
+            add_fn=self._async_index_add,
+            batch_size=batch_size,
+            workers=self.index.write_concurrency,
+            progress_callback=progress_callback,
+            checkpoint=_get_checkpoint(records, batch_size, checkpoint_path),
+        )
+
+    def _index_add(self, records: List[Tuple], embeddings: Any):
+        """Add a batch of encoded records to the index.
+
+        :param records: The records, as tuples of route name, utterance, function
+            schema and metadata.
+        :type records: List[Tuple]
+        :param embeddings: The embeddings of the records.
+        :type embeddings: Any
+        """
+        routes, utterances, function_schemas, metadata = map(list, zip(*records))
+        self.index.add(
+            embeddings=embeddings.tolist(),
+            routes=routes,
+            utterances=utterances,
+            function_schemas=function_schemas,
+            metadata_list=metadata,
+        )
+
+    async def _async_index_add(self, records: List[Tuple], embeddings: Any):
+        """Add a batch of encoded records to the index asynchronously.
+
+        :param records: The records, as tuples of route name, utterance, function
+            schema and metadata.
+        :type records: List[Tuple]
+        :param embeddings: The embeddings of the records.
+        :type embeddings: Any
+        """
+        routes, utterances, function_schemas, metadata = map(list, zip(*records))
+        await self.index.aadd(
+            embeddings=embeddings.tolist(),
+            routes=routes,
+            utterances=utterances,
+            function_schemas=function_schemas,
+            metadata_list=metadata,
+        )
+
+    def _update_remote_metadata(self, utterances: List[Utterance]) -> List[Utterance]:
+        """Update the function schemas and metadata of utterances stored in the
+        index without encoding them. Utterances the index cannot update in place are
+        removed from it so they can be added again.
+
+        :param utterances: The utterances with their new function schemas and
+            metadata.
+        :type utterances: List[Utterance]
+        :return: The utterances that must be added to the index again.
+        :rtype: List[Utterance]
+        """
+        if not utterances:
+            return []
+        not_updated = self.index.update_metadata(utterances)
+        if not_updated:
+            self.index._remove_and_sync(_utterances_by_route(not_updated))
+        return not_updated
+
+    async def _async_update_remote_metadata(
+        self, utterances: List[Utterance]
+    ) -> List[Utterance]:
+        """Update the function schemas and metadata of utterances stored in the
+        index without encoding them asynchronously. Utterances the index cannot
+        update in place are removed from it so they can be added again.
+
+        :param utterances: The utterances with their new function schemas and
+            metadata.
+        :type utterances: List[Utterance]
+        :return: The utterances that must be added to the index again.
+        :rtype: List[Utterance]
+        """
+        if not utterances:
+            return []
+        not_updated = await self.index.aupdate_metadata(utterances)
+        if not_updated:
+            await self.index._async_remove_and_sync(_utterances_by_route(not_updated))
+        return not_updated
+
     def _local_upsert(self, utterances: List[Utterance]):
         """Adds new routes to the SemanticRouter.
 
@@ -998,19 +2381,29 @@ class BaseRouter(BaseModel):
         :type utterances: List[Utterance]
         """
         new_routes = {route.name: route for route in self.routes}
+        # utterance keys of each route, built once per route on first use
+        route_utterances: Dict[str, set] = {}
         for utt_obj in utterances:
-            if utt_obj.route not in new_routes.keys():
+            route = new_routes.get(utt_obj.route)
+            key = _utterance_key(utt_obj.utterance)
+            if route is None:
                 new_routes[utt_obj.route] = Route(
                     name=utt_obj.route,
                     utterances=[utt_obj.utterance],
                     function_schemas=utt_obj.function_schemas,
                     metadata=utt_obj.metadata,
                 )
-            else:
-                if utt_obj.utterance not in new_routes[utt_obj.route].utterances:
-                    new_routes[utt_obj.route].utterances.append(utt_obj.utterance)
-                new_routes[utt_obj.route].function_schemas = utt_obj.function_schemas
-                new_routes[utt_obj.route].metadata = utt_obj.metadata
+                route_utterances[utt_obj.route] = {key}
+                continue
+            if utt_obj.route not in route_utterances:
+                route_utterances[utt_obj.route] = {
+                    _utterance_key(utterance) for utterance in route.utterances
+                }
+            if key not in route_utterances[utt_obj.route]:
+                route.utterances.append(utt_obj.utterance)
+                route_utterances[utt_obj.route].add(key)
+            route.function_schemas = utt_obj.function_schemas
+            route.metadata = utt_obj.metadata
         self.routes = list(new_routes.values())
 
     def _local_delete(self, utterances: List[Utterance]):
@@ -1019,30 +2412,29 @@ class BaseRouter(BaseModel):
         :param utterances: The utterances to delete from the local SemanticRouter.
         :type utterances: List[Utterance]
         """
-        # create dictionary of route names to utterances
-        route_dict: dict[str, List[str]] = {}
+        # create dictionary of route names to the keys of utterances to delete
+        route_dict: Dict[str, set] = {}
         for utt in utterances:
-            route_dict.setdefault(utt.route, []).append(utt.utterance)
+            route_dict.setdefault(utt.route, set()).add(_utterance_key(utt.utterance))
         # iterate over current routes and delete specific utterance if found
         new_routes = []
         for route in self.routes:
-            if route.name in route_dict.keys():
-                # drop utterances that are in route_dict deletion list
-                new_utterances = list(
-                    set(route.utterances) - set(route_dict[route.name])
-                )
+            if route.name in route_dict:
+                # drop utterances that are in route_dict deletion list, keeping the
+                # order of the rest
+                to_delete = route_dict[route.name]
+                new_utterances = [
+                    utterance
+                    for utterance in route.utterances
+                    if _utterance_key(utterance) not in to_delete
+                ]
                 if len(new_utterances) == 0:
                     # the route is now empty, so we skip it
                     continue
                 else:
+                    # keep existing function schemas, metadata and settings
                     new_routes.append(
-                        Route(
-                            name=route.name,
-                            utterances=new_utterances,
-                            # use existing function schemas and metadata
-                            function_schemas=route.function_schemas,
-                            metadata=route.metadata,
-                        )
+                        route.model_copy(update={"utterances": new_utterances})
                     )
             else:
                 # the route is not in the route_dict, so we keep it as is
@@ -1104,11 +2496,25 @@ class BaseRouter(BaseModel):
         else:
             raise ValueError(f"{type(encoder)} not supported for loading from config.")
 
-    def add(self, routes: List[Route] | Route):
+    def add(
+        self,
+        routes: List[Route] | Route,
+        batch_size: int = DEFAULT_INGEST_BATCH_SIZE,
+        progress_callback: Optional[ProgressCallback] = None,
+        checkpoint_path: Optional[str] = None,
+    ):
         """Add a route to the local SemanticRouter and index.
 
         :param route: The route to add.
         :type route: Route
+        :param batch_size: The number of utterances encoded and added at once.
+        :type batch_size: int
+        :param progress_callback: Called with the number of utterances added and the
+            total number of utterances after each batch.
+        :type progress_callback: Optional[Callable[[int, int], None]]
+        :param checkpoint_path: A file recording the batches added, so an
+            interrupted add of the same routes resumes where it stopped.
+        :type checkpoint_path: Optional[str]
         """
         raise NotImplementedError("This method must be implemented by subclasses.")
 
@@ -1145,41 +2551,42 @@ class BaseRouter(BaseModel):
         :param utterances: The utterances to update.
         :type utterances: Optional[List[str]]
         """
-        # TODO JB: should modify update to take a Route object
-        current_local_hash = self._get_hash()
-        current_remote_hash = self.index._read_hash()
-        if current_remote_hash.value == "":
-            # if remote hash is empty, the index is to be initialized
-            current_remote_hash = current_local_hash
+        with self._write_state() as router:
+            # TODO JB: should modify update to take a Route object
+            current_local_hash = router._get_hash()
+            current_remote_hash = router.index._read_hash()
+            if current_remote_hash.value == "":
+                # if remote hash is empty, the index is to be initialized
+                current_remote_hash = current_local_hash
+
+            if threshold is None and utterances is None:
+                raise ValueError(
+                    "At least one of 'threshold' or 'utterances' must be provided."
+                )
+            if utterances:
+                raise NotImplementedError(
+                    "The update method cannot be used for updating utterances yet."
+                )
 
-        if threshold is None and utterances is None:
-            raise ValueError(
-                "At least one of 'threshold' or 'utterances' must be provided."
-            )
-        if utterances:
-            raise NotImplementedError(
-                "The update method cannot be used for updating utterances yet."
-            )
+            route = router.get(name)
+            if route:
+                if threshold:
+                    old_threshold = route.score_threshold
+                    route.score_threshold = threshold
+                    logger.info(
+                        f"Updated threshold for route '{route.name}' from {old_threshold} to {threshold}"
+                    )
+            else:
+                raise ValueError(f"Route '{name}' not found. Nothing updated.")
 
-        route = self.get(name)
-        if route:
-            if threshold:
-                old_threshold = route.score_threshold
-                route.score_threshold = threshold
-                logger.info(
-                    f"Updated threshold for route '{route.name}' from {old_threshold} to {threshold}"
+            if current_local_hash.value == current_remote_hash.value:
+                router._write_hash()  # update current hash in index
+            else:
+                logger.warning(
+                    "Local and remote route layers were not aligned. Remote hash "
+                    f"not updated. Use `{self.__class__.__name__}.get_utterance_diff()` "
+                    "to see details."
                 )
-        else:
-            raise ValueError(f"Route '{name}' not found. Nothing updated.")
-
-        if current_local_hash.value == current_remote_hash.value:
-            self._write_hash()  # update current hash in index
-        else:
-            logger.warning(
-                "Local and remote route layers were not aligned. Remote hash "
-                f"not updated. Use `{self.__class__.__name__}.get_utterance_diff()` "
-                "to see details."
-            )
 
     def delete(self, route_name: str):
         """Deletes a route given a specific route name.
@@ -1190,31 +2597,34 @@ class BaseRouter(BaseModel):
         # ensure index is not locked
         if self.index._is_locked():
             raise ValueError("Index is locked. Cannot delete route.")
-        current_local_hash = self._get_hash()
-        current_remote_hash = self.index._read_hash()
-        if current_remote_hash.value == "":
-            # if remote hash is empty, the index is to be initialized
-            current_remote_hash = current_local_hash
-
-        if route_name not in [route.name for route in self.routes]:
-            err_msg = f"Route `{route_name}` not found in {self.__class__.__name__}"
-            logger.warning(err_msg)
-            try:
-                self.index.delete(route_name=route_name)
-            except Exception as e:
-                logger.error(f"Failed to delete route from the index: {e}")
-        else:
-            self.routes = [route for route in self.routes if route.name != route_name]
-            self.index.delete(route_name=route_name)
+        with self._write_state() as router:
+            current_local_hash = router._get_hash()
+            current_remote_hash = router.index._read_hash()
+            if current_remote_hash.value == "":
+                # if remote hash is empty, the index is to be initialized
+                current_remote_hash = current_local_hash
+
+            if route_name not in [route.name for route in router.routes]:
+                err_msg = f"Route `{route_name}` not found in {self.__class__.__name__}"
+                logger.warning(err_msg)
+                try:
+                    router.index.delete(route_name=route_name)
+                except Exception as e:
+                    logger.error(f"Failed to delete route from the index: {e}")
+            else:
+                router.routes = [
+                    route for route in router.routes if route.name != route_name
+                ]
+                router.index.delete(route_name=route_name)
 
-        if current_local_hash.value == current_remote_hash.value:
-            self._write_hash()  # update current hash in index
-        else:
-            logger.warning(
-                "Local and remote route layers were not aligned. Remote hash "
-                f"not updated. Use `{self.__class__.__name__}.get_utterance_diff()` "
-                "to see details."
-            )
+            if current_local_hash.value == current_remote_hash.value:
+                router._write_hash()  # update current hash in index
+            else:
+                logger.warning(
+                    "Local and remote route layers were not aligned. Remote hash "
+                    f"not updated. Use `{self.__class__.__name__}.get_utterance_diff()` "
+                    "to see details."
+                )
 
     async def adelete(self, route_name: str):
         """Deletes a route given a specific route name asynchronously.
@@ -1225,31 +2635,34 @@ class BaseRouter(BaseModel):
         # ensure index is not locked
         if await self.index._ais_locked():
             raise ValueError("Index is locked. Cannot delete route.")
-        current_local_hash = self._get_hash()
-        current_remote_hash = await self.index._async_read_hash()
-        if current_remote_hash.value == "":
-            # if remote hash is empty, the index is to be initialized
-            current_remote_hash = current_local_hash
-
-        if route_name not in [route.name for route in self.routes]:
-            err_msg = f"Route `{route_name}` not found in {self.__class__.__name__}"
-            logger.warning(err_msg)
-            try:
-                await self.index.adelete(route_name=route_name)
-            except Exception as e:
-                logger.error(f"Failed to delete route from the index: {e}")
-        else:
-            self.routes = [route for route in self.routes if route.name != route_name]
-            await self.index.adelete(route_name=route_name)
+        async with self._async_write_state() as router:
+            current_local_hash = router._get_hash()
+            current_remote_hash = await router.index._async_read_hash()
+            if current_remote_hash.value == "":
+                # if remote hash is empty, the index is to be initialized
+                current_remote_hash = current_local_hash
+
+            if route_name not in [route.name for route in router.routes]:
+                err_msg = f"Route `{route_name}` not found in {self.__class__.__name__}"
+                logger.warning(err_msg)
+                try:
+                    await router.index.adelete(route_name=route_name)
+                except Exception as e:
+                    logger.error(f"Failed to delete route from the index: {e}")
+            else:
+                router.routes = [
+                    route for route in router.routes if route.name != route_name
+                ]
+                await router.index.adelete(route_name=route_name)
 
-        if current_local_hash.value == current_remote_hash.value:
-            await self._async_write_hash()  # update current hash in index
-        else:
-            logger.warning(
-                "Local and remote route layers were not aligned. Remote hash "
-                f"not updated. Use `{self.__class__.__name__}.get_utterance_diff()` "
-                "to see details."
-            )
+            if current_local_hash.value == current_remote_hash.value:
+                await router._async_write_hash()  # update current hash in index
+            else:
+                logger.warning(
+                    "Local and remote route layers were not aligned. Remote hash "
+                    f"not updated. Use `{self.__class__.__name__}.get_utterance_diff()` "
+                    "to see details."
+                )
 
     def _refresh_routes(self):
         """Pulls out the latest routes from the index.
@@ -1289,6 +2702,8 @@ class BaseRouter(BaseModel):
         config = self.to_config()
         hash_config = config.get_hash()
         self.index._write_config(config=hash_config)
+        for route_hashes in config.get_route_hashes():
+            self.index._write_config(config=route_hashes)
         return hash_config
 
     async def _async_write_hash(self) -> ConfigParameter:
@@ -1300,8 +2715,41 @@ class BaseRouter(BaseModel):
         config = self.to_config()
         hash_config = config.get_hash()
         await self.index._async_write_config(config=hash_config)
+        await asyncio.gather(
+            *(
+                self.index._async_write_config(config=route_hashes)
+                for route_hashes in config.get_route_hashes()
+            )
+        )
         return hash_config
 
+    def _read_route_hashes(self) -> List[str]:
+        """Read all records of the route hashes from the index.
+
+        :return: The records of the route hashes, starting with the first record.
+        :rtype: List[str]
+        """
+        head = self.index._read_route_hashes().value
+        return [head] + [
+            self.index._read_route_hashes(shard=shard).value
+            for shard in range(1, _route_hash_shards(head))
+        ]
+
+    async def _async_read_route_hashes(self) -> List[str]:
+        """Read all records of the route hashes from the index asynchronously.
+
+        :return: The records of the route hashes, starting with the first record.
+        :rtype: List[str]
+        """
+        head = (await self.index._async_read_route_hashes()).value
+        shards = await asyncio.gather(
+            *(
+                self.index._async_read_route_hashes(shard=shard)
+                for shard in range(1, _route_hash_shards(head))
+            )
+        )
+        return [head] + [shard.value for shard in shards]
+
     def is_synced(self) -> bool:
         """Check if the local and remote route layer instances are
         synchronized.
@@ -1334,6 +2782,85 @@ class BaseRouter(BaseModel):
         else:
             return False
 
+    def _get_remote_utterances(
+        self,
+        local_utterances: List[Utterance],
+        include_metadata: bool = True,
+        force: bool = False,
+    ) -> List[Utterance]:
+        """Get the remote utterances to diff against the local utterances. Only the
+        routes whose hash in the index differs from the local one are fetched, the
+        local utterances stand in for the routes that match.
+
+        :param local_utterances: The local utterances.
+        :type local_utterances: List[Utterance]
+        :param include_metadata: Whether to include function schemas and metadata.
+        :type include_metadata: bool
+        :param force: Whether to fetch all routes, ignoring the route hashes.
+        :type force: bool
+        :return: The remote utterances.
+        :rtype: List[Utterance]
+        """
+        changed_routes = None
+        if not force:
+            changed_routes = _changed_routes(
+                local_utterances,
+                route_hashes=self._read_route_hashes(),
+                remote_hash=self.index._read_hash().value,
+            )
+        if changed_routes is None:
+            return self.index.get_utterances(include_metadata=include_metadata)
+        remote_utterances = []
+        if changed_routes:
+            remote_utterances = self.index.get_utterances(
+                include_metadata=include_metadata, routes=sorted(changed_routes)
+            )
+        return remote_utterances + _unchanged_utterances(
+            local_utterances, changed_routes, include_metadata
+        )
+
+    async def _async_get_remote_utterances(
+        self,
+        local_utterances: List[Utterance],
+        include_metadata: bool = True,
+        force: bool = False,
+    ) -> List[Utterance]:
+        """Get the remote utterances to diff against the local utterances
+        asynchronously. Only the routes whose hash in the index differs from the
+        local one are fetched, the local utterances stand in for the routes that
+        match.
+
+        :param local_utterances: The local utterances.
+        :type local_utterances: List[Utterance]
+        :param include_metadata: Whether to include function schemas and metadata.
+        :type include_metadata: bool
+        :param force: Whether to fetch all routes, ignoring the route hashes.
+        :type force: bool
+        :return: The remote utterances.
+        :rtype: List[Utterance]
+        """
+        changed_routes = None
+        if not force:
+            route_hashes, remote_hash = await asyncio.gather(
+                self._async_read_route_hashes(),
+                self.index._async_read_hash(),
+            )
+            changed_routes = _changed_routes(
+                local_utterances,
+                route_hashes=route_hashes,
+                remote_hash=remote_hash.value,
+            )
+        if changed_routes is None:
+            return await self.index.aget_utterances(include_metadata=include_metadata)
+        remote_utterances = []
+        if changed_routes:
+            remote_utterances = await self.index.aget_utterances(
+                include_metadata=include_metadata, routes=sorted(changed_routes)
+            )
+        return remote_utterances + _unchanged_utterances(
+            local_utterances, changed_routes, include_metadata
+        )
+
     def get_utterance_diff(self, include_metadata: bool = False) -> List[str]:
         """Get the difference between the local and remote utterances. Returns
         a list of strings showing what is different in the remote when compared
@@ -1361,9 +2888,11 @@ class BaseRouter(BaseModel):
             utterances.
         :rtype: List[str]
         """
-        # first we get remote and local utterances
-        remote_utterances = self.index.get_utterances(include_metadata=include_metadata)
+        # first we get local and remote utterances
         local_utterances = self.to_config().to_utterances()
+        remote_utterances = self._get_remote_utterances(
+            local_utterances, include_metadata=include_metadata
+        )
 
         diff_obj = UtteranceDiff.from_utterances(
             local_utterances=local_utterances, remote_utterances=remote_utterances
@@ -1397,11 +2926,11 @@ class BaseRouter(BaseModel):
             utterances.
         :rtype: List[str]
         """
-        # first we get remote and local utterances
-        remote_utterances = await self.index.aget_utterances(
-            include_metadata=include_metadata
-        )
+        # first we get local and remote utterances
         local_utterances = self.to_config().to_utterances()
+        remote_utterances = await self._async_get_remote_utterances(
+            local_utterances, include_metadata=include_metadata
+        )
 
         diff_obj = UtteranceDiff.from_utterances(
             local_utterances=local_utterances, remote_utterances=remote_utterances
@@ -1475,6 +3004,151 @@ class BaseRouter(BaseModel):
         # TODO: should encode "content" rather than text
         raise NotImplementedError("This method should be implemented by subclasses.")
 
+    def _cached_encode(
+        self,
+        text: List[str],
+        input_type: EncodeInputType,
+        encode_fn: Callable[[List[str]], List[List[float]]],
+    ) -> np.ndarray:
+        """Encode text with `encode_fn`, reading from and writing to the embedding
+        cache and embedding store when set. Only texts missing from both are sent to
+        `encode_fn`, so batch calls pay only for the misses.
+
+        :param text: The text to encode.
+        :type text: List[str]
+        :param input_type: Specify whether encoding 'queries' or 'documents', used in asymmetric retrieval
+        :type input_type: semantic_router.encoders.encode_input_type.EncodeInputType
+        :param encode_fn: The encoder method used to encode any cache misses.
+        :type encode_fn: Callable[[List[str]], List[List[float]]]
+        :return: The embeddings of the text.
+        :rtype: np.ndarray
+        """
+        if self.embedding_cache is None and self.embedding_store is None:
+            return np.array(encode_fn(text))
+        keys = [embedding_cache_key(self.encoder, t, input_type) for t in text]
+        embeddings = self._read_cached_embeddings(keys=keys)
+        misses = self._get_cache_misses(text=text, keys=keys, embeddings=embeddings)
+        if misses:
+            new_embeddings = encode_fn(list(misses.values()))
+            self._fill_cache_misses(
+                keys=keys,
+                embeddings=embeddings,
+                misses=misses,
+                new_embeddings=new_embeddings,
+            )
+        return np.array(embeddings)
+
+    async def _async_cached_encode(
+        self,
+        text: List[str],
+        input_type: EncodeInputType,
+        encode_fn: Callable[[List[str]], Awaitable[List[List[float]]]],
+    ) -> np.ndarray:
+        """Asynchronously encode text with `encode_fn`, reading from and writing to
+        the embedding cache and embedding store when set. Only texts missing from
+        both are sent to `encode_fn`.
+
+        :param text: The text to encode.
+        :type text: List[str]
+        :param input_type: Specify whether encoding 'queries' or 'documents', used in asymmetric retrieval
+        :type input_type: semantic_router.encoders.encode_input_type.EncodeInputType
+        :param encode_fn: The async encoder method used to encode any cache misses.
+        :type encode_fn: Callable[[List[str]], Awaitable[List[List[float]]]]
+        :return: The embeddings of the text.
+        :rtype: np.ndarray
+        """
+        if self.embedding_cache is None and self.embedding_store is None:
+            return np.array(await encode_fn(text))
+        keys = [embedding_cache_key(self.encoder, t, input_type) for t in text]
+        embeddings = self._read_cached_embeddings(keys=keys)
+        misses = self._get_cache_misses(text=text, keys=keys, embeddings=embeddings)
+        if misses:
+            new_embeddings = await encode_fn(list(misses.values()))
+            self._fill_cache_misses(
+                keys=keys,
+                embeddings=embeddings,
+                misses=misses,
+                new_embeddings=new_embeddings,
+            )
+        return np.array(embeddings)
+
+    def _read_cached_embeddings(self, keys: List[str]) -> List[Optional[Any]]:
+        """Read embeddings from the embedding cache, falling back to the embedding
+        store for any misses. Embeddings found in the store are promoted into the
+        cache.
+
+        :param keys: The cache keys to read.
+        :type keys: List[str]
+        :return: The cached embeddings, None where neither layer had the key.
+        :rtype: List[Optional[Any]]
+        """
+        embeddings: List[Optional[Any]] = [None] * len(keys)
+        if self.embedding_cache is not None:
+            embeddings = self.embedding_cache.get_many(keys)
+        if self.embedding_store is not None:
+            missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+            if missing:
+                stored = self.embedding_store.get_many([keys[i] for i in missing])
+                promoted = []
+                for i, embedding in zip(missing, stored):
+                    if embedding is not None:
+                        embeddings[i] = embedding
+                        promoted.append((keys[i], embedding))
+                if self.embedding_cache is not None and promoted:
+                    self.embedding_cache.set_many(promoted)
+        return embeddings
+
+    def _get_cache_misses(
+        self, text: List[str], keys: List[str], embeddings: List[Optional[Any]]
+    ) -> Dict[str, str]:
+        """Collect the texts that were not found in the embedding cache. Duplicate
+        texts within a batch are only returned once.
+
+        :param text: The text being encoded.
+        :type text: List[str]
+        :param keys: The cache keys for each text.
+        :type keys: List[str]
+        :param embeddings: The cached embeddings, None where there was a miss.
+        :type embeddings: List[Optional[Any]]
+        :return: A mapping of cache key to the text to encode for that key.
+        :rtype: Dict[str, str]
+        """
+        misses: Dict[str, str] = {}
+        for t, key, embedding in zip(text, keys, embeddings):
+            if embedding is None and key not in misses:
+                misses[key] = t
+        return misses
+
+    def _fill_cache_misses(
+        self,
+        keys: List[str],
+        embeddings: List[Optional[Any]],
+        misses: Dict[str, str],
+        new_embeddings: List[List[float]],
+    ):
+        """Write newly encoded embeddings to the embedding cache and embedding store,
+        and fill in the missing entries of `embeddings` in place.
+
+        :param keys: The cache keys for each text.
+        :type keys: List[str]
+        :param embeddings: The cached embeddings, None where there was a miss.
+        :type embeddings: List[Optional[Any]]
+        :param misses: A mapping of cache key to the text that was encoded.
+        :type misses: Dict[str, str]
+        :param new_embeddings: The embeddings returned for the missed texts.
+        :type new_embeddings: List[List[float]]
+        """
+        encoded = {
+            key: np.asarray(embedding) for key, embedding in zip(misses, new_embeddings)
+        }
+        if self.embedding_cache is not None:
+            self.embedding_cache.set_many(list(encoded.items()))
+        if self.embedding_store is not None:
+            self.embedding_store.set_many(list(encoded.items()))
+        for i, key in enumerate(keys):
+            if embeddings[i] is None:
+                embeddings[i] = encoded[key]
+
     def _set_aggregation_method(self, aggregation: str = "sum"):
         """Set the aggregation method.
 
@@ -1584,7 +3258,7 @@ class BaseRouter(BaseModel):
         """
         if route_thresholds:
             for route, threshold in route_thresholds.items():
-                self.set_threshold(
+                self._set_threshold(
                     threshold=threshold,
                     route_name=route,
                 )
@@ -1595,6 +3269,19 @@ class BaseRouter(BaseModel):
         a threshold of 1.0 will mean that a route must contain an exact utterance match
         to be returned.
 
+        :param threshold: The threshold to set.
+        :type threshold: float
+        :param route_name: The name of the route to set the threshold for. If None, the
+        threshold will be set for all routes.
+        :type route_name: str | None
+        """
+        with self._write_state() as router:
+            router._set_threshold(threshold=threshold, route_name=route_name)
+
+    def _set_threshold(self, threshold: float, route_name: str | None = None):
+        """Set the score threshold for a specific route or all routes of a router
+        copy being written.
+
         :param threshold: The threshold to set.
         :type threshold: float
         :param route_name: The name of the route to set the threshold for. If None, the
@@ -1677,59 +3364,61 @@ class BaseRouter(BaseModel):
         :param local_execution: Whether to execute the fitting locally.
         :type local_execution: bool
         """
-        original_index = self.index
-        if local_execution:
-            # Switch to a local index for fitting
-            from semantic_router.index.local import LocalIndex
-
-            remote_utterances = self.index.get_utterances(include_metadata=True)
-            # TODO Enhance by retrieving directly the vectors instead of embedding all utterances again
-            routes = []
-            utterances = []
-            metadata = []
-            for utterance in remote_utterances:
-                routes.append(utterance.route)
-                utterances.append(utterance.utterance)
-                metadata.append(utterance.metadata)
-            embeddings = self.encoder(utterances)
-            self.index = LocalIndex()
-            self.index.add(
-                embeddings=embeddings,
-                routes=routes,
-                utterances=utterances,
-                metadata_list=metadata,
-            )
+        with self._write_state() as router:
+            original_index = router.index
+            if local_execution:
+                # Switch to a local index for fitting
+                from semantic_router.index.local import LocalIndex
+
+                remote_utterances = router.index.get_utterances(include_metadata=True)
+                # embeddings are read from the embedding store where available so only
+                # utterances that have never been encoded are sent to the encoder
+                routes = []
+                utterances = []
+                metadata = []
+                for utterance in remote_utterances:
+                    routes.append(utterance.route)
+                    utterances.append(utterance.utterance)
+                    metadata.append(utterance.metadata)
+                embeddings = router._encode(utterances, input_type="documents").tolist()
+                router.index = LocalIndex()
+                router.index.add(
+                    embeddings=embeddings,
+                    routes=routes,
+                    utterances=utterances,
+                    metadata_list=metadata,
+                )
 
-        # convert inputs into array
-        Xq: List[List[float]] = []
-        for i in tqdm(range(0, len(X), batch_size), desc="Generating embeddings"):
-            emb = np.array(self.encoder(X[i : i + batch_size]))
-            Xq.extend(emb)
-        # initial eval (we will iterate from here)
-        best_acc = self._vec_evaluate(Xq_d=np.array(Xq), y=y)
-        best_thresholds = self.get_thresholds()
-        # begin fit
-        for _ in (pbar := tqdm(range(max_iter), desc="Training")):
-            pbar.set_postfix({"acc": round(best_acc, 2)})
-            # Find the best score threshold for each route
-            thresholds = threshold_random_search(
-                route_layer=self,
-                search_range=0.8,
-            )
-            # update current route layer
-            self._update_thresholds(route_thresholds=thresholds)
-            # evaluate
-            acc = self._vec_evaluate(Xq_d=Xq, y=y)
-            # update best
-            if acc > best_acc:
-                best_acc = acc
-                best_thresholds = thresholds
-        # update route layer to best thresholds
-        self._update_thresholds(route_thresholds=best_thresholds)
-
-        if local_execution:
-            # Switch back to the original index
-            self.index = original_index
+            # convert inputs into array
+            Xq: List[List[float]] = []
+            for i in tqdm(range(0, len(X), batch_size), desc="Generating embeddings"):
+                emb = router._encode(X[i : i + batch_size], input_type="queries")
+                Xq.extend(emb)
+            # initial eval (we will iterate from here)
+            best_acc = router._vec_evaluate(Xq_d=np.array(Xq), y=y)
+            best_thresholds = router.get_thresholds()
+            # begin fit
+            for _ in (pbar := tqdm(range(max_iter), desc="Training")):
+                pbar.set_postfix({"acc": round(best_acc, 2)})
+                # Find the best score threshold for each route
+                thresholds = threshold_random_search(
+                    route_layer=router,
+                    search_range=0.8,
+                )
+                # update current route layer
+                router._update_thresholds(route_thresholds=thresholds)
+                # evaluate
+                acc = router._vec_evaluate(Xq_d=Xq, y=y)
+                # update best
+                if acc > best_acc:
+                    best_acc = acc
+                    best_thresholds = thresholds
+            # update route layer to best thresholds
+            router._update_thresholds(route_thresholds=best_thresholds)
+
+            if local_execution:
+                # Switch back to the original index
+                router.index = original_index
 
     def evaluate(self, X: List[str], y: List[str], batch_size: int = 500) -> float:
         """Evaluate the accuracy of the route selection.
@@ -1745,7 +3434,7 @@ class BaseRouter(BaseModel):
         """
         Xq: List[List[float]] = []
         for i in tqdm(range(0, len(X), batch_size), desc="Generating embeddings"):
-            emb = np.array(self.encoder(X[i : i + batch_size]))
+            emb = self._encode(X[i : i + batch_size], input_type="queries")
             Xq.extend(emb)
 
         accuracy = self._vec_evaluate(Xq_d=np.array(Xq), y=y)
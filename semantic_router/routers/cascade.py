@@ -0,0 +1,561 @@
+import copy
+import threading
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict, PrivateAttr
+from tqdm.auto import tqdm
+
+from semantic_router.encoders import SparseEncoder
+from semantic_router.encoders.base import AsymmetricSparseMixin, FittableMixin
+from semantic_router.route import Route
+from semantic_router.routers.base import BaseRouter
+from semantic_router.routers.hybrid import HybridRouter
+from semantic_router.schema import RouteChoice, SparseEmbedding
+from semantic_router.utils.logger import logger
+
+
+class CascadeStage(BaseModel):
+    """A cheap routing stage tried before the full router of a `CascadeRouter`.
+
+    A stage scores the routes for a query and is confident when the top route
+    scores at least `min_score` and its route's `score_threshold`, and beats the
+    runner-up by at least `margin`.
+    """
+
+    margin: float = 0.1
+    min_score: Optional[float] = None
+
+    model_config: ClassVar[ConfigDict] = ConfigDict(arbitrary_types_allowed=True)
+
+    _thresholds: Dict[str, float] = PrivateAttr(default_factory=dict)
+
+    def build(self, routes: List[Route]):
+        """Prepare the stage for the given routes, keeping their score thresholds.
+
+        :param routes: The routes of the cascade.
+        :type routes: List[Route]
+        """
+        self._thresholds = {
+            route.name: route.score_threshold
+            for route in routes
+            if route.score_threshold is not None
+        }
+
+    def score(self, text: str) -> List[Tuple[str, float]]:
+        """Score the routes for a query.
+
+        :param text: The query.
+        :type text: str
+        :return: The route names and scores, ordered from highest to lowest score.
+        :rtype: List[Tuple[str, float]]
+        """
+        raise NotImplementedError("Subclasses must implement this method")
+
+    async def ascore(self, text: str) -> List[Tuple[str, float]]:
+        """Score the routes for a query asynchronously.
+
+        :param text: The query.
+        :type text: str
+        :return: The route names and scores, ordered from highest to lowest score.
+        :rtype: List[Tuple[str, float]]
+        """
+        return self.score(text)
+
+    def score_many(self, texts: List[str]) -> List[List[Tuple[str, float]]]:
+        """Score the routes for many queries, used when fitting the cascade.
+
+        :param texts: The queries.
+        :type texts: List[str]
+        :return: The scored routes of each query.
+        :rtype: List[List[Tuple[str, float]]]
+        """
+        return [self.score(text) for text in texts]
+
+    def is_confident(self, scored_routes: List[Tuple[str, float]]) -> bool:
+        """Check whether the stage is confident enough to return its top route.
+
+        :param scored_routes: The scored routes, ordered from highest to lowest.
+        :type scored_routes: List[Tuple[str, float]]
+        :return: True if the top route can be returned without escalating.
+        :rtype: bool
+        """
+        if not self.passes_threshold(scored_routes):
+            return False
+        return _margin(scored_routes) >= self.margin
+
+    def passes_threshold(self, scored_routes: List[Tuple[str, float]]) -> bool:
+        """Check whether the top route scores at least `min_score` and the score
+        threshold of the route.
+
+        :param scored_routes: The scored routes, ordered from highest to lowest.
+        :type scored_routes: List[Tuple[str, float]]
+        :return: True if the top route passes the thresholds.
+        :rtype: bool
+        """
+        if not scored_routes:
+            return False
+        name, top = scored_routes[0]
+        if self.min_score is not None and top < self.min_score:
+            return False
+        threshold = self._thresholds.get(name)
+        return threshold is None or top >= threshold
+
+
+class RouterStage(CascadeStage):
+    """A stage backed by another router, typically a `SemanticRouter` using a small
+    local encoder such as `FastEmbedEncoder` or `HuggingFaceEncoder`. The router must
+    hold the same routes as the cascade. The score thresholds of the stage router's
+    routes are applied, as its scores are on the scale of its own encoder.
+    """
+
+    router: BaseRouter
+
+    def build(self, routes: List[Route]):
+        super().build(self.router.routes)
+
+    def score(self, text: str) -> List[Tuple[str, float]]:
+        return [(name, score) for name, score, _ in self.router._retrieve(text=text)]
+
+    async def ascore(self, text: str) -> List[Tuple[str, float]]:
+        scored_routes = await self.router._async_retrieve(text=text)
+        return [(name, score) for name, score, _ in scored_routes]
+
+    def score_many(self, texts: List[str]) -> List[List[Tuple[str, float]]]:
+        if isinstance(self.router, HybridRouter):
+            return super().score_many(texts)
+        xq = self.router._encode(texts, input_type="queries")
+        return [
+            [(name, score) for name, score, _ in self.router._retrieve(vector=vector)]
+            for vector in xq
+        ]
+
+
+class SparseStage(CascadeStage):
+    """A stage scoring routes by keyword overlap using a sparse encoder such as
+    `TfidfEncoder` or `BM25Encoder`. Utterances are kept in an in-memory inverted
+    index, so a query only costs a sparse encoding and a few array lookups.
+    """
+
+    encoder: SparseEncoder
+    top_k: int = 5
+    aggregation: str = "mean"
+    fit_encoder: bool = True
+
+    # the encoder, the postings of each sparse index and the route of each
+    # utterance, replaced together so a query never mixes two builds
+    _built: Optional[
+        Tuple[SparseEncoder, Dict[int, Tuple[np.ndarray, np.ndarray]], List[str]]
+    ] = PrivateAttr(default=None)
+
+    def build(self, routes: List[Route]):
+        """Fit a copy of the encoder (if it is fittable and `fit_encoder` is set)
+        and index the utterances of the routes. Queries keep being scored with the
+        previous build until the new one is complete.
+
+        :param routes: The routes of the cascade.
+        :type routes: List[Route]
+        """
+        if self.aggregation not in ["sum", "mean", "max"]:
+            raise ValueError(
+                f"Unsupported aggregation method chosen: {self.aggregation}. Choose "
+                "either 'SUM', 'MEAN', or 'MAX'."
+            )
+        super().build(routes)
+        utterances = [str(u) for route in routes for u in route.utterances]
+        utterance_routes = [route.name for route in routes for _ in route.utterances]
+        encoder = self.encoder
+        if not utterances:
+            self._built = (encoder, {}, utterance_routes)
+            return
+        if self.fit_encoder and isinstance(encoder, FittableMixin):
+            # the encoder scoring queries meanwhile must not be refitted
+            encoder = copy.deepcopy(encoder)
+            encoder.fit(routes)
+        if isinstance(encoder, AsymmetricSparseMixin):
+            embeddings = encoder.encode_documents(utterances)
+        else:
+            embeddings = encoder(utterances)
+        postings: Dict[int, Tuple[List[int], List[float]]] = {}
+        for i, embedding in enumerate(embeddings):
+            for index, value in embedding.items():
+                if value == 0:
+                    continue
+                ids, values = postings.setdefault(int(index), ([], []))
+                ids.append(i)
+                values.append(float(value))
+        self._built = (
+            encoder,
+            {
+                index: (np.array(ids), np.array(values))
+                for index, (ids, values) in postings.items()
+            },
+            utterance_routes,
+        )
+
+    def score(self, text: str) -> List[Tuple[str, float]]:
+        return self.score_many([text])[0]
+
+    def score_many(self, texts: List[str]) -> List[List[Tuple[str, float]]]:
+        built = self._built
+        if built is None:
+            return [[] for _ in texts]
+        encoder, postings, utterance_routes = built
+        if isinstance(encoder, AsymmetricSparseMixin):
+            embeddings = encoder.encode_queries(texts)
+        else:
+            embeddings = encoder(texts)
+        return [
+            self._score_embedding(embedding, postings, utterance_routes)
+            for embedding in embeddings
+        ]
+
+    def _score_embedding(
+        self,
+        embedding: SparseEmbedding,
+        postings: Dict[int, Tuple[np.ndarray, np.ndarray]],
+        utterance_routes: List[str],
+    ) -> List[Tuple[str, float]]:
+        scores = np.zeros(len(utterance_routes))
+        for index, value in embedding.items():
+            if (posting := postings.get(int(index))) is not None:
+                ids, values = posting
+                scores[ids] += value * values
+        top_ids = [i for i in np.argsort(-scores)[: self.top_k] if scores[i] > 0]
+        scores_by_route: Dict[str, List[float]] = {}
+        for i in top_ids:
+            scores_by_route.setdefault(utterance_routes[i], []).append(float(scores[i]))
+        aggregate = {"sum": sum, "mean": np.mean, "max": max}[self.aggregation]
+        scored_routes = [
+            (route, float(aggregate(scores)))  # type: ignore
+            for route, scores in scores_by_route.items()
+        ]
+        scored_routes.sort(key=lambda x: x[1], reverse=True)
+        return scored_routes
+
+
+class CascadeRouter(BaseModel):
+    """A router that tries cheap stages before falling back to a full router.
+
+    Each query goes through the stages in order. The first stage that is confident
+    about its top route returns that route without encoding the query with the full
+    router's (typically remote) encoder. Queries that no stage is confident about
+    are escalated to the full `SemanticRouter` or `HybridRouter`. Stage margins can
+    be learned with `fit` so that early exits do not cost accuracy.
+
+    Example usage:
+
+    ```python
+    from semantic_router.encoders import TfidfEncoder
+    from semantic_router.routers import CascadeRouter, SemanticRouter, SparseStage
+
+    router = SemanticRouter(encoder=OpenAIEncoder(), routes=routes, auto_sync="local")
+    cascade = CascadeRouter(router=router, stages=[SparseStage(encoder=TfidfEncoder())])
+    cascade.fit(X=train_queries, y=train_labels)
+    choice = cascade("how's the weather today?")
+    ```
+    """
+
+    router: BaseRouter
+    stages: List[CascadeStage]
+
+    model_config: ClassVar[ConfigDict] = ConfigDict(arbitrary_types_allowed=True)
+
+    _stage_hits: List[int] = PrivateAttr(default_factory=list)
+    _escalations: int = PrivateAttr(default=0)
+    _built_version: Optional[str] = PrivateAttr(default=None)
+    _build_lock: Any = PrivateAttr(default_factory=threading.Lock)
+
+    def __init__(self, router: BaseRouter, stages: List[CascadeStage]):
+        """Initialize the CascadeRouter.
+
+        :param router: The full router queries are escalated to.
+        :type router: BaseRouter
+        :param stages: The cheap stages, tried in order before the full router.
+        :type stages: List[CascadeStage]
+        """
+        super().__init__(router=router, stages=stages)
+        self.refresh()
+
+    def refresh(self):
+        """Rebuild the stages from the routes of the full router and reset the stage
+        statistics. Stages are also rebuilt automatically when the routes or
+        thresholds of the full router change.
+        """
+        self._build_stages()
+        self._stage_hits = [0] * len(self.stages)
+        self._escalations = 0
+
+    def _build_stages(self, only_if_stale: bool = False):
+        with self._build_lock:
+            version = self.router._router_version_key()
+            if only_if_stale and version == self._built_version:
+                # another query rebuilt the stages while this one waited
+                return
+            for stage in self.stages:
+                stage.build(self.router.routes)
+            self._built_version = version
+
+    def _refresh_if_stale(self):
+        """Rebuild the stages if the full router changed since they were built. One
+        query rebuilds them while concurrent queries wait for the new build.
+        """
+        if self.router._router_version_key() != self._built_version:
+            logger.debug("Router changed, rebuilding cascade stages.")
+            self._build_stages(only_if_stale=True)
+
+    def __call__(
+        self,
+        text: str,
+        simulate_static: bool = False,
+        route_filter: Optional[List[str]] = None,
+        use_function_cache: bool = True,
+    ) -> RouteChoice | List[RouteChoice]:
+        """Route a query through the cascade.
+
+        :param text: The text to route.
+        :type text: str
+        :param simulate_static: Whether to simulate a static route.
+        :type simulate_static: bool
+        :param route_filter: The route filter to use.
+        :type route_filter: Optional[List[str]]
+        :param use_function_cache: Whether dynamic routes may reuse the function call
+            inputs cached by their function cache, defaults to True.
+        :type use_function_cache: bool
+        :return: The route choice.
+        :rtype: RouteChoice | List[RouteChoice]
+        """
+        self._refresh_if_stale()
+        for i, stage in enumerate(self.stages):
+            route = self._confident_route(stage.score(text), stage, route_filter)
+            if route is not None:
+                self._stage_hits[i] += 1
+                return self.router._choose_route(
+                    route=route,
+                    text=text,
+                    simulate_static=simulate_static,
+                    use_function_cache=use_function_cache,
+                )
+        self._escalations += 1
+        return self.router(
+            text=text,
+            simulate_static=simulate_static,
+            route_filter=route_filter,
+            use_function_cache=use_function_cache,
+        )
+
+    async def acall(
+        self,
+        text: str,
+        simulate_static: bool = False,
+        route_filter: Optional[List[str]] = None,
+        use_function_cache: bool = True,
+    ) -> RouteChoice | List[RouteChoice]:
+        """Asynchronously route a query through the cascade.
+
+        :param text: The text to route.
+        :type text: str
+        :param simulate_static: Whether to simulate a static route.
+        :type simulate_static: bool
+        :param route_filter: The route filter to use.
+        :type route_filter: Optional[List[str]]
+        :param use_function_cache: Whether dynamic routes may reuse the function call
+            inputs cached by their function cache, defaults to True.
+        :type use_function_cache: bool
+        :return: The route choice.
+        :rtype: RouteChoice | List[RouteChoice]
+        """
+        self._refresh_if_stale()
+        for i, stage in enumerate(self.stages):
+            scored_routes = await stage.ascore(text)
+            route = self._confident_route(scored_routes, stage, route_filter)
+            if route is not None:
+                self._stage_hits[i] += 1
+                return await self.router._async_choose_route(
+                    route=route,
+                    text=text,
+                    simulate_static=simulate_static,
+                    use_function_cache=use_function_cache,
+                )
+        self._escalations += 1
+        return await self.router.acall(
+            text=text,
+            simulate_static=simulate_static,
+            route_filter=route_filter,
+            use_function_cache=use_function_cache,
+        )
+
+    def _confident_route(
+        self,
+        scored_routes: List[Tuple[str, float]],
+        stage: CascadeStage,
+        route_filter: Optional[List[str]],
+    ) -> Optional[Route]:
+        if route_filter is not None:
+            scored_routes = [r for r in scored_routes if r[0] in route_filter]
+        if not stage.is_confident(scored_routes):
+            return None
+        return self.router.check_for_matching_routes(top_class=scored_routes[0][0])
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the number of queries answered by each stage and escalated to the
+        full router since the last `refresh`.
+
+        :return: The hits of each stage, the number of escalations and the share of
+            queries answered without the full router.
+        :rtype: Dict[str, Any]
+        """
+        total = sum(self._stage_hits) + self._escalations
+        return {
+            "stage_hits": list(self._stage_hits),
+            "escalations": self._escalations,
+            "early_exit_rate": sum(self._stage_hits) / total if total else 0.0,
+        }
+
+    def fit(
+        self,
+        X: List[str],
+        y: List[Optional[str]],
+        batch_size: int = 500,
+        fit_router: bool = False,
+        **kwargs,
+    ):
+        """Learn the margin of each stage from labelled queries. For each stage the
+        smallest margin is chosen at which the stage is right at least as often as
+        the full router on the queries it would answer, so early exits do not lower
+        accuracy. Queries answered by a stage are not used to fit later stages.
+
+        :param X: The queries.
+        :type X: List[str]
+        :param y: The expected route name of each query, None for no route.
+        :type y: List[Optional[str]]
+        :param batch_size: The batch size used to encode queries for the full
+            router.
+        :type batch_size: int
+        :param fit_router: Whether to fit the thresholds of the full router first.
+        :type fit_router: bool
+        :param kwargs: Additional keyword arguments passed to the full router's
+            `fit` method.
+        """
+        if fit_router:
+            self.router.fit(X=X, y=y, batch_size=batch_size, **kwargs)  # type: ignore
+        self._refresh_if_stale()
+        reference = [
+            name == target
+            for name, target in zip(self._router_predictions(X, batch_size), y)
+        ]
+        remaining = list(range(len(X)))
+        for stage in self.stages:
+            if not remaining:
+                break
+            scored = stage.score_many([X[i] for i in remaining])
+            stage.margin = _fit_margin(
+                scored_routes=[s if stage.passes_threshold(s) else [] for s in scored],
+                y=[y[i] for i in remaining],
+                reference=[reference[i] for i in remaining],
+                min_score=stage.min_score,
+            )
+            remaining = [
+                i for i, s in zip(remaining, scored) if not stage.is_confident(s)
+            ]
+        logger.info(
+            f"Cascade stages answer {len(X) - len(remaining)} of {len(X)} queries "
+            "without the full router."
+        )
+
+    def evaluate(self, X: List[str], y: List[Optional[str]]) -> float:
+        """Evaluate the accuracy of the cascade.
+
+        :param X: The queries.
+        :type X: List[str]
+        :param y: The expected route name of each query, None for no route.
+        :type y: List[Optional[str]]
+        :return: The accuracy of the route selection.
+        :rtype: float
+        """
+        if not X:
+            raise ValueError("Cannot evaluate the cascade on an empty dataset.")
+        correct = 0
+        for text, target in zip(X, y):
+            if _route_name(self(text=text, simulate_static=True)) == target:
+                correct += 1
+        return correct / len(X)
+
+    def _router_predictions(self, X: List[str], batch_size: int) -> List[Optional[str]]:
+        """Get the routes chosen by the full router for each query.
+
+        :param X: The queries.
+        :type X: List[str]
+        :param batch_size: The batch size used to encode queries.
+        :type batch_size: int
+        :return: The route name chosen for each query.
+        :rtype: List[Optional[str]]
+        """
+        if isinstance(self.router, HybridRouter):
+            return [
+                _route_name(self.router(text=text, simulate_static=True))
+                for text in tqdm(X, desc="Routing")
+            ]
+        predictions: List[Optional[str]] = []
+        for i in tqdm(range(0, len(X), batch_size), desc="Generating embeddings"):
+            xq = self.router._encode(X[i : i + batch_size], input_type="queries")
+            predictions.extend(
+                _route_name(self.router(vector=vector, simulate_static=True))
+                for vector in xq
+            )
+        return predictions
+
+
+def _margin(scored_routes: List[Tuple[str, float]]) -> float:
+    """Get the gap between the top route and the runner-up, or the top score when
+    only one route scored.
+    """
+    second = scored_routes[1][1] if len(scored_routes) > 1 else 0.0
+    return scored_routes[0][1] - second
+
+
+def _route_name(route_choice: RouteChoice | List[RouteChoice]) -> Optional[str]:
+    if isinstance(route_choice, list):
+        return route_choice[0].name
+    return route_choice.name
+
+
+def _fit_margin(
+    scored_routes: List[List[Tuple[str, float]]],
+    y: List[Optional[str]],
+    reference: List[bool],
+    min_score: Optional[float],
+) -> float:
+    """Find the smallest margin at which a stage is correct at least as often as the
+    full router on the queries it accepts.
+
+    :param scored_routes: The scored routes of each query.
+    :type scored_routes: List[List[Tuple[str, float]]]
+    :param y: The expected route name of each query.
+    :type y: List[Optional[str]]
+    :param reference: Whether the full router chose the right route for each query.
+    :type reference: List[bool]
+    :param min_score: The minimum top score required by the stage.
+    :type min_score: Optional[float]
+    :return: The margin, infinite if the stage should never answer.
+    :rtype: float
+    """
+    candidates = []
+    for scored, target, ref in zip(scored_routes, y, reference):
+        if not scored or (min_score is not None and scored[0][1] < min_score):
+            continue
+        candidates.append((_margin(scored), scored[0][0] == target, ref))
+    # accept queries from the most to the least confident, keeping the lowest margin
+    # at which the stage is still at least as accurate as the full router
+    candidates.sort(key=lambda x: x[0], reverse=True)
+    best = float("inf")
+    stage_correct = router_correct = 0
+    for i, (margin, correct, ref) in enumerate(candidates):
+        stage_correct += correct
+        router_correct += ref
+        is_last_of_tie = i + 1 == len(candidates) or candidates[i + 1][0] < margin
+        if is_last_of_tie and stage_correct >= router_correct:
+            best = margin
+    if best == float("inf"):
+        logger.warning("Cascade stage is never accurate enough to answer queries.")
+    return best
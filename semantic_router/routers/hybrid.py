@@ -1,10 +1,12 @@
 import asyncio
-from typing import Any, Dict, List, Optional, Union
+import copy
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 from pydantic import Field
 from tqdm.auto import tqdm
 
+from semantic_router.cache import BaseCache
 from semantic_router.encoders import (
     BM25Encoder,
     DenseEncoder,
@@ -19,8 +21,16 @@ from semantic_router.encoders.encode_input_type import EncodeInputType
 from semantic_router.index import BaseIndex, HybridLocalIndex
 from semantic_router.llms import BaseLLM
 from semantic_router.route import Route
-from semantic_router.routers.base import BaseRouter, threshold_random_search, xq_reshape
+from semantic_router.routers.base import (
+    BaseRouter,
+    RouterState,
+    _utterance_records,
+    _utterances_by_route,
+    threshold_random_search,
+    xq_reshape,
+)
 from semantic_router.schema import RouteChoice, SparseEmbedding, Utterance
+from semantic_router.utils.ingestion import DEFAULT_INGEST_BATCH_SIZE, ProgressCallback
 from semantic_router.utils.logger import logger
 
 
@@ -42,6 +52,10 @@ class HybridRouter(BaseRouter):
         aggregation: str = "mean",
         auto_sync: Optional[str] = None,
         alpha: float = 0.3,
+        embedding_cache: Optional[BaseCache] = None,
+        embedding_store: Optional[BaseCache] = None,
+        decision_cache: Optional[BaseCache] = None,
+        sync_interval: Optional[float] = None,
     ):
         """Initialize the HybridRouter.
 
@@ -49,6 +63,15 @@ class HybridRouter(BaseRouter):
         :type encoder: DenseEncoder
         :param sparse_encoder: The sparse encoder to use.
         :type sparse_encoder: Optional[SparseEncoder]
+        :param embedding_cache: An optional cache for dense embeddings.
+        :type embedding_cache: Optional[BaseCache]
+        :param embedding_store: An optional persistent store for dense embeddings.
+        :type embedding_store: Optional[BaseCache]
+        :param decision_cache: An optional in-memory cache of route choices.
+        :type decision_cache: Optional[BaseCache]
+        :param sync_interval: When set with `auto_sync`, the router is synced in the
+            background every `sync_interval` seconds.
+        :type sync_interval: Optional[float]
         """
         if index is None:
             logger.warning("No index provided. Using default HybridLocalIndex.")
@@ -68,6 +91,10 @@ class HybridRouter(BaseRouter):
             top_k=top_k,
             aggregation=aggregation,
             auto_sync=auto_sync,
+            embedding_cache=embedding_cache,
+            embedding_store=embedding_store,
+            decision_cache=decision_cache,
+            sync_interval=sync_interval,
         )
         # set alpha
         self.alpha = alpha
@@ -87,55 +114,63 @@ class HybridRouter(BaseRouter):
                     "'None' value can lead to unexpected results."
                 )
 
-    def add(self, routes: List[Route] | Route):
-        """Add a route to the local HybridRouter and index.
+    def add(
+        self,
+        routes: List[Route] | Route,
+        batch_size: int = DEFAULT_INGEST_BATCH_SIZE,
+        progress_callback: Optional[ProgressCallback] = None,
+        checkpoint_path: Optional[str] = None,
+    ):
+        """Add a route to the local HybridRouter and index. The utterances are
+        encoded and added to the index in batches, encoding the next batches while
+        the previous ones are added.
 
         :param route: The route to add.
         :type route: Route
+        :param batch_size: The number of utterances encoded and added at once.
+        :type batch_size: int
+        :param progress_callback: Called with the number of utterances added and the
+            total number of utterances after each batch.
+        :type progress_callback: Optional[Callable[[int, int], None]]
+        :param checkpoint_path: A file recording the batches added, so an
+            interrupted add of the same routes resumes where it stopped.
+        :type checkpoint_path: Optional[str]
         """
-
         if self.sparse_encoder is None:
             raise ValueError("Sparse Encoder not initialised.")
-        # TODO: merge into single method within BaseRouter
-        current_local_hash = self._get_hash()
-        current_remote_hash = self.index._read_hash()
-        if current_remote_hash.value == "":
-            # if remote hash is empty, the index is to be initialized
-            current_remote_hash = current_local_hash
-        if isinstance(routes, Route):
-            routes = [routes]
-
-        self.routes.extend(routes)
-        if isinstance(self.sparse_encoder, FittableMixin) and self.routes:
-            self.sparse_encoder.fit(self.routes)
-        # create embeddings for all routes
-        (
-            route_names,
-            all_utterances,
-            all_function_schemas,
-            all_metadata,
-        ) = self._extract_routes_details(routes, include_metadata=True)
-        # TODO: to merge, self._encode should probably output a special
-        # TODO Embedding type that can be either dense or hybrid
-        dense_emb, sparse_emb = self._encode(all_utterances, input_type="documents")
-        self.index.add(
-            embeddings=dense_emb.tolist(),
-            routes=route_names,
-            utterances=all_utterances,
-            function_schemas=all_function_schemas,
-            metadata_list=all_metadata,
-            sparse_embeddings=sparse_emb,
-        )
-
-        if current_local_hash.value == current_remote_hash.value:
-            self._write_hash()  # update current hash in index
-        else:
-            logger.warning(
-                "Local and remote route layers were not aligned. Remote hash "
-                f"not updated. Use `{self.__class__.__name__}.get_utterance_diff()` "
-                "to see details."
+        with self._write_state() as router:
+            # TODO: merge into single method within BaseRouter
+            current_local_hash = router._get_hash()
+            current_remote_hash = router.index._read_hash()
+            if current_remote_hash.value == "":
+                # if remote hash is empty, the index is to be initialized
+                current_remote_hash = current_local_hash
+            if isinstance(routes, Route):
+                routes = [routes]
+
+            router.routes.extend(routes)
+            if isinstance(router.sparse_encoder, FittableMixin) and router.routes:
+                router.sparse_encoder.fit(router.routes)
+            # create embeddings for all routes
+            records = list(
+                zip(*router._extract_routes_details(routes, include_metadata=True))
+            )
+            router._add_records(
+                records,
+                batch_size=batch_size,
+                progress_callback=progress_callback,
+                checkpoint_path=checkpoint_path,
             )
 
+            if current_local_hash.value == current_remote_hash.value:
+                router._write_hash()  # update current hash in index
+            else:
+                logger.warning(
+                    "Local and remote route layers were not aligned. Remote hash "
+                    f"not updated. Use `{self.__class__.__name__}.get_utterance_diff()` "
+                    "to see details."
+                )
+
     def _execute_sync_strategy(self, strategy: Dict[str, Dict[str, List[Utterance]]]):
         """Executes the provided sync strategy, either deleting or upserting
         routes from the local and remote instances as defined in the strategy.
@@ -145,28 +180,17 @@ class HybridRouter(BaseRouter):
         """
         if self.sparse_encoder is None:
             raise ValueError("Sparse Encoder not initialised.")
+        self._invalidate_decisions()
         if strategy["remote"]["delete"]:
-            data_to_delete = {}  # type: ignore
-            for utt_obj in strategy["remote"]["delete"]:
-                data_to_delete.setdefault(utt_obj.route, []).append(utt_obj.utterance)
             # TODO: switch to remove without sync??
-            self.index._remove_and_sync(data_to_delete)
-        if strategy["remote"]["upsert"]:
-            utterances_text = [utt.utterance for utt in strategy["remote"]["upsert"]]
-            dense_emb, sparse_emb = self._encode(
-                utterances_text, input_type="documents"
-            )
-            self.index.add(
-                embeddings=dense_emb.tolist(),
-                routes=[utt.route for utt in strategy["remote"]["upsert"]],
-                utterances=utterances_text,
-                function_schemas=[
-                    utt.function_schemas  # type: ignore
-                    for utt in strategy["remote"]["upsert"]
-                ],
-                metadata_list=[utt.metadata for utt in strategy["remote"]["upsert"]],
-                sparse_embeddings=sparse_emb,
+            self.index._remove_and_sync(
+                _utterances_by_route(strategy["remote"]["delete"])
             )
+        remote_upsert = strategy["remote"]["upsert"] + self._update_remote_metadata(
+            strategy["remote"].get("update", [])
+        )
+        if remote_upsert:
+            self._add_records(_utterance_records(remote_upsert))
         if strategy["local"]["delete"]:
             self._local_delete(utterances=strategy["local"]["delete"])
         if strategy["local"]["upsert"]:
@@ -176,6 +200,73 @@ class HybridRouter(BaseRouter):
         if isinstance(self.sparse_encoder, FittableMixin) and self.routes:
             self.sparse_encoder.fit(self.routes)
 
+    def _stage_copy(self) -> BaseRouter:
+        """Copy the router for a write. A fittable sparse encoder is copied too, as
+        writes refit it to the changed routes.
+
+        :return: The router copy.
+        :rtype: BaseRouter
+        """
+        staged = super()._stage_copy()
+        if isinstance(self.sparse_encoder, FittableMixin):
+            staged.sparse_encoder = copy.deepcopy(self.sparse_encoder)
+        return staged
+
+    def _publish_staged(self, staged: BaseRouter):
+        """Replace the state the router serves from with the routes, index, score
+        threshold and sparse encoder of a changed router copy.
+
+        :param staged: The changed router copy.
+        :type staged: BaseRouter
+        """
+        with self._state_lock:
+            self.sparse_encoder = staged.sparse_encoder
+            super()._publish_staged(staged)
+
+    def _index_add(self, records: List[Tuple], embeddings: Any):
+        """Add a batch of encoded records to the index with their dense and sparse
+        embeddings.
+
+        :param records: The records, as tuples of route name, utterance, function
+            schema and metadata.
+        :type records: List[Tuple]
+        :param embeddings: The dense and sparse embeddings of the records.
+        :type embeddings: Any
+        """
+        # TODO: to merge, self._encode should probably output a special
+        # TODO Embedding type that can be either dense or hybrid
+        dense_emb, sparse_emb = embeddings
+        routes, utterances, function_schemas, metadata = map(list, zip(*records))
+        self.index.add(
+            embeddings=dense_emb.tolist(),
+            routes=routes,
+            utterances=utterances,
+            function_schemas=function_schemas,
+            metadata_list=metadata,
+            sparse_embeddings=sparse_emb,
+        )
+
+    async def _async_index_add(self, records: List[Tuple], embeddings: Any):
+        """Add a batch of encoded records to the index with their dense and sparse
+        embeddings asynchronously.
+
+        :param records: The records, as tuples of route name, utterance, function
+            schema and metadata.
+        :type records: List[Tuple]
+        :param embeddings: The dense and sparse embeddings of the records.
+        :type embeddings: Any
+        """
+        dense_emb, sparse_emb = embeddings
+        routes, utterances, function_schemas, metadata = map(list, zip(*records))
+        await self.index.aadd(
+            embeddings=dense_emb.tolist(),
+            routes=routes,
+            utterances=utterances,
+            function_schemas=function_schemas,
+            metadata_list=metadata,
+            sparse_embeddings=sparse_emb,
+        )
+
     def _get_index(self, index: Optional[BaseIndex]) -> BaseIndex:
         """Get the index.
 
@@ -226,12 +317,12 @@ class HybridRouter(BaseRouter):
         if isinstance(self.encoder, AsymmetricDenseMixin):
             match input_type:
                 case "queries":
-                    dense_v = self.encoder.encode_queries(text)
+                    dense_fn = self.encoder.encode_queries
                 case "documents":
-                    dense_v = self.encoder.encode_documents(text)
+                    dense_fn = self.encoder.encode_documents
         else:
-            dense_v = self.encoder(text)
-        xq_d = np.array(dense_v)  # type: ignore
+            dense_fn = self.encoder
+        xq_d = self._cached_encode(text=text, input_type=input_type, encode_fn=dense_fn)
 
         if isinstance(self.sparse_encoder, AsymmetricSparseMixin):
             match input_type:
@@ -268,11 +359,14 @@ class HybridRouter(BaseRouter):
         if isinstance(self.encoder, AsymmetricDenseMixin):
             match input_type:
                 case "queries":
-                    dense_coro = self.encoder.aencode_queries(text)
+                    dense_fn = self.encoder.aencode_queries
                 case "documents":
-                    dense_coro = self.encoder.aencode_documents(text)
+                    dense_fn = self.encoder.aencode_documents
         else:
-            dense_coro = self.encoder.acall(text)
+            dense_fn = self.encoder.acall
+        dense_coro = self._async_cached_encode(
+            text=text, input_type=input_type, encode_fn=dense_fn
+        )
 
         if isinstance(self.sparse_encoder, AsymmetricSparseMixin):
             match input_type:
@@ -297,6 +391,7 @@ class HybridRouter(BaseRouter):
         route_filter: Optional[List[str]] = None,
         limit: int | None = 1,
         sparse_vector: dict[int, float] | SparseEmbedding | None = None,
+        use_function_cache: bool = True,
     ) -> RouteChoice | list[RouteChoice]:
         """Call the HybridRouter.
 
@@ -313,22 +408,95 @@ class HybridRouter(BaseRouter):
         :type limit: int | None
         :param sparse_vector: The sparse vector to use.
         :type sparse_vector: dict[int, float] | SparseEmbedding | None
+        :param use_function_cache: Whether dynamic routes may reuse the function call
+            inputs cached by their function cache, defaults to True. When False the
+            router's decision cache is not read either.
+        :type use_function_cache: bool
         :return: A RouteChoice or a list of RouteChoices.
         :rtype: RouteChoice | list[RouteChoice]
         """
-        if not self.index.is_ready():
+        state = self._get_state()
+        if not state.route_index.is_ready():
             raise ValueError("Index is not ready.")
+        cache_text = text if vector is None and sparse_vector is None else None
+        if cache_text is not None and use_function_cache:
+            if (
+                cached := self._read_decision(cache_text, route_filter, limit, state)
+            ) is not None:
+                return cached
+        scored_routes = self._retrieve(
+            text=text,
+            vector=vector,
+            route_filter=route_filter,
+            sparse_vector=sparse_vector,
+            state=state,
+        )
+        route_choices = self._pass_routes(
+            scored_routes=scored_routes,
+            simulate_static=simulate_static,
+            text=text,
+            limit=limit,
+            state=state,
+            use_function_cache=use_function_cache,
+        )
+        if cache_text is not None:
+            self._write_decision(cache_text, route_filter, limit, route_choices, state)
+        return route_choices
+
+    def enable_micro_batching(self, max_wait: float = 0.003, max_batch_size: int = 64):
+        """Micro-batching is not supported for hybrid routing, as the batched index
+        query does not take sparse vectors.
+
+        :param max_wait: The maximum time in seconds a query waits for others.
+        :type max_wait: float
+        :param max_batch_size: The maximum number of queries per batch.
+        :type max_batch_size: int
+        """
+        raise NotImplementedError(
+            f"Micro-batching is not supported for {self.__class__.__name__}."
+        )
+
+    def _retrieve(  # type: ignore
+        self,
+        text: Optional[str] = None,
+        vector: Optional[List[float] | np.ndarray] = None,
+        route_filter: Optional[List[str]] = None,
+        sparse_vector: dict[int, float] | SparseEmbedding | None = None,
+        state: Optional[RouterState] = None,
+    ) -> List[Tuple[str, float, List[float]]]:
+        """Query the hybrid index and score the routes for a text or vectors,
+        without applying any thresholds.
+
+        :param text: The text to encode.
+        :type text: Optional[str]
+        :param vector: The vector to encode.
+        :type vector: Optional[List[float] | np.ndarray]
+        :param route_filter: The route filter to use.
+        :type route_filter: Optional[List[str]]
+        :param sparse_vector: The sparse vector to use.
+        :type sparse_vector: dict[int, float] | SparseEmbedding | None
+        :param state: The state to query, defaults to the current state.
+        :type state: Optional[RouterState]
+        :return: The routes, their total scores and their individual scores, ordered
+            from highest to lowest total score.
+        :rtype: List[Tuple[str, float, List[float]]]
+        """
         if self.sparse_encoder is None:
             raise ValueError
+        if state is None:
+            state = self._get_state()
+        if vector is None and sparse_vector is None and text is not None:
+            if exact_routes := self._match_exact(
+                text, route_filter=route_filter, state=state
+            ):
+                return exact_routes
         potential_sparse_vector: List[SparseEmbedding] | None = None
         # if no vector provided, encode text to get vector
         if vector is None:
             if text is None:
                 raise ValueError("Either text or vector must be provided")
-            xq_d = np.array(self.encoder([text]))
-            xq_s = self.sparse_encoder([text])
-            vector, potential_sparse_vector = self._convex_scaling(
-                dense=xq_d, sparse=xq_s
+            vector, potential_sparse_vector = self._encode(
+                text=[text], input_type="queries"
             )
         # convert to numpy array if not already
         vector = xq_reshape(vector)
@@ -341,7 +509,7 @@ class HybridRouter(BaseRouter):
         if sparse_vector is None:
             raise ValueError("Sparse vector is required for HybridLocalIndex.")
         # TODO: add alpha as a parameter
-        scores, route_names = self.index.query(
+        scores, route_names = state.route_index.query(
             vector=vector[0],
             top_k=self.top_k,
             route_filter=route_filter,
@@ -351,14 +519,7 @@ class HybridRouter(BaseRouter):
             {"route": d, "score": s.item()} for d, s in zip(route_names, scores)
         ]
         # decide most relevant routes
-        scored_routes = self._score_routes(query_results=query_results)
-        route_choices = self._pass_routes(
-            scored_routes=scored_routes,
-            simulate_static=simulate_static,
-            text=text,
-            limit=limit,
-        )
-        return route_choices
+        return self._score_routes(query_results=query_results)
 
     def _convex_scaling(
         self, dense: np.ndarray, sparse: list[SparseEmbedding]
@@ -404,85 +565,95 @@ class HybridRouter(BaseRouter):
         :param local_execution: Whether to execute the fitting locally.
         :type local_execution: bool
         """
-        original_index = self.index
-        if self.sparse_encoder is None:
-            raise ValueError("Sparse encoder is not set.")
-        if local_execution:
-            # Switch to a local index for fitting
-            from semantic_router.index.hybrid_local import HybridLocalIndex
-
-            remote_utterances = self.index.get_utterances(include_metadata=True)
-            # TODO Enhance by retrieving directly the vectors instead of embedding all utterances again
-            routes = []
-            utterances = []
-            metadata = []
-            for utterance in remote_utterances:
-                routes.append(utterance.route)
-                utterances.append(utterance.utterance)
-                metadata.append(utterance.metadata)
-            embeddings = (
-                self.encoder(utterances)
-                if not isinstance(self.encoder, AsymmetricDenseMixin)
-                else self.encoder.encode_documents(utterances)
-            )
-            sparse_embeddings = (
-                self.sparse_encoder(utterances)
-                if not isinstance(self.sparse_encoder, AsymmetricSparseMixin)
-                else self.sparse_encoder.encode_documents(utterances)
-            )
-            self.index = HybridLocalIndex()
-            self.index.add(
-                embeddings=embeddings,
-                sparse_embeddings=sparse_embeddings,
-                routes=routes,
-                utterances=utterances,
-                metadata_list=metadata,
-            )
+        with self._write_state() as router:
+            original_index = router.index
+            if router.sparse_encoder is None:
+                raise ValueError("Sparse encoder is not set.")
+            if local_execution:
+                # Switch to a local index for fitting
+                from semantic_router.index.hybrid_local import HybridLocalIndex
+
+                remote_utterances = router.index.get_utterances(include_metadata=True)
+                # embeddings are read from the embedding store where available so only
+                # utterances that have never been encoded are sent to the encoder
+                routes = []
+                utterances = []
+                metadata = []
+                for utterance in remote_utterances:
+                    routes.append(utterance.route)
+                    utterances.append(utterance.utterance)
+                    metadata.append(utterance.metadata)
+                embeddings = router._cached_encode(
+                    text=utterances,
+                    input_type="documents",
+                    encode_fn=(
+                        router.encoder
+                        if not isinstance(router.encoder, AsymmetricDenseMixin)
+                        else router.encoder.encode_documents
+                    ),
+                ).tolist()
+                sparse_embeddings = (
+                    router.sparse_encoder(utterances)
+                    if not isinstance(router.sparse_encoder, AsymmetricSparseMixin)
+                    else router.sparse_encoder.encode_documents(utterances)
+                )
+                router.index = HybridLocalIndex()
+                router.index.add(
+                    embeddings=embeddings,
+                    sparse_embeddings=sparse_embeddings,
+                    routes=routes,
+                    utterances=utterances,
+                    metadata_list=metadata,
+                )
 
-        # convert inputs into array
-        Xq_d: List[List[float]] = []
-        Xq_s: List[SparseEmbedding] = []
-        for i in tqdm(range(0, len(X), batch_size), desc="Generating embeddings"):
-            emb_d = np.array(
-                self.encoder(X[i : i + batch_size])
-                if not isinstance(self.encoder, AsymmetricDenseMixin)
-                else self.encoder.encode_queries(X[i : i + batch_size])
-            )
-            # TODO JB: for some reason the sparse encoder is receiving a tuple
-            # like `("Hello",)`
-            emb_s = (
-                self.sparse_encoder(X[i : i + batch_size])
-                if not isinstance(self.sparse_encoder, AsymmetricSparseMixin)
-                else self.sparse_encoder.encode_queries(X[i : i + batch_size])
-            )
+            # convert inputs into array
+            Xq_d: List[List[float]] = []
+            Xq_s: List[SparseEmbedding] = []
+            for i in tqdm(range(0, len(X), batch_size), desc="Generating embeddings"):
+                emb_d = router._cached_encode(
+                    text=X[i : i + batch_size],
+                    input_type="queries",
+                    encode_fn=(
+                        router.encoder
+                        if not isinstance(router.encoder, AsymmetricDenseMixin)
+                        else router.encoder.encode_queries
+                    ),
+                )
+                # TODO JB: for some reason the sparse encoder is receiving a tuple
+                # like `("Hello",)`
+                emb_s = (
+                    router.sparse_encoder(X[i : i + batch_size])
+                    if not isinstance(router.sparse_encoder, AsymmetricSparseMixin)
+                    else router.sparse_encoder.encode_queries(X[i : i + batch_size])
+                )
 
-            Xq_d.extend(emb_d)
-            Xq_s.extend(emb_s)
-        # initial eval (we will iterate from here)
-        best_acc = self._vec_evaluate(Xq_d=np.array(Xq_d), Xq_s=Xq_s, y=y)
-        best_thresholds = self.get_thresholds()
-        # begin fit
-        for _ in (pbar := tqdm(range(max_iter), desc="Training")):
-            pbar.set_postfix({"acc": round(best_acc, 2)})
-            # Find the best score threshold for each route
-            thresholds = threshold_random_search(
-                route_layer=self,
-                search_range=0.8,
-            )
-            # update current route layer
-            self._update_thresholds(route_thresholds=thresholds)
-            # evaluate
-            acc = self._vec_evaluate(Xq_d=np.array(Xq_d), Xq_s=Xq_s, y=y)
-            # update best
-            if acc > best_acc:
-                best_acc = acc
-                best_thresholds = thresholds
-        # update route layer to best thresholds
-        self._update_thresholds(route_thresholds=best_thresholds)
-
-        if local_execution:
-            # Switch back to the original index
-            self.index = original_index
+                Xq_d.extend(emb_d)
+                Xq_s.extend(emb_s)
+            # initial eval (we will iterate from here)
+            best_acc = router._vec_evaluate(Xq_d=np.array(Xq_d), Xq_s=Xq_s, y=y)
+            best_thresholds = router.get_thresholds()
+            # begin fit
+            for _ in (pbar := tqdm(range(max_iter), desc="Training")):
+                pbar.set_postfix({"acc": round(best_acc, 2)})
+                # Find the best score threshold for each route
+                thresholds = threshold_random_search(
+                    route_layer=router,
+                    search_range=0.8,
+                )
+                # update current route layer
+                router._update_thresholds(route_thresholds=thresholds)
+                # evaluate
+                acc = router._vec_evaluate(Xq_d=np.array(Xq_d), Xq_s=Xq_s, y=y)
+                # update best
+                if acc > best_acc:
+                    best_acc = acc
+                    best_thresholds = thresholds
+            # update route layer to best thresholds
+            router._update_thresholds(route_thresholds=best_thresholds)
+
+            if local_execution:
+                # Switch back to the original index
+                router.index = original_index
 
     def evaluate(self, X: List[str], y: List[str], batch_size: int = 500) -> float:
         """Evaluate the accuracy of the route selection.
@@ -501,10 +672,14 @@ class HybridRouter(BaseRouter):
         Xq_d: List[List[float]] = []
         Xq_s: List[SparseEmbedding] = []
         for i in tqdm(range(0, len(X), batch_size), desc="Generating embeddings"):
-            emb_d = np.array(
-                self.encoder(X[i : i + batch_size])
-                if not isinstance(self.encoder, AsymmetricDenseMixin)
-                else self.encoder.encode_queries(X[i : i + batch_size])
+            emb_d = self._cached_encode(
+                text=X[i : i + batch_size],
+                input_type="queries",
+                encode_fn=(
+                    self.encoder
+                    if not isinstance(self.encoder, AsymmetricDenseMixin)
+                    else self.encoder.encode_queries
+                ),
             )
             emb_s = (
                 self.sparse_encoder(X[i : i + batch_size])
@@ -1,7 +1,6 @@
 from typing import Any, List, Optional
 
-import numpy as np
-
+from semantic_router.cache import BaseCache, SemanticCache
 from semantic_router.encoders import DenseEncoder
 from semantic_router.encoders.base import AsymmetricDenseMixin
 from semantic_router.encoders.encode_input_type import EncodeInputType
@@ -9,6 +8,7 @@ from semantic_router.index.base import BaseIndex
 from semantic_router.llms import BaseLLM
 from semantic_router.route import Route
 from semantic_router.routers.base import BaseRouter
+from semantic_router.utils.ingestion import DEFAULT_INGEST_BATCH_SIZE, ProgressCallback
 from semantic_router.utils.logger import logger
 
 
@@ -24,6 +24,11 @@ class SemanticRouter(BaseRouter):
         top_k: int = 5,
         aggregation: str = "mean",
         auto_sync: Optional[str] = None,
+        embedding_cache: Optional[BaseCache] = None,
+        embedding_store: Optional[BaseCache] = None,
+        decision_cache: Optional[BaseCache] = None,
+        semantic_cache: Optional[SemanticCache] = None,
+        sync_interval: Optional[float] = None,
     ):
         index = self._get_index(index=index)
         encoder = self._get_encoder(encoder=encoder)
@@ -35,6 +40,11 @@ class SemanticRouter(BaseRouter):
             top_k=top_k,
             aggregation=aggregation,
             auto_sync=auto_sync,
+            embedding_cache=embedding_cache,
+            embedding_store=embedding_store,
+            decision_cache=decision_cache,
+            semantic_cache=semantic_cache,
+            sync_interval=sync_interval,
         )
 
     def _encode(self, text: list[str], input_type: EncodeInputType) -> Any:
@@ -50,18 +60,20 @@ class SemanticRouter(BaseRouter):
         # create query vector
         match input_type:
             case "queries":
-                xq = np.array(
-                    self.encoder(text)
+                encode_fn = (
+                    self.encoder
                     if not isinstance(self.encoder, AsymmetricDenseMixin)
-                    else self.encoder.encode_queries(text)
+                    else self.encoder.encode_queries
                 )
             case "documents":
-                xq = np.array(
-                    self.encoder(text)
+                encode_fn = (
+                    self.encoder
                     if not isinstance(self.encoder, AsymmetricDenseMixin)
-                    else self.encoder.encode_documents(text)
+                    else self.encoder.encode_documents
                 )
-        return xq
+        return self._cached_encode(
+            text=text, input_type=input_type, encode_fn=encode_fn
+        )
 
     async def _async_encode(self, text: list[str], input_type: EncodeInputType) -> Any:
         """Given some text, encode it.
@@ -76,58 +88,68 @@ class SemanticRouter(BaseRouter):
         # create query vector
         match input_type:
             case "queries":
-                xq = np.array(
-                    await (
-                        self.encoder.acall(docs=text)
-                        if not isinstance(self.encoder, AsymmetricDenseMixin)
-                        else self.encoder.aencode_queries(docs=text)
-                    )
+                encode_fn = (
+                    self.encoder.acall
+                    if not isinstance(self.encoder, AsymmetricDenseMixin)
+                    else self.encoder.aencode_queries
                 )
             case "documents":
-                xq = np.array(
-                    await (
-                        self.encoder.acall(docs=text)
-                        if not isinstance(self.encoder, AsymmetricDenseMixin)
-                        else self.encoder.aencode_documents(docs=text)
-                    )
+                encode_fn = (
+                    self.encoder.acall
+                    if not isinstance(self.encoder, AsymmetricDenseMixin)
+                    else self.encoder.aencode_documents
                 )
-        return xq
+        return await self._async_cached_encode(
+            text=text, input_type=input_type, encode_fn=encode_fn
+        )
 
-    def add(self, routes: List[Route] | Route):
-        """Add a route to the local SemanticRouter and index.
+    def add(
+        self,
+        routes: List[Route] | Route,
+        batch_size: int = DEFAULT_INGEST_BATCH_SIZE,
+        progress_callback: Optional[ProgressCallback] = None,
+        checkpoint_path: Optional[str] = None,
+    ):
+        """Add a route to the local SemanticRouter and index. The utterances are
+        encoded and added to the index in batches, encoding the next batches while
+        the previous ones are added.
 
         :param route: The route to add.
         :type route: Route
+        :param batch_size: The number of utterances encoded and added at once.
+        :type batch_size: int
+        :param progress_callback: Called with the number of utterances added and the
+            total number of utterances after each batch.
+        :type progress_callback: Optional[Callable[[int, int], None]]
+        :param checkpoint_path: A file recording the batches added, so an
+            interrupted add of the same routes resumes where it stopped.
+        :type checkpoint_path: Optional[str]
         """
-        current_local_hash = self._get_hash()
-        current_remote_hash = self.index._read_hash()
-        if current_remote_hash.value == "":
-            # if remote hash is empty, the index is to be initialized
-            current_remote_hash = current_local_hash
-        if isinstance(routes, Route):
-            routes = [routes]
-        # create embeddings for all routes
-        (
-            route_names,
-            all_utterances,
-            all_function_schemas,
-            all_metadata,
-        ) = self._extract_routes_details(routes, include_metadata=True)
-        dense_emb = self._encode(all_utterances, input_type="documents")
-        self.index.add(
-            embeddings=dense_emb.tolist(),
-            routes=route_names,
-            utterances=all_utterances,
-            function_schemas=all_function_schemas,
-            metadata_list=all_metadata,
-        )
-
-        self.routes.extend(routes)
-        if current_local_hash.value == current_remote_hash.value:
-            self._write_hash()  # update current hash in index
-        else:
-            logger.warning(
-                "Local and remote route layers were not aligned. Remote hash "
-                f"not updated. Use `{self.__class__.__name__}.get_utterance_diff()` "
-                "to see details."
+        with self._write_state() as router:
+            current_local_hash = router._get_hash()
+            current_remote_hash = router.index._read_hash()
+            if current_remote_hash.value == "":
+                # if remote hash is empty, the index is to be initialized
+                current_remote_hash = current_local_hash
+            if isinstance(routes, Route):
+                routes = [routes]
+            # create embeddings for all routes
+            records = list(
+                zip(*router._extract_routes_details(routes, include_metadata=True))
             )
+            router._add_records(
+                records,
+                batch_size=batch_size,
+                progress_callback=progress_callback,
+                checkpoint_path=checkpoint_path,
+            )
+
+            router.routes.extend(routes)
+            if current_local_hash.value == current_remote_hash.value:
+                router._write_hash()  # update current hash in index
+            else:
+                logger.warning(
+                    "Local and remote route layers were not aligned. Remote hash "
+                    f"not updated. Use `{self.__class__.__name__}.get_utterance_diff()` "
+                    "to see details."
+                )
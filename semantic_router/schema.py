@@ -1,6 +1,5 @@
 import json
 from datetime import datetime, timezone
-from difflib import Differ
 from enum import Enum
 from typing import Any, ClassVar, Dict, List, Optional, Tuple, Union
 
@@ -225,6 +224,9 @@ class UtteranceDiff(BaseModel):
         cls, local_utterances: List[Utterance], remote_utterances: List[Utterance]
     ):
         """Create a UtteranceDiff object from two lists of Utterance objects.
+        Utterances are compared by their string including metadata, and the diff
+        lists them in sorted order. Utterances only in the local list are tagged
+        "-", only in the remote list "+", and in both " ".
 
         :param local_utterances: A list of Utterance objects.
         :type local_utterances: List[Utterance]
@@ -237,28 +239,19 @@ class UtteranceDiff(BaseModel):
         remote_utterances_map = {
             x.to_str(include_metadata=True): x for x in remote_utterances
         }
-        # sort local and remote utterances
-        local_utterances_str = list(local_utterances_map.keys())
-        local_utterances_str.sort()
-        remote_utterances_str = list(remote_utterances_map.keys())
-        remote_utterances_str.sort()
-        # get diff
-        differ = Differ()
-        diff_obj = list(differ.compare(local_utterances_str, remote_utterances_str))
-        # create UtteranceDiff list
+        # walk the union in sorted order, tagging each utterance by which side has it
         utterance_diffs = []
-        for line in diff_obj:
-            utterance_str = line[2:]
-            utterance_diff_tag = line[0]
-            if utterance_diff_tag == "?":
-                # this is a new line from diff string, we can ignore
-                continue
-            utterance = (
-                remote_utterances_map[utterance_str]
-                if utterance_diff_tag == "+"
-                else local_utterances_map[utterance_str]
-            )
-            utterance.diff_tag = utterance_diff_tag
+        for utterance_str in sorted(
+            local_utterances_map.keys() | remote_utterances_map.keys()
+        ):
+            utterance = local_utterances_map.get(utterance_str)
+            if utterance is None:
+                utterance = remote_utterances_map[utterance_str]
+                utterance.diff_tag = "+"
+            elif utterance_str in remote_utterances_map:
+                utterance.diff_tag = " "
+            else:
+                utterance.diff_tag = "-"
             utterance_diffs.append(utterance)
         return UtteranceDiff(diff=utterance_diffs)
 
@@ -304,6 +297,52 @@ class UtteranceDiff(BaseModel):
 
     def get_sync_strategy(self, sync_mode: str) -> dict:
         """Generates the optimal synchronization plan for local and remote instances.
+        The plan is built with set and dict lookups, so it scales linearly with the
+        number of utterances.
+
+        Remote upserts of utterances that the remote already stores, and that only
+        change function schemas or metadata, are planned as remote updates instead
+        so their embeddings can be kept.
+
+        :param sync_mode: The mode to sync the routes with the remote index.
+        :type sync_mode: str
+        :return: A dictionary describing the synchronization strategy.
+        :rtype: dict
+        """
+        strategy = self._plan_sync_strategy(sync_mode)
+        remote_settings: Dict[str, List[Tuple[Optional[List[Dict]], dict]]] = {}
+        for utt in self.diff:
+            if utt.diff_tag != "-":
+                remote_settings.setdefault(utt.to_str(), []).append(
+                    (utt.function_schemas, utt.metadata)
+                )
+        upsert: List[Utterance] = []
+        update: List[Utterance] = []
+        update_strs = set()
+        for utt in strategy["remote"]["upsert"]:
+            utt_str = utt.to_str()
+            if utt_str not in remote_settings:
+                upsert.append(utt)
+            elif utt_str not in update_strs:
+                update_strs.add(utt_str)
+                settings = (utt.function_schemas, utt.metadata)
+                if any(x != settings for x in remote_settings[utt_str]):
+                    update.append(utt)
+        strategy["remote"] = {
+            "upsert": upsert,
+            "update": update,
+            # the records being updated are kept rather than deleted and re-added
+            "delete": [
+                utt
+                for utt in strategy["remote"]["delete"]
+                if utt.to_str() not in update_strs
+            ],
+        }
+        return strategy
+
+    def _plan_sync_strategy(self, sync_mode: str) -> dict:
+        """Generates the synchronization plan for local and remote instances, with
+        every remote change planned as an upsert or delete.
 
         :param sync_mode: The mode to sync the routes with the remote index.
         :type sync_mode: str
@@ -312,15 +351,22 @@ class UtteranceDiff(BaseModel):
         """
         if sync_mode not in SYNC_MODES:
             raise ValueError(f"sync_mode must be one of {SYNC_MODES}")
-        local_only = self.get_tag("-")
+        local_only: List[Utterance] = []
+        remote_only: List[Utterance] = []
+        local_and_remote: List[Utterance] = []
+        for utt in self.diff:
+            if utt.diff_tag == "-":
+                local_only.append(utt)
+            elif utt.diff_tag == "+":
+                remote_only.append(utt)
+            elif utt.diff_tag == " ":
+                local_and_remote.append(utt)
         local_only_mapper = {
             utt.route: (utt.function_schemas, utt.metadata) for utt in local_only
         }
-        remote_only = self.get_tag("+")
         remote_only_mapper = {
             utt.route: (utt.function_schemas, utt.metadata) for utt in remote_only
         }
-        local_and_remote = self.get_tag(" ")
         if sync_mode == "error":
             if len(local_only) > 0 or len(remote_only) > 0:
                 raise ValueError(
@@ -348,52 +394,35 @@ class UtteranceDiff(BaseModel):
             }
         elif sync_mode == "merge-force-local":  # merge-to-local merge-join-local
             # PRIORITIZE LOCAL
-            # get set of route names that exist in local (we keep these if
-            # they are in remote)
-            local_route_names = set([utt.route for utt in local_only])
+            # routes that exist in local (we keep these if they are in remote) are
+            # the keys of local_only_mapper
+            logger.info(f"local_only_mapper: {local_only_mapper}")
             # if we see route: utterance exists in local, we do not pull it in
             # from remote
-            local_route_utt_strs = set([utt.to_str() for utt in local_only])
-            # get remote utterances that are in local
-            remote_to_keep = [
-                utt
-                for utt in remote_only
-                if (
-                    utt.route in local_route_names
-                    and utt.to_str() not in local_route_utt_strs
-                )
-            ]
-            # overwrite remote routes with local metadata and function schemas
-            logger.info(f"local_only_mapper: {local_only_mapper}")
-            remote_to_update = [
-                Utterance(
-                    route=utt.route,
-                    utterance=utt.utterance,
-                    metadata=local_only_mapper[utt.route][1],
-                    function_schemas=local_only_mapper[utt.route][0],
-                )
-                for utt in remote_only
-                if (
-                    utt.route in local_only_mapper
-                    and (
-                        utt.metadata != local_only_mapper[utt.route][1]
-                        or utt.function_schemas != local_only_mapper[utt.route][0]
+            local_route_utt_strs = {utt.to_str() for utt in local_only}
+            remote_to_keep: List[Utterance] = []
+            remote_to_update: List[Utterance] = []
+            remote_to_update_strs = set()
+            remote_to_delete: List[Utterance] = []
+            for utt in remote_only:
+                if utt.route not in local_only_mapper:
+                    # remote utterances of routes that are NOT in local
+                    remote_to_delete.append(utt)
+                    continue
+                function_schemas, metadata = local_only_mapper[utt.route]
+                utt_str = utt.to_str()
+                # overwrite remote routes with local metadata and function schemas
+                if utt.metadata != metadata or utt.function_schemas != function_schemas:
+                    remote_to_update.append(
+                        _with_route_settings(utt, function_schemas, metadata)
                     )
-                )
-            ]
+                    remote_to_update_strs.add(utt_str)
+                if utt_str not in local_route_utt_strs:
+                    remote_to_keep.append(utt)
             remote_to_keep = [
-                Utterance(
-                    route=utt.route,
-                    utterance=utt.utterance,
-                    metadata=local_only_mapper[utt.route][1],
-                    function_schemas=local_only_mapper[utt.route][0],
-                )
+                _with_route_settings(utt, *local_only_mapper[utt.route])
                 for utt in remote_to_keep
-                if utt.to_str() not in [x.to_str() for x in remote_to_update]
-            ]
-            # get remote utterances that are NOT in local
-            remote_to_delete = [
-                utt for utt in remote_only if utt.route not in local_route_names
+                if utt.to_str() not in remote_to_update_strs
             ]
             return {
                 "remote": {
@@ -403,35 +432,23 @@ class UtteranceDiff(BaseModel):
                 "local": {"upsert": remote_to_keep, "delete": []},
             }
         elif sync_mode == "merge-force-remote":  # merge-to-remote merge-join-remote
-            # get set of route names that exist in remote (we keep these if
-            # they are in local)
-            remote_route_names = set([utt.route for utt in remote_only])
+            # routes that exist in remote (we keep these if they are in local) are
+            # the keys of remote_only_mapper
             # if we see route: utterance exists in remote, we do not pull it in
             # from local
-            remote_route_utt_strs = set([utt.to_str() for utt in remote_only])
-            # get local utterances that are in remote
-            local_to_keep = [
-                utt
-                for utt in local_only
-                if (
-                    utt.route in remote_route_names
-                    and utt.to_str() not in remote_route_utt_strs
-                )
-            ]
-            # overwrite remote routes with local metadata and function schemas
-            local_to_keep = [
-                Utterance(
-                    route=utt.route,
-                    utterance=utt.utterance,
-                    metadata=remote_only_mapper[utt.route][1],
-                    function_schemas=remote_only_mapper[utt.route][0],
-                )
-                for utt in local_to_keep
-            ]
-            # get local utterances that are NOT in remote
-            local_to_delete = [
-                utt for utt in local_only if utt.route not in remote_route_names
-            ]
+            remote_route_utt_strs = {utt.to_str() for utt in remote_only}
+            local_to_keep: List[Utterance] = []
+            local_to_delete: List[Utterance] = []
+            for utt in local_only:
+                if utt.route not in remote_only_mapper:
+                    # local utterances of routes that are NOT in remote
+                    local_to_delete.append(utt)
+                elif utt.to_str() not in remote_route_utt_strs:
+                    # overwrite local routes with remote metadata and function
+                    # schemas
+                    local_to_keep.append(
+                        _with_route_settings(utt, *remote_only_mapper[utt.route])
+                    )
             return {
                 "remote": {"upsert": local_to_keep, "delete": []},
                 "local": {"upsert": remote_only, "delete": local_to_delete},
@@ -440,12 +457,7 @@ class UtteranceDiff(BaseModel):
             # overwrite remote routes with local metadata and function schemas
             remote_only_updated = [
                 (
-                    Utterance(
-                        route=utt.route,
-                        utterance=utt.utterance,
-                        metadata=local_only_mapper[utt.route][1],
-                        function_schemas=local_only_mapper[utt.route][0],
-                    )
+                    _with_route_settings(utt, *local_only_mapper[utt.route])
                     if utt.route in local_only_mapper
                     else utt
                 )
@@ -453,12 +465,7 @@ class UtteranceDiff(BaseModel):
             ]
             # propogate same to shared routes
             shared_updated = [
-                Utterance(
-                    route=utt.route,
-                    utterance=utt.utterance,
-                    metadata=local_only_mapper[utt.route][1],
-                    function_schemas=local_only_mapper[utt.route][0],
-                )
+                _with_route_settings(utt, *local_only_mapper[utt.route])
                 for utt in local_and_remote
                 if (
                     utt.route in local_only_mapper
@@ -479,6 +486,22 @@ class UtteranceDiff(BaseModel):
             raise ValueError(f"sync_mode must be one of {SYNC_MODES}")
 
 
+def _with_route_settings(
+    utterance: Utterance,
+    function_schemas: Optional[List[Dict]],
+    metadata: dict,
+) -> Utterance:
+    """Copy an utterance with the function schemas and metadata of another
+    instance of its route.
+    """
+    return Utterance(
+        route=utterance.route,
+        utterance=utterance.utterance,
+        metadata=metadata,
+        function_schemas=function_schemas,
+    )
+
+
 class Metric(Enum):
     """The metric to use in vector-based similarity search indexes."""
 
@@ -0,0 +1,107 @@
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+
+
+class MicroBatcher:
+    """Coalesces concurrent async requests into batches. Items submitted within
+    `max_wait` seconds of the first item of a batch, up to `max_batch_size` items,
+    are passed to `batch_fn` together and each caller receives its own result.
+
+    `batch_fn` receives the list of items and must return one result per item in
+    the same order. If it raises, every caller of the batch receives the error, and
+    if the batch is cancelled, every caller is cancelled.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[Any]], Awaitable[List[Any]]],
+        max_wait: float = 0.003,
+        max_batch_size: int = 64,
+    ):
+        """Initialize the MicroBatcher.
+
+        :param batch_fn: The coroutine function processing a batch of items.
+        :type batch_fn: Callable[[List[Any]], Awaitable[List[Any]]]
+        :param max_wait: The maximum time in seconds an item waits for more items
+            before its batch is processed.
+        :type max_wait: float
+        :param max_batch_size: The maximum number of items in a batch, a full batch
+            is processed immediately.
+        :type max_batch_size: int
+        """
+        if max_batch_size < 1:
+            raise ValueError(
+                f"max_batch_size needs to be >= 1, but was: {max_batch_size}."
+            )
+        self.batch_fn = batch_fn
+        self.max_wait = max_wait
+        self.max_batch_size = max_batch_size
+        self._pending: List[Tuple[Any, "asyncio.Future[Any]"]] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: set = set()
+        self.batches = 0
+        self.items = 0
+
+    async def submit(self, item: Any) -> Any:
+        """Add an item to the next batch and wait for its result.
+
+        :param item: The item to process.
+        :type item: Any
+        :return: The result for the item.
+        :rtype: Any
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # requests of a previous event loop can never complete
+            self._loop = loop
+            self._pending = []
+            self._timer = None
+        future = loop.create_future()
+        self._pending.append((item, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.ensure_future(self._run(batch))
+        # keep a reference so the task is not garbage collected while running
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[Tuple[Any, "asyncio.Future[Any]"]]):
+        # callers that gave up while waiting are left out of the batch
+        batch = [(item, future) for item, future in batch if not future.done()]
+        if not batch:
+            return
+        self.batches += 1
+        self.items += len(batch)
+        try:
+            results = await self.batch_fn([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(
+                    f"Batch function returned {len(results)} results for "
+                    f"{len(batch)} items."
+                )
+        except BaseException as e:
+            # callers must never be left waiting on a batch that will not complete
+            for _, future in batch:
+                if not future.done():
+                    if isinstance(e, asyncio.CancelledError):
+                        future.cancel()
+                    else:
+                        future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
@@ -0,0 +1,272 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, Optional
+
+from semantic_router.utils.rate_limit import get_status_code
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """Check whether an error means the provider is overloaded, i.e. it was rate
+    limited (429) or failed with a server error (5xx).
+
+    :param error: The error raised by the request.
+    :type error: BaseException
+    :return: True if the error signals that the provider is overloaded.
+    :rtype: bool
+    """
+    status = get_status_code(error)
+    if status is not None:
+        return status == 429 or status >= 500
+    return "ratelimit" in type(error).__name__.lower()
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limits the number of concurrent requests sent to a provider, adapting the
+    limit with additive-increase/multiplicative-decrease (AIMD).
+
+    Every successful request grows the limit by roughly one per limit's worth of
+    requests. A rate limited (429) or failed (5xx) request multiplies the limit by
+    `backoff_factor`, and so does a request much slower than the recent average when
+    `latency_tolerance` is set. Latency is not normalized by request size, so only
+    set it for a provider whose requests are of similar size. Requests that
+    were already in flight when the limit was cut do not cut it again, so a burst of
+    429s shrinks the limit once rather than collapsing it. Requests over the limit
+    wait in a first-in first-out queue. Threads and coroutines, including those of
+    different event loops, can share the same limiter.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        backoff_factor: float = 0.5,
+        latency_tolerance: Optional[float] = None,
+    ):
+        """Initialize the AdaptiveConcurrencyLimiter.
+
+        :param name: The name of the limiter, typically the provider it guards.
+        :type name: str
+        :param initial_limit: The concurrency limit to start with.
+        :type initial_limit: int
+        :param min_limit: The lowest the limit can be cut to.
+        :type min_limit: int
+        :param max_limit: The highest the limit can grow to.
+        :type max_limit: int
+        :param backoff_factor: The factor the limit is multiplied by when the
+            provider is overloaded.
+        :type backoff_factor: float
+        :param latency_tolerance: A request taking longer than this multiple of the
+            average latency counts as overload. Defaults to None, which only reacts
+            to errors.
+        :type latency_tolerance: Optional[float]
+        """
+        self.name = name
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_factor = backoff_factor
+        self.latency_tolerance = latency_tolerance
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._in_flight = 0
+        self._waiters: Deque[Any] = deque()
+        self._lock = threading.Lock()
+        self._decreased_at = 0.0
+        self._latency: Optional[float] = None
+        self.requests = 0
+        self.overloads = 0
+
+    @property
+    def limit(self) -> int:
+        """The current concurrency limit."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """The number of requests currently in flight."""
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of requests waiting for a free slot."""
+        return len(self._waiters)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Get the current state of the limiter.
+
+        :return: The limit, requests in flight, queue depth, number of completed
+            requests, number of overload signals and the average latency in seconds.
+        :rtype: Dict[str, Any]
+        """
+        return {
+            "name": self.name,
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "requests": self.requests,
+            "overloads": self.overloads,
+            "latency": self._latency,
+        }
+
+    def _try_acquire(self) -> bool:
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return True
+        return False
+
+    def _wake_waiters(self):
+        # hand free slots to waiters in arrival order, called with the lock held
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            self._in_flight += 1
+            if isinstance(waiter, threading.Event):
+                waiter.set()
+            else:
+                loop, future = waiter
+                loop.call_soon_threadsafe(self._resolve, future)
+
+    def _resolve(self, future: "asyncio.Future[None]"):
+        if future.cancelled():
+            # the waiter gave up after being handed a slot
+            self._release_slot()
+        else:
+            future.set_result(None)
+
+    def _release_slot(self):
+        with self._lock:
+            self._in_flight -= 1
+            self._wake_waiters()
+
+    def acquire(self) -> float:
+        """Block until a request may be sent.
+
+        :return: The time the slot was acquired, to pass to `release`.
+        :rtype: float
+        """
+        with self._lock:
+            if self._try_acquire():
+                return time.monotonic()
+            event = threading.Event()
+            self._waiters.append(event)
+        event.wait()
+        return time.monotonic()
+
+    async def aacquire(self) -> float:
+        """Wait asynchronously until a request may be sent.
+
+        :return: The time the slot was acquired, to pass to `release`.
+        :rtype: float
+        """
+        with self._lock:
+            if self._try_acquire():
+                return time.monotonic()
+            future = asyncio.get_running_loop().create_future()
+            waiter = (asyncio.get_running_loop(), future)
+            self._waiters.append(waiter)
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                    raise
+            if future.done() and not future.cancelled():
+                self._release_slot()
+            raise
+        return time.monotonic()
+
+    def release(self, started_at: float, error: Optional[BaseException] = None):
+        """Release a slot and adapt the limit to the outcome of the request.
+
+        :param started_at: The time the slot was acquired.
+        :type started_at: float
+        :param error: The error raised by the request, if it failed.
+        :type error: Optional[BaseException]
+        """
+        now = time.monotonic()
+        latency = now - started_at
+        with self._lock:
+            self._in_flight -= 1
+            self.requests += 1
+            overloaded = error is not None and is_overload_error(error)
+            if error is None:
+                if (
+                    self.latency_tolerance is not None
+                    and self._latency is not None
+                    and latency > self.latency_tolerance * self._latency
+                ):
+                    overloaded = True
+                self._latency = (
+                    latency
+                    if self._latency is None
+                    else 0.9 * self._latency + 0.1 * latency
+                )
+            if overloaded:
+                self.overloads += 1
+                # only cut once per round of requests sent under the old limit
+                if started_at >= self._decreased_at:
+                    self._limit = max(
+                        float(self.min_limit), self._limit * self.backoff_factor
+                    )
+                    self._decreased_at = now
+            elif error is None:
+                self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+            self._wake_waiters()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold a slot for the duration of a request, adapting the limit to its
+        outcome.
+        """
+        started_at = self.acquire()
+        try:
+            yield
+        except BaseException as e:
+            self.release(started_at, e)
+            raise
+        self.release(started_at)
+
+    @asynccontextmanager
+    async def aslot(self) -> AsyncIterator[None]:
+        """Hold a slot for the duration of an async request, adapting the limit to
+        its outcome.
+        """
+        started_at = await self.aacquire()
+        try:
+            yield
+        except BaseException as e:
+            self.release(started_at, e)
+            raise
+        self.release(started_at)
+
+
+_limiters: Dict[str, AdaptiveConcurrencyLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_concurrency_limiter(name: str, **kwargs) -> AdaptiveConcurrencyLimiter:
+    """Get the limiter shared by all clients of a provider, creating it on first
+    use. Keyword arguments are only used when the limiter is created.
+
+    :param name: The name of the limiter, e.g. "encoder/openai".
+    :type name: str
+    :return: The shared limiter.
+    :rtype: AdaptiveConcurrencyLimiter
+    """
+    with _limiters_lock:
+        if name not in _limiters:
+            _limiters[name] = AdaptiveConcurrencyLimiter(name=name, **kwargs)
+        return _limiters[name]
+
+
+def concurrency_metrics() -> Dict[str, Dict[str, Any]]:
+    """Get the metrics of every shared limiter.
+
+    :return: The metrics of each limiter by name.
+    :rtype: Dict[str, Dict[str, Any]]
+    """
+    with _limiters_lock:
+        return {name: limiter.metrics() for name, limiter in _limiters.items()}
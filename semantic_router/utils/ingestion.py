@@ -0,0 +1,320 @@
+import asyncio
+import hashlib
+import json
+import os
+import queue
+import threading
+from typing import Any, Awaitable, Callable, List, Optional, Set, Tuple
+
+from semantic_router.utils.logger import logger
+
+DEFAULT_INGEST_BATCH_SIZE = 500
+
+ProgressCallback = Callable[[int, int], None]
+
+# marks the end of the batches in the ingestion queue
+_DONE = object()
+
+
+def fingerprint(keys: List[str]) -> str:
+    """Hash the keys of the items being ingested, so a checkpoint is only resumed
+    for the same items.
+
+    :param keys: A string key for each item, in order.
+    :type keys: List[str]
+    :return: The fingerprint of the items.
+    :rtype: str
+    """
+    digest = hashlib.sha256()
+    for key in keys:
+        digest.update(key.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class IngestionCheckpoint:
+    """Records the batches of an ingestion that were written to the index in a JSON
+    file, so an interrupted ingestion can resume from where it stopped. The file is
+    removed once the ingestion completes.
+    """
+
+    def __init__(self, path: str, fingerprint: str, batch_size: int):
+        """Initialize the IngestionCheckpoint, resuming from the file at `path` if it
+        was written for the same items and batch size.
+
+        :param path: The path of the checkpoint file.
+        :type path: str
+        :param fingerprint: The fingerprint of the items being ingested.
+        :type fingerprint: str
+        :param batch_size: The number of items in each batch.
+        :type batch_size: int
+        """
+        self.path = path
+        self.fingerprint = fingerprint
+        self.batch_size = batch_size
+        self.completed: Set[int] = set()
+        self._lock = threading.Lock()
+        if not os.path.exists(path):
+            return
+        try:
+            with open(path) as f:
+                state = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Could not read ingestion checkpoint {path}: {e}")
+            return
+        if (
+            state.get("fingerprint") == fingerprint
+            and state.get("batch_size") == batch_size
+        ):
+            self.completed = set(state.get("completed", []))
+            logger.info(
+                f"Resuming ingestion with {len(self.completed)} completed batches."
+            )
+        else:
+            logger.warning(
+                f"Ingestion checkpoint {path} was written for other items, starting "
+                "from the first batch."
+            )
+
+    def complete(self, batch: int):
+        """Mark a batch as written to the index and save the checkpoint.
+
+        :param batch: The index of the batch.
+        :type batch: int
+        """
+        with self._lock:
+            self.completed.add(batch)
+            state = {
+                "fingerprint": self.fingerprint,
+                "batch_size": self.batch_size,
+                "completed": sorted(self.completed),
+            }
+            # write then rename so a crash never leaves a partial checkpoint
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.path)
+
+    def clear(self):
+        """Remove the checkpoint file once the ingestion is complete."""
+        with self._lock:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+
+class _Progress:
+    """Counts the ingested items, reporting them to the progress callback and the
+    checkpoint.
+    """
+
+    def __init__(
+        self,
+        total: int,
+        progress_callback: Optional[ProgressCallback],
+        checkpoint: Optional[IngestionCheckpoint],
+    ):
+        self.total = total
+        self.done = 0
+        self.progress_callback = progress_callback
+        self.checkpoint = checkpoint
+        self._lock = threading.Lock()
+
+    def skip(self, count: int):
+        if count:
+            self._advance(count)
+
+    def complete(self, batch: int, count: int):
+        if self.checkpoint is not None:
+            self.checkpoint.complete(batch)
+        self._advance(count)
+
+    def _advance(self, count: int):
+        with self._lock:
+            self.done += count
+            done = self.done
+        if self.progress_callback is not None:
+            self.progress_callback(done, self.total)
+
+
+def _get_batches(
+    items: List[Any],
+    batch_size: int,
+    checkpoint: Optional[IngestionCheckpoint],
+) -> List[Tuple[int, List[Any]]]:
+    if batch_size < 1:
+        raise ValueError(f"batch_size needs to be >= 1, but was: {batch_size}.")
+    completed = checkpoint.completed if checkpoint is not None else set()
+    return [
+        (i, items[start : start + batch_size])
+        for i, start in enumerate(range(0, len(items), batch_size))
+        if i not in completed
+    ]
+
+
+def ingest(
+    items: List[Any],
+    encode_fn: Callable[[List[Any]], Any],
+    add_fn: Callable[[List[Any], Any], None],
+    batch_size: int = DEFAULT_INGEST_BATCH_SIZE,
+    queue_size: int = 2,
+    workers: int = 1,
+    progress_callback: Optional[ProgressCallback] = None,
+    checkpoint: Optional[IngestionCheckpoint] = None,
+):
+    """Encode and add items to an index in batches, encoding the next batches while
+    `workers` threads add the previous ones. At most `queue_size` encoded batches
+    wait to be added, which bounds the memory used.
+
+    The first batch is added before any other, so an index created on its first
+    add is only created once. With a single worker the batches are added in order.
+
+    :param items: The items to ingest.
+    :type items: List[Any]
+    :param encode_fn: Encodes a batch of items.
+    :type encode_fn: Callable[[List[Any]], Any]
+    :param add_fn: Adds a batch of items with their embeddings to the index.
+    :type add_fn: Callable[[List[Any], Any], None]
+    :param batch_size: The number of items in each batch.
+    :type batch_size: int
+    :param queue_size: The maximum number of encoded batches waiting to be added.
+    :type queue_size: int
+    :param workers: The number of threads adding batches concurrently.
+    :type workers: int
+    :param progress_callback: Called with the number of items ingested and the
+        total number of items after each batch.
+    :type progress_callback: Optional[Callable[[int, int], None]]
+    :param checkpoint: Records the batches added, skipping those already added.
+    :type checkpoint: Optional[IngestionCheckpoint]
+    """
+    batches = _get_batches(items, batch_size, checkpoint)
+    progress = _Progress(len(items), progress_callback, checkpoint)
+    progress.skip(len(items) - sum(len(batch) for _, batch in batches))
+    if batches:
+        i, batch = batches[0]
+        add_fn(batch, encode_fn(batch))
+        progress.complete(i, len(batch))
+    if len(batches) > 1:
+        _ingest_pipelined(batches[1:], encode_fn, add_fn, queue_size, workers, progress)
+    if checkpoint is not None:
+        checkpoint.clear()
+
+
+def _ingest_pipelined(
+    batches: List[Tuple[int, List[Any]]],
+    encode_fn: Callable[[List[Any]], Any],
+    add_fn: Callable[[List[Any], Any], None],
+    queue_size: int,
+    workers: int,
+    progress: _Progress,
+):
+    encoded: "queue.Queue[Any]" = queue.Queue(maxsize=max(queue_size, 1))
+    errors: List[BaseException] = []
+    failed = threading.Event()
+
+    def consume():
+        while (entry := encoded.get()) is not _DONE:
+            if failed.is_set():
+                # keep draining the queue so the producer never blocks
+                continue
+            i, batch, embeddings = entry
+            try:
+                add_fn(batch, embeddings)
+                progress.complete(i, len(batch))
+            except BaseException as e:
+                errors.append(e)
+                failed.set()
+
+    threads = [
+        threading.Thread(target=consume, daemon=True)
+        for _ in range(max(1, min(workers, len(batches))))
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        for i, batch in batches:
+            if failed.is_set():
+                break
+            encoded.put((i, batch, encode_fn(batch)))
+    finally:
+        for _ in threads:
+            encoded.put(_DONE)
+        for thread in threads:
+            thread.join()
+    if errors:
+        raise errors[0]
+
+
+async def aingest(
+    items: List[Any],
+    encode_fn: Callable[[List[Any]], Awaitable[Any]],
+    add_fn: Callable[[List[Any], Any], Awaitable[None]],
+    batch_size: int = DEFAULT_INGEST_BATCH_SIZE,
+    queue_size: int = 2,
+    workers: int = 1,
+    progress_callback: Optional[ProgressCallback] = None,
+    checkpoint: Optional[IngestionCheckpoint] = None,
+):
+    """Encode and add items to an index in batches asynchronously, encoding the next
+    batches while `workers` tasks add the previous ones. At most `queue_size`
+    encoded batches wait to be added, which bounds the memory used.
+
+    The first batch is added before any other, so an index created on its first
+    add is only created once. With a single worker the batches are added in order.
+
+    :param items: The items to ingest.
+    :type items: List[Any]
+    :param encode_fn: Encodes a batch of items.
+    :type encode_fn: Callable[[List[Any]], Awaitable[Any]]
+    :param add_fn: Adds a batch of items with their embeddings to the index.
+    :type add_fn: Callable[[List[Any], Any], Awaitable[None]]
+    :param batch_size: The number of items in each batch.
+    :type batch_size: int
+    :param queue_size: The maximum number of encoded batches waiting to be added.
+    :type queue_size: int
+    :param workers: The number of tasks adding batches concurrently.
+    :type workers: int
+    :param progress_callback: Called with the number of items ingested and the
+        total number of items after each batch.
+    :type progress_callback: Optional[Callable[[int, int], None]]
+    :param checkpoint: Records the batches added, skipping those already added.
+    :type checkpoint: Optional[IngestionCheckpoint]
+    """
+    batches = _get_batches(items, batch_size, checkpoint)
+    progress = _Progress(len(items), progress_callback, checkpoint)
+    progress.skip(len(items) - sum(len(batch) for _, batch in batches))
+    if batches:
+        i, batch = batches[0]
+        await add_fn(batch, await encode_fn(batch))
+        progress.complete(i, len(batch))
+    if len(batches) > 1:
+        encoded: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=max(queue_size, 1))
+        errors: List[BaseException] = []
+
+        async def consume():
+            while (entry := await encoded.get()) is not _DONE:
+                if errors:
+                    continue
+                i, batch, embeddings = entry
+                try:
+                    await add_fn(batch, embeddings)
+                    progress.complete(i, len(batch))
+                except Exception as e:
+                    errors.append(e)
+
+        tasks = [
+            asyncio.create_task(consume())
+            for _ in range(max(1, min(workers, len(batches) - 1)))
+        ]
+        try:
+            for i, batch in batches[1:]:
+                if errors:
+                    break
+                await encoded.put((i, batch, await encode_fn(batch)))
+        finally:
+            for _ in tasks:
+                await encoded.put(_DONE)
+            await asyncio.gather(*tasks)
+        if errors:
+            raise errors[0]
+    if checkpoint is not None:
+        checkpoint.clear()
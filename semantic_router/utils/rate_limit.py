@@ -0,0 +1,163 @@
+import asyncio
+import random
+import threading
+import time
+from typing import Optional
+
+
+def jittered_backoff(attempt: int, base: float = 1.0, cap: float = 60.0) -> float:
+    """Get the delay before retrying a failed request. The delay grows exponentially
+    with each attempt and half of it is randomized, so that concurrent clients that
+    failed together do not all retry at the same moment.
+
+    :param attempt: The zero-based number of the attempt that failed.
+    :type attempt: int
+    :param base: The delay in seconds for the first retry before jitter.
+    :type base: float
+    :param cap: The maximum delay in seconds.
+    :type cap: float
+    :return: The delay in seconds.
+    :rtype: float
+    """
+    delay = min(cap, base * 2**attempt)
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+def get_status_code(error: BaseException) -> Optional[int]:
+    """Get the HTTP status code carried by an exception raised by an API client,
+    if any. Works with the exceptions raised by requests, aiohttp, httpx based SDKs
+    such as openai and litellm, and botocore.
+
+    :param error: The exception to inspect.
+    :type error: BaseException
+    :return: The HTTP status code, or None if the exception does not carry one.
+    :rtype: Optional[int]
+    """
+    for attr in ("status_code", "status", "http_status"):
+        value = getattr(error, attr, None)
+        if isinstance(value, int):
+            return value
+    response = getattr(error, "response", None)
+    if isinstance(response, dict):
+        # botocore ClientError
+        if response.get("Error", {}).get("Code") in (
+            "ThrottlingException",
+            "TooManyRequestsException",
+        ):
+            return 429
+        status = response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+        return status if isinstance(status, int) else None
+    for attr in ("status_code", "status"):
+        value = getattr(response, attr, None)
+        if isinstance(value, int):
+            return value
+    return None
+
+
+def get_retry_after(error: BaseException) -> Optional[float]:
+    """Get the number of seconds a server asked us to wait via the Retry-After
+    header of a rate limited response, if any.
+
+    :param error: The exception to inspect.
+    :type error: BaseException
+    :return: The delay in seconds, or None if no Retry-After header is available.
+    :rtype: Optional[float]
+    """
+    headers = getattr(error, "headers", None)
+    if headers is None:
+        headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        value = headers.get("retry-after") or headers.get("Retry-After")
+        return float(value) if value is not None else None
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+
+class RateLimiter:
+    """A thread-safe token bucket limiting requests per minute and tokens per
+    minute. Callers reserve capacity before sending a request and are told how long
+    to wait, which allows the same limiter to be shared by threads and coroutines.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+    ):
+        """Initialize the RateLimiter.
+
+        :param requests_per_minute: The maximum number of requests per minute, or None
+            for no request limit.
+        :type requests_per_minute: Optional[int]
+        :param tokens_per_minute: The maximum number of tokens per minute, or None for
+            no token limit.
+        :type tokens_per_minute: Optional[int]
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._requests = float(requests_per_minute or 0)
+        self._tokens = float(tokens_per_minute or 0)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        if self.requests_per_minute:
+            self._requests = min(
+                float(self.requests_per_minute),
+                self._requests + elapsed * self.requests_per_minute / 60,
+            )
+        if self.tokens_per_minute:
+            self._tokens = min(
+                float(self.tokens_per_minute),
+                self._tokens + elapsed * self.tokens_per_minute / 60,
+            )
+
+    def reserve(self, tokens: int = 0) -> float:
+        """Reserve capacity for one request using the given number of tokens. The
+        capacity is consumed immediately, if the budget is exhausted the caller must
+        wait for the returned number of seconds before sending the request.
+
+        :param tokens: The number of tokens the request will use.
+        :type tokens: int
+        :return: The number of seconds to wait before sending the request.
+        :rtype: float
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            wait = 0.0
+            if self.requests_per_minute:
+                self._requests -= 1
+                if self._requests < 0:
+                    wait = max(wait, -self._requests * 60 / self.requests_per_minute)
+            if self.tokens_per_minute:
+                # a single request larger than the budget can never fit, so it is
+                # capped to the full budget rather than waiting forever
+                self._tokens -= min(tokens, self.tokens_per_minute)
+                if self._tokens < 0:
+                    wait = max(wait, -self._tokens * 60 / self.tokens_per_minute)
+            return wait
+
+    def acquire(self, tokens: int = 0):
+        """Block until a request using the given number of tokens fits the budget.
+
+        :param tokens: The number of tokens the request will use.
+        :type tokens: int
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self, tokens: int = 0):
+        """Wait asynchronously until a request using the given number of tokens fits
+        the budget.
+
+        :param tokens: The number of tokens the request will use.
+        :type tokens: int
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
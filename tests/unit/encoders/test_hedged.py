@@ -0,0 +1,105 @@
+import asyncio
+from typing import Any, List
+
+import pytest
+
+from semantic_router.encoders import DenseEncoder, HedgedEncoder
+
+
+class DelayedEncoder(DenseEncoder):
+    delays: List[float] = []
+    value: float = 0.0
+    calls: int = 0
+    cancelled: int = 0
+    dimensions: int = 2
+
+    def __call__(self, docs: List[Any]) -> List[List[float]]:
+        return [[self.value, 0.0] for _ in docs]
+
+    async def acall(self, docs: List[Any]) -> List[List[float]]:
+        delay = self.delays[self.calls] if self.calls < len(self.delays) else 0.0
+        self.calls += 1
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if delay < 0:
+            raise ConnectionError("request failed")
+        return [[self.value, 0.0] for _ in docs]
+
+
+def make_encoder(primary, secondary=None, **kwargs) -> HedgedEncoder:
+    kwargs.setdefault("initial_delay", 0.01)
+    kwargs.setdefault("max_hedge_ratio", 1.0)
+    return HedgedEncoder(primary=primary, secondary=secondary, **kwargs)
+
+
+class TestHedgedEncoder:
+    @pytest.mark.asyncio
+    async def test_fast_primary_is_not_hedged(self):
+        primary = DelayedEncoder(name="primary", value=1.0)
+        secondary = DelayedEncoder(name="secondary", value=2.0)
+        encoder = make_encoder(primary, secondary)
+        assert await encoder.acall(["a"]) == [[1.0, 0.0]]
+        assert secondary.calls == 0
+        assert encoder.hedge_rate() == 0.0
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged_and_cancelled(self):
+        primary = DelayedEncoder(name="primary", value=1.0, delays=[1.0])
+        secondary = DelayedEncoder(name="secondary", value=2.0)
+        encoder = make_encoder(primary, secondary)
+        assert await encoder.acall(["a"]) == [[2.0, 0.0]]
+        await asyncio.sleep(0)
+        assert primary.cancelled == 1
+        assert encoder.hedge_rate() == 1.0
+
+    @pytest.mark.asyncio
+    async def test_hedges_to_primary_without_secondary(self):
+        primary = DelayedEncoder(name="primary", value=1.0, delays=[1.0, 0.0])
+        encoder = make_encoder(primary)
+        assert await encoder.acall(["a"]) == [[1.0, 0.0]]
+        assert primary.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_hedge_waits_for_primary(self):
+        primary = DelayedEncoder(name="primary", value=1.0, delays=[0.05])
+        secondary = DelayedEncoder(name="secondary", value=2.0, delays=[-0.001])
+        encoder = make_encoder(primary, secondary)
+        assert await encoder.acall(["a"]) == [[1.0, 0.0]]
+
+    @pytest.mark.asyncio
+    async def test_hedge_budget(self):
+        primary = DelayedEncoder(name="primary", value=1.0, delays=[0.05] * 10)
+        secondary = DelayedEncoder(name="secondary", value=2.0)
+        encoder = make_encoder(primary, secondary, max_hedge_ratio=0.2)
+        for _ in range(10):
+            await encoder.acall(["a"])
+        assert secondary.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_only_unhedged_latencies_recorded(self):
+        primary = DelayedEncoder(name="primary", value=1.0, delays=[0.0, 1.0])
+        secondary = DelayedEncoder(name="secondary", value=2.0)
+        encoder = make_encoder(primary, secondary)
+        await encoder.acall(["a"])
+        await encoder.acall(["a"])
+        assert len(encoder._latencies) == 1
+        assert list(encoder._hedged) == [False, True]
+
+    def test_delay_uses_latency_percentile(self):
+        encoder = make_encoder(
+            DelayedEncoder(name="primary"), min_samples=10, hedge_percentile=90
+        )
+        assert encoder.hedge_delay() == 0.01
+        for i in range(1, 11):
+            encoder._record(i / 10, hedged=False)
+        assert encoder.hedge_delay() == pytest.approx(0.91)
+
+    def test_dimension_mismatch(self):
+        with pytest.raises(ValueError):
+            HedgedEncoder(
+                primary=DelayedEncoder(name="primary", dimensions=2),
+                secondary=DelayedEncoder(name="secondary", dimensions=3),
+            )
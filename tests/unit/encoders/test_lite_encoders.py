@@ -131,3 +131,24 @@ class TestEncoders:
         )
         with pytest.raises(ValueError):
             encoder(model_in)(["test"])
+
+
+def test_batches_by_provider_limit(mocker):
+    os.environ["COHERE_API_KEY"] = "test_api_key"
+
+    def embedding(input, **kwargs):
+        return litellm.EmbeddingResponse(
+            data=[
+                Embedding(embedding=[float(i)], index=i, object="embedding")
+                for i in range(len(input))
+            ]
+        )
+
+    mocker.patch.object(litellm, "embedding", side_effect=embedding)
+    encoder = CohereEncoder("embed-english-v3.0")
+    assert encoder.max_batch_size == 96
+    result = encoder.encode_documents([f"doc {i}" for i in range(200)])
+    assert len(result) == 200
+    assert litellm.embedding.call_count == 3
+    for call in litellm.embedding.call_args_list:
+        assert call.kwargs["input_type"] == "search_document"
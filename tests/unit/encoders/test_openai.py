@@ -242,3 +242,25 @@ class TestOpenAIEncoder:
             await openai_encoder.acall(["test document"])
 
         assert mock_create.call_count == 1  # Only the initial attempt, no retries
+
+    def test_openai_encoder_splits_batches_by_tokens(self, openai_encoder, mocker):
+        openai_encoder.max_batch_tokens = 3
+
+        def create(input, model, dimensions):
+            return CreateEmbeddingResponse(
+                model="text-embedding-3-small",
+                object="list",
+                usage=Usage(prompt_tokens=0, total_tokens=0),
+                data=[
+                    Embedding(embedding=[float(len(doc))], index=i, object="embedding")
+                    for i, doc in enumerate(input)
+                ],
+            )
+
+        mock_create = mocker.patch.object(
+            openai_encoder._client.embeddings, "create", side_effect=create
+        )
+        docs = ["one two", "three four", "five six", "seven"]
+        embeddings = openai_encoder(docs)
+        assert embeddings == [[float(len(doc))] for doc in docs]
+        assert mock_create.call_count == 3
@@ -0,0 +1,279 @@
+import asyncio
+import threading
+import time
+from typing import Any, List
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+import requests
+from aiohttp import web
+
+from semantic_router.encoders.huggingface import HFEndpointEncoder
+from semantic_router.encoders.remote import RemoteDenseEncoder
+from semantic_router.utils.rate_limit import (
+    RateLimiter,
+    get_retry_after,
+    get_status_code,
+    jittered_backoff,
+)
+
+
+class StubRemoteEncoder(RemoteDenseEncoder):
+    name: str = "stub"
+    batches: List[List[Any]] = []
+
+    def _count_tokens(self, docs: List[Any]) -> List[int]:
+        return [len(doc.split()) for doc in docs]
+
+    def _embed_batch(self, docs: List[Any]) -> List[List[float]]:
+        self.batches.append(list(docs))
+        # finish later batches first to check results are reassembled in order
+        time.sleep(0.01 / len(self.batches))
+        return [[float(doc.split()[-1])] for doc in docs]
+
+    async def _aembed_batch(self, docs: List[Any]) -> List[List[float]]:
+        self.batches.append(list(docs))
+        await asyncio.sleep(0.01 / len(self.batches))
+        return [[float(doc.split()[-1])] for doc in docs]
+
+    def __call__(self, docs: List[Any]) -> List[List[float]]:
+        return self._encode_batches(docs, self._count_tokens(docs))
+
+    async def acall(self, docs: List[Any]) -> List[List[float]]:
+        return await self._aencode_batches(docs, self._count_tokens(docs))
+
+
+@pytest.fixture
+def docs():
+    return [f"doc {i}" for i in range(10)]
+
+
+class TestRemoteDenseEncoder:
+    def test_split_by_item_count(self, docs):
+        encoder = StubRemoteEncoder(max_batch_size=4)
+        assert encoder._split_batches(docs) == [
+            [0, 1, 2, 3],
+            [4, 5, 6, 7],
+            [8, 9],
+        ]
+
+    def test_split_by_token_count(self):
+        encoder = StubRemoteEncoder(max_batch_size=100, max_batch_tokens=5)
+        token_counts = [2, 2, 2, 6, 1]
+        assert encoder._split_batches([""] * 5, token_counts) == [
+            [0, 1],
+            [2],
+            [3],
+            [4],
+        ]
+
+    def test_results_are_in_input_order(self, docs):
+        encoder = StubRemoteEncoder(max_batch_size=3, max_concurrency=4, batches=[])
+        assert encoder(docs) == [[float(i)] for i in range(10)]
+        assert len(encoder.batches) == 4
+
+    @pytest.mark.asyncio
+    async def test_async_results_are_in_input_order(self, docs):
+        encoder = StubRemoteEncoder(max_batch_size=3, max_concurrency=2, batches=[])
+        assert await encoder.acall(docs) == [[float(i)] for i in range(10)]
+        assert len(encoder.batches) == 4
+
+    def test_concurrency_is_bounded(self, docs):
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        class TrackingEncoder(StubRemoteEncoder):
+            def _embed_batch(self, docs: List[Any]) -> List[List[float]]:
+                nonlocal active, peak
+                with lock:
+                    active += 1
+                    peak = max(peak, active)
+                time.sleep(0.01)
+                with lock:
+                    active -= 1
+                return [[0.0] for _ in docs]
+
+        encoder = TrackingEncoder(max_batch_size=1, max_concurrency=3)
+        encoder(docs)
+        assert peak <= 3
+
+    def test_rate_limiter_charges_batch_tokens(self, docs):
+        encoder = StubRemoteEncoder(
+            max_batch_size=5, tokens_per_minute=1000, batches=[]
+        )
+        with patch.object(RateLimiter, "acquire") as mock_acquire:
+            encoder(docs)
+        assert sorted(call.args[0] for call in mock_acquire.call_args_list) == [
+            10,
+            10,
+        ]
+
+
+class RateLimitError(Exception):
+    def __init__(self, retry_after: str):
+        super().__init__("rate limited")
+        self.status_code = 429
+        self.headers = {"retry-after": retry_after}
+
+
+class TestRetries:
+    def test_status_code_from_errors(self):
+        response = requests.Response()
+        response.status_code = 503
+        assert get_status_code(requests.HTTPError(response=response)) == 503
+        assert get_status_code(RateLimitError("1")) == 429
+        throttled = Exception()
+        throttled.response = {"Error": {"Code": "ThrottlingException"}}  # type: ignore
+        assert get_status_code(throttled) == 429
+        assert get_status_code(ValueError("bad input")) is None
+
+    def test_retry_after_header(self):
+        assert get_retry_after(RateLimitError("2.5")) == 2.5
+        assert get_retry_after(ValueError("bad input")) is None
+
+    def test_retries_rate_limited_requests(self):
+        encoder = StubRemoteEncoder(max_retries=2)
+        calls = []
+
+        def flaky(docs: List[Any]) -> List[List[float]]:
+            calls.append(docs)
+            if len(calls) < 3:
+                raise RateLimitError("0.01")
+            return [[1.0]]
+
+        with patch("semantic_router.encoders.remote.sleep") as mock_sleep:
+            assert encoder._with_retries(flaky, ["a"]) == [[1.0]]
+        assert len(calls) == 3
+        assert mock_sleep.call_count == 2
+        # a 429 pauses every other batch of the encoder too
+        assert encoder._throttled_until > 0
+
+    def test_requests_hold_adaptive_concurrency_slots(self):
+        encoder = StubRemoteEncoder(type="stub-adaptive", max_retries=1)
+        limiter = encoder._get_concurrency_limiter()
+        limit = limiter.limit
+        calls = []
+
+        def flaky(docs: List[Any]) -> List[List[float]]:
+            assert limiter.in_flight == 1
+            calls.append(docs)
+            if len(calls) == 1:
+                raise RateLimitError("0")
+            return [[1.0]]
+
+        with patch("semantic_router.encoders.remote.sleep"):
+            encoder._with_retries(flaky, ["a"])
+        assert limiter.limit < limit
+        assert limiter.in_flight == 0
+
+    def test_retry_delay_honours_retry_after(self):
+        encoder = StubRemoteEncoder()
+        assert encoder._retry_delay(0, RateLimitError("30")) == 30
+        assert 29 < encoder._throttle_delay() <= 30
+
+    def test_client_errors_are_not_retried(self):
+        encoder = StubRemoteEncoder(max_retries=3)
+        calls = []
+
+        def failing(docs: List[Any]) -> List[List[float]]:
+            calls.append(docs)
+            raise ValueError("bad input")
+
+        with pytest.raises(ValueError):
+            encoder._with_retries(failing, ["a"])
+        assert len(calls) == 1
+
+    def test_gives_up_after_max_retries(self):
+        encoder = StubRemoteEncoder(max_retries=1)
+
+        def failing(docs: List[Any]) -> List[List[float]]:
+            raise ConnectionError("connection reset")
+
+        with patch("semantic_router.encoders.remote.sleep"):
+            with pytest.raises(ConnectionError):
+                encoder._with_retries(failing, ["a"])
+
+    @pytest.mark.asyncio
+    async def test_async_retries(self):
+        encoder = StubRemoteEncoder(max_retries=2)
+        calls = []
+
+        async def flaky(docs: List[Any]) -> List[List[float]]:
+            calls.append(docs)
+            if len(calls) < 2:
+                raise TimeoutError()
+            return [[1.0]]
+
+        with patch("semantic_router.encoders.remote.asleep") as mock_sleep:
+            assert await encoder._awith_retries(flaky, ["a"]) == [[1.0]]
+        assert mock_sleep.call_count == 1
+
+
+@pytest_asyncio.fixture
+async def hf_stub_server(unused_tcp_port):
+    """A local Hugging Face endpoint that rate limits the first request."""
+    requests_seen = []
+
+    async def embed(request: web.Request) -> web.Response:
+        payload = await request.json()
+        requests_seen.append(payload["inputs"])
+        if len(requests_seen) == 1:
+            return web.Response(status=429, headers={"Retry-After": "0"})
+        return web.json_response([float(len(payload["inputs"])), 1.0])
+
+    app = web.Application()
+    app.router.add_post("/embed", embed)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", unused_tcp_port)
+    await site.start()
+    yield f"http://127.0.0.1:{unused_tcp_port}/embed", requests_seen
+    await runner.cleanup()
+
+
+class TestHFEndpointEncoderSessions:
+    @pytest.mark.asyncio
+    async def test_acall_against_stub_server(self, hf_stub_server):
+        url, requests_seen = hf_stub_server
+        with patch.object(HFEndpointEncoder, "query", return_value=[0.0]):
+            encoder = HFEndpointEncoder(
+                huggingface_url=url, huggingface_api_key="test-api-key"
+            )
+        with patch("semantic_router.encoders.huggingface.asleep") as mock_sleep:
+            embeddings = await encoder.acall(["a", "bbb", "cc"])
+        mock_sleep.assert_called_once()
+        # the rate limited request is retried and results stay in input order
+        assert embeddings == [[1.0, 1.0], [3.0, 1.0], [2.0, 1.0]]
+        assert len(requests_seen) == 4
+        session = encoder._get_async_session()
+        # the pooled session is reused across requests
+        assert session is encoder._get_async_session()
+        await encoder.aclose()
+        assert session.closed
+
+
+class TestRateLimiter:
+    def test_no_wait_within_budget(self):
+        limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=1000)
+        assert limiter.reserve(500) == 0.0
+        assert limiter.reserve(400) == 0.0
+
+    def test_wait_when_token_budget_exhausted(self):
+        limiter = RateLimiter(tokens_per_minute=600)
+        limiter.reserve(600)
+        # 60 tokens refill in roughly 6 seconds at 600 tokens per minute
+        assert limiter.reserve(60) == pytest.approx(6.0, abs=0.1)
+
+    def test_wait_when_request_budget_exhausted(self):
+        limiter = RateLimiter(requests_per_minute=2)
+        limiter.reserve()
+        limiter.reserve()
+        assert limiter.reserve() == pytest.approx(30.0, abs=0.1)
+
+    def test_jittered_backoff_bounds(self):
+        for attempt in range(5):
+            delay = jittered_backoff(attempt, base=1.0, cap=8.0)
+            expected = min(8.0, 2**attempt)
+            assert expected / 2 <= delay <= expected
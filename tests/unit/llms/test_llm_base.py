@@ -3,6 +3,11 @@ from unittest.mock import patch
 import pytest
 
 from semantic_router.llms import BaseLLM
+from semantic_router.llms.base import (
+    build_function_inputs_prompt,
+    compile_function_schema,
+    parse_function_inputs,
+)
 
 
 class TestBaseLLM:
@@ -242,3 +247,85 @@ class TestBaseLLM:
         signature = "(param1 int, param2: str = 'default')"
         with pytest.raises(IndexError):
             base_llm._extract_parameter_info(signature)
+
+
+class TestCompiledFunctionSchema:
+    def test_compile_parameters(self):
+        compiled = compile_function_schema(
+            {
+                "name": "test_function",
+                "description": "A test function.",
+                "signature": "(a, b: Tuple[int, str], c: str = 'x, y', *args, d=None, **kwargs) -> Dict[str, int]",
+            }
+        )
+        assert compiled.parameters == ("a", "b", "c", "d")
+        assert compiled.mandatory_parameters == ("a", "b")
+        assert compiled.parameter_types["b"] == "Tuple[int, str]"
+        assert compiled.accepts_extra_inputs
+
+    def test_compiled_once(self):
+        schema = {"name": "f", "description": "None", "signature": "(x: int) -> int"}
+        compiled = compile_function_schema(schema)
+        assert compile_function_schema(dict(schema)) is compiled
+        assert compiled.prompt == "f(x: int) -> int"
+
+    def test_no_return_annotation(self):
+        compiled = compile_function_schema({"name": "f", "signature": "(a, b)"})
+        assert compiled.parameters == ("a", "b")
+
+    def test_prompt_is_compact(self):
+        schema = {
+            "name": "get_time",
+            "description": "Finds the current time in a specific timezone.",
+            "signature": "(timezone: str) -> str",
+        }
+        prompt = build_function_inputs_prompt("time in Rome?", [schema])
+        assert "get_time(timezone: str) -> str" in prompt
+        assert "Query: time in Rome?" in prompt
+        assert len(prompt) < 500
+
+    @pytest.mark.parametrize(
+        "output",
+        [
+            '{"name": "O\'Brien"}',
+            "{'name': 'Smith'},",
+            '```json\n{"name": "Smith"}\n```',
+        ],
+    )
+    def test_parse_function_inputs(self, output):
+        inputs = parse_function_inputs(output)
+        assert len(inputs) == 1 and "name" in inputs[0]
+
+    def test_extract_function_inputs(self, mocker):
+        llm = BaseLLM(name="TestLLM")
+        mocker.patch.object(
+            BaseLLM, "__call__", return_value='{"timezone": "Europe/Rome"}'
+        )
+        schema = {
+            "name": "get_time",
+            "description": "Finds the current time in a specific timezone.",
+            "signature": "(timezone: str) -> str",
+        }
+        inputs = llm.extract_function_inputs("time in Rome?", [schema])
+        assert inputs == [{"timezone": "Europe/Rome"}]
+        prompt = BaseLLM.__call__.call_args.args[0][0].content
+        assert prompt == build_function_inputs_prompt("time in Rome?", [schema])
+
+
+class TestBaseLLMAsync:
+    @pytest.mark.asyncio
+    async def test_acall_runs_call_in_thread(self, mocker):
+        import threading
+
+        threads = []
+
+        def call(self, messages):
+            threads.append(threading.current_thread())
+            return '{"timezone": "Europe/Rome"}'
+
+        mocker.patch.object(BaseLLM, "__call__", call)
+        llm = BaseLLM(name="TestLLM")
+        schema = {"name": "get_time", "signature": "(timezone: str) -> str"}
+        inputs = await llm.async_extract_function_inputs("time in Rome?", [schema])
+        assert inputs == [{"timezone": "Europe/Rome"}]
+        assert threads and threads[0] is not threading.main_thread()
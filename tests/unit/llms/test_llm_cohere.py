@@ -50,3 +50,14 @@ class TestCohereLLM:
         )
         with pytest.raises(ValueError):
             cohere_llm("test")
+
+    @pytest.mark.asyncio
+    async def test_acall(self, cohere_llm, mocker):
+        mock_llm = mocker.MagicMock()
+        mock_llm.text = "test"
+        cohere_llm._async_client = mocker.MagicMock()
+        cohere_llm._async_client.chat = mocker.AsyncMock(return_value=mock_llm)
+
+        result = await cohere_llm.acall([Message(role="user", content="test")])
+        assert result == "test"
+        cohere_llm._async_client.chat.assert_awaited_once()
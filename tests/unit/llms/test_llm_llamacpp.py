@@ -87,3 +87,22 @@ class TestLlamaCppLLM:
             llamacpp_llm.extract_function_inputs(
                 query=test_query, function_schemas=[test_schema]
             )
+
+    @pytest.mark.asyncio
+    async def test_llamacpp_async_extract_function_inputs(self, llamacpp_llm, mocker):
+        llamacpp_llm.llm.create_chat_completion = mocker.Mock(
+            return_value={
+                "choices": [{"message": {"content": '{"timezone": "Europe/Rome"}'}}]
+            }
+        )
+        test_schema = {
+            "name": "get_time",
+            "description": "Finds the current time in a specific timezone.",
+            "signature": "(timezone: str) -> str",
+            "output": "<class 'str'>",
+        }
+        result = await llamacpp_llm.async_extract_function_inputs(
+            query="What time is it in Rome?", function_schemas=[test_schema]
+        )
+        assert result == [{"timezone": "Europe/Rome"}]
+        assert llamacpp_llm.grammar is None
@@ -68,3 +68,15 @@ class TestMistralAILLM:
         llm_input = [Message(role="user", content="test")]
         output = mistralai_llm(llm_input)
         assert output == "test"
+
+    @pytest.mark.asyncio
+    async def test_mistralai_llm_acall_success(self, mistralai_llm, mocker):
+        mock_completion = mocker.MagicMock()
+        mock_completion.choices[0].message.content = "test"
+        mocker.patch.object(
+            mistralai_llm._async_client,
+            "chat",
+            new=mocker.AsyncMock(return_value=mock_completion),
+        )
+        output = await mistralai_llm.acall([Message(role="user", content="test")])
+        assert output == "test"
@@ -19,13 +19,41 @@ class TestOllamaLLM:
     def test_ollama_llm_call_success(self, ollama_llm, mocker):
         mock_response = mocker.MagicMock()
         mock_response.json.return_value = {"message": {"content": "test response"}}
-        mocker.patch("requests.post", return_value=mock_response)
+        mocker.patch("requests.Session.post", return_value=mock_response)
 
         output = ollama_llm([Message(role="user", content="test")])
         assert output == "test response"
 
     def test_ollama_llm_error_handling(self, ollama_llm, mocker):
-        mocker.patch("requests.post", side_effect=Exception("LLM error"))
+        mocker.patch("requests.Session.post", side_effect=Exception("LLM error"))
         with pytest.raises(Exception) as exc_info:
             ollama_llm([Message(role="user", content="test")])
         assert "LLM error" in str(exc_info.value)
+
+    def test_ollama_llm_reuses_session(self, ollama_llm, mocker):
+        mock_response = mocker.MagicMock()
+        mock_response.json.return_value = {"message": {"content": "test response"}}
+        post = mocker.patch("requests.Session.post", return_value=mock_response)
+
+        ollama_llm([Message(role="user", content="test")])
+        session = ollama_llm._session
+        ollama_llm([Message(role="user", content="test")])
+        assert ollama_llm._session is session
+        assert post.call_count == 2
+        ollama_llm.close()
+        assert ollama_llm._session is None
+
+    @pytest.mark.asyncio
+    async def test_ollama_llm_acall_success(self, ollama_llm, mocker):
+        mock_response = mocker.MagicMock()
+        mock_response.json = mocker.AsyncMock(
+            return_value={"message": {"content": "test response"}}
+        )
+        mock_response.__aenter__ = mocker.AsyncMock(return_value=mock_response)
+        mock_response.__aexit__ = mocker.AsyncMock(return_value=None)
+        post = mocker.patch("aiohttp.ClientSession.post", return_value=mock_response)
+
+        output = await ollama_llm.acall([Message(role="user", content="test")])
+        assert output == "test response"
+        assert post.call_args.kwargs["json"]["model"] == "openhermes"
+        await ollama_llm.aclose()
@@ -471,3 +471,55 @@ class TestOpenAILLM:
         mocked_logger.assert_called_once_with(
             "Single input validation error: Test exception"
         )
+
+
+get_time_schema = {
+    "name": "get_time",
+    "description": "Finds the current time in a specific timezone.",
+    "signature": "(timezone: str, fmt: str = '%H:%M') -> str",
+    "output": "<class 'str'>",
+}
+
+
+class TestOpenAISignatureSchemas:
+    def test_prompted_by_default(self, openai_llm, mocker):
+        mocker.patch.object(
+            OpenAILLM, "__call__", return_value='{"timezone": "Europe/Rome"}'
+        )
+        result = openai_llm.extract_function_inputs("time in Rome", [get_time_schema])
+        assert result == [{"timezone": "Europe/Rome"}]
+        messages = OpenAILLM.__call__.call_args.args[0]
+        assert "get_time(timezone: str" in messages[0].content
+
+    def test_native_function_calling(self, openai_llm, mocker):
+        openai_llm.native_function_calling = True
+        tool_call = mocker.MagicMock()
+        tool_call.function.name = "get_time"
+        tool_call.function.arguments = '{"timezone": "Europe/Rome"}'
+        completion = mocker.MagicMock()
+        completion.choices[0].message.tool_calls = [tool_call]
+        create = mocker.patch.object(
+            openai_llm._client.chat.completions, "create", return_value=completion
+        )
+        result = openai_llm.extract_function_inputs("time in Rome", [get_time_schema])
+        assert result == [{"timezone": "Europe/Rome"}]
+        tools = create.call_args.kwargs["tools"]
+        assert tools[0]["function"]["parameters"] == {
+            "type": "object",
+            "properties": {"timezone": {"type": "string"}, "fmt": {"type": "string"}},
+            "required": ["timezone"],
+        }
+        assert create.call_args.kwargs["tool_choice"]["function"]["name"] == "get_time"
+
+    def test_native_function_calling_unknown_function(self, openai_llm, mocker):
+        openai_llm.native_function_calling = True
+        tool_call = mocker.MagicMock()
+        tool_call.function.name = "other"
+        tool_call.function.arguments = "{}"
+        completion = mocker.MagicMock()
+        completion.choices[0].message.tool_calls = [tool_call]
+        mocker.patch.object(
+            openai_llm._client.chat.completions, "create", return_value=completion
+        )
+        with pytest.raises(ValueError):
+            openai_llm.extract_function_inputs("time in Rome", [get_time_schema])
@@ -58,3 +58,15 @@ class TestOpenRouterLLM:
         llm_input = [Message(role="user", content="test")]
         output = openrouter_llm(llm_input)
         assert output == "test"
+
+    @pytest.mark.asyncio
+    async def test_openrouter_llm_acall_success(self, openrouter_llm, mocker):
+        mock_completion = mocker.MagicMock()
+        mock_completion.choices[0].message.content = "test"
+        mocker.patch.object(
+            openrouter_llm._async_client.chat.completions,
+            "create",
+            new=mocker.AsyncMock(return_value=mock_completion),
+        )
+        output = await openrouter_llm.acall([Message(role="user", content="test")])
+        assert output == "test"
@@ -0,0 +1,149 @@
+import asyncio
+from typing import List
+
+import numpy as np
+import pytest
+
+from semantic_router.encoders import DenseEncoder
+from semantic_router.index.local import LocalIndex
+from semantic_router.route import Route
+from semantic_router.routers import SemanticRouter
+from semantic_router.utils.batching import MicroBatcher
+
+
+class CountingEncoder(DenseEncoder):
+    calls: List[List[str]] = []
+
+    def __call__(self, docs: List[str]) -> List[List[float]]:
+        self.calls.append(list(docs))
+        return [[float("hello" in doc), float("bye" in doc), 0.1] for doc in docs]
+
+    async def acall(self, docs: List[str]) -> List[List[float]]:
+        return self(docs)
+
+
+@pytest.fixture
+def encoder():
+    return CountingEncoder(name="counting-encoder", calls=[], score_threshold=0.5)
+
+
+@pytest.fixture
+def router(encoder):
+    routes = [
+        Route(name="greeting", utterances=["hello", "hello there"]),
+        Route(name="farewell", utterances=["bye", "bye for now"]),
+    ]
+    router = SemanticRouter(
+        encoder=encoder, routes=routes, index=LocalIndex(), auto_sync="local"
+    )
+    router.enable_micro_batching(max_wait=0.01, max_batch_size=64)
+    return router
+
+
+class TestMicroBatcher:
+    @pytest.mark.asyncio
+    async def test_coalesces_concurrent_items(self):
+        batches = []
+
+        async def batch_fn(items):
+            batches.append(items)
+            return [item * 2 for item in items]
+
+        batcher = MicroBatcher(batch_fn=batch_fn, max_wait=0.01)
+        results = await asyncio.gather(*[batcher.submit(i) for i in range(5)])
+        assert results == [0, 2, 4, 6, 8]
+        assert batches == [[0, 1, 2, 3, 4]]
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_immediately(self):
+        batches = []
+
+        async def batch_fn(items):
+            batches.append(items)
+            return items
+
+        batcher = MicroBatcher(batch_fn=batch_fn, max_wait=10, max_batch_size=2)
+        results = await asyncio.wait_for(
+            asyncio.gather(*[batcher.submit(i) for i in range(4)]), timeout=1
+        )
+        assert results == [0, 1, 2, 3]
+        assert batches == [[0, 1], [2, 3]]
+
+    @pytest.mark.asyncio
+    async def test_error_reaches_every_caller(self):
+        async def batch_fn(items):
+            raise RuntimeError("boom")
+
+        batcher = MicroBatcher(batch_fn=batch_fn, max_wait=0.001)
+        results = await asyncio.gather(
+            batcher.submit(1), batcher.submit(2), return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_batch_cancels_callers(self):
+        started = asyncio.Event()
+
+        async def batch_fn(items):
+            started.set()
+            await asyncio.sleep(10)
+            return items
+
+        batcher = MicroBatcher(batch_fn=batch_fn, max_wait=0.001)
+        callers = [asyncio.ensure_future(batcher.submit(i)) for i in range(2)]
+        await started.wait()
+        for task in list(batcher._tasks):
+            task.cancel()
+        results = await asyncio.wait_for(
+            asyncio.gather(*callers, return_exceptions=True), timeout=1
+        )
+        assert all(isinstance(r, asyncio.CancelledError) for r in results)
+
+
+class TestRouterMicroBatching:
+    @pytest.mark.asyncio
+    async def test_concurrent_acalls_share_encoder_and_index_calls(
+        self, router, encoder, mocker
+    ):
+        query_spy = mocker.spy(LocalIndex, "aquery_batch")
+        encoder.calls.clear()
+        texts = ["hello friend", "bye friend", "hello again", "bye again"]
+        choices = await asyncio.gather(*[router.acall(text) for text in texts])
+        assert [c.name for c in choices] == [
+            "greeting",
+            "farewell",
+            "greeting",
+            "farewell",
+        ]
+        assert encoder.calls == [texts]
+        assert query_spy.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_route_filters_are_grouped(self, router, mocker):
+        query_spy = mocker.spy(LocalIndex, "aquery_batch")
+        choices = await asyncio.gather(
+            router.acall("hello friend"),
+            router.acall("hello friend", route_filter=["farewell"]),
+            router.acall("hello again", route_filter=["farewell"]),
+        )
+        assert choices[0].name == "greeting"
+        assert choices[1].name is None
+        assert query_spy.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalid_filter_only_fails_its_caller(self, router):
+        results = await asyncio.gather(
+            router.acall("hello friend"),
+            router.acall("hello friend", route_filter=["missing"]),
+            return_exceptions=True,
+        )
+        assert results[0].name == "greeting"
+        assert isinstance(results[1], ValueError)
+
+    @pytest.mark.asyncio
+    async def test_matches_unbatched_scores(self, router):
+        batched = await router._query_batcher.submit((np.array([1.0, 0.0, 0.1]), None))
+        router.disable_micro_batching()
+        unbatched = await router._async_retrieve(vector=[1.0, 0.0, 0.1])
+        assert [r[0] for r in batched] == [r[0] for r in unbatched]
+        assert [r[1] for r in batched] == pytest.approx([r[1] for r in unbatched])
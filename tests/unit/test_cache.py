@@ -0,0 +1,304 @@
+from typing import List
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from semantic_router.cache import LRUCache, SemanticCache, SQLiteCache, TTLCache
+from semantic_router.cache.base import embedding_cache_key, normalize_text
+from semantic_router.encoders import DenseEncoder, TfidfEncoder
+from semantic_router.index import HybridLocalIndex
+from semantic_router.index.local import LocalIndex
+from semantic_router.route import Route
+from semantic_router.routers import HybridRouter, SemanticRouter
+from semantic_router.schema import Utterance
+
+
+class CountingEncoder(DenseEncoder):
+    calls: List[List[str]] = []
+
+    def __call__(self, docs: List[str]) -> List[List[float]]:
+        self.calls.append(list(docs))
+        return [[float(len(doc)), 1.0, 0.5] for doc in docs]
+
+    async def acall(self, docs: List[str]) -> List[List[float]]:
+        return self(docs)
+
+
+@pytest.fixture
+def encoder():
+    return CountingEncoder(name="counting-encoder", calls=[])
+
+
+@pytest.fixture
+def router(encoder):
+    routes = [
+        Route(name="greeting", utterances=["hello", "hi there"]),
+        Route(name="farewell", utterances=["goodbye", "see you later"]),
+    ]
+    return SemanticRouter(
+        encoder=encoder,
+        routes=routes,
+        index=LocalIndex(),
+        auto_sync="local",
+        embedding_cache=LRUCache(max_entries=100),
+    )
+
+
+class TestNormalization:
+    def test_normalize_text_collapses_whitespace(self):
+        assert normalize_text("  hello \n\t world  ") == "hello world"
+
+    def test_key_depends_on_input_type_and_encoder(self, encoder):
+        other = CountingEncoder(name="other-encoder", calls=[])
+        key = embedding_cache_key(encoder, "hello  world", "queries")
+        assert key == embedding_cache_key(encoder, " hello world", "queries")
+        assert key != embedding_cache_key(encoder, "hello world", "documents")
+        assert key != embedding_cache_key(other, "hello world", "queries")
+
+
+class TestLRUCache:
+    def test_get_and_set(self):
+        cache = LRUCache()
+        assert cache.get("a") is None
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.hits == 1
+        assert cache.misses == 1
+        assert cache.stats()["hit_rate"] == 0.5
+
+    def test_evicts_least_recently_used_by_entries(self):
+        cache = LRUCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_evicts_by_bytes(self):
+        cache = LRUCache(max_bytes=100)
+        cache.set("a", np.zeros(8))  # 64 bytes
+        cache.set("b", np.zeros(8))
+        assert len(cache) == 1
+        assert cache.get("a") is None
+        assert cache.nbytes == 64
+
+    def test_value_larger_than_max_bytes_is_not_cached(self):
+        cache = LRUCache(max_bytes=10)
+        cache.set("a", np.zeros(8))
+        assert len(cache) == 0
+
+    def test_delete_and_clear(self):
+        cache = LRUCache()
+        cache.set_many([("a", 1), ("b", 2)])
+        cache.delete("a")
+        assert cache.get_many(["a", "b"]) == [None, 2]
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.nbytes == 0
+
+
+class TestTTLCache:
+    def test_entries_expire(self):
+        cache = TTLCache(ttl=10)
+        with patch("semantic_router.cache.memory.time.monotonic", return_value=0.0):
+            cache.set("a", 1)
+        with patch("semantic_router.cache.memory.time.monotonic", return_value=5.0):
+            assert cache.get("a") == 1
+        with patch("semantic_router.cache.memory.time.monotonic", return_value=11.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+
+class TestRouterEmbeddingCache:
+    def test_repeated_query_hits_cache(self, router, encoder):
+        encoder.calls.clear()
+        first = router("hello world")
+        second = router("hello world")
+        assert first == second
+        assert encoder.calls == [["hello world"]]
+        assert router.embedding_cache.hits >= 1
+
+    def test_batch_only_encodes_misses(self, router, encoder):
+        router._encode(["a", "b"], input_type="queries")
+        encoder.calls.clear()
+        xq = router._encode(["a", "c", "b", "c"], input_type="queries")
+        assert encoder.calls == [["c"]]
+        assert xq.shape == (4, 3)
+        np.testing.assert_array_equal(xq[1], xq[3])
+
+    def test_input_types_are_cached_separately(self, router, encoder):
+        router._encode(["query"], input_type="queries")
+        encoder.calls.clear()
+        router._encode(["query"], input_type="documents")
+        assert encoder.calls == [["query"]]
+
+    @pytest.mark.asyncio
+    async def test_async_encode_uses_cache(self, router, encoder):
+        router._encode(["a"], input_type="queries")
+        encoder.calls.clear()
+        xq = await router._async_encode(["a", "b"], input_type="queries")
+        assert encoder.calls == [["b"]]
+        assert xq.shape == (2, 3)
+
+    @pytest.mark.asyncio
+    async def test_hybrid_async_sync_strategy_upserts_dense_and_sparse(self, encoder):
+        router = HybridRouter(
+            encoder=encoder,
+            sparse_encoder=TfidfEncoder(),
+            routes=[Route(name="greeting", utterances=["hello", "hi there"])],
+            index=HybridLocalIndex(),
+            auto_sync="local",
+            embedding_cache=LRUCache(max_entries=100),
+        )
+        encoder.calls.clear()
+        strategy = {
+            "remote": {
+                "upsert": [Utterance(route="greeting", utterance="hey")],
+                "delete": [],
+            },
+            "local": {"upsert": [], "delete": []},
+        }
+        await router._async_execute_sync_strategy(strategy)
+        assert encoder.calls == [["hey"]]
+        assert list(router.index.utterances) == ["hello", "hi there", "hey"]
+
+    def test_hybrid_repeated_query_hits_cache(self, encoder):
+        router = HybridRouter(
+            encoder=encoder,
+            sparse_encoder=TfidfEncoder(),
+            routes=[Route(name="greeting", utterances=["hello", "hi there"])],
+            index=HybridLocalIndex(),
+            auto_sync="local",
+            embedding_cache=LRUCache(max_entries=100),
+        )
+        encoder.calls.clear()
+        router("hello world")
+        router("hello world")
+        assert encoder.calls == [["hello world"]]
+
+    def test_no_cache_encodes_every_call(self, encoder):
+        router = SemanticRouter(encoder=encoder, index=LocalIndex())
+        encoder.calls.clear()
+        router._encode(["a"], input_type="queries")
+        router._encode(["a"], input_type="queries")
+        assert encoder.calls == [["a"], ["a"]]
+
+
+class TestSemanticCache:
+    def test_similar_vector_hits(self):
+        cache = SemanticCache(similarity_threshold=0.98)
+        cache.set([1.0, 0.0, 0.0], "a")
+        assert cache.get([1.0, 0.01, 0.0]) == "a"
+        assert cache.get([1.0, 1.0, 0.0]) is None
+        assert cache.stats()["hits"] == 1
+
+    def test_returns_most_similar(self):
+        cache = SemanticCache(similarity_threshold=0.9)
+        cache.set([1.0, 0.2], "a")
+        cache.set([1.0, 0.0], "b")
+        assert cache.get([1.0, 0.01]) == "b"
+
+    def test_context_isolation(self):
+        cache = SemanticCache()
+        cache.set([1.0, 0.0], "a", context="v1")
+        assert cache.get([1.0, 0.0], context="v2") is None
+        assert cache.get([1.0, 0.0], context="v1") == "a"
+
+    def test_evicts_oldest(self):
+        cache = SemanticCache(max_entries=2)
+        cache.set([1.0, 0.0, 0.0], "a")
+        cache.set([0.0, 1.0, 0.0], "b")
+        cache.set([0.0, 0.0, 1.0], "c")
+        assert len(cache) == 2
+        assert cache.get([1.0, 0.0, 0.0]) is None
+        assert cache.get([0.0, 0.0, 1.0]) == "c"
+
+
+class TestSQLiteCache:
+    def test_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "store.db")
+        store = SQLiteCache(path=path)
+        store.set_many([("a", np.array([0.1, 0.2])), ("b", np.array([0.3, 0.4]))])
+        store.close()
+        reopened = SQLiteCache(path=path)
+        a, missing, b = reopened.get_many(["a", "missing", "b"])
+        np.testing.assert_array_equal(a, [0.1, 0.2])
+        np.testing.assert_array_equal(b, [0.3, 0.4])
+        assert missing is None
+        assert reopened.hits == 2
+        assert reopened.misses == 1
+
+    def test_row_count_kept_without_scanning(self, tmp_path):
+        path = str(tmp_path / "store.db")
+        store = SQLiteCache(path=path, max_entries=3)
+        statements: List[str] = []
+        store._conn.set_trace_callback(statements.append)
+        store.set_many([("a", np.array([0.1])), ("b", np.array([0.2]))])
+        store.set_many([("a", np.array([0.3])), ("c", np.array([0.4]))])
+        store.set("d", np.array([0.5]))
+        store.delete("missing")
+        store.delete("c")
+        assert not any("COUNT" in statement for statement in statements)
+        assert len(store) == 2
+        store.close()
+        assert len(SQLiteCache(path=path)) == 2
+
+    def test_evicts_oldest_entries(self, tmp_path):
+        store = SQLiteCache(path=str(tmp_path / "store.db"), max_entries=2)
+        store.set("a", np.zeros(2))
+        store.set("b", np.zeros(2))
+        store.set("c", np.zeros(2))
+        assert len(store) == 2
+        assert store.get("a") is None
+
+    def test_prewarm_from_text_file(self, tmp_path, encoder):
+        texts = tmp_path / "texts.txt"
+        texts.write_text("hello\nhi there\n\nhello\n")
+        store = SQLiteCache(path=str(tmp_path / "store.db"))
+        assert store.prewarm(path=str(texts), encoder=encoder) == 2
+        encoder.calls.clear()
+        assert store.prewarm(path=str(texts), encoder=encoder) == 0
+        assert encoder.calls == []
+
+    def test_prewarm_from_router_config(self, tmp_path, encoder):
+        config = tmp_path / "router.yaml"
+        config.write_text(
+            "encoder_type: openai\n"
+            "encoder_name: text-embedding-3-small\n"
+            "routes:\n"
+            "- name: greeting\n"
+            "  utterances:\n"
+            "  - hello\n"
+            "  - hi there\n"
+        )
+        store = SQLiteCache(path=str(tmp_path / "store.db"))
+        assert store.prewarm(path=str(config), encoder=encoder) == 2
+
+    def test_router_restart_reuses_store(self, tmp_path, encoder):
+        path = str(tmp_path / "store.db")
+        routes = [Route(name="greeting", utterances=["hello", "hi there"])]
+        SemanticRouter(
+            encoder=encoder,
+            routes=routes,
+            index=LocalIndex(),
+            auto_sync="local",
+            embedding_store=SQLiteCache(path=path),
+        )
+        encoder.calls.clear()
+        router = SemanticRouter(
+            encoder=encoder,
+            routes=routes,
+            index=LocalIndex(),
+            auto_sync="local",
+            embedding_store=SQLiteCache(path=path),
+        )
+        # only the dimension probe of the index reaches the encoder
+        assert encoder.calls == [["test"]]
+        encoder.calls.clear()
+        router.evaluate(X=["hello", "hi there"], y=["greeting", "greeting"])
+        router.evaluate(X=["hello", "hi there"], y=["greeting", "greeting"])
+        assert encoder.calls == [["hello", "hi there"]]
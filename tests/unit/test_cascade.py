@@ -0,0 +1,218 @@
+import threading
+import time
+from typing import List
+
+import pytest
+
+from semantic_router.encoders import DenseEncoder, TfidfEncoder
+from semantic_router.index.local import LocalIndex
+from semantic_router.route import Route
+from semantic_router.routers import (
+    CascadeRouter,
+    RouterStage,
+    SemanticRouter,
+    SparseStage,
+)
+from semantic_router.routers.cascade import _fit_margin
+
+
+class SlowSparseStage(SparseStage):
+    builds: int = 0
+
+    def build(self, routes):
+        self.builds += 1
+        time.sleep(0.05)
+        super().build(routes)
+
+
+KEYWORDS = ["weather", "rain", "sunny", "politics", "election", "vote"]
+
+
+class KeywordEncoder(DenseEncoder):
+    calls: List[List[str]] = []
+
+    def __call__(self, docs: List[str]) -> List[List[float]]:
+        self.calls.append(list(docs))
+        return [
+            [float(word in doc.lower()) for word in KEYWORDS] + [0.1] for doc in docs
+        ]
+
+    async def acall(self, docs: List[str]) -> List[List[float]]:
+        return self(docs)
+
+
+@pytest.fixture
+def encoder():
+    return KeywordEncoder(name="keyword-encoder", calls=[], score_threshold=0.1)
+
+
+@pytest.fixture
+def routes():
+    return [
+        Route(
+            name="weather",
+            utterances=["what is the weather", "will it rain today", "is it sunny"],
+        ),
+        Route(
+            name="politics",
+            utterances=["who won the election", "how do I vote", "talk politics"],
+        ),
+    ]
+
+
+@pytest.fixture
+def router(encoder, routes):
+    return SemanticRouter(
+        encoder=encoder, routes=routes, index=LocalIndex(), auto_sync="local"
+    )
+
+
+@pytest.fixture
+def cascade(router):
+    return CascadeRouter(
+        router=router, stages=[SparseStage(encoder=TfidfEncoder(), margin=0.1)]
+    )
+
+
+class TestSparseStage:
+    def test_scores_keyword_overlap(self, routes):
+        stage = SparseStage(encoder=TfidfEncoder())
+        stage.build(routes)
+        scored = stage.score("will it rain tomorrow")
+        assert scored[0][0] == "weather"
+        assert stage.is_confident(scored)
+
+    def test_not_confident_without_overlap(self, routes):
+        stage = SparseStage(encoder=TfidfEncoder())
+        stage.build(routes)
+        assert stage.score("xyz") == []
+        assert not stage.is_confident(stage.score("xyz"))
+
+    def test_route_threshold(self, routes):
+        stage = SparseStage(encoder=TfidfEncoder())
+        routes[0].score_threshold = 100.0
+        stage.build(routes)
+        scored = stage.score("will it rain tomorrow")
+        assert scored[0][0] == "weather"
+        assert not stage.is_confident(scored)
+
+    def test_build_fits_a_copy_of_the_encoder(self, routes):
+        encoder = TfidfEncoder()
+        stage = SparseStage(encoder=encoder)
+        stage.build(routes)
+        assert encoder.word_index == {}
+        built = stage._built
+        stage.build(routes[:1])
+        # a query holding the previous build keeps a consistent encoder and index
+        assert built[0].word_index != stage._built[0].word_index
+        assert set(built[2]) == {"weather", "politics"}
+        assert set(stage._built[2]) == {"weather"}
+
+    def test_invalid_aggregation(self, routes):
+        stage = SparseStage(encoder=TfidfEncoder(), aggregation="median")
+        with pytest.raises(ValueError):
+            stage.build(routes)
+
+
+class TestCascadeRouter:
+    def test_confident_stage_skips_full_router(self, cascade, encoder):
+        encoder.calls.clear()
+        choice = cascade("will it rain tomorrow")
+        assert choice.name == "weather"
+        assert encoder.calls == []
+        assert cascade.stats()["stage_hits"] == [1]
+
+    def test_uncertain_query_escalates(self, cascade, encoder):
+        encoder.calls.clear()
+        cascade("tell me a joke")
+        assert len(encoder.calls) == 1
+        assert cascade.stats()["escalations"] == 1
+
+    def test_route_filter(self, cascade, encoder):
+        encoder.calls.clear()
+        choice = cascade("will it rain tomorrow", route_filter=["politics"])
+        assert choice.name is None
+        assert len(encoder.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_acall(self, cascade, encoder):
+        encoder.calls.clear()
+        choice = await cascade.acall("how do I vote")
+        assert choice.name == "politics"
+        assert encoder.calls == []
+
+    def test_router_stage(self, router, routes):
+        local = SemanticRouter(
+            encoder=KeywordEncoder(name="local", calls=[], score_threshold=0.1),
+            routes=routes,
+            index=LocalIndex(),
+            auto_sync="local",
+        )
+        cascade = CascadeRouter(router=router, stages=[RouterStage(router=local)])
+        router.encoder.calls.clear()
+        assert cascade("is it sunny").name == "weather"
+        assert router.encoder.calls == []
+
+    def test_stage_below_route_threshold_escalates(self, cascade, encoder):
+        cascade.router.set_threshold(100.0, route_name="weather")
+        encoder.calls.clear()
+        cascade("will it rain tomorrow")
+        assert len(encoder.calls) == 1
+        assert cascade.stats()["escalations"] == 1
+
+    def test_stages_rebuilt_after_router_change(self, cascade, encoder):
+        cascade.router.add(
+            Route(name="sports", utterances=["who won the football match"])
+        )
+        encoder.calls.clear()
+        assert cascade("football match tonight").name == "sports"
+        assert encoder.calls == []
+        cascade.router.delete("sports")
+        assert cascade("football match tonight").name != "sports"
+
+    def test_concurrent_queries_rebuild_stages_once(self, router):
+        stage = SlowSparseStage(encoder=TfidfEncoder())
+        cascade = CascadeRouter(router=router, stages=[stage])
+        router.add(Route(name="sports", utterances=["who won the football match"]))
+        results: List[str] = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(cascade("football match tonight").name)
+            )
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+        assert results == ["sports"] * 4
+        assert stage.builds == 2
+
+    def test_fit_learns_margin(self, cascade):
+        X = ["will it rain", "who won the vote", "sunny election", "rain politics"]
+        y = ["weather", "politics", "weather", "politics"]
+        cascade.fit(X=X, y=y)
+        assert cascade.stages[0].margin >= 0
+        assert cascade.evaluate(X=X, y=y) >= cascade.router.evaluate(X=X, y=y)
+
+    def test_evaluate_empty(self, cascade):
+        with pytest.raises(ValueError):
+            cascade.evaluate(X=[], y=[])
+
+
+class TestFitMargin:
+    def test_smallest_margin_matching_router(self):
+        scored = [
+            [("a", 0.9), ("b", 0.1)],
+            [("b", 0.6), ("a", 0.3)],
+            [("b", 0.5), ("a", 0.45)],
+        ]
+        y = ["a", "b", "a"]
+        # the least confident query is wrong while the router gets it right
+        assert _fit_margin(scored, y, [True, True, True], None) == pytest.approx(0.3)
+        # accepting every query is fine when the router gets it wrong too
+        assert _fit_margin(scored, y, [True, True, False], None) == pytest.approx(0.05)
+
+    def test_never_confident(self):
+        scored = [[("b", 0.9)]]
+        assert _fit_margin(scored, ["a"], [True], None) == float("inf")
@@ -0,0 +1,154 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from semantic_router.utils.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    concurrency_metrics,
+    get_concurrency_limiter,
+    is_overload_error,
+)
+
+
+class ProviderError(Exception):
+    def __init__(self, status_code: int):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+
+
+class TestAdaptiveConcurrencyLimiter:
+    def test_additive_increase_on_success(self):
+        limiter = AdaptiveConcurrencyLimiter(name="test", initial_limit=2)
+        for _ in range(4):
+            with limiter.slot():
+                pass
+        assert limiter.limit == 3
+        assert limiter.metrics()["requests"] == 4
+
+    def test_multiplicative_decrease_on_overload(self):
+        limiter = AdaptiveConcurrencyLimiter(name="test", initial_limit=8)
+        with pytest.raises(ProviderError):
+            with limiter.slot():
+                raise ProviderError(429)
+        assert limiter.limit == 4
+        assert limiter.metrics()["overloads"] == 1
+
+    def test_client_errors_do_not_change_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(name="test", initial_limit=8)
+        with pytest.raises(ProviderError):
+            with limiter.slot():
+                raise ProviderError(400)
+        assert limiter.limit == 8
+
+    def test_burst_of_429s_cuts_limit_once(self):
+        limiter = AdaptiveConcurrencyLimiter(name="test", initial_limit=8)
+        started = [limiter.acquire() for _ in range(4)]
+        for started_at in started:
+            limiter.release(started_at, ProviderError(429))
+        assert limiter.limit == 4
+        assert limiter.in_flight == 0
+
+    def test_slow_requests_count_as_overload(self):
+        limiter = AdaptiveConcurrencyLimiter(
+            name="test", initial_limit=8, latency_tolerance=3.0
+        )
+        limiter.release(limiter.acquire())
+        started_at = limiter.acquire()
+        limiter.release(started_at - 10.0)
+        assert limiter.limit < 8
+
+    def test_slow_requests_ignored_by_default(self):
+        limiter = AdaptiveConcurrencyLimiter(name="test", initial_limit=8)
+        limiter.release(limiter.acquire())
+        started_at = limiter.acquire()
+        limiter.release(started_at - 10.0)
+        assert limiter.limit >= 8
+        assert limiter.overloads == 0
+
+    def test_limit_bounds(self):
+        limiter = AdaptiveConcurrencyLimiter(
+            name="test", initial_limit=1, min_limit=1, max_limit=2
+        )
+        limiter.release(limiter.acquire(), ProviderError(503))
+        assert limiter.limit == 1
+        for _ in range(10):
+            limiter.release(limiter.acquire())
+        assert limiter.limit == 2
+
+    def test_threads_wait_for_free_slot(self):
+        limiter = AdaptiveConcurrencyLimiter(
+            name="test", initial_limit=2, max_limit=2, latency_tolerance=None
+        )
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def work():
+            nonlocal active, peak
+            with limiter.slot():
+                with lock:
+                    active += 1
+                    peak = max(peak, active)
+                time.sleep(0.01)
+                with lock:
+                    active -= 1
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert peak == 2
+        assert limiter.in_flight == 0
+        assert limiter.queue_depth == 0
+
+    @pytest.mark.asyncio
+    async def test_coroutines_queue_for_free_slot(self):
+        limiter = AdaptiveConcurrencyLimiter(
+            name="test", initial_limit=1, max_limit=1, latency_tolerance=None
+        )
+        order = []
+
+        async def work(i: int):
+            async with limiter.aslot():
+                order.append(i)
+                await asyncio.sleep(0.01)
+
+        first = asyncio.create_task(work(0))
+        await asyncio.sleep(0)
+        rest = [asyncio.create_task(work(i)) for i in range(1, 4)]
+        await asyncio.sleep(0)
+        assert limiter.queue_depth == 3
+        await asyncio.gather(first, *rest)
+        assert order == [0, 1, 2, 3]
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_frees_its_place(self):
+        limiter = AdaptiveConcurrencyLimiter(name="test", initial_limit=1, max_limit=1)
+        started_at = await limiter.aacquire()
+        waiter = asyncio.create_task(limiter.aacquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert limiter.queue_depth == 0
+        limiter.release(started_at)
+        assert limiter.in_flight == 0
+
+
+def test_is_overload_error():
+    assert is_overload_error(ProviderError(429))
+    assert is_overload_error(ProviderError(502))
+    assert not is_overload_error(ProviderError(404))
+    assert not is_overload_error(ValueError("bad input"))
+
+
+def test_shared_limiters_expose_metrics():
+    limiter = get_concurrency_limiter("test/shared", initial_limit=3)
+    assert get_concurrency_limiter("test/shared") is limiter
+    metrics = concurrency_metrics()["test/shared"]
+    assert metrics["limit"] == 3
+    assert metrics["queue_depth"] == 0
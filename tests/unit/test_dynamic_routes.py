@@ -0,0 +1,161 @@
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+from semantic_router.cache import LRUCache
+from semantic_router.encoders import DenseEncoder
+from semantic_router.index.local import LocalIndex
+from semantic_router.llms import BaseLLM
+from semantic_router.route import Route
+from semantic_router.routers import SemanticRouter
+
+
+class RankingEncoder(DenseEncoder):
+    """Ranks routes with shorter names closer to the query "query"."""
+
+    def __call__(self, docs: List[str]) -> List[List[float]]:
+        return [
+            [1.0, 0.0] if doc == "query" else [1.0, 0.1 * len(doc.split()[0])]
+            for doc in docs
+        ]
+
+    async def acall(self, docs: List[str]) -> List[List[float]]:
+        return self(docs)
+
+
+class SlowLLM(BaseLLM):
+    delay: float = 0.05
+    running: int = 0
+    max_running: int = 0
+    calls: int = 0
+
+    def extract_function_inputs(
+        self, query: str, function_schemas: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        self.calls += 1
+        return [{"function_name": function_schemas[0]["name"], "arguments": {}}]
+
+    async def async_extract_function_inputs(
+        self, query: str, function_schemas: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        # later routes finish first to check the results keep the score order
+        await asyncio.sleep(self.delay / len(function_schemas[0]["name"]))
+        self.running -= 1
+        return self.extract_function_inputs(query, function_schemas)
+
+
+@pytest.fixture
+def llm():
+    return SlowLLM(name="slow-llm")
+
+
+@pytest.fixture
+def router(llm):
+    routes = [
+        Route(
+            name=name,
+            utterances=[f"{name} utterance"],
+            function_schemas=[{"name": name}] if name != "static" else None,
+            llm=llm if name != "static" else None,
+        )
+        for name in ["a", "bb", "ccc", "static"]
+    ]
+    return SemanticRouter(
+        encoder=RankingEncoder(name="ranking"),
+        routes=routes,
+        index=LocalIndex(),
+        auto_sync="local",
+        top_k=4,
+    )
+
+
+class TestConcurrentDynamicRoutes:
+    @pytest.mark.asyncio
+    async def test_dynamic_routes_run_concurrently(self, router, llm):
+        choices = await router.acall("query", limit=None)
+        assert [c.name for c in choices] == ["a", "bb", "ccc", "static"]
+        assert llm.max_running == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, router, llm):
+        router.max_concurrent_routes = 1
+        await router.acall("query", limit=None)
+        assert llm.max_running == 1
+
+    @pytest.mark.asyncio
+    async def test_limit_skips_extra_llm_calls(self, router, llm):
+        choices = await router.acall("query", limit=2)
+        assert [c.name for c in choices] == ["a", "bb"]
+        assert llm.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_astream_yields_static_routes_first(self, router):
+        names = [choice.name async for choice in router.astream("query")]
+        assert sorted(names) == ["a", "bb", "ccc", "static"]
+        assert names[0] == "static"
+
+
+class TestFunctionCache:
+    @pytest.fixture
+    def route(self, llm):
+        return Route(
+            name="get_time",
+            utterances=["what time is it"],
+            function_schemas=[{"name": "get_time"}],
+            llm=llm,
+            function_cache=LRUCache(max_entries=10),
+        )
+
+    def test_repeated_query_is_cached(self, route, llm):
+        first = route("what time is it in Rome")
+        second = route(" what time is it  in Rome ")
+        assert llm.calls == 1
+        assert first == second
+        second.function_call[0]["arguments"]["mutated"] = True
+        assert (
+            "mutated"
+            not in route("what time is it in Rome").function_call[0]["arguments"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_acall_shares_cache(self, route, llm):
+        route("what time is it in Rome")
+        await route.acall("what time is it in Rome")
+        assert llm.calls == 1
+
+    def test_bypass(self, route, llm):
+        route("what time is it in Rome")
+        route("what time is it in Rome", use_cache=False)
+        assert llm.calls == 2
+
+    def test_key_includes_schema_and_llm(self, route, llm):
+        route("what time is it in Rome")
+        route.function_schemas = [{"name": "get_time", "description": "new"}]
+        route("what time is it in Rome")
+        route.llm = SlowLLM(name="other-llm")
+        route("what time is it in Rome")
+        assert llm.calls == 2
+        assert route.llm.calls == 1
+
+    def test_not_serialized(self, route):
+        assert "function_cache" not in route.to_dict()
+
+    def test_router_bypass(self, router, llm):
+        for route in router.routes:
+            route.function_cache = LRUCache(max_entries=10)
+        router("query")
+        router("query")
+        assert llm.calls == 1
+        router("query", use_function_cache=False)
+        assert llm.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_router_acall_bypass(self, router, llm):
+        for route in router.routes:
+            route.function_cache = LRUCache(max_entries=10)
+        await router.acall("query", limit=None)
+        await router.acall("query", limit=None, use_function_cache=False)
+        assert llm.calls == 6
@@ -0,0 +1,200 @@
+from typing import List
+
+import pytest
+
+from semantic_router.cache import LRUCache, SemanticCache
+from semantic_router.encoders import DenseEncoder
+from semantic_router.index.local import LocalIndex
+from semantic_router.route import Route
+from semantic_router.routers import SemanticRouter
+
+
+class CountingEncoder(DenseEncoder):
+    calls: List[List[str]] = []
+
+    def __call__(self, docs: List[str]) -> List[List[float]]:
+        self.calls.append(list(docs))
+        return [[float(len(doc)), 1.0, 0.5] for doc in docs]
+
+    async def acall(self, docs: List[str]) -> List[List[float]]:
+        return self(docs)
+
+
+@pytest.fixture
+def encoder():
+    return CountingEncoder(name="counting-encoder", calls=[], score_threshold=0.5)
+
+
+@pytest.fixture
+def router(encoder):
+    routes = [
+        Route(name="greeting", utterances=["hello", "hi there"]),
+        Route(name="farewell", utterances=["goodbye", "see you later"]),
+    ]
+    return SemanticRouter(
+        encoder=encoder, routes=routes, index=LocalIndex(), auto_sync="local"
+    )
+
+
+@pytest.fixture
+def exact_router(router):
+    router.exact_match = True
+    return router
+
+
+class TestExactMatch:
+    def test_disabled_by_default(self, router, encoder):
+        encoder.calls.clear()
+        router("hello")
+        assert len(encoder.calls) == 1
+
+    def test_exact_match_skips_encoding(self, exact_router, encoder):
+        encoder.calls.clear()
+        assert exact_router(" hi \n there ").name == "greeting"
+        assert encoder.calls == []
+
+    @pytest.mark.asyncio
+    async def test_acall(self, exact_router, encoder):
+        encoder.calls.clear()
+        assert (await exact_router.acall("goodbye")).name == "farewell"
+        assert encoder.calls == []
+
+    def test_route_filter(self, exact_router, encoder):
+        encoder.calls.clear()
+        exact_router("goodbye", route_filter=["greeting"])
+        assert len(encoder.calls) == 1
+
+    def test_shared_utterance_returns_all_routes(self, exact_router):
+        exact_router.add(Route(name="polite", utterances=["hello"]))
+        choices = exact_router("hello", limit=None)
+        assert sorted(choice.name for choice in choices) == ["greeting", "polite"]
+
+    def test_follows_route_changes(self, exact_router, encoder):
+        exact_router.add(Route(name="thanks", utterances=["thank you"]))
+        encoder.calls.clear()
+        assert exact_router("thank you").name == "thanks"
+        assert encoder.calls == []
+        exact_router.delete("thanks")
+        exact_router("thank you")
+        assert len(encoder.calls) == 1
+
+    def test_table_built_on_write(self, exact_router):
+        exact_router.add(Route(name="thanks", utterances=["thank you"]))
+        exact_matches = exact_router._get_state().exact_matches
+        assert exact_matches["thank you"] == ["thanks"]
+        # queries look text up in the published table without rebuilding it
+        exact_router("thank you")
+        assert exact_router._get_state().exact_matches is exact_matches
+
+    def test_disabled(self, exact_router, encoder):
+        exact_router.exact_match = False
+        encoder.calls.clear()
+        exact_router("hello")
+        assert len(encoder.calls) == 1
+
+
+@pytest.fixture
+def cached_router(encoder):
+    routes = [
+        Route(name="greeting", utterances=["hello", "hi there"]),
+        Route(name="farewell", utterances=["goodbye", "see you later"]),
+    ]
+    return SemanticRouter(
+        encoder=encoder,
+        routes=routes,
+        index=LocalIndex(),
+        auto_sync="local",
+        decision_cache=LRUCache(max_entries=100),
+    )
+
+
+class TestDecisionCache:
+    def test_repeated_query_is_cached(self, cached_router, encoder):
+        encoder.calls.clear()
+        first = cached_router("hey there")
+        second = cached_router(" hey  there ")
+        assert len(encoder.calls) == 1
+        assert first == second
+        assert second is not first
+        assert cached_router.decision_cache.hits == 1
+
+    def test_key_includes_filter_and_limit(self, cached_router, encoder):
+        encoder.calls.clear()
+        cached_router("hey there")
+        cached_router("hey there", route_filter=["farewell"])
+        cached_router("hey there", limit=None)
+        assert len(encoder.calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_acall_shares_cache(self, cached_router, encoder):
+        encoder.calls.clear()
+        cached_router("hey there")
+        await cached_router.acall("hey there")
+        assert len(encoder.calls) == 1
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            lambda router: router.set_threshold(0.9),
+            lambda router: router.update(name="greeting", threshold=0.2),
+            lambda router: router.add(Route(name="thanks", utterances=["thanks"])),
+            lambda router: router.delete("farewell"),
+        ],
+    )
+    def test_invalidated_on_change(self, cached_router, encoder, change):
+        cached_router("hey there")
+        change(cached_router)
+        encoder.calls.clear()
+        cached_router("hey there")
+        assert len(encoder.calls) == 1
+
+    def test_dynamic_routes_not_cached(self, cached_router):
+        for route in cached_router.routes:
+            route.function_schemas = [{"name": route.name}]
+        cached_router("hey there", simulate_static=True)
+        assert len(cached_router.decision_cache) == 0
+
+
+class TestSemanticCache:
+    @pytest.fixture
+    def semantic_router(self, encoder):
+        routes = [
+            Route(name="greeting", utterances=["hello", "hi there"]),
+            Route(name="farewell", utterances=["goodbye", "see you later"]),
+        ]
+        return SemanticRouter(
+            encoder=encoder,
+            routes=routes,
+            index=LocalIndex(),
+            auto_sync="local",
+            semantic_cache=SemanticCache(similarity_threshold=0.999),
+        )
+
+    def test_near_duplicate_skips_index(self, semantic_router, mocker):
+        query_spy = mocker.spy(LocalIndex, "query")
+        first = semantic_router("hey there")
+        # same length, so the counting encoder gives an identical embedding
+        second = semantic_router("hey where")
+        assert query_spy.call_count == 1
+        assert first == second
+        assert semantic_router.semantic_cache.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_acall(self, semantic_router, mocker):
+        query_spy = mocker.spy(LocalIndex, "aquery")
+        await semantic_router.acall("hey there")
+        await semantic_router.acall("hey where")
+        assert query_spy.call_count == 1
+
+    def test_invalidated_on_threshold_change(self, semantic_router, mocker):
+        query_spy = mocker.spy(LocalIndex, "query")
+        semantic_router("hey there")
+        semantic_router.set_threshold(0.1)
+        semantic_router("hey where")
+        assert query_spy.call_count == 2
+
+    def test_dynamic_routes_not_cached_by_default(self, semantic_router):
+        for route in semantic_router.routes:
+            route.function_schemas = [{"name": route.name}]
+        semantic_router("hey there", simulate_static=True)
+        assert len(semantic_router.semantic_cache) == 0
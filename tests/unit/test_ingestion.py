@@ -0,0 +1,180 @@
+import json
+import threading
+from typing import List
+
+import numpy as np
+import pytest
+
+from semantic_router.encoders import DenseEncoder
+from semantic_router.index.local import LocalIndex
+from semantic_router.route import Route
+from semantic_router.routers import SemanticRouter
+from semantic_router.utils.ingestion import (
+    IngestionCheckpoint,
+    aingest,
+    fingerprint,
+    ingest,
+)
+
+
+class CountingEncoder(DenseEncoder):
+    calls: List[List[str]] = []
+
+    def __call__(self, docs: List[str]) -> List[List[float]]:
+        self.calls.append(list(docs))
+        return [[float(len(doc)), 1.0, 0.5] for doc in docs]
+
+    async def acall(self, docs: List[str]) -> List[List[float]]:
+        return self(docs)
+
+
+class Recorder:
+    """Records the batches encoded and added, tracking how far encoding runs
+    ahead of adding.
+    """
+
+    def __init__(self, fail_on: int | None = None):
+        self.encoded = 0
+        self.added: List[List[int]] = []
+        self.max_ahead = 0
+        self.fail_on = fail_on
+        self._lock = threading.Lock()
+
+    def encode(self, batch: List[int]) -> List[int]:
+        with self._lock:
+            self.encoded += 1
+            self.max_ahead = max(self.max_ahead, self.encoded - len(self.added))
+        return [x * 2 for x in batch]
+
+    def add(self, batch: List[int], embeddings: List[int]):
+        assert embeddings == [x * 2 for x in batch]
+        if self.fail_on is not None and self.fail_on in batch:
+            raise RuntimeError("upsert failed")
+        with self._lock:
+            self.added.append(batch)
+
+    async def aencode(self, batch: List[int]) -> List[int]:
+        return self.encode(batch)
+
+    async def aadd(self, batch: List[int], embeddings: List[int]):
+        self.add(batch, embeddings)
+
+
+class TestIngest:
+    def test_batches_added_in_order_with_progress(self):
+        recorder = Recorder()
+        progress = []
+        ingest(
+            list(range(10)),
+            recorder.encode,
+            recorder.add,
+            batch_size=3,
+            progress_callback=lambda done, total: progress.append((done, total)),
+        )
+        assert recorder.added == [[0, 1, 2], [3, 4, 5], [6, 7, 8], [9]]
+        assert progress == [(3, 10), (6, 10), (9, 10), (10, 10)]
+
+    def test_encoding_bounded_by_queue(self):
+        recorder = Recorder()
+        ingest(
+            list(range(100)),
+            recorder.encode,
+            recorder.add,
+            batch_size=1,
+            queue_size=2,
+            workers=3,
+        )
+        assert sorted(x for batch in recorder.added for x in batch) == list(range(100))
+        # queued batches, batches being added, and the batch being encoded
+        assert recorder.max_ahead <= 2 + 3 + 1
+
+    def test_add_error_raised(self):
+        recorder = Recorder(fail_on=5)
+        with pytest.raises(RuntimeError, match="upsert failed"):
+            ingest(list(range(100)), recorder.encode, recorder.add, batch_size=2)
+        assert recorder.encoded < 50
+
+    def test_resume_from_checkpoint(self, tmp_path):
+        path = str(tmp_path / "ingest.json")
+        items = list(range(10))
+
+        def checkpoint():
+            return IngestionCheckpoint(
+                path, fingerprint([str(x) for x in items]), batch_size=2
+            )
+
+        failing = Recorder(fail_on=6)
+        with pytest.raises(RuntimeError):
+            ingest(items, failing.encode, failing.add, 2, checkpoint=checkpoint())
+        with open(path) as f:
+            assert json.load(f)["completed"] == [0, 1, 2]
+
+        recorder = Recorder()
+        progress = []
+        ingest(
+            items,
+            recorder.encode,
+            recorder.add,
+            2,
+            progress_callback=lambda done, total: progress.append(done),
+            checkpoint=checkpoint(),
+        )
+        assert recorder.added == [[6, 7], [8, 9]]
+        assert progress == [6, 8, 10]
+        assert not (tmp_path / "ingest.json").exists()
+
+    def test_checkpoint_of_other_items_ignored(self, tmp_path):
+        path = str(tmp_path / "ingest.json")
+        IngestionCheckpoint(path, fingerprint(["a"]), batch_size=2).complete(0)
+        checkpoint = IngestionCheckpoint(path, fingerprint(["b"]), batch_size=2)
+        assert checkpoint.completed == set()
+
+    @pytest.mark.asyncio
+    async def test_aingest(self):
+        recorder = Recorder()
+        progress = []
+        await aingest(
+            list(range(10)),
+            recorder.aencode,
+            recorder.aadd,
+            batch_size=3,
+            progress_callback=lambda done, total: progress.append(done),
+        )
+        assert recorder.added == [[0, 1, 2], [3, 4, 5], [6, 7, 8], [9]]
+        assert progress == [3, 6, 9, 10]
+
+    @pytest.mark.asyncio
+    async def test_aingest_add_error_raised(self):
+        recorder = Recorder(fail_on=5)
+        with pytest.raises(RuntimeError, match="upsert failed"):
+            await aingest(
+                list(range(100)), recorder.aencode, recorder.aadd, batch_size=2
+            )
+        assert recorder.encoded < 50
+
+
+class TestRouterAdd:
+    def test_add_in_batches(self):
+        encoder = CountingEncoder(name="counting-encoder", calls=[])
+        router = SemanticRouter(encoder=encoder, index=LocalIndex(), auto_sync="local")
+        encoder.calls.clear()
+        progress = []
+        routes = [
+            Route(name=f"route{i}", utterances=[f"utterance {i}.{j}" for j in range(3)])
+            for i in range(4)
+        ]
+        router.add(
+            routes,
+            batch_size=5,
+            progress_callback=lambda done, total: progress.append((done, total)),
+        )
+        assert [len(call) for call in encoder.calls] == [5, 5, 2]
+        assert progress == [(5, 12), (10, 12), (12, 12)]
+        assert list(router.index.utterances) == [
+            utt for route in routes for utt in route.utterances
+        ]
+        assert np.array_equal(
+            router.index.index[:, 0],
+            [len(utt) for route in routes for utt in route.utterances],
+        )
+        assert router.list_route_names() == [f"route{i}" for i in range(4)]
@@ -0,0 +1,326 @@
+import asyncio
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from semantic_router.index import pinecone
+from semantic_router.index.pinecone import (
+    DELETE_BATCH_SIZE,
+    FETCH_BATCH_SIZE,
+    MAX_CONCURRENT_FETCHES,
+    PineconeIndex,
+)
+
+IDS = [f"route{i % 3}#{i:04d}" for i in range(250)]
+
+
+def _metadata(id: str) -> Dict[str, Any]:
+    return {"sr_route": id.split("#")[0], "sr_utterance": id}
+
+
+class ApiError(Exception):
+    def __init__(self, status: int):
+        super().__init__(f"status {status}")
+        self.status = status
+
+
+class FakeIndex:
+    """Serves list, fetch, upsert and delete calls like a Pinecone index, recording
+    the batches sent and how many requests run at once. Upserts raise the queued
+    `failures` first.
+    """
+
+    def __init__(self, ids: List[str], page_size: int = 100):
+        self.ids = list(ids)
+        self.page_size = page_size
+        self.fetched: List[List[str]] = []
+        self.upserted: List[List[dict]] = []
+        self.deleted: List[List[str]] = []
+        self.failures: List[Exception] = []
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _request(self):
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            time.sleep(0.01)
+            yield
+        finally:
+            with self._lock:
+                self.running -= 1
+
+    def list(self, prefix=None, namespace=None):
+        ids = [id for id in self.ids if prefix is None or id.startswith(prefix)]
+        for i in range(0, len(ids), self.page_size):
+            yield ids[i : i + self.page_size]
+
+    def fetch(self, ids, namespace=None):
+        with self._request(), self._lock:
+            self.fetched.append(list(ids))
+        return {
+            "vectors": {
+                id: {"id": id, "values": [0.1], "metadata": _metadata(id)}
+                for id in ids
+                if id in self.ids
+            }
+        }
+
+    def upsert(self, vectors, namespace=None):
+        with self._request(), self._lock:
+            if self.failures:
+                raise self.failures.pop(0)
+            self.upserted.append(vectors)
+
+    def delete(self, ids, namespace=None):
+        with self._request(), self._lock:
+            self.deleted.append(list(ids))
+            self.ids = [id for id in self.ids if id not in set(ids)]
+
+
+def _pinecone_index(index: Any = None, host: str = "") -> PineconeIndex:
+    # async methods call the data plane at `host`, only checking the index is set
+    return PineconeIndex.model_construct(
+        index=index or FakeIndex([]), namespace="", host=host, headers={}
+    )
+
+
+@pytest_asyncio.fixture
+async def pinecone_server(unused_tcp_port):
+    """A local Pinecone data plane serving the list, fetch, upsert and delete
+    endpoints. Upserts fail with a server error `fail_upserts` times first.
+    """
+    ids = IDS[:]
+    stats: Dict[str, Any] = {
+        "fetched": [],
+        "upserted": [],
+        "deleted": [],
+        "fail_upserts": 0,
+        "running": 0,
+        "max_running": 0,
+        "peers": set(),
+    }
+
+    async def list_vectors(request: web.Request) -> web.Response:
+        stats["peers"].add(request.transport.get_extra_info("peername"))
+        start = int(request.query.get("paginationToken", 0))
+        prefix = request.query.get("prefix", "")
+        matched = [id for id in ids if id.startswith(prefix)]
+        body: Dict[str, Any] = {
+            "vectors": [{"id": id} for id in matched[start : start + 100]]
+        }
+        if start + 100 < len(matched):
+            body["pagination"] = {"next": str(start + 100)}
+        return web.json_response(body)
+
+    async def fetch_vectors(request: web.Request) -> web.Response:
+        batch = request.query.getall("ids")
+        stats["fetched"].append(batch)
+        stats["running"] += 1
+        stats["max_running"] = max(stats["max_running"], stats["running"])
+        await asyncio.sleep(0.01)
+        stats["running"] -= 1
+        vectors = {
+            id: {"id": id, "values": [0.1], "metadata": _metadata(id)}
+            for id in batch
+            if id in ids
+        }
+        return web.json_response({"vectors": vectors})
+
+    async def upsert_vectors(request: web.Request) -> web.Response:
+        if stats["fail_upserts"]:
+            stats["fail_upserts"] -= 1
+            return web.json_response({"error": "unavailable"}, status=503)
+        vectors = (await request.json())["vectors"]
+        stats["upserted"].append([vector["id"] for vector in vectors])
+        return web.json_response({"upsertedCount": len(vectors)})
+
+    async def delete_vectors(request: web.Request) -> web.Response:
+        batch = (await request.json())["ids"]
+        stats["deleted"].append(batch)
+        ids[:] = [id for id in ids if id not in set(batch)]
+        return web.json_response({})
+
+    app = web.Application()
+    app.router.add_get("/vectors/list", list_vectors)
+    app.router.add_get("/vectors/fetch", fetch_vectors)
+    app.router.add_post("/vectors/upsert", upsert_vectors)
+    app.router.add_post("/vectors/delete", delete_vectors)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", unused_tcp_port)
+    await site.start()
+    yield f"http://127.0.0.1:{unused_tcp_port}", stats
+    await runner.cleanup()
+
+
+class TestGetAll:
+    def test_metadata_fetched_in_batches(self):
+        fake = FakeIndex(IDS, page_size=60)
+        ids, metadata = _pinecone_index(index=fake)._get_all(include_metadata=True)
+        assert ids == IDS
+        assert metadata == [_metadata(id) for id in IDS]
+        assert sorted(len(batch) for batch in fake.fetched) == [10, 60, 60, 60, 60]
+        assert 1 < fake.max_running <= MAX_CONCURRENT_FETCHES
+
+    def test_large_pages_split_into_fetch_batches(self):
+        fake = FakeIndex(IDS, page_size=250)
+        _, metadata = _pinecone_index(index=fake)._get_all(include_metadata=True)
+        assert metadata == [_metadata(id) for id in IDS]
+        assert max(len(batch) for batch in fake.fetched) == FETCH_BATCH_SIZE
+
+    def test_ids_without_metadata(self):
+        fake = FakeIndex(IDS)
+        ids, metadata = _pinecone_index(index=fake)._get_all(prefix="route1#")
+        assert ids == [id for id in IDS if id.startswith("route1#")]
+        assert metadata == []
+        assert fake.fetched == []
+
+    @pytest.mark.asyncio
+    async def test_async_metadata_fetched_in_batches(self, pinecone_server):
+        host, stats = pinecone_server
+        async with _pinecone_index(host=host) as index:
+            ids, metadata = await index._async_get_all(include_metadata=True)
+        assert ids == IDS
+        assert metadata == [_metadata(id) for id in IDS]
+        assert sorted(len(batch) for batch in stats["fetched"]) == [50, 100, 100]
+        assert stats["max_running"] <= MAX_CONCURRENT_FETCHES
+
+
+class TestAsyncSession:
+    @pytest.mark.asyncio
+    async def test_session_reused_across_requests(self, pinecone_server):
+        host, stats = pinecone_server
+        async with _pinecone_index(host=host) as index:
+            session = index._get_async_session()
+            await index._async_get_all(prefix="route1#")
+            await index._async_get_all(prefix="route2#")
+            assert index._get_async_session() is session
+        # the list requests shared one kept alive connection
+        assert len(stats["peers"]) == 1
+        assert session.closed
+        assert index._async_session is None
+
+    @pytest.mark.asyncio
+    async def test_session_reopened_after_aclose(self, pinecone_server):
+        host, _ = pinecone_server
+        index = _pinecone_index(host=host)
+        first = index._get_async_session()
+        await index.aclose()
+        assert first.closed
+        ids, _ = await index._async_get_all(prefix="route0#")
+        assert ids == [id for id in IDS if id.startswith("route0#")]
+        assert index._async_session is not first
+        await index.aclose()
+
+    def test_local_host_resolved_against_base_url(self):
+        index = _pinecone_index(host="localhost:5081")
+        index.base_url = "http://pinecone:5080"
+        assert index._get_async_host() == "http://pinecone:5081"
+        index = _pinecone_index(host="my-index.svc.pinecone.io")
+        index.base_url = "https://api.pinecone.io"
+        assert index._get_async_host() == "https://my-index.svc.pinecone.io"
+        with pytest.raises(ValueError, match="host is not initialized"):
+            _pinecone_index()._get_async_host()
+
+
+@pytest.fixture
+def no_retry_delay(monkeypatch):
+    monkeypatch.setattr(pinecone, "RETRY_BASE_DELAY", 0.0)
+
+
+def _records(count: int, batch_size: int) -> Dict[str, Any]:
+    return dict(
+        embeddings=[[float(i), 1.0] for i in range(count)],
+        routes=[f"route{i % 3}" for i in range(count)],
+        utterances=[f"utterance {i}" for i in range(count)],
+        metadata_list=[{}] * count,
+        batch_size=batch_size,
+    )
+
+
+class TestBatchWrites:
+    def test_add_upserts_batches_concurrently(self):
+        fake = FakeIndex([])
+        index = _pinecone_index(index=fake)
+        index.add(**_records(95, batch_size=10))
+        assert sorted(len(batch) for batch in fake.upserted) == [5] + [10] * 9
+        assert 1 < fake.max_running <= index.batch_concurrency
+
+    def test_failed_batch_retried(self, no_retry_delay):
+        fake = FakeIndex([])
+        fake.failures = [ApiError(503), ApiError(429)]
+        index = _pinecone_index(index=fake)
+        index.add(**_records(10, batch_size=10))
+        assert len(fake.upserted) == 1
+
+    def test_client_error_not_retried(self, no_retry_delay):
+        fake = FakeIndex([])
+        fake.failures = [ApiError(400)]
+        index = _pinecone_index(index=fake)
+        with pytest.raises(ApiError):
+            index.add(**_records(10, batch_size=10))
+        assert fake.upserted == []
+
+    def test_retries_exhausted(self, no_retry_delay):
+        fake = FakeIndex([])
+        fake.failures = [ApiError(503)] * 3
+        index = _pinecone_index(index=fake)
+        index.max_retries = 2
+        with pytest.raises(ApiError):
+            index.add(**_records(10, batch_size=10))
+
+    def test_delete_routes_in_max_size_batches(self):
+        ids = [f"route{i % 3}#{i:04d}" for i in range(3600)]
+        fake = FakeIndex(ids)
+        deleted = _pinecone_index(index=fake).delete_routes(["route0", "route2"])
+        assert sorted(deleted) == sorted(
+            id for id in ids if not id.startswith("route1#")
+        )
+        assert sorted(len(batch) for batch in fake.deleted) == [400, 1000, 1000]
+        assert all(id.startswith("route1#") for id in fake.ids)
+
+    def test_remove_and_sync_deletes_utterances(self):
+        fake = FakeIndex(IDS)
+        _pinecone_index(index=fake)._remove_and_sync(
+            {"route0": [IDS[0], IDS[3]], "route1": [IDS[1]], "route2": []}
+        )
+        assert sorted(fake.deleted[0]) == sorted([IDS[0], IDS[1], IDS[3]])
+        assert len(fake.ids) == len(IDS) - 3
+
+    @pytest.mark.asyncio
+    async def test_async_add_retries_failed_batches(
+        self, pinecone_server, no_retry_delay
+    ):
+        host, stats = pinecone_server
+        stats["fail_upserts"] = 2
+        async with _pinecone_index(host=host) as index:
+            await index.aadd(**_records(25, batch_size=10))
+        assert sorted(len(batch) for batch in stats["upserted"]) == [5, 10, 10]
+
+    @pytest.mark.asyncio
+    async def test_async_delete_routes(self, pinecone_server):
+        host, stats = pinecone_server
+        async with _pinecone_index(host=host) as index:
+            deleted = await index.adelete_routes(["route0", "route1"])
+            remaining, _ = await index._async_get_all()
+        assert sorted(deleted) == sorted(
+            id for id in IDS if not id.startswith("route2#")
+        )
+        assert all(len(batch) <= DELETE_BATCH_SIZE for batch in stats["deleted"])
+        assert remaining == [id for id in IDS if id.startswith("route2#")]
+
+    @pytest.mark.asyncio
+    async def test_async_remove_and_sync(self, pinecone_server):
+        host, stats = pinecone_server
+        async with _pinecone_index(host=host) as index:
+            await index._async_remove_and_sync({"route0": [IDS[0]], "route2": [IDS[2]]})
+        assert sorted(stats["deleted"][0]) == [IDS[0], IDS[2]]
@@ -0,0 +1,186 @@
+import asyncio
+import threading
+from typing import Any, List
+
+import pytest
+
+from semantic_router.cache import LRUCache
+from semantic_router.encoders import DenseEncoder
+from semantic_router.index.local import LocalIndex
+from semantic_router.route import Route
+from semantic_router.routers import SemanticRouter
+
+
+class GatedEncoder(DenseEncoder):
+    """Encodes by length, waiting for the gate before encoding "slow" documents and
+    failing on "boom" documents.
+    """
+
+    gate: Any = None
+    entered: Any = None
+
+    def __call__(self, docs: List[str]) -> List[List[float]]:
+        if any(doc.startswith("boom") for doc in docs):
+            raise RuntimeError("encoding failed")
+        if self.gate is not None and any(doc.startswith("slow") for doc in docs):
+            self.entered.set()
+            self.gate.wait(timeout=5)
+        return [[float(len(doc)), 1.0, 0.5] for doc in docs]
+
+    async def acall(self, docs: List[str]) -> List[List[float]]:
+        return self(docs)
+
+
+class ServingIndex(LocalIndex):
+    """A local index type distinct from the one used during local fitting."""
+
+
+@pytest.fixture
+def router():
+    encoder = GatedEncoder(name="gated-encoder", score_threshold=0.5)
+    routes = [
+        Route(name="greeting", utterances=["hello", "hi there"]),
+        Route(name="farewell", utterances=["goodbye", "see you later"]),
+    ]
+    return SemanticRouter(
+        encoder=encoder, routes=routes, index=ServingIndex(), auto_sync="local"
+    )
+
+
+class TestCopyOnWrite:
+    def test_queries_served_during_add(self, router):
+        router.encoder.gate, router.encoder.entered = (
+            threading.Event(),
+            threading.Event(),
+        )
+        served = router._get_state()
+        writer = threading.Thread(
+            target=router.add, args=(Route(name="slow", utterances=["slow one"]),)
+        )
+        writer.start()
+        try:
+            assert router.encoder.entered.wait(timeout=5)
+            # the add is still encoding, queries see the previous state
+            assert router._get_state() is served
+            assert router(vector=[5.0, 1.0, 0.5]).name == "greeting"
+            assert router.list_route_names() == ["greeting", "farewell"]
+        finally:
+            router.encoder.gate.set()
+            writer.join(timeout=5)
+        assert router.list_route_names() == ["greeting", "farewell", "slow"]
+        assert "slow one" in list(router.index.utterances)
+        # the previous state is left untouched
+        assert [route.name for route in served.routes] == ["greeting", "farewell"]
+        assert len(served.route_index) == 4
+
+    def test_failed_write_not_published(self, router):
+        served = router._get_state()
+        with pytest.raises(RuntimeError, match="encoding failed"):
+            router.add(Route(name="broken", utterances=["boom"]))
+        assert router._get_state() is served
+        assert router.index is served.route_index
+        assert router.list_route_names() == ["greeting", "farewell"]
+
+    def test_concurrent_adds_not_lost(self, router):
+        writers = [
+            threading.Thread(
+                target=router.add,
+                args=(Route(name=f"route{i}", utterances=[f"utterance {i}"]),),
+            )
+            for i in range(8)
+        ]
+        for writer in writers:
+            writer.start()
+        for writer in writers:
+            writer.join(timeout=5)
+        assert sorted(router.list_route_names()[2:]) == [f"route{i}" for i in range(8)]
+        assert len(router.index) == 12
+
+    def test_thresholds_set_on_new_state(self, router):
+        served = router._get_state()
+        router.set_threshold(0.9, route_name="greeting")
+        assert router.get("greeting").score_threshold == 0.9
+        assert served.routes[0].score_threshold == 0.5
+        router.set_threshold(0.2)
+        assert router._get_state().score_threshold == 0.2
+        assert served.score_threshold == 0.5
+        assert [route.score_threshold for route in served.routes] == [0.5, 0.5]
+
+    def test_fit_local_execution_keeps_serving_index(self, router):
+        served = router._get_state()
+        router.fit(
+            X=["hello", "goodbye", "random"],
+            y=["greeting", "farewell", None],
+            max_iter=3,
+            local_execution=True,
+        )
+        assert isinstance(router.index, ServingIndex)
+        assert len(router.index) == 4
+        assert [route.score_threshold for route in served.routes] == [0.5, 0.5]
+
+    @pytest.mark.asyncio
+    async def test_async_writers_serialized(self, router):
+        async def write(name: str):
+            async with router._async_write_state() as staged:
+                await asyncio.sleep(0.01)
+                staged.routes.append(Route(name=name, utterances=[name]))
+
+        await asyncio.gather(write("a"), write("b"))
+        assert sorted(router.list_route_names()[2:]) == ["a", "b"]
+
+    def test_nested_write_does_not_deadlock(self, router):
+        def write():
+            with router._write_state() as staged:
+                staged.add(Route(name="nested", utterances=["nested one"]))
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        writer.join(timeout=5)
+        assert not writer.is_alive()
+        assert router.list_route_names() == ["greeting", "farewell", "nested"]
+
+    @pytest.mark.asyncio
+    async def test_nested_async_write_does_not_deadlock(self, router):
+        async def write():
+            async with router._async_write_state() as staged:
+                async with router._async_write_state():
+                    pass
+                staged.routes.append(Route(name="nested", utterances=["nested"]))
+
+        await asyncio.wait_for(write(), timeout=5)
+        assert router.list_route_names() == ["greeting", "farewell", "nested"]
+
+    def test_decision_cached_under_version_of_query_state(self, router):
+        router.decision_cache = LRUCache(max_entries=10)
+        router.encoder.gate, router.encoder.entered = (
+            threading.Event(),
+            threading.Event(),
+        )
+        served = router._get_state()
+        query = threading.Thread(target=router, args=("slow query",))
+        query.start()
+        try:
+            assert router.encoder.entered.wait(timeout=5)
+            # the router changes while the query is being routed
+            router.add(Route(name="other", utterances=["other one"]))
+        finally:
+            router.encoder.gate.set()
+            query.join(timeout=5)
+        current = router._get_state()
+        assert current.version != served.version
+        assert router._read_decision("slow query", None, 1, served) is not None
+        assert router._read_decision("slow query", None, 1, current) is None
+
+    def test_index_arrays_shared_until_written(self, router):
+        served = router._get_state()
+        with router._write_state() as staged:
+            assert staged.index.index is served.route_index.index
+            staged.add(Route(name="new", utterances=["new one"]))
+        assert len(router.index) == 5
+        assert len(served.route_index) == 4
+        assert sorted(served.route_index.routes) == [
+            "farewell",
+            "farewell",
+            "greeting",
+            "greeting",
+        ]
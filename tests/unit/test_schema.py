@@ -3,6 +3,8 @@ from pydantic import ValidationError
 
 from semantic_router.schema import (
     Message,
+    Utterance,
+    UtteranceDiff,
 )
 
 
@@ -28,3 +30,35 @@ class TestMessageDataclass:
         message = Message(role="user", content="Hello!")
         cohere_format = message.to_cohere()
         assert cohere_format == {"role": "user", "message": "Hello!"}
+
+
+class TestUtteranceDiff:
+    def test_from_utterances(self):
+        local = [
+            Utterance(route="a", utterance="hello"),
+            Utterance(route="b", utterance="bye"),
+            Utterance(route="a", utterance="hi", metadata={"x": 1}),
+        ]
+        remote = [
+            Utterance(route="a", utterance="hello"),
+            Utterance(route="a", utterance="hi"),
+            Utterance(route="c", utterance="boo"),
+        ]
+        diff = UtteranceDiff.from_utterances(local, remote)
+        assert diff.to_utterance_str() == [
+            "  a: hello",
+            "- a: hi",
+            "+ a: hi",
+            "- b: bye",
+            "+ c: boo",
+        ]
+        assert [u.utterance for u in diff.get_tag("+")] == ["hi", "boo"]
+
+    def test_large_diff(self):
+        local = [Utterance(route="r", utterance=f"u{i}") for i in range(0, 20000, 2)]
+        remote = [Utterance(route="r", utterance=f"u{i}") for i in range(0, 20000, 3)]
+        diff = UtteranceDiff.from_utterances(local, remote)
+        assert len(diff.get_tag(" ")) == len(range(0, 20000, 6))
+        assert len(diff.diff) == len(
+            {u.utterance for u in local} | {u.utterance for u in remote}
+        )
@@ -0,0 +1,455 @@
+import json
+import threading
+from typing import Any, Dict, List, Optional
+from unittest.mock import patch
+
+import pytest
+
+from semantic_router.encoders import DenseEncoder
+from semantic_router.index.base import route_hashes_field
+from semantic_router.index.local import LocalIndex
+from semantic_router.route import Route
+from semantic_router.routers import SemanticRouter
+from semantic_router.routers.base import MAX_ROUTE_HASHES_SIZE
+from semantic_router.schema import ConfigParameter, Utterance, UtteranceDiff
+
+
+class LengthEncoder(DenseEncoder):
+    calls: List[List[str]] = []
+
+    def __call__(self, docs: List[str]) -> List[List[float]]:
+        self.calls.append(list(docs))
+        return [[float(len(doc)), 1.0, 0.5] for doc in docs]
+
+    async def acall(self, docs: List[str]) -> List[List[float]]:
+        return self(docs)
+
+
+class ConfigLocalIndex(LocalIndex):
+    """A local index that keeps its config, like a remote index would."""
+
+    configs: Dict[str, ConfigParameter] = {}
+    fetched: List[Optional[List[str]]] = []
+
+    def _read_config(self, field: str, scope: str | None = None) -> ConfigParameter:
+        return self.configs.get(field, ConfigParameter(field=field, value=""))
+
+    async def _async_read_config(
+        self, field: str, scope: str | None = None
+    ) -> ConfigParameter:
+        return self._read_config(field, scope)
+
+    def _write_config(self, config: ConfigParameter) -> ConfigParameter:
+        self.configs[config.field] = config
+        return config
+
+    async def _async_write_config(self, config: ConfigParameter) -> ConfigParameter:
+        return self._write_config(config)
+
+    def get_utterances(
+        self, include_metadata: bool = False, routes: Optional[List[str]] = None
+    ) -> List[Utterance]:
+        self.fetched.append(routes)
+        return super().get_utterances(include_metadata=include_metadata, routes=routes)
+
+    async def aget_utterances(
+        self, include_metadata: bool = False, routes: Optional[List[str]] = None
+    ) -> List[Utterance]:
+        return self.get_utterances(include_metadata=include_metadata, routes=routes)
+
+
+@pytest.fixture
+def encoder():
+    return LengthEncoder(name="length-encoder", calls=[], score_threshold=0.5)
+
+
+@pytest.fixture
+def router(encoder):
+    routes = [
+        Route(name="greeting", utterances=["hello", "hi there", "hey"]),
+        Route(name="farewell", utterances=["goodbye", "see you later"]),
+    ]
+    return SemanticRouter(
+        encoder=encoder, routes=routes, index=LocalIndex(), auto_sync="local"
+    )
+
+
+class TestSyncStrategy:
+    def test_merge_force_local_large(self):
+        local = [
+            Utterance(route=f"r{i % 50}", utterance=f"u{i}", metadata={"v": 2})
+            for i in range(0, 30000, 2)
+        ]
+        remote = [
+            Utterance(route=f"r{i % 50}", utterance=f"u{i}", metadata={"v": 1})
+            for i in range(0, 30000, 3)
+        ]
+        diff = UtteranceDiff.from_utterances(local, remote)
+        strategy = diff.get_sync_strategy("merge-force-local")
+        # remote utterances of local routes take the local metadata without being
+        # re-added, the others belong to routes that only exist remotely and are
+        # deleted
+        updated = strategy["remote"]["update"]
+        assert len(updated) == len(range(0, 30000, 6))
+        assert all(utt.metadata == {"v": 2} for utt in updated)
+        assert len(strategy["remote"]["upsert"]) == len(local) - len(updated)
+        assert len(strategy["remote"]["delete"]) == len(remote) - len(updated)
+        assert strategy["local"]["upsert"] == []
+
+    def test_merge_force_remote(self):
+        local = [
+            Utterance(route="a", utterance="x", metadata={"v": 2}),
+            Utterance(route="b", utterance="y"),
+        ]
+        remote = [Utterance(route="a", utterance="z", metadata={"v": 1})]
+        strategy = UtteranceDiff.from_utterances(local, remote).get_sync_strategy(
+            "merge-force-remote"
+        )
+        assert [
+            (u.route, u.utterance, u.metadata) for u in strategy["remote"]["upsert"]
+        ] == [("a", "x", {"v": 1})]
+        assert [u.route for u in strategy["local"]["delete"]] == ["b"]
+
+
+class TestLocalAppliers:
+    def test_local_upsert(self, router):
+        router._local_upsert(
+            [
+                Utterance(route="greeting", utterance="hello"),
+                Utterance(route="greeting", utterance="howdy", metadata={"a": 1}),
+                Utterance(route="thanks", utterance="thank you"),
+            ]
+        )
+        greeting = router.get("greeting")
+        assert greeting.utterances == ["hello", "hi there", "hey", "howdy"]
+        assert greeting.metadata == {"a": 1}
+        assert router.get("thanks").utterances == ["thank you"]
+
+    def test_local_delete_keeps_order_and_settings(self, router):
+        router.get("greeting").score_threshold = 0.3
+        router._local_delete(
+            [
+                Utterance(route="greeting", utterance="hi there"),
+                Utterance(route="farewell", utterance="goodbye"),
+                Utterance(route="farewell", utterance="see you later"),
+            ]
+        )
+        assert [route.name for route in router.routes] == ["greeting"]
+        assert router.routes[0].utterances == ["hello", "hey"]
+        assert router.routes[0].score_threshold == 0.3
+
+
+@pytest.fixture
+def hashed_router(encoder):
+    routes = [
+        Route(name=f"route{i}", utterances=[f"utterance {i}", f"other {i}"])
+        for i in range(5)
+    ]
+    index = ConfigLocalIndex()
+    index.configs, index.fetched = {}, []
+    return SemanticRouter(
+        encoder=encoder, routes=routes, index=index, auto_sync="local"
+    )
+
+
+class TestRouteHashes:
+    def test_hashes_written_with_router_hash(self, hashed_router):
+        stored = json.loads(hashed_router.index.configs["sr_route_hashes"].value)
+        assert stored["sr_hash"] == hashed_router.index.configs["sr_hash"].value
+        assert sorted(stored["routes"]) == [f"route{i}" for i in range(5)]
+
+    def test_sync_fetches_changed_routes(self, hashed_router):
+        index = hashed_router.index
+        hashed_router.routes.append(Route(name="route5", utterances=["new"]))
+        hashed_router.get("route1").utterances.append("more")
+        index.fetched = []
+        diff = hashed_router.sync("merge")
+        assert index.fetched == [["route1", "route5"]]
+        assert "- route5: new" in diff
+        assert "- route1: more" in diff
+        # the sync publishes a new copy of the index
+        assert sorted(
+            utt.to_str()
+            for utt in hashed_router.index.get_utterances(routes=["route1", "route5"])
+        ) == [
+            "route1: more",
+            "route1: other 1",
+            "route1: utterance 1",
+            "route5: new",
+        ]
+
+    def test_diff_matches_full_diff(self, hashed_router):
+        hashed_router.get("route2").utterances.remove("other 2")
+        hashed_router.get("route3").metadata = {"tier": "gold"}
+        hashed_router.routes.pop(4)
+        for include_metadata in [False, True]:
+            hashed_router.index.fetched = []
+            diff = hashed_router.get_utterance_diff(include_metadata=include_metadata)
+            assert hashed_router.index.fetched == [["route2", "route3", "route4"]]
+            full_diff = UtteranceDiff.from_utterances(
+                local_utterances=hashed_router.to_config().to_utterances(),
+                remote_utterances=hashed_router.index.get_utterances(
+                    include_metadata=include_metadata
+                ),
+            ).to_utterance_str(include_metadata=include_metadata)
+            assert diff == full_diff
+
+    def test_full_fetch_without_trusted_hashes(self, hashed_router):
+        index = hashed_router.index
+        hashed_router.get("route0").utterances.append("more")
+        # route hashes written alongside an older router hash are not trusted
+        index.configs["sr_hash"] = ConfigParameter(field="sr_hash", value="other")
+        index.fetched = []
+        hashed_router.get_utterance_diff()
+        assert index.fetched == [None]
+        index.configs["sr_route_hashes"] = ConfigParameter(
+            field="sr_route_hashes", value="not json"
+        )
+        index.fetched = []
+        hashed_router.sync("local", force=True)
+        assert index.fetched == [None]
+
+    def test_unchanged_routes_not_fetched(self, hashed_router):
+        hashed_router.index.fetched = []
+        assert hashed_router.get_utterance_diff() == [
+            f"  {utt.to_str()}"
+            for utt in sorted(
+                hashed_router.to_config().to_utterances(), key=lambda u: u.to_str()
+            )
+        ]
+        assert hashed_router.index.fetched == []
+
+    @pytest.mark.asyncio
+    async def test_async_sync_fetches_changed_routes(self, hashed_router):
+        index = hashed_router.index
+        hashed_router.get("route4").utterances = ["replaced"]
+        index.fetched = []
+        await hashed_router.async_sync("local")
+        assert index.fetched == [["route4"]]
+        assert [
+            utt.utterance
+            for utt in hashed_router.index.get_utterances(routes=["route4"])
+        ] == ["replaced"]
+
+
+class TestShardedRouteHashes:
+    @pytest.fixture
+    def large_router(self, encoder):
+        # long route names so the route hashes do not fit in one record
+        routes = [
+            Route(name=f"{'route' * 12}{i:04d}", utterances=[f"utterance {i}"])
+            for i in range(500)
+        ]
+        index = ConfigLocalIndex()
+        index.configs, index.fetched = {}, []
+        return SemanticRouter(
+            encoder=encoder, routes=routes, index=index, auto_sync="local"
+        )
+
+    def test_hashes_sharded_at_cap(self, large_router):
+        configs = large_router.index.configs
+        head = json.loads(configs["sr_route_hashes"].value)
+        assert head["shards"] > 1
+        records = [configs[route_hashes_field(i)].value for i in range(head["shards"])]
+        assert all(0 < len(record) <= MAX_ROUTE_HASHES_SIZE for record in records)
+        stored: Dict[str, str] = {}
+        for record in records:
+            stored.update(json.loads(record)["routes"])
+        assert len(stored) == 500
+
+    def test_sync_fetches_changed_routes(self, large_router):
+        index = large_router.index
+        changed = large_router.routes[-1]
+        changed.utterances.append("more")
+        index.fetched = []
+        large_router.sync("local")
+        assert index.fetched == [[changed.name]]
+
+    @pytest.mark.asyncio
+    async def test_async_sync_fetches_changed_routes(self, large_router):
+        index = large_router.index
+        changed = large_router.routes[0]
+        changed.utterances.append("more")
+        index.fetched = []
+        await large_router.async_sync("local")
+        assert index.fetched == [[changed.name]]
+
+    def test_stale_shard_not_trusted(self, large_router):
+        index = large_router.index
+        index.configs["sr_route_hashes_1"] = ConfigParameter(
+            field="sr_route_hashes_1", value=json.dumps({"routes": {}})
+        )
+        index.fetched = []
+        large_router.get_utterance_diff()
+        assert index.fetched == [None]
+
+    def test_warns_when_a_route_does_not_fit(self, large_router):
+        large_router.routes.append(
+            Route(name="r" * MAX_ROUTE_HASHES_SIZE, utterances=["too long"])
+        )
+        with patch("semantic_router.routers.base.logger") as mock_logger:
+            records = large_router.to_config().get_route_hashes()
+            mock_logger.warning.assert_called_once()
+        assert [(record.field, record.value) for record in records] == [
+            ("sr_route_hashes", "")
+        ]
+
+
+class UpdatingLocalIndex(LocalIndex):
+    """A local index that records metadata updates."""
+
+    updated: List[Utterance] = []
+
+    def update_metadata(self, utterances: List[Utterance]) -> List[Utterance]:
+        self.updated.extend(utterances)
+        return []
+
+
+class NoUpdateLocalIndex(LocalIndex):
+    """A local index that cannot update records in place."""
+
+    def update_metadata(self, utterances: List[Utterance]) -> List[Utterance]:
+        return utterances
+
+
+class TestMetadataUpdates:
+    def test_metadata_change_planned_as_update(self):
+        local = [
+            Utterance(route="a", utterance="x", metadata={"v": 2}),
+            Utterance(route="a", utterance="new", metadata={"v": 2}),
+        ]
+        remote = [
+            Utterance(route="a", utterance="x", metadata={"v": 1}),
+            Utterance(route="b", utterance="y"),
+        ]
+        strategy = UtteranceDiff.from_utterances(local, remote).get_sync_strategy(
+            "local"
+        )
+        assert [u.utterance for u in strategy["remote"]["upsert"]] == ["new"]
+        assert [(u.utterance, u.metadata) for u in strategy["remote"]["update"]] == [
+            ("x", {"v": 2})
+        ]
+        # the stored record of "x" is updated rather than deleted
+        assert [u.utterance for u in strategy["remote"]["delete"]] == ["y"]
+
+    def test_unchanged_remote_utterances_not_updated(self):
+        local = [Utterance(route="a", utterance="x")]
+        remote = [
+            Utterance(route="a", utterance="x"),
+            Utterance(route="b", utterance="y", metadata={"v": 1}),
+        ]
+        strategy = UtteranceDiff.from_utterances(local, remote).get_sync_strategy(
+            "merge"
+        )
+        assert strategy["remote"] == {"upsert": [], "update": [], "delete": []}
+
+    def test_sync_updates_metadata_without_encoding(self, encoder):
+        index = UpdatingLocalIndex()
+        index.updated = []
+        routes = [Route(name="greeting", utterances=["hello", "hi there"])]
+        router = SemanticRouter(
+            encoder=encoder, routes=routes, index=index, auto_sync="local"
+        )
+        router.get("greeting").metadata = {"tier": "gold"}
+        encoder.calls.clear()
+        router.sync("local", force=True)
+        assert encoder.calls == []
+        assert sorted(u.utterance for u in index.updated) == ["hello", "hi there"]
+        assert all(u.metadata == {"tier": "gold"} for u in index.updated)
+        assert len(index) == 2
+
+    def test_sync_re_adds_utterances_not_updated(self, encoder):
+        routes = [Route(name="farewell", utterances=["goodbye", "see you later"])]
+        router = SemanticRouter(
+            encoder=encoder,
+            routes=routes,
+            index=NoUpdateLocalIndex(),
+            auto_sync="local",
+        )
+        router.get("farewell").metadata = {"tier": "gold"}
+        encoder.calls.clear()
+        router.sync("local", force=True)
+        # records that cannot be updated in place are removed and added again
+        assert encoder.calls == [["goodbye", "see you later"]]
+        assert len(router.index) == 2
+
+    def test_pinecone_records_keep_stored_values(self):
+        from semantic_router.index.pinecone import (
+            _metadata_record,
+            _with_stored_values,
+        )
+
+        utterances = [
+            Utterance(route="a b", utterance="x", metadata={"v": 2}),
+            Utterance(route="a b", utterance="missing"),
+        ]
+        records = [_metadata_record(utt) for utt in utterances]
+        stored = {records[0].id: {"id": records[0].id, "values": [0.1, 0.2]}}
+        to_upsert, missing = _with_stored_values(utterances, records, stored)
+        assert missing == [utterances[1]]
+        assert to_upsert == [
+            {
+                "id": records[0].id,
+                "values": [0.1, 0.2],
+                "metadata": {
+                    "v": 2,
+                    "sr_route": "a b",
+                    "sr_utterance": "x",
+                    "sr_function_schema": "null",
+                },
+            }
+        ]
+
+
+class GatedLocalIndex(ConfigLocalIndex):
+    """A config keeping local index whose reads wait until the gate is opened."""
+
+    gate: Any = None
+
+    def get_utterances(
+        self, include_metadata: bool = False, routes: Optional[List[str]] = None
+    ) -> List[Utterance]:
+        self.gate.wait(timeout=5)
+        return super().get_utterances(include_metadata=include_metadata, routes=routes)
+
+
+class TestBackgroundSync:
+    def test_startup_does_not_wait_for_sync(self, encoder):
+        index = GatedLocalIndex()
+        index.configs, index.fetched, index.gate = {}, [], threading.Event()
+        routes = [Route(name="greeting", utterances=["hello", "hi there"])]
+        router = SemanticRouter(
+            encoder=encoder,
+            routes=routes,
+            index=index,
+            auto_sync="local",
+            sync_interval=3600,
+        )
+        try:
+            # the sync is still waiting on the index
+            assert not router.wait_for_background_sync(timeout=0.05)
+            assert len(router.index) == 0
+            index.gate.set()
+            assert router.wait_for_background_sync(timeout=5)
+            assert router.index is not index
+            assert list(router.index.utterances) == ["hello", "hi there"]
+            assert router("hello").name == "greeting"
+            assert router.is_synced()
+        finally:
+            router.stop_background_sync(timeout=5)
+        assert router._sync_thread is None
+
+    def test_sync_publishes_new_state(self, hashed_router):
+        served = hashed_router._get_state()
+        hashed_router.routes = hashed_router.routes + [
+            Route(name="route5", utterances=["brand new"])
+        ]
+        assert hashed_router._background_sync(sync_mode="local")
+        state = hashed_router._get_state()
+        assert state.routes is hashed_router.routes
+        assert state.route_index is hashed_router.index
+        assert "brand new" in list(state.route_index.utterances)
+        # queries that took the previous state still see it unchanged
+        assert len(served.route_index) == 10
+        assert "brand new" not in list(served.route_index.utterances)
+        assert not hashed_router._background_sync(sync_mode="local")